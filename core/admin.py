@@ -6,6 +6,7 @@ from .models import (
     Advocate, District, Taluka, Village, AssignedTask, LandSale, 
     Installment, Client
 )
+from .reporting import refresh_stats, stat_scopes
 
 @admin.register(User)
 class CustomUserAdmin(UserAdmin):
@@ -131,13 +132,21 @@ class AssignedTaskAdmin(admin.ModelAdmin):
     
     actions = ['mark_completed', 'mark_pending']
     
+    def _update_tracking_stats(self, queryset, **values):
+        # Queryset updates skip the signals that keep the task stats current
+        ids = list(queryset.values_list('id', flat=True))
+        scopes = stat_scopes(id__in=ids)
+        updated = AssignedTask.objects.filter(id__in=ids).update(**values)
+        refresh_stats(stat_scopes(scopes, id__in=ids))
+        return updated
+    
     def mark_completed(self, request, queryset):
-        updated = queryset.update(status='complete', completed_date=datetime.datetime.now())
+        updated = self._update_tracking_stats(queryset, status='complete', completed_date=datetime.datetime.now())
         self.message_user(request, f'{updated} task(s) marked as completed.')
     mark_completed.short_description = "Mark selected tasks as completed"
     
     def mark_pending(self, request, queryset):
-        updated = queryset.update(status='pending', completed_date=None)
+        updated = self._update_tracking_stats(queryset, status='pending', completed_date=None)
         self.message_user(request, f'{updated} task(s) marked as pending.')
     mark_pending.short_description = "Mark selected tasks as pending"
 
@@ -1,6 +1,20 @@
 from django.apps import AppConfig
+from django.contrib.staticfiles.apps import StaticFilesConfig
 
 
 class CoreConfig(AppConfig):
+    default = True
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'core'
+
+    def ready(self):
+        from . import caching, conditional, reporting, search
+        caching.connect_signals()
+        conditional.connect_signals()
+        reporting.connect_signals()
+        search.connect_signals()
+
+
+class CrmStaticFilesConfig(StaticFilesConfig):
+    # Editor and backup leftovers never go out with collectstatic
+    ignore_patterns = StaticFilesConfig.ignore_patterns + ['*.backup', '*.bak', '*.orig', '*.swp']
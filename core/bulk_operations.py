@@ -0,0 +1,328 @@
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from .caching import invalidate
+from .conditional import bump_resource_version
+from .reporting import deferred_refresh, refresh_stats, stat_scopes
+from .search import ASSIGNED_TASK, index_objects
+from .models import User, Message, Notification, Land, AssignedTask, TaskManage, LandSale, Installment, Client, Reminder
+
+
+OPEN_TASK_STATUSES = ['pending', 'in_progress', 'pending_approval']
+
+EMPLOYEE_ACTIONS = ['activate', 'deactivate', 'reassign', 'delete']
+
+# action: (statuses a task must be in, result label)
+TASK_TRANSITIONS = {
+    'approve': (['pending_approval'], 'approved'),
+    'reject': (['pending_approval'], 'rejected'),
+    'mark_complete': (['pending', 'in_progress'], 'completed'),
+}
+
+
+def _parse_ids(raw_ids, label):
+    """Split raw ids into a list of ints and a failures dict for the unparseable ones"""
+    ids = []
+    failures = {}
+    for raw_id in raw_ids:
+        try:
+            ids.append(int(raw_id))
+        except (TypeError, ValueError):
+            failures[raw_id] = f'Invalid {label} ID'
+    return list(dict.fromkeys(ids)), failures
+
+
+def bulk_delete_lands(land_ids):
+    """
+    Delete many lands in one transaction.
+
+    The cascade to AssignedTask, LandSale, Installment and Reminder is resolved
+    once for the whole id set, and the task stats of the cascaded AssignedTask
+    rows are refreshed once at the end. If the set delete fails, each land is
+    retried in its own savepoint so one bad row does not abort the batch.
+    Returns (deleted_names, failures) where failures maps land id -> reason.
+    """
+    ids, failures = _parse_ids(land_ids, 'land')
+
+    with transaction.atomic(), deferred_refresh():
+        names = dict(Land.objects.filter(id__in=ids).values_list('id', 'name'))
+        for land_id in ids:
+            if land_id not in names:
+                failures[land_id] = 'Land not found'
+
+        if not names:
+            return [], failures
+
+        try:
+            with transaction.atomic():
+                Land.objects.filter(id__in=list(names)).delete()
+            return list(names.values()), failures
+        except Exception:
+            pass
+
+        deleted_names = []
+        for land_id, name in names.items():
+            try:
+                with transaction.atomic():
+                    Land.objects.filter(id=land_id).delete()
+                deleted_names.append(name)
+            except Exception as e:
+                failures[land_id] = str(e)
+        return deleted_names, failures
+
+
+def _reassign_assigned_tasks(queryset, to_employee, **extra_updates):
+    """
+    Move AssignedTask rows in queryset to to_employee with a single UPDATE.
+
+    Rows whose (land, task) the target already holds would violate the
+    unique_together on (land, task, employee), so they are left in place and
+    returned as conflicts. Returns (moved_rows, conflict_ids) where moved_rows
+    is a list of (id, previous_employee_id, task_id) tuples.
+    """
+    held = set(AssignedTask.objects.filter(
+        employee=to_employee,
+        land_id__in=queryset.values('land_id'),
+    ).values_list('land_id', 'task_id'))
+
+    moved_rows = []
+    conflict_ids = []
+    seen = set(held)
+    for task_id, employee_id, land_id, assigned_task_id in queryset.exclude(employee=to_employee).values_list(
+        'task_id', 'employee_id', 'land_id', 'id'
+    ):
+        # Two source employees may share the same land/task; only one can move
+        if (land_id, task_id) in seen:
+            conflict_ids.append(assigned_task_id)
+        else:
+            seen.add((land_id, task_id))
+            moved_rows.append((assigned_task_id, employee_id, task_id))
+
+    if moved_rows:
+        moved_ids = [row[0] for row in moved_rows]
+        scopes = stat_scopes(id__in=moved_ids)
+        AssignedTask.objects.filter(id__in=moved_ids).update(employee=to_employee, **extra_updates)
+        # Queryset updates skip the signals that keep the task stats current
+        refresh_stats(stat_scopes(scopes, id__in=moved_ids))
+        # The employee name is part of the search document
+        index_objects(ASSIGNED_TASK, id__in=moved_ids)
+        TaskManage.objects.bulk_create(
+            [TaskManage(task_id=task_id, employee=to_employee) for task_id in {row[2] for row in moved_rows}],
+            ignore_conflicts=True,
+        )
+        invalidate('task_catalog', 'dashboard_stats')
+    return moved_rows, conflict_ids
+
+
+def _employee_dependent_counts(employee_ids, action):
+    """Count the rows each lifecycle action would touch for the given employees"""
+    if action in ('activate', 'deactivate'):
+        target_status = 'active' if action == 'activate' else 'inactive'
+        return {'status_changes': User.objects.filter(id__in=employee_ids).exclude(status=target_status).count()}
+
+    open_tasks = AssignedTask.objects.filter(employee_id__in=employee_ids, status__in=OPEN_TASK_STATUSES)
+    if action == 'reassign':
+        return {'open_assigned_tasks': open_tasks.count()}
+
+    return {
+        'assigned_tasks': AssignedTask.objects.filter(employee_id__in=employee_ids).count(),
+        'open_assigned_tasks': open_tasks.count(),
+        'task_manages': TaskManage.objects.filter(employee_id__in=employee_ids).count(),
+        'messages': Message.objects.filter(Q(sender_id__in=employee_ids) | Q(receiver_id__in=employee_ids)).count(),
+        'notifications': Notification.objects.filter(user_id__in=employee_ids).count(),
+        'reminders': Reminder.objects.filter(Q(created_by_id__in=employee_ids) | Q(assigned_to_id__in=employee_ids)).count(),
+        'land_sales_unlinked': LandSale.objects.filter(Q(marketing_employee_id__in=employee_ids) | Q(created_by_id__in=employee_ids)).count(),
+        'installments_unlinked': Installment.objects.filter(received_by_id__in=employee_ids).count(),
+        'clients_unlinked': Client.objects.filter(created_by_id__in=employee_ids).count(),
+    }
+
+
+def bulk_employee_action(employee_ids, action, reassign_to=None, dry_run=False):
+    """
+    Apply a lifecycle action to many employees with set-based statements.
+
+    action: 'activate', 'deactivate', 'reassign' (move open tasks to
+        reassign_to) or 'delete' (optionally reassigning open tasks first)
+    dry_run: only count the dependent rows the action would touch
+
+    Returns a report dict with the matched employee count, per-table
+    counts, reassigned/conflicting task ids and per-id failures.
+    """
+    if action not in EMPLOYEE_ACTIONS:
+        raise ValueError(f'Unknown employee action: {action}')
+    if action == 'reassign' and reassign_to is None:
+        raise ValueError('reassign_to is required to reassign tasks')
+
+    ids, failures = _parse_ids(employee_ids, 'employee')
+    report = {
+        'action': action,
+        'dry_run': dry_run,
+        'employees': 0,
+        'counts': {},
+        'reassigned_tasks': 0,
+        'conflicts': [],
+        'failures': failures,
+    }
+
+    with transaction.atomic():
+        employees = User.objects.select_for_update().filter(id__in=ids, role='employee')
+        found_ids = list(employees.values_list('id', flat=True))
+        for employee_id in ids:
+            if employee_id not in found_ids:
+                failures[employee_id] = 'Employee not found'
+        if reassign_to is not None and reassign_to.id in found_ids:
+            found_ids.remove(reassign_to.id)
+            failures[reassign_to.id] = 'Cannot reassign tasks to an employee in the same batch'
+
+        report['employees'] = len(found_ids)
+        if not found_ids:
+            return report
+
+        report['counts'] = _employee_dependent_counts(found_ids, action)
+        if dry_run:
+            return report
+
+        if reassign_to is not None and action in ('reassign', 'delete'):
+            moved_rows, conflict_ids = _reassign_assigned_tasks(
+                AssignedTask.objects.filter(employee_id__in=found_ids, status__in=OPEN_TASK_STATUSES),
+                reassign_to,
+            )
+            report['reassigned_tasks'] = len(moved_rows)
+            report['conflicts'] = conflict_ids
+
+        if action in ('activate', 'deactivate'):
+            User.objects.filter(id__in=found_ids).update(
+                status='active' if action == 'activate' else 'inactive', updated_at=timezone.now()
+            )
+            # Queryset updates skip post_save (and auto_now), so bump the cached user lists here
+            bump_resource_version('users')
+            invalidate('employees', 'dashboard_stats')
+        elif action == 'delete':
+            User.objects.filter(id__in=found_ids).delete()
+
+    return report
+
+
+def bulk_reassign_tasks(to_employee, task_ids=None, from_employee=None, statuses=None, land=None, task=None, notes=''):
+    """
+    Reassign many AssignedTask rows to to_employee in one conflict-aware UPDATE.
+
+    Rows are selected either by task_ids or by a filter on from_employee,
+    statuses, land and task; with a filter, statuses default to the open
+    ones. Returns a report with the moved count, conflicting ids, per-id
+    failures and a {previous_employee_id: count} map for notifications.
+    """
+    failures = {}
+    queryset = AssignedTask.objects.all()
+    if task_ids is not None:
+        ids, failures = _parse_ids(task_ids, 'task')
+        queryset = queryset.filter(id__in=ids)
+        if statuses:
+            queryset = queryset.filter(status__in=statuses)
+    else:
+        if from_employee is None and land is None and task is None:
+            raise ValueError('A task id list or at least one filter is required')
+        queryset = queryset.filter(status__in=statuses or OPEN_TASK_STATUSES)
+        if from_employee is not None:
+            queryset = queryset.filter(employee=from_employee)
+        if land is not None:
+            queryset = queryset.filter(land=land)
+        if task is not None:
+            queryset = queryset.filter(task=task)
+
+    extra_updates = {}
+    if notes:
+        extra_updates['admin_approval_notes'] = f"Task reassigned with notes: {notes}".strip()
+
+    with transaction.atomic():
+        queryset = queryset.select_for_update()
+        if task_ids is not None:
+            found_ids = set(queryset.values_list('id', flat=True))
+            for task_id in ids:
+                if task_id not in found_ids:
+                    failures[task_id] = 'Task not found'
+        moved_rows, conflict_ids = _reassign_assigned_tasks(queryset, to_employee, **extra_updates)
+
+    per_employee = {}
+    for _, previous_employee_id, _ in moved_rows:
+        per_employee[previous_employee_id] = per_employee.get(previous_employee_id, 0) + 1
+    for conflict_id in conflict_ids:
+        failures[conflict_id] = f'{to_employee.get_display_name()} already has this task on the same land'
+
+    return {
+        'reassigned': len(moved_rows),
+        'conflicts': conflict_ids,
+        'failures': failures,
+        'per_employee': per_employee,
+    }
+
+
+def _transition_updates(action, admin_notes):
+    """Column values written by each bulk workflow action, mirroring the AssignedTask methods"""
+    now = timezone.now()
+    if action == 'approve':
+        return {
+            'status': 'complete',
+            'completed_date': now,
+            'admin_approval_date': now,
+            'admin_approval_notes': admin_notes,
+        }
+    if action == 'reject':
+        return {
+            'status': 'in_progress',
+            'completion_notes': '',
+            'completion_photos': None,
+            'completion_pdf': None,
+            'completion_submitted_date': None,
+            'admin_approval_notes': admin_notes,
+        }
+    return {
+        'status': 'complete',
+        'completed_date': now,
+        'admin_approval_date': now,
+        'admin_approval_notes': f"Task manually marked complete by admin: {admin_notes}".strip(),
+    }
+
+
+def bulk_transition_tasks(task_ids, action, admin_notes=''):
+    """
+    Approve, reject or mark complete many AssignedTask rows with one UPDATE.
+
+    Only rows in the statuses allowed for the action are changed
+    (pending_approval for approve/reject, pending/in_progress for
+    mark_complete). Returns (results, changed) where results maps each
+    requested id to the outcome label or a reason, and changed is a list of
+    (id, employee_id, task_name) tuples for the rows that transitioned.
+    """
+    if action not in TASK_TRANSITIONS:
+        raise ValueError(f'Unknown task action: {action}')
+    allowed_statuses, label = TASK_TRANSITIONS[action]
+
+    ids, results = _parse_ids(task_ids, 'task')
+    changed = []
+    with transaction.atomic():
+        rows = AssignedTask.objects.select_for_update().filter(id__in=ids).values_list(
+            'id', 'status', 'employee_id', 'task__name'
+        )
+        found = {row[0]: row for row in rows}
+        for task_id in ids:
+            row = found.get(task_id)
+            if row is None:
+                results[task_id] = 'Task not found'
+            elif row[1] not in allowed_statuses:
+                results[task_id] = f"Task is {row[1].replace('_', ' ')}"
+            else:
+                results[task_id] = label
+                changed.append((task_id, row[2], row[3]))
+
+        if changed:
+            changed_ids = [row[0] for row in changed]
+            scopes = stat_scopes(id__in=changed_ids)
+            AssignedTask.objects.filter(
+                id__in=changed_ids, status__in=allowed_statuses
+            ).update(**_transition_updates(action, admin_notes))
+            refresh_stats(stat_scopes(scopes, id__in=changed_ids))
+            invalidate('dashboard_stats')
+
+    return results, changed
@@ -0,0 +1,157 @@
+from django.core.cache import cache, caches
+from django.core.cache.backends.locmem import LocMemCache
+from django.db.models import F
+from django.db.models.signals import post_save, post_delete
+from django.utils import timezone
+
+from .models import User, Task, TaskManage, Land, LandSale, AssignedTask, District, Taluka, Village, ResourceVersion
+
+
+# namespace: (models whose writes invalidate it, default timeout in seconds)
+CACHE_NAMESPACES = {
+    'locations': ((District, Taluka, Village), 24 * 60 * 60),
+    # Tasks with their assigned employees' names
+    'task_catalog': ((Task, TaskManage, User), 60 * 60),
+    'employees': ((User,), 60 * 60),
+    # Overdue counts move with the clock, so stats also expire on their own
+    'dashboard_stats': ((User, Task, Land, AssignedTask), 60),
+    # Rendered land tables (admin land, inventory, sold lands)
+    'land_tables': ((Land, LandSale), 24 * 60 * 60),
+}
+
+# Rendered table fragments are keyed by version, so they only need to expire
+# to free space once a newer version has replaced them
+FRAGMENT_TIMEOUT = 24 * 60 * 60
+
+_MISSING = object()
+
+
+def _version_name(namespace):
+    return f'cache.{namespace}'
+
+
+def namespace_versions(*namespaces):
+    """
+    {namespace: version} in one query.
+
+    Versions are ResourceVersion rows rather than cache keys: with a
+    per-process cache (locmem) a version key would only move in the worker
+    that saw the write, and every other worker would keep serving its stale
+    entries. Each process may hold its own copy of a value, but all of them
+    agree on which version is current.
+    """
+    names = {_version_name(namespace): namespace for namespace in namespaces}
+    versions = dict(ResourceVersion.objects.filter(name__in=names).values_list('name', 'version'))
+    return {namespace: versions.get(name, 0) for name, namespace in names.items()}
+
+
+def namespace_version(namespace):
+    return namespace_versions(namespace)[namespace]
+
+
+def invalidate(*namespaces):
+    """Drop every entry in the given namespaces by moving their version counters"""
+    names = [_version_name(namespace) for namespace in dict.fromkeys(namespaces)]
+    updated = ResourceVersion.objects.filter(name__in=names).update(
+        version=F('version') + 1, updated_at=timezone.now()
+    )
+    if updated < len(names):
+        for name in names:
+            ResourceVersion.objects.get_or_create(name=name, defaults={'version': 1})
+
+
+def _count(namespace, outcome):
+    key = f'ns:{namespace}:{outcome}'
+    try:
+        cache.incr(key)
+    except ValueError:
+        if not cache.add(key, 1, timeout=None):
+            cache.incr(key)
+
+
+def get_cached(namespace, key, compute, timeout=_MISSING):
+    """
+    Return the cached value for key in namespace, calling compute() on a miss.
+
+    Keys are scoped by the namespace version, so invalidate(namespace) retires
+    every entry at once without tracking individual keys. timeout defaults to
+    the namespace's own timeout.
+    """
+    _, default_timeout = CACHE_NAMESPACES[namespace]
+    full_key = f'ns:{namespace}:{namespace_version(namespace)}:{key}'
+    value = cache.get(full_key, _MISSING)
+    if value is not _MISSING:
+        _count(namespace, 'hits')
+        return value
+
+    _count(namespace, 'misses')
+    value = compute()
+    cache.set(full_key, value, timeout=default_timeout if timeout is _MISSING else timeout)
+    return value
+
+
+def fragment_versions(table_namespace, *row_namespaces):
+    """
+    Template context for the {% cache %} blocks around a list table.
+
+    table_version moves whenever table_namespace is invalidated and retires
+    the whole table. row_version tracks what rows show from other tables
+    (village or employee names); it is part of the table key and of every
+    row key, which is otherwise the row's pk and updated_at, so unchanged
+    rows are reused when only some of the table changed. Both come from the
+    database, so a write retires the fragments in every worker.
+    """
+    versions = namespace_versions(table_namespace, *row_namespaces)
+    return {
+        'fragment_timeout': FRAGMENT_TIMEOUT,
+        'table_version': versions[table_namespace],
+        'row_version': '.'.join(str(versions[namespace]) for namespace in row_namespaces),
+    }
+
+
+def cache_stats():
+    """
+    {namespace: {'hits', 'misses', 'version'}}: the counters as recorded in
+    the cache backend (this process's only, with locmem) and the version
+    from the database
+    """
+    keys = [f'ns:{namespace}:{field}' for namespace in CACHE_NAMESPACES for field in ('hits', 'misses')]
+    values = cache.get_many(keys)
+    versions = namespace_versions(*CACHE_NAMESPACES)
+    return {
+        namespace: {
+            'hits': values.get(f'ns:{namespace}:hits', 0),
+            'misses': values.get(f'ns:{namespace}:misses', 0),
+            'version': versions[namespace],
+        }
+        for namespace in CACHE_NAMESPACES
+    }
+
+
+def cache_is_process_local():
+    """True when the cache backend lives in each process (locmem)"""
+    return isinstance(caches['default'], LocMemCache)
+
+
+def reset_cache_stats():
+    cache.delete_many([f'ns:{namespace}:{field}' for namespace in CACHE_NAMESPACES for field in ('hits', 'misses')])
+
+
+# model -> namespaces it invalidates
+_MODEL_NAMESPACES = {}
+for _namespace, (_models, _) in CACHE_NAMESPACES.items():
+    for _model in _models:
+        _MODEL_NAMESPACES.setdefault(_model, []).append(_namespace)
+
+
+def _invalidate_for_instance(sender, instance=None, update_fields=None, **kwargs):
+    # Logins only touch last_login, which no cached value shows
+    if update_fields is not None and set(update_fields) <= {'last_login'}:
+        return
+    invalidate(*_MODEL_NAMESPACES[sender])
+
+
+def connect_signals():
+    for model in _MODEL_NAMESPACES:
+        post_save.connect(_invalidate_for_instance, sender=model, dispatch_uid=f'cache_namespace_save_{model.__name__}')
+        post_delete.connect(_invalidate_for_instance, sender=model, dispatch_uid=f'cache_namespace_delete_{model.__name__}')
@@ -0,0 +1,366 @@
+import csv
+import datetime
+import io
+import re
+import zipfile
+from pathlib import Path
+
+from django.core.exceptions import ValidationError
+from django.core.validators import validate_email
+from django.db import DataError, transaction
+from django.db.models import Count
+
+from . import search
+from .models import Client
+
+
+CLIENT_PAGE_SIZE = 25
+CLIENT_MAX_PAGE_SIZE = 200
+CLIENT_PICKER_LIMIT = 20
+CLIENT_IMPORT_BATCH_SIZE = 500
+
+CLIENT_TYPES = [value for value, _ in Client.CLIENT_TYPE_CHOICES]
+
+
+def _parse_date(value, label):
+    try:
+        return datetime.date.fromisoformat(value)
+    except ValueError:
+        raise ValueError(f'Invalid {label} date, expected YYYY-MM-DD')
+
+
+def filter_clients(params):
+    """
+    Apply the client list filters from a QueryDict.
+
+    search, created_by (user id), date_from / date_to (created_at, inclusive,
+    YYYY-MM-DD) and is_active (true/false) narrow the base queryset; the
+    client_type filter is applied separately so the type breakdown can be
+    computed over everything else. Returns (base_queryset, client_type) and
+    raises ValueError on malformed values.
+    """
+    clients = Client.objects.all()
+
+    search_query = params.get('search', '').strip()
+    if search_query:
+        clients = search.search_filter(clients, search.CLIENT, search_query)
+
+    created_by = params.get('created_by', '')
+    if created_by:
+        try:
+            clients = clients.filter(created_by_id=int(created_by))
+        except ValueError:
+            raise ValueError('Invalid created_by')
+
+    if params.get('date_from'):
+        clients = clients.filter(created_at__date__gte=_parse_date(params['date_from'], 'from'))
+    if params.get('date_to'):
+        clients = clients.filter(created_at__date__lte=_parse_date(params['date_to'], 'to'))
+
+    is_active = params.get('is_active', '').lower()
+    if is_active in ('true', '1'):
+        clients = clients.filter(is_active=True)
+    elif is_active in ('false', '0'):
+        clients = clients.filter(is_active=False)
+    elif is_active:
+        raise ValueError('Invalid is_active, expected true or false')
+
+    client_type = params.get('client_type', '')
+    if client_type and client_type not in CLIENT_TYPES:
+        raise ValueError('Invalid client_type')
+
+    return clients, client_type
+
+
+def client_type_counts(clients):
+    """Count clients per type with one grouped aggregate; every type is present"""
+    counts = dict.fromkeys(CLIENT_TYPES, 0)
+    for row in clients.order_by().values('client_type').annotate(count=Count('id')):
+        counts[row['client_type']] = row['count']
+    return counts
+
+
+def serialize_client(client):
+    return {
+        'id': client.id,
+        'client_name': client.client_name,
+        'client_type': client.client_type,
+        'client_type_display': client.get_client_type_display(),
+        'search_property_title': client.search_property_title or '',
+        'email': client.email,
+        'mobile_no': client.mobile_no,
+        'whatsapp_no': client.whatsapp_no,
+        'is_active': client.is_active,
+        'created_at': client.created_at.strftime('%d/%m/%Y %H:%M'),
+        'created_by': client.created_by.full_name if client.created_by else 'System',
+    }
+
+
+def pick_clients(query, limit=CLIENT_PICKER_LIMIT):
+    """
+    (id, name, mobile) rows for the client typeahead.
+
+    Digits match the start of the indexed mobile number; anything else goes
+    through the client search documents. An empty query lists the newest
+    clients so the picker has something to show when it opens.
+    """
+    clients = Client.objects.all()
+    query = query.strip()
+    if query.isdigit():
+        clients = clients.filter(mobile_no__startswith=query)
+    elif query:
+        clients = search.search_filter(clients, search.CLIENT, query)
+    rows = clients.order_by('-created_at', '-id').values_list('id', 'client_name', 'mobile_no')[:limit]
+    return [{'id': client_id, 'name': name, 'mobile': mobile} for client_id, name, mobile in rows]
+
+
+# --- Bulk import ---
+
+# Spreadsheet header (normalized) -> Client field
+IMPORT_COLUMNS = {
+    'client_name': 'client_name', 'name': 'client_name', 'full_name': 'client_name',
+    'client_type': 'client_type', 'type': 'client_type',
+    'email': 'email', 'email_id': 'email',
+    'mobile_no': 'mobile_no', 'mobile': 'mobile_no', 'phone': 'mobile_no', 'mobile_number': 'mobile_no',
+    'another_mobile_no': 'another_mobile_no', 'alternate_mobile': 'another_mobile_no',
+    'whatsapp_no': 'whatsapp_no', 'whatsapp': 'whatsapp_no',
+    'pan_no': 'pan_no', 'pan': 'pan_no',
+    'adhar_card_no': 'adhar_card_no', 'aadhaar': 'adhar_card_no', 'aadhar': 'adhar_card_no',
+    'aadhaar_no': 'adhar_card_no', 'aadhar_card_no': 'adhar_card_no',
+    'search_property_title': 'search_property_title', 'property': 'search_property_title',
+    'address': 'address',
+    'approx_investment': 'approx_investment', 'investment': 'approx_investment',
+    'remark': 'remark', 'remarks': 'remark',
+}
+
+# SQLite ignores CharField lengths, PostgreSQL rejects the whole INSERT
+IMPORT_MAX_LENGTHS = {
+    field: Client._meta.get_field(field).max_length
+    for field in dict.fromkeys(IMPORT_COLUMNS.values())
+    if Client._meta.get_field(field).max_length
+}
+
+# Same rules as Client.clean()
+MOBILE_RE = re.compile(r'^\d{10}$')
+PAN_RE = re.compile(r'^[A-Z]{5}[0-9]{4}[A-Z]$')
+AADHAAR_RE = re.compile(r'^\d{12}$')
+
+
+def _header_key(value):
+    return re.sub(r'[^a-z0-9]+', '_', str(value or '').strip().lower()).strip('_')
+
+
+def _cell_text(value):
+    # Spreadsheets hand numbers back as int/float (9876543210.0)
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    return '' if value is None else str(value).strip()
+
+
+def _rows_from_table(header, rows):
+    columns = [IMPORT_COLUMNS.get(_header_key(name)) for name in header]
+    if 'client_name' not in columns or 'mobile_no' not in columns:
+        raise ValueError('The file needs at least a name and a mobile column')
+    for values in rows:
+        row = {}
+        for column, value in zip(columns, values):
+            if column and column not in row:
+                row[column] = _cell_text(value)
+        if any(row.values()):
+            yield row
+        else:
+            yield None
+
+
+def read_client_rows(source, filename):
+    """
+    Stream client dicts from an uploaded or opened (binary) CSV or XLSX file.
+
+    Headers are matched loosely (Name, Mobile, WhatsApp, PAN, Aadhaar, ...);
+    blank lines are yielded as None so row numbers stay aligned.
+    """
+    suffix = Path(filename).suffix.lower()
+    if suffix == '.csv':
+        reader = csv.reader(io.TextIOWrapper(source, encoding='utf-8-sig', newline=''))
+        header = next(reader, None)
+        if header is None:
+            return
+        yield from _rows_from_table(header, reader)
+    elif suffix == '.xlsx':
+        try:
+            from openpyxl import load_workbook
+        except ImportError:
+            raise ValueError('Install openpyxl to import .xlsx files')
+        try:
+            workbook = load_workbook(source, read_only=True, data_only=True)
+        except (OSError, KeyError, zipfile.BadZipFile) as e:
+            raise ValueError(f'Not a valid .xlsx workbook ({e})')
+        try:
+            rows = workbook.active.iter_rows(values_only=True)
+            header = next(rows, None)
+            if header is None:
+                return
+            yield from _rows_from_table(header, rows)
+        finally:
+            workbook.close()
+    else:
+        raise ValueError('Upload a .csv or .xlsx file')
+
+
+def _normalize_phone(value):
+    digits = re.sub(r'[\s\-()]', '', value)
+    if digits.startswith('+91'):
+        digits = digits[3:]
+    elif len(digits) == 12 and digits.startswith('91'):
+        digits = digits[2:]
+    elif len(digits) == 11 and digits.startswith('0'):
+        digits = digits[1:]
+    return digits
+
+
+def _validate_batch(batch, default_type, seen_mobiles):
+    """
+    Validate a batch of (row_number, row) pairs in one pass.
+
+    Returns (candidates, errors) where candidates are (row_number, field
+    values) ready for the duplicate check and errors maps row numbers to
+    messages. seen_mobiles carries the mobiles already taken by earlier rows
+    of the file.
+    """
+    candidates = []
+    errors = {}
+    for row_number, row in batch:
+        messages = []
+        values = {field: row.get(field, '') for field in set(IMPORT_COLUMNS.values())}
+
+        if not values['client_name']:
+            messages.append('Name is required')
+
+        for field, label in [('mobile_no', 'Mobile'), ('another_mobile_no', 'Another mobile'), ('whatsapp_no', 'WhatsApp')]:
+            values[field] = _normalize_phone(values[field]) if values[field] else ''
+            if values[field] and not MOBILE_RE.match(values[field]):
+                messages.append(f'{label} number must be exactly 10 digits')
+        if not values['mobile_no']:
+            messages.append('Mobile number is required')
+        # Lead lists rarely carry a separate WhatsApp column
+        values['whatsapp_no'] = values['whatsapp_no'] or values['mobile_no']
+
+        values['pan_no'] = values['pan_no'].upper()
+        if values['pan_no'] and not PAN_RE.match(values['pan_no']):
+            messages.append('PAN number must be in format ABCDE1234F')
+
+        values['adhar_card_no'] = re.sub(r'\s', '', values['adhar_card_no'])
+        if values['adhar_card_no'] and not AADHAAR_RE.match(values['adhar_card_no']):
+            messages.append('Aadhaar number must be exactly 12 digits')
+
+        try:
+            validate_email(values['email'])
+        except ValidationError:
+            messages.append('A valid email is required')
+
+        client_type = _header_key(values['client_type']) or default_type
+        if client_type not in CLIENT_TYPES:
+            messages.append(f"Unknown client type '{values['client_type']}'")
+        values['client_type'] = client_type
+
+        if values['approx_investment']:
+            # The model field's own checks: finite, max_digits and decimal_places
+            field = Client._meta.get_field('approx_investment')
+            try:
+                values['approx_investment'] = field.to_python(values['approx_investment'].replace(',', ''))
+            except ValidationError:
+                messages.append('Approx investment must be a number')
+            else:
+                try:
+                    field.run_validators(values['approx_investment'])
+                except ValidationError as e:
+                    messages.append(f"Approx investment: {' '.join(e.messages)}")
+        else:
+            values['approx_investment'] = None
+
+        for field, max_length in IMPORT_MAX_LENGTHS.items():
+            if len(values[field]) > max_length:
+                label = Client._meta.get_field(field).verbose_name.capitalize()
+                messages.append(f'{label} must be at most {max_length} characters')
+
+        if not messages and values['mobile_no'] in seen_mobiles:
+            messages.append(f"Mobile {values['mobile_no']} appears earlier in the file")
+
+        if messages:
+            errors[row_number] = messages
+        else:
+            seen_mobiles.add(values['mobile_no'])
+            candidates.append((row_number, values))
+    return candidates, errors
+
+
+def import_clients(rows, created_by=None, client_type='lead_generation', batch_size=CLIENT_IMPORT_BATCH_SIZE, dry_run=False):
+    """
+    Validate and insert clients from an iterable of row dicts.
+
+    Rows are consumed in batches: each batch is validated in one pass,
+    checked against existing mobile numbers with a single IN query and
+    written with bulk_create. Row numbers in the report count the header
+    as row 1, matching what spreadsheet users see.
+    Returns {'total', 'created', 'skipped', 'errors': [{'row', 'errors'}]}.
+    """
+    report = {'total': 0, 'created': 0, 'skipped': 0, 'errors': []}
+    seen_mobiles = set()
+
+    def flush(batch):
+        candidates, errors = _validate_batch(batch, client_type, seen_mobiles)
+        existing = set(Client.objects.filter(
+            mobile_no__in=[values['mobile_no'] for _, values in candidates]
+        ).values_list('mobile_no', flat=True))
+
+        clients = []
+        client_rows = []
+        for row_number, values in candidates:
+            if values['mobile_no'] in existing:
+                errors[row_number] = [f"A client with mobile {values['mobile_no']} already exists"]
+                continue
+            client_rows.append(row_number)
+            clients.append(Client(
+                client_type=values['client_type'],
+                search_property_title=values['search_property_title'] or None,
+                client_name=values['client_name'],
+                email=values['email'],
+                mobile_no=values['mobile_no'],
+                another_mobile_no=values['another_mobile_no'] or None,
+                whatsapp_no=values['whatsapp_no'],
+                pan_no=values['pan_no'] or None,
+                adhar_card_no=values['adhar_card_no'] or None,
+                address=values['address'] or None,
+                approx_investment=values['approx_investment'],
+                remark=values['remark'] or None,
+                created_by=created_by,
+            ))
+
+        if clients and not dry_run:
+            # bulk_create skips Client.save(), so index the new rows here
+            try:
+                with transaction.atomic():
+                    Client.objects.bulk_create(clients)
+                    search.index_objects(search.CLIENT, mobile_no__in=[client.mobile_no for client in clients])
+            except (ValidationError, DataError) as e:
+                # Only this batch is rolled back; earlier and later batches still import
+                message = f"Batch could not be saved: {' '.join(getattr(e, 'messages', [str(e)]))}"
+                for row_number in client_rows:
+                    errors[row_number] = [message]
+                clients = []
+        report['created'] += len(clients)
+        report['skipped'] += len(errors)
+        report['errors'].extend({'row': row_number, 'errors': messages} for row_number, messages in sorted(errors.items()))
+
+    batch = []
+    for row_number, row in enumerate(rows, start=2):
+        if row is None:
+            continue
+        report['total'] += 1
+        batch.append((row_number, row))
+        if len(batch) >= batch_size:
+            flush(batch)
+            batch = []
+    if batch:
+        flush(batch)
+    return report
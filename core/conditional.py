@@ -0,0 +1,97 @@
+from functools import wraps
+
+from django.db.models import Count, F, Max
+from django.db.models.signals import post_save, post_delete
+from django.utils import timezone
+from django.utils.cache import patch_cache_control
+from django.views.decorators.http import etag
+
+from .models import User, Task, Land, Client, ResourceVersion
+from .locations import location_version
+
+
+# Models whose writes bump a named version counter. Tables with an
+# updated_at column (clients, locations) are versioned from their own rows.
+VERSIONED_MODELS = {
+    Task: 'tasks',
+    User: 'users',
+    Land: 'lands',
+}
+
+
+def bump_resource_version(*names):
+    """Increment the version counters for the given resources"""
+    for name in names:
+        updated = ResourceVersion.objects.filter(name=name).update(
+            version=F('version') + 1, updated_at=timezone.now()
+        )
+        if not updated:
+            ResourceVersion.objects.get_or_create(name=name, defaults={'version': 1})
+
+
+def _counter_versions(*names):
+    versions = dict(ResourceVersion.objects.filter(name__in=names).values_list('name', 'version'))
+    return [f"{name}.{versions.get(name, 0)}" for name in names]
+
+
+def _client_version():
+    stats = Client.objects.aggregate(count=Count('id'), last=Max('updated_at'))
+    last = stats['last'].timestamp() if stats['last'] else 0
+    return f"clients.{stats['count']}.{last}"
+
+
+# Version token builders per resource; each returns a list of token parts
+RESOURCE_TOKENS = {
+    'tasks': lambda: _counter_versions('tasks'),
+    'employees': lambda: _counter_versions('users'),
+    'lands': lambda: _counter_versions('lands') + [f"locations.{location_version()[0]}"],
+    'clients': lambda: [_client_version()] + _counter_versions('users'),
+    'locations': lambda: [f"locations.{location_version()[0]}"],
+}
+
+
+def resource_etag(request, *resources):
+    """
+    Build the ETag for a response listing the given resources.
+
+    The requesting user's role is part of the tag because the same URL
+    answers differently (or refuses) depending on who asks.
+    """
+    parts = []
+    for resource in resources:
+        parts.extend(RESOURCE_TOKENS[resource]())
+    user = request.user
+    parts.append(f"{user.role}.{user.employee_type}" if user.is_authenticated else 'anonymous')
+    return '-'.join(parts)
+
+
+def conditional_resource(*resources):
+    """
+    Serve 304 Not Modified when the client's If-None-Match matches the
+    current version of the listed resources, skipping the query and
+    serialization work of the wrapped view.
+    """
+    def decorator(view_func):
+        conditional_view = etag(lambda request, *args, **kwargs: resource_etag(request, *resources))(view_func)
+
+        @wraps(view_func)
+        def _view(request, *args, **kwargs):
+            response = conditional_view(request, *args, **kwargs)
+            # Browsers keep the body but must revalidate it on every use
+            patch_cache_control(response, private=True, no_cache=True)
+            return response
+        return _view
+    return decorator
+
+
+def _bump_for_instance(sender, instance=None, update_fields=None, **kwargs):
+    # Logins only touch last_login, which none of the cached lists show
+    if update_fields is not None and set(update_fields) <= {'last_login'}:
+        return
+    bump_resource_version(VERSIONED_MODELS[sender])
+
+
+def connect_signals():
+    for model in VERSIONED_MODELS:
+        post_save.connect(_bump_for_instance, sender=model, dispatch_uid=f'resource_version_save_{model.__name__}')
+        post_delete.connect(_bump_for_instance, sender=model, dispatch_uid=f'resource_version_delete_{model.__name__}')
@@ -0,0 +1,252 @@
+import bisect
+import csv
+import hashlib
+import json
+import threading
+from pathlib import Path
+
+from django.db import connection, transaction
+from django.db.models import Count, F, Max
+
+from .caching import invalidate
+from .models import District, Taluka, Village
+
+
+# (version, json_bytes) of the precomputed bundle shared by all requests in this process
+_bundle_lock = threading.Lock()
+_bundle = (None, None)
+
+# (version, VillagePrefixIndex) used for typeahead on databases without a trigram index
+_village_index_lock = threading.Lock()
+_village_index = (None, None)
+
+VILLAGE_SEARCH_LIMIT = 10
+VILLAGE_SEARCH_MAX_LIMIT = 50
+
+DEFAULT_STATE = 'Gujarat'
+DEFAULT_LOCATIONS_FILE = Path(__file__).resolve().parent / 'data' / 'gujarat_locations.json'
+LOCATION_BATCH_SIZE = 1000
+
+
+def location_version():
+    """
+    Return (version, last_modified) for the District/Taluka/Village tables.
+
+    The version is derived from each table's row count and latest updated_at,
+    so it changes whenever a location is added, edited or removed - from any
+    worker, the admin or a management command - without a shared cache.
+    """
+    parts = []
+    last_modified = None
+    for model in (District, Taluka, Village):
+        stats = model.objects.aggregate(count=Count('id'), last=Max('updated_at'))
+        parts.append(f"{stats['count']}:{stats['last'].isoformat() if stats['last'] else ''}")
+        if stats['last'] and (last_modified is None or stats['last'] > last_modified):
+            last_modified = stats['last']
+    version = hashlib.sha1('|'.join(parts).encode()).hexdigest()[:16]
+    return version, last_modified
+
+
+def build_location_bundle(version):
+    """
+    Serialize the full hierarchy once.
+
+    Rows are compact [id, name, parent_id] lists (districts carry the state
+    instead) so thousands of villages stay small on the wire.
+    """
+    bundle = {
+        'version': version,
+        'districts': list(District.objects.order_by('name').values_list('id', 'name', 'state')),
+        'talukas': list(Taluka.objects.order_by('name').values_list('id', 'name', 'district_id')),
+        'villages': list(Village.objects.order_by('name').values_list('id', 'name', 'taluka_id')),
+    }
+    return json.dumps(bundle, separators=(',', ':')).encode()
+
+
+def get_location_bundle(version):
+    """Return the bundle bytes for version, rebuilding only when the version moved"""
+    global _bundle
+    bundle = _bundle
+    if bundle[0] != version:
+        with _bundle_lock:
+            bundle = _bundle
+            if bundle[0] != version:
+                bundle = (version, build_location_bundle(version))
+                _bundle = bundle
+    return bundle[1]
+
+
+class VillagePrefixIndex:
+    """Villages sorted by case-folded name so a prefix lookup is a bisect plus a short scan"""
+
+    def __init__(self, rows):
+        self.rows = sorted(rows, key=lambda row: (row['name'].casefold(), row['id']))
+        self.keys = [row['name'].casefold() for row in self.rows]
+
+    def search(self, prefix, taluka_id=None, district_id=None, limit=VILLAGE_SEARCH_LIMIT):
+        prefix = prefix.casefold()
+        results = []
+        for position in range(bisect.bisect_left(self.keys, prefix), len(self.keys)):
+            if not self.keys[position].startswith(prefix):
+                break
+            row = self.rows[position]
+            if taluka_id is not None and row['taluka_id'] != taluka_id:
+                continue
+            if district_id is not None and row['district_id'] != district_id:
+                continue
+            results.append(row)
+            if len(results) >= limit:
+                break
+        return results
+
+
+def _village_rows():
+    return Village.objects.values(
+        'id', 'name', 'taluka_id',
+        taluka_name=F('taluka__name'),
+        district_id=F('taluka__district_id'),
+        district_name=F('taluka__district__name'),
+    )
+
+
+def get_village_index(version):
+    """Return the in-memory prefix index for version, rebuilding only when the version moved"""
+    global _village_index
+    index = _village_index
+    if index[0] != version:
+        with _village_index_lock:
+            index = _village_index
+            if index[0] != version:
+                index = (version, VillagePrefixIndex(list(_village_rows())))
+                _village_index = index
+    return index[1]
+
+
+def search_villages(prefix, taluka_id=None, district_id=None, limit=VILLAGE_SEARCH_LIMIT):
+    """
+    Return up to limit villages whose name starts with prefix (case-insensitive),
+    optionally within a taluka or district, with their taluka and district.
+
+    PostgreSQL answers from the trigram index on the village name; other
+    databases use a per-process sorted prefix index keyed by the location version.
+    """
+    limit = max(1, min(limit, VILLAGE_SEARCH_MAX_LIMIT))
+    if connection.vendor == 'postgresql':
+        villages = _village_rows().filter(name__istartswith=prefix)
+        if taluka_id is not None:
+            villages = villages.filter(taluka_id=taluka_id)
+        if district_id is not None:
+            villages = villages.filter(taluka__district_id=district_id)
+        return list(villages.order_by('name', 'id')[:limit])
+
+    version, _ = location_version()
+    return get_village_index(version).search(prefix, taluka_id=taluka_id, district_id=district_id, limit=limit)
+
+
+def read_location_rows(path, file_format=None):
+    """
+    Read (state, district, taluka, village) tuples from a CSV or JSON file.
+
+    CSV files need district, taluka and village columns (state is optional;
+    taluka/village may be blank to declare only the parent). JSON files hold
+    a list of {"name", "state", "talukas": [{"name", "villages": [...]}]}
+    districts. The format is taken from the extension unless given.
+    """
+    path = Path(path)
+    file_format = (file_format or path.suffix.lstrip('.')).lower()
+    rows = []
+
+    if file_format == 'csv':
+        with path.open(newline='', encoding='utf-8-sig') as handle:
+            for record in csv.DictReader(handle):
+                rows.append((
+                    record.get('state') or DEFAULT_STATE,
+                    record.get('district', ''),
+                    record.get('taluka', ''),
+                    record.get('village', ''),
+                ))
+    elif file_format == 'json':
+        with path.open(encoding='utf-8') as handle:
+            districts = json.load(handle)
+        for district in districts:
+            state = district.get('state') or DEFAULT_STATE
+            rows.append((state, district['name'], '', ''))
+            for taluka in district.get('talukas', []):
+                rows.append((state, district['name'], taluka['name'], ''))
+                for village in taluka.get('villages', []):
+                    rows.append((state, district['name'], taluka['name'], village))
+    else:
+        raise ValueError(f'Unsupported location file format: {file_format}')
+
+    return [tuple((value or '').strip() for value in row) for row in rows]
+
+
+def load_location_rows(rows, batch_size=LOCATION_BATCH_SIZE, dry_run=False):
+    """
+    Insert the districts, talukas and villages named in rows that do not exist yet.
+
+    Existing rows are read once per level and diffed in memory, the missing
+    ones are written with bulk_create(ignore_conflicts=True) in batches, and
+    the whole load runs in one transaction, so re-running a file is a no-op.
+    Returns {level: {'inserted': n, 'skipped': n}} where skipped counts the
+    distinct names in the file that already existed.
+    """
+    districts = {}
+    talukas = set()
+    villages = set()
+    for state, district, taluka, village in rows:
+        if not district:
+            continue
+        districts.setdefault(district, state or DEFAULT_STATE)
+        if taluka:
+            talukas.add((district, taluka))
+            if village:
+                villages.add((district, taluka, village))
+
+    report = {level: {'inserted': 0, 'skipped': 0} for level in ('districts', 'talukas', 'villages')}
+
+    with transaction.atomic():
+        district_ids = dict(District.objects.filter(name__in=districts).values_list('name', 'id'))
+        new_districts = [District(name=name, state=state) for name, state in districts.items() if name not in district_ids]
+        District.objects.bulk_create(new_districts, batch_size=batch_size, ignore_conflicts=True)
+        report['districts'] = {'inserted': len(new_districts), 'skipped': len(districts) - len(new_districts)}
+        if new_districts:
+            district_ids = dict(District.objects.filter(name__in=districts).values_list('name', 'id'))
+
+        def existing_talukas():
+            return {
+                (district_id, name): taluka_id
+                for taluka_id, name, district_id in Taluka.objects.filter(
+                    district_id__in=district_ids.values()
+                ).values_list('id', 'name', 'district_id')
+            }
+
+        taluka_ids = existing_talukas()
+        new_talukas = [
+            Taluka(name=taluka, district_id=district_ids[district])
+            for district, taluka in sorted(talukas)
+            if (district_ids[district], taluka) not in taluka_ids
+        ]
+        Taluka.objects.bulk_create(new_talukas, batch_size=batch_size, ignore_conflicts=True)
+        report['talukas'] = {'inserted': len(new_talukas), 'skipped': len(talukas) - len(new_talukas)}
+        if new_talukas:
+            taluka_ids = existing_talukas()
+
+        existing_villages = set(Village.objects.filter(
+            taluka_id__in=taluka_ids.values()
+        ).values_list('taluka_id', 'name'))
+        new_villages = []
+        for district, taluka, village in sorted(villages):
+            taluka_id = taluka_ids[(district_ids[district], taluka)]
+            if (taluka_id, village) not in existing_villages:
+                new_villages.append(Village(name=village, taluka_id=taluka_id))
+        Village.objects.bulk_create(new_villages, batch_size=batch_size, ignore_conflicts=True)
+        report['villages'] = {'inserted': len(new_villages), 'skipped': len(villages) - len(new_villages)}
+
+        if dry_run:
+            transaction.set_rollback(True)
+        else:
+            # bulk_create sends no post_save
+            transaction.on_commit(lambda: invalidate('locations'))
+
+    return report
@@ -0,0 +1,30 @@
+from importlib import import_module
+
+from django.conf import settings
+from django.utils import timezone
+
+
+SESSION_CLEANUP_BATCH_SIZE = 1000
+SESSION_CLEANUP_INTERVAL = 60 * 60
+
+
+def clear_expired_sessions(batch_size=SESSION_CLEANUP_BATCH_SIZE):
+    """
+    Delete expired sessions and return how many rows were removed.
+
+    Database-backed engines are pruned in batches of session keys so a large
+    backlog never holds one long DELETE on the session table; other engines
+    (cache, signed cookies) expire on their own and get their clear_expired().
+    """
+    store = import_module(settings.SESSION_ENGINE).SessionStore
+    if not hasattr(store, 'get_model_class'):
+        store.clear_expired()
+        return 0
+
+    sessions = store.get_model_class().objects
+    deleted = 0
+    while True:
+        keys = list(sessions.filter(expire_date__lt=timezone.now()).values_list('session_key', flat=True)[:batch_size])
+        if not keys:
+            return deleted
+        deleted += sessions.filter(session_key__in=keys).delete()[0]
@@ -0,0 +1,40 @@
+from django.core.management.base import BaseCommand
+
+from core.caching import cache_is_process_local, cache_stats, invalidate, reset_cache_stats, CACHE_NAMESPACES
+
+
+class Command(BaseCommand):
+    help = 'Show hit/miss counters and versions for the core cache namespaces'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--reset', action='store_true', help='Zero the counters after printing them')
+        parser.add_argument(
+            '--invalidate',
+            nargs='+',
+            choices=list(CACHE_NAMESPACES),
+            metavar='NAMESPACE',
+            help='Drop every entry in these namespaces',
+        )
+
+    def handle(self, *args, **options):
+        if options['invalidate']:
+            # Versions live in the database, so this reaches every server process
+            invalidate(*options['invalidate'])
+            self.stdout.write(f"Invalidated {', '.join(options['invalidate'])}")
+
+        if cache_is_process_local():
+            self.stdout.write(self.style.WARNING(
+                'The cache backend is locmem: the hit/miss counters below are this '
+                "command's own process, not the servers'. Set CACHE_BACKEND=file or redis to share them."
+            ))
+        for namespace, stats in cache_stats().items():
+            lookups = stats['hits'] + stats['misses']
+            ratio = f"{stats['hits'] / lookups:.0%}" if lookups else '-'
+            self.stdout.write(
+                f"{namespace:<16} hits {stats['hits']:>8}  misses {stats['misses']:>8}  "
+                f"hit rate {ratio:>5}  version {stats['version']}"
+            )
+
+        if options['reset']:
+            reset_cache_stats()
+            self.stdout.write('Counters reset')
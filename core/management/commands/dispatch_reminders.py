@@ -0,0 +1,65 @@
+import datetime
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from core.reminders import DISPATCH_INTERVAL, REMINDER_BATCH_SIZE, dispatch_due_reminders
+
+
+class Command(BaseCommand):
+    help = 'Send notifications for reminders as they fall due (runs until stopped unless --once is given)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='Deliver everything due now and exit, e.g. from cron',
+        )
+        parser.add_argument(
+            '--interval',
+            type=int,
+            default=DISPATCH_INTERVAL,
+            help=f'Seconds between scans (default {DISPATCH_INTERVAL})',
+        )
+        parser.add_argument(
+            '--lookahead',
+            type=int,
+            default=0,
+            help='Also deliver reminders due within this many seconds, so they are not late by up to one interval',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=REMINDER_BATCH_SIZE,
+            help=f'Reminders delivered per transaction (default {REMINDER_BATCH_SIZE})',
+        )
+
+    def dispatch(self, options):
+        delivered = dispatch_due_reminders(
+            lookahead=datetime.timedelta(seconds=options['lookahead']),
+            batch_size=options['batch_size'],
+        )
+        if delivered:
+            self.stdout.write(f'Delivered {delivered} reminder(s)')
+        return delivered
+
+    def handle(self, *args, **options):
+        if options['once']:
+            self.dispatch(options)
+            return
+
+        self.stdout.write(f"Dispatching reminders every {options['interval']}s")
+        try:
+            while True:
+                started = time.monotonic()
+                # Long-running loop: drop connections past CONN_MAX_AGE or broken by a restart
+                close_old_connections()
+                try:
+                    self.dispatch(options)
+                except Exception as e:
+                    self.stderr.write(f'Reminder dispatch failed: {e}')
+                close_old_connections()
+                time.sleep(max(0, options['interval'] - (time.monotonic() - started)))
+        except KeyboardInterrupt:
+            self.stdout.write('Stopped')
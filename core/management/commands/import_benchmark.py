@@ -0,0 +1,59 @@
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+
+# Modules that should only load when a report or import actually runs
+HEAVY_MODULES = ('reportlab', 'PIL', 'openpyxl')
+
+PROBE = '''
+import importlib, json, sys, time
+started = time.perf_counter()
+import django
+django.setup()
+setup_done = time.perf_counter()
+importlib.import_module(sys.argv[1])
+finished = time.perf_counter()
+print(json.dumps({
+    'setup': setup_done - started,
+    'module': finished - setup_done,
+    'heavy': sorted({name.split('.')[0] for name in sys.modules} & set(sys.argv[2:])),
+}))
+'''
+
+
+class Command(BaseCommand):
+    help = 'Time django.setup() and importing the URLconf in fresh interpreters (worker boot cost)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--runs', type=int, default=5, help='Fresh interpreters to start (default 5)')
+        parser.add_argument(
+            '--module',
+            default=settings.ROOT_URLCONF,
+            help=f'Module to import after setup (default {settings.ROOT_URLCONF})',
+        )
+
+    def handle(self, *args, **options):
+        env = {**os.environ, 'DJANGO_SETTINGS_MODULE': settings.SETTINGS_MODULE}
+        samples = []
+        for _ in range(options['runs']):
+            result = subprocess.run(
+                [sys.executable, '-c', PROBE, options['module'], *HEAVY_MODULES],
+                capture_output=True, text=True, env=env, cwd=settings.BASE_DIR,
+            )
+            if result.returncode:
+                raise CommandError(result.stderr.strip().splitlines()[-1] if result.stderr else 'Import failed')
+            samples.append(json.loads(result.stdout.strip().splitlines()[-1]))
+
+        for phase in ('setup', 'module'):
+            times = [sample[phase] * 1000 for sample in samples]
+            self.stdout.write(
+                f"{phase:<7} median {statistics.median(times):7.1f} ms   min {min(times):7.1f} ms   max {max(times):7.1f} ms"
+            )
+        heavy = samples[-1]['heavy']
+        self.stdout.write(f"Heavy modules loaded: {', '.join(heavy) if heavy else 'none'}")
@@ -0,0 +1,81 @@
+import csv
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from core.clients import CLIENT_IMPORT_BATCH_SIZE, CLIENT_TYPES, read_client_rows, import_clients
+from core.models import User
+
+
+class Command(BaseCommand):
+    help = 'Bulk import clients from a CSV or XLSX file, skipping invalid rows and existing mobile numbers'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='CSV or XLSX file with a header row (name, mobile, email, ...)')
+        parser.add_argument(
+            '--created-by',
+            help='Username recorded as the creator of the imported clients',
+        )
+        parser.add_argument(
+            '--client-type',
+            choices=CLIENT_TYPES,
+            default='lead_generation',
+            help='Type for rows without a client type column (default lead_generation)',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=CLIENT_IMPORT_BATCH_SIZE,
+            help=f'Rows validated and inserted per batch (default {CLIENT_IMPORT_BATCH_SIZE})',
+        )
+        parser.add_argument(
+            '--errors-csv',
+            help='Write the rejected rows and their reasons to this CSV file',
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Validate the file and report without writing anything',
+        )
+
+    def handle(self, *args, **options):
+        created_by = None
+        if options['created_by']:
+            try:
+                created_by = User.objects.get(username=options['created_by'])
+            except User.DoesNotExist:
+                raise CommandError(f"User {options['created_by']} does not exist")
+
+        started = time.monotonic()
+        try:
+            with open(options['path'], 'rb') as handle:
+                report = import_clients(
+                    read_client_rows(handle, options['path']),
+                    created_by=created_by,
+                    client_type=options['client_type'],
+                    batch_size=options['batch_size'],
+                    dry_run=options['dry_run'],
+                )
+        except (OSError, ValueError, UnicodeDecodeError) as e:
+            raise CommandError(f"Could not read {options['path']}: {e}")
+
+        for error in report['errors'][:20]:
+            self.stdout.write(self.style.WARNING(f"  Row {error['row']}: {'; '.join(error['errors'])}"))
+        if len(report['errors']) > 20:
+            self.stdout.write(f"  ... and {len(report['errors']) - 20} more")
+
+        if options['errors_csv'] and report['errors']:
+            with open(options['errors_csv'], 'w', newline='', encoding='utf-8') as handle:
+                writer = csv.writer(handle)
+                writer.writerow(['row', 'errors'])
+                for error in report['errors']:
+                    writer.writerow([error['row'], '; '.join(error['errors'])])
+            self.stdout.write(f"Error report written to {options['errors_csv']}")
+
+        elapsed = time.monotonic() - started
+        counts = f"{report['created']} of {report['total']} rows"
+        skipped = f"{report['skipped']} skipped ({elapsed:.2f}s)"
+        if options['dry_run']:
+            self.stdout.write(self.style.WARNING(f'Dry run - {counts} would be imported, {skipped}'))
+        else:
+            self.stdout.write(self.style.SUCCESS(f'Imported {counts}, {skipped}'))
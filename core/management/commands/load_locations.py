@@ -0,0 +1,52 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from core.locations import DEFAULT_LOCATIONS_FILE, LOCATION_BATCH_SIZE, read_location_rows, load_location_rows
+
+
+class Command(BaseCommand):
+    help = 'Load districts, talukas and villages from a CSV or JSON file (safe to re-run)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'path',
+            nargs='?',
+            default=str(DEFAULT_LOCATIONS_FILE),
+            help='CSV (state,district,taluka,village columns) or JSON file; defaults to the bundled Gujarat data',
+        )
+        parser.add_argument(
+            '--format',
+            choices=['csv', 'json'],
+            help='File format, when it cannot be taken from the extension',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=LOCATION_BATCH_SIZE,
+            help=f'Rows per INSERT statement (default {LOCATION_BATCH_SIZE})',
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Report what would be inserted without writing anything',
+        )
+
+    def handle(self, *args, **options):
+        started = time.monotonic()
+        try:
+            rows = read_location_rows(options['path'], options['format'])
+        except (OSError, ValueError, KeyError) as e:
+            raise CommandError(f"Could not read {options['path']}: {e}")
+
+        self.stdout.write(f"Read {len(rows)} rows from {options['path']}")
+        report = load_location_rows(rows, batch_size=options['batch_size'], dry_run=options['dry_run'])
+
+        for level, counts in report.items():
+            self.stdout.write(f"  {level.capitalize()}: {counts['inserted']} inserted, {counts['skipped']} already present")
+
+        elapsed = time.monotonic() - started
+        if options['dry_run']:
+            self.stdout.write(self.style.WARNING(f'Dry run - nothing was written ({elapsed:.2f}s)'))
+        else:
+            self.stdout.write(self.style.SUCCESS(f'Locations loaded in {elapsed:.2f}s'))
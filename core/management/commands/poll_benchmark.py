@@ -0,0 +1,119 @@
+import asyncio
+import statistics
+import time
+from importlib import import_module
+from urllib.parse import urlsplit
+
+from django.conf import settings
+from django.contrib.auth import BACKEND_SESSION_KEY, HASH_SESSION_KEY, SESSION_KEY
+from django.core.management.base import BaseCommand, CommandError
+
+from core.models import User
+
+
+# The lightweight read endpoints every open page polls
+POLL_ENDPOINTS = ['/chat/unread_count', '/notifications/user/', '/api/reminders/']
+
+
+async def _get(host, port, path, cookie):
+    """One HTTP/1.1 GET on a fresh connection; returns the status code"""
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        writer.write(
+            f'GET {path} HTTP/1.1\r\nHost: {host}\r\nCookie: {cookie}\r\n'
+            'Accept: application/json\r\nConnection: close\r\n\r\n'.encode()
+        )
+        await writer.drain()
+        status_line = await reader.readline()
+        await reader.read()
+    finally:
+        writer.close()
+    parts = status_line.split()
+    return int(parts[1]) if len(parts) > 1 else 0
+
+
+# Compare the two deployments with the same worker count, e.g.
+#   gunicorn crm_project.wsgi -w 2 -b 127.0.0.1:8001
+#   gunicorn crm_project.asgi -k uvicorn.workers.UvicornWorker -w 2 -b 127.0.0.1:8002
+#   python manage.py poll_benchmark --user admin --url http://127.0.0.1:8001
+#   python manage.py poll_benchmark --user admin --url http://127.0.0.1:8002
+class Command(BaseCommand):
+    help = (
+        'Hold many concurrent polling clients against a running server and report '
+        'throughput and latency; run once against the WSGI and once against the ASGI deployment'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--url', default='http://127.0.0.1:8000', help='Server to poll (default http://127.0.0.1:8000)')
+        parser.add_argument('--user', required=True, help='Username to poll as (a session is created for it)')
+        parser.add_argument('--clients', type=int, default=200, help='Concurrent polling clients (default 200)')
+        parser.add_argument('--duration', type=float, default=10, help='Seconds to poll for (default 10)')
+        parser.add_argument('--interval', type=float, default=0.5, help='Seconds each client waits between polls (default 0.5)')
+        parser.add_argument('--timeout', type=float, default=10, help='Seconds before a poll counts as failed (default 10)')
+        parser.add_argument('--endpoint', action='append', dest='endpoints', help='Path to poll; repeatable (default: the chat, notification and reminder polls)')
+
+    def session_cookie(self, username):
+        try:
+            user = User.objects.get(username=username)
+        except User.DoesNotExist:
+            raise CommandError(f'User "{username}" not found')
+        session = import_module(settings.SESSION_ENGINE).SessionStore()
+        session[SESSION_KEY] = user._meta.pk.value_to_string(user)
+        session[BACKEND_SESSION_KEY] = settings.AUTHENTICATION_BACKENDS[0]
+        session[HASH_SESSION_KEY] = user.get_session_auth_hash()
+        session.create()
+        return session, f'{settings.SESSION_COOKIE_NAME}={session.session_key}'
+
+    def handle(self, *args, **options):
+        url = urlsplit(options['url'])
+        host, port = url.hostname or '127.0.0.1', url.port or 80
+        endpoints = options['endpoints'] or POLL_ENDPOINTS
+        session, cookie = self.session_cookie(options['user'])
+        try:
+            results = asyncio.run(self.poll(host, port, cookie, endpoints, options))
+        finally:
+            session.delete()
+
+        elapsed = results.pop('elapsed')
+        total = sum(len(stats['latencies']) for stats in results.values())
+        errors = sum(stats['errors'] for stats in results.values())
+        self.stdout.write(
+            f"{options['clients']} clients for {elapsed:.1f}s against {options['url']}: "
+            f"{total} ok, {errors} failed, {total / elapsed:.1f} req/s"
+        )
+        for path, stats in results.items():
+            latencies = sorted(stats['latencies'])
+            if not latencies:
+                self.stdout.write(f"{path:<24} no successful responses ({stats['errors']} failed)")
+                continue
+            p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+            self.stdout.write(
+                f"{path:<24} {len(latencies):6d} ok {stats['errors']:5d} failed   "
+                f"p50 {statistics.median(latencies) * 1000:7.1f} ms   p95 {p95 * 1000:7.1f} ms   "
+                f"max {latencies[-1] * 1000:7.1f} ms"
+            )
+
+    async def poll(self, host, port, cookie, endpoints, options):
+        results = {path: {'latencies': [], 'errors': 0} for path in endpoints}
+        started = time.perf_counter()
+        deadline = started + options['duration']
+
+        async def client(number):
+            position = number
+            while time.perf_counter() < deadline:
+                path = endpoints[position % len(endpoints)]
+                position += 1
+                sent = time.perf_counter()
+                try:
+                    status = await asyncio.wait_for(_get(host, port, path, cookie), options['timeout'])
+                except (OSError, asyncio.TimeoutError):
+                    status = 0
+                if status == 200:
+                    results[path]['latencies'].append(time.perf_counter() - sent)
+                else:
+                    results[path]['errors'] += 1
+                await asyncio.sleep(options['interval'])
+
+        await asyncio.gather(*(client(number) for number in range(options['clients'])))
+        results['elapsed'] = time.perf_counter() - started
+        return results
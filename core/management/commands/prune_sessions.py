@@ -0,0 +1,50 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from core.maintenance import SESSION_CLEANUP_BATCH_SIZE, SESSION_CLEANUP_INTERVAL, clear_expired_sessions
+
+
+class Command(BaseCommand):
+    help = 'Delete expired sessions in batches (once, or repeatedly with --loop)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--loop',
+            action='store_true',
+            help='Keep running and prune every --interval seconds instead of exiting',
+        )
+        parser.add_argument(
+            '--interval',
+            type=int,
+            default=SESSION_CLEANUP_INTERVAL,
+            help=f'Seconds between runs with --loop (default {SESSION_CLEANUP_INTERVAL})',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=SESSION_CLEANUP_BATCH_SIZE,
+            help=f'Sessions deleted per statement (default {SESSION_CLEANUP_BATCH_SIZE})',
+        )
+
+    def prune(self, options):
+        deleted = clear_expired_sessions(batch_size=options['batch_size'])
+        self.stdout.write(f'Deleted {deleted} expired session(s)')
+
+    def handle(self, *args, **options):
+        if not options['loop']:
+            self.prune(options)
+            return
+
+        try:
+            while True:
+                close_old_connections()
+                try:
+                    self.prune(options)
+                except Exception as e:
+                    self.stderr.write(f'Session cleanup failed: {e}')
+                close_old_connections()
+                time.sleep(options['interval'])
+        except KeyboardInterrupt:
+            self.stdout.write('Stopped')
@@ -0,0 +1,17 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from core.models import SearchDocument
+from core.search import rebuild_index
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the land, client and assigned task search documents and drop stale ones'
+
+    def handle(self, *args, **options):
+        started = time.monotonic()
+        rebuild_index()
+        self.stdout.write(self.style.SUCCESS(
+            f'Indexed {SearchDocument.objects.count()} search documents in {time.monotonic() - started:.2f}s'
+        ))
@@ -0,0 +1,18 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from core.reporting import rebuild_stats
+
+
+# Saves and deletes keep the stats current; run this nightly (cron) to fold
+# in lands moved between districts and any change made without the model signals
+class Command(BaseCommand):
+    help = 'Recompute the daily task throughput and SLA stats from the assigned tasks'
+
+    def handle(self, *args, **options):
+        started = time.monotonic()
+        rows = rebuild_stats()
+        self.stdout.write(self.style.SUCCESS(
+            f'Rebuilt {rows} task stat rows in {time.monotonic() - started:.2f}s'
+        ))
@@ -0,0 +1,34 @@
+from django.db import migrations
+
+
+# Expression matches the UPPER("name"::text) LIKE UPPER(...) that Django emits
+# for name__istartswith on PostgreSQL, so prefix typeahead uses the index.
+CREATE_INDEX = (
+    'CREATE INDEX IF NOT EXISTS core_village_name_trgm '
+    'ON core_village USING gin (UPPER("name"::text) gin_trgm_ops)'
+)
+DROP_INDEX = 'DROP INDEX IF EXISTS core_village_name_trgm'
+
+
+def create_trigram_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    schema_editor.execute(CREATE_INDEX)
+
+
+def drop_trigram_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(DROP_INDEX)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0002_resourceversion'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_index, drop_trigram_index),
+    ]
@@ -0,0 +1,122 @@
+import unicodedata
+
+from django.db import migrations, models
+
+
+SQLITE_FTS = [
+    # External-content FTS5 table kept in sync with core_searchdocument by triggers
+    """CREATE VIRTUAL TABLE core_searchdocument_fts USING fts5(
+        document, content='core_searchdocument', content_rowid='id',
+        tokenize="unicode61 categories 'L* N* Co M*'"
+    )""",
+    """CREATE TRIGGER core_searchdocument_ai AFTER INSERT ON core_searchdocument BEGIN
+        INSERT INTO core_searchdocument_fts(rowid, document) VALUES (new.id, new.document);
+    END""",
+    """CREATE TRIGGER core_searchdocument_ad AFTER DELETE ON core_searchdocument BEGIN
+        INSERT INTO core_searchdocument_fts(core_searchdocument_fts, rowid, document) VALUES ('delete', old.id, old.document);
+    END""",
+    """CREATE TRIGGER core_searchdocument_au AFTER UPDATE ON core_searchdocument BEGIN
+        INSERT INTO core_searchdocument_fts(core_searchdocument_fts, rowid, document) VALUES ('delete', old.id, old.document);
+        INSERT INTO core_searchdocument_fts(rowid, document) VALUES (new.id, new.document);
+    END""",
+]
+
+SQLITE_FTS_DROP = [
+    'DROP TRIGGER IF EXISTS core_searchdocument_ai',
+    'DROP TRIGGER IF EXISTS core_searchdocument_ad',
+    'DROP TRIGGER IF EXISTS core_searchdocument_au',
+    'DROP TABLE IF EXISTS core_searchdocument_fts',
+]
+
+# Must stay identical to the expression matched in core.search.matching_documents
+POSTGRES_INDEX = (
+    "CREATE INDEX IF NOT EXISTS core_searchdocument_document_gin "
+    "ON core_searchdocument USING gin (to_tsvector('simple', document))"
+)
+
+
+def sqlite_has_fts5(schema_editor):
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute("SELECT sqlite_compileoption_used('ENABLE_FTS5')")
+        return bool(cursor.fetchone()[0])
+
+
+def create_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == 'postgresql':
+        schema_editor.execute(POSTGRES_INDEX)
+    elif vendor == 'sqlite' and sqlite_has_fts5(schema_editor):
+        for statement in SQLITE_FTS:
+            schema_editor.execute(statement)
+
+
+def drop_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == 'postgresql':
+        schema_editor.execute('DROP INDEX IF EXISTS core_searchdocument_document_gin')
+    elif vendor == 'sqlite':
+        for statement in SQLITE_FTS_DROP:
+            schema_editor.execute(statement)
+
+
+# Frozen copy of the core.search indexing as of this migration, so the
+# initial fill does not change when that module does
+INDEX_BATCH_SIZE = 1000
+
+SEARCH_SOURCES = {
+    'land': ('Land', ['name', 'old_sr_no', 'new_sr_no', 'village__name', 'taluka__name', 'district__name']),
+    'client': ('Client', ['client_name', 'email', 'mobile_no', 'another_mobile_no', 'whatsapp_no', 'pan_no']),
+    'assigned_task': ('AssignedTask', ['task__name', 'land__name', 'land__village__name', 'employee__full_name', 'employee__username']),
+}
+
+
+def search_terms(text):
+    text = str(text or '').casefold()
+    return ''.join(ch if unicodedata.category(ch)[0] in 'LNM' else ' ' for ch in text).split()
+
+
+def build_search_documents(apps, schema_editor):
+    document_model = apps.get_model('core', 'SearchDocument')
+    for kind, (model_name, columns) in SEARCH_SOURCES.items():
+        rows = apps.get_model('core', model_name).objects.values_list('id', *columns).order_by()
+        batch = []
+        for object_id, *values in rows.iterator(chunk_size=INDEX_BATCH_SIZE):
+            title = f"{values[0]} - {values[1]}" if kind == 'assigned_task' else str(values[0] or '')
+            batch.append(document_model(
+                kind=kind,
+                object_id=object_id,
+                title=title[:255],
+                document=' '.join(search_terms(' '.join(str(value) for value in values if value))),
+            ))
+            if len(batch) >= INDEX_BATCH_SIZE:
+                document_model.objects.bulk_create(batch)
+                batch = []
+        document_model.objects.bulk_create(batch)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0003_village_name_trigram_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchDocument',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('land', 'Land'), ('client', 'Client'), ('assigned_task', 'Assigned Task')], max_length=20)),
+                ('object_id', models.PositiveBigIntegerField()),
+                ('title', models.CharField(max_length=255)),
+                ('document', models.TextField()),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Search Document',
+                'verbose_name_plural': 'Search Documents',
+                'unique_together': {('kind', 'object_id')},
+            },
+        ),
+        migrations.RunPython(create_search_index, drop_search_index),
+        migrations.RunPython(build_search_documents, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,53 @@
+# Generated by Django 5.2.18 on 2026-10-19 14:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0004_searchdocument'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='client',
+            name='mobile_no',
+            field=models.CharField(db_index=True, max_length=15),
+        ),
+        migrations.AlterField(
+            model_name='client',
+            name='pan_no',
+            field=models.CharField(blank=True, db_index=True, max_length=20, null=True),
+        ),
+        migrations.AlterField(
+            model_name='installment',
+            name='payment_reference',
+            field=models.CharField(blank=True, db_index=True, help_text='Cheque number, transaction ID, etc.', max_length=255),
+        ),
+        migrations.AlterField(
+            model_name='installment',
+            name='utr_reference',
+            field=models.CharField(blank=True, db_index=True, help_text='UTR reference number', max_length=100),
+        ),
+        migrations.AlterField(
+            model_name='land',
+            name='new_sr_no',
+            field=models.CharField(db_index=True, default='', max_length=50),
+        ),
+        migrations.AlterField(
+            model_name='land',
+            name='old_sr_no',
+            field=models.CharField(db_index=True, default='', max_length=50),
+        ),
+        migrations.AlterField(
+            model_name='landsale',
+            name='buyer_contact',
+            field=models.CharField(blank=True, db_index=True, help_text='Contact number of buyer', max_length=20),
+        ),
+        migrations.AlterField(
+            model_name='user',
+            name='mobile',
+            field=models.CharField(blank=True, db_index=True, max_length=20),
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.18 on 2026-10-19 15:07
+
+from django.db import migrations, models
+from django.utils import timezone
+
+
+def mark_overdue_delivered(apps, schema_editor):
+    # Reminders already overdue were surfaced by the reminder list; only ones
+    # falling due after this migration should produce notifications.
+    Reminder = apps.get_model('core', 'Reminder')
+    Reminder.objects.filter(status='pending', reminder_time__lte=timezone.now()).update(delivered_at=timezone.now())
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0006_client_list_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='reminder',
+            name='delivered_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='reminder',
+            index=models.Index(fields=['status', 'reminder_time'], name='reminder_status_time_idx'),
+        ),
+        migrations.RunPython(mark_overdue_delivered, migrations.RunPython.noop),
+    ]
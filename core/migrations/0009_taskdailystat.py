@@ -0,0 +1,104 @@
+# Generated by Django 5.2.18 on 2026-10-19 15:48
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.utils import timezone
+
+
+# Frozen copy of the core.reporting rebuild as of this migration, so the
+# initial fill does not change when that module or the schema does
+REPORT_BATCH_SIZE = 1000
+
+COUNTERS = [
+    'assigned', 'started', 'submitted', 'completed', 'completed_on_time', 'completed_late',
+    'work_seconds', 'work_count', 'approval_seconds', 'approval_count',
+]
+
+SOURCE_COLUMNS = [
+    'employee_id', 'task_id', 'land__district_id', 'status', 'assigned_date', 'started_date',
+    'completion_submitted_date', 'completed_date', 'admin_approval_date', 'due_date',
+]
+
+
+def _day(value):
+    return timezone.localtime(value).date() if timezone.is_aware(value) else value.date()
+
+
+def _seconds(start, end):
+    return int((end - start).total_seconds())
+
+
+def _add_row(stats, row):
+    employee_id, task_id, district_id, status, assigned, started, submitted, completed, approved, due = row
+
+    def add(when, **counts):
+        bucket = stats.setdefault((_day(when), employee_id, task_id, district_id), dict.fromkeys(COUNTERS, 0))
+        for counter, amount in counts.items():
+            bucket[counter] += amount
+
+    if assigned:
+        add(assigned, assigned=1)
+    if started:
+        add(started, started=1)
+    if submitted:
+        add(submitted, submitted=1)
+        if started and submitted >= started:
+            add(submitted, work_seconds=_seconds(started, submitted), work_count=1)
+    if status != 'complete':
+        return
+    if completed:
+        counts = {'completed': 1}
+        if due:
+            counts['completed_on_time' if completed <= due else 'completed_late'] = 1
+        add(completed, **counts)
+    if approved and submitted and approved >= submitted:
+        add(approved, approval_seconds=_seconds(submitted, approved), approval_count=1)
+
+
+def build_task_stats(apps, schema_editor):
+    stat_model = apps.get_model('core', 'TaskDailyStat')
+    stats = {}
+    rows = apps.get_model('core', 'AssignedTask').objects.values_list(*SOURCE_COLUMNS).order_by()
+    for row in rows.iterator(chunk_size=REPORT_BATCH_SIZE):
+        _add_row(stats, row)
+    stat_model.objects.bulk_create([
+        stat_model(day=day, employee_id=employee_id, task_id=task_id, district_id=district_id, **counters)
+        for (day, employee_id, task_id, district_id), counters in stats.items()
+    ], batch_size=REPORT_BATCH_SIZE)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0008_row_updated_at'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TaskDailyStat',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('assigned', models.PositiveIntegerField(default=0)),
+                ('started', models.PositiveIntegerField(default=0)),
+                ('submitted', models.PositiveIntegerField(default=0)),
+                ('completed', models.PositiveIntegerField(default=0)),
+                ('completed_on_time', models.PositiveIntegerField(default=0)),
+                ('completed_late', models.PositiveIntegerField(default=0)),
+                ('work_seconds', models.PositiveBigIntegerField(default=0)),
+                ('work_count', models.PositiveIntegerField(default=0)),
+                ('approval_seconds', models.PositiveBigIntegerField(default=0)),
+                ('approval_count', models.PositiveIntegerField(default=0)),
+                ('district', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='task_daily_stats', to='core.district')),
+                ('employee', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='task_daily_stats', to=settings.AUTH_USER_MODEL)),
+                ('task', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_stats', to='core.task')),
+            ],
+            options={
+                'verbose_name': 'Task Daily Stat',
+                'verbose_name_plural': 'Task Daily Stats',
+                'unique_together': {('day', 'employee', 'task', 'district')},
+            },
+        ),
+        migrations.RunPython(build_task_stats, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 5.2.18 on 2026-10-19 16:20
+
+from django.db import migrations, models
+
+
+# buyer_name__istartswith and full_name__istartswith compile to
+# UPPER("col"::text) LIKE UPPER(...) on PostgreSQL; text_pattern_ops lets a
+# btree on the same expression answer the prefix match under any collation.
+NAME_INDEXES = [
+    ('core_landsale_buyer_name_upper_like', 'core_landsale', 'buyer_name'),
+    ('core_user_full_name_upper_like', 'core_user', 'full_name'),
+]
+
+
+def create_name_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for name, table, column in NAME_INDEXES:
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS {name} ON {table} (UPPER("{column}"::text) text_pattern_ops)'
+        )
+
+
+def drop_name_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for name, table, column in NAME_INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS {name}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0009_taskdailystat'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='client',
+            name='whatsapp_no',
+            field=models.CharField(db_index=True, max_length=15),
+        ),
+        migrations.RunPython(create_name_indexes, drop_name_indexes),
+    ]
@@ -47,7 +47,7 @@ class User(AbstractBaseUser, PermissionsMixin):
     employee_type = models.CharField(max_length=20, choices=EMPLOYEE_TYPE_CHOICES, blank=True)
     full_name = models.CharField(max_length=255, blank=True)
     email = models.EmailField(unique=True, blank=True)
-    mobile = models.CharField(max_length=20, blank=True)
+    mobile = models.CharField(max_length=20, blank=True, db_index=True)
     location = models.CharField(max_length=255, blank=True, help_text="Area covered")
     address = models.TextField(blank=True)
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='active')
@@ -61,6 +61,8 @@ class User(AbstractBaseUser, PermissionsMixin):
     is_active = models.BooleanField(default=True)
     date_joined = models.DateTimeField(default=timezone.now)
     last_login = models.DateTimeField(blank=True, null=True)
+    # Keys the cached employee table rows
+    updated_at = models.DateTimeField(auto_now=True)
     
     objects = UserManager()
     
@@ -214,8 +216,8 @@ class Land(models.Model):
     village = models.ForeignKey(Village, on_delete=models.CASCADE, related_name='lands')
     
     # Identification Numbers
-    old_sr_no = models.CharField(max_length=50, default='')
-    new_sr_no = models.CharField(max_length=50, default='')
+    old_sr_no = models.CharField(max_length=50, default='', db_index=True)
+    new_sr_no = models.CharField(max_length=50, default='', db_index=True)
     
     # Land Type/Area Details
     sata_prakar = models.CharField(max_length=255)  # Removed choices constraint to allow dynamic values
@@ -246,6 +248,8 @@ class Land(models.Model):
         ('archived', 'Archived'),
     ]
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='active')
+    # Keys the cached land table rows
+    updated_at = models.DateTimeField(auto_now=True)
     
     def __str__(self):
         return f"Land {self.id} - {self.name} - {self.village.name}, {self.taluka.name}"
@@ -373,7 +377,7 @@ class AssignedTask(models.Model):
         """Mark the task as in progress"""
         self.status = 'in_progress'
         self.started_date = datetime.datetime.now()
-        self.save()
+        self.save(update_fields=['status', 'started_date'])
     
     def submit_for_approval(self, notes='', photos=None, pdf=None):
         """Submit task for admin approval"""
@@ -385,7 +389,9 @@ class AssignedTask(models.Model):
             if pdf:
                 self.completion_pdf = pdf
             self.completion_submitted_date = datetime.datetime.now()
-            self.save()
+            self.save(update_fields=[
+                'status', 'completion_notes', 'completion_photos', 'completion_pdf', 'completion_submitted_date'
+            ])
             print(f"Task {self.id} submitted for approval successfully")
         except Exception as e:
             print(f"Error in submit_for_approval: {str(e)}")
@@ -399,7 +405,7 @@ class AssignedTask(models.Model):
         self.completed_date = datetime.datetime.now()
         self.admin_approval_date = datetime.datetime.now()
         self.admin_approval_notes = admin_notes
-        self.save()
+        self.save(update_fields=['status', 'completed_date', 'admin_approval_date', 'admin_approval_notes'])
     
     def reject_completion(self, admin_notes=''):
         """Admin rejects task completion"""
@@ -409,7 +415,10 @@ class AssignedTask(models.Model):
         self.completion_pdf = None
         self.completion_submitted_date = None
         self.admin_approval_notes = admin_notes
-        self.save()
+        self.save(update_fields=[
+            'status', 'completion_notes', 'completion_photos', 'completion_pdf',
+            'completion_submitted_date', 'admin_approval_notes'
+        ])
     
     def mark_pending(self):
         """Mark the task as pending"""
@@ -422,7 +431,10 @@ class AssignedTask(models.Model):
         self.completion_submitted_date = None
         self.admin_approval_date = None
         self.admin_approval_notes = ''
-        self.save()
+        self.save(update_fields=[
+            'status', 'started_date', 'completed_date', 'completion_notes', 'completion_photos',
+            'completion_pdf', 'completion_submitted_date', 'admin_approval_date', 'admin_approval_notes'
+        ])
     
     def save(self, *args, **kwargs):
         """Override save method to automatically calculate due_date"""
@@ -431,6 +443,9 @@ class AssignedTask(models.Model):
         if self.completion_days > 0 and not self.due_date:
             from datetime import timedelta
             self.due_date = self.assigned_date + timedelta(days=self.completion_days)
+            # Make sure a partial save still persists the computed due date
+            if kwargs.get('update_fields') is not None:
+                kwargs['update_fields'] = {*kwargs['update_fields'], 'due_date'}
         
         super().save(*args, **kwargs)
 
@@ -450,7 +465,7 @@ class LandSale(models.Model):
     client = models.ForeignKey('Client', on_delete=models.SET_NULL, null=True, blank=True, related_name='land_sales', help_text="Client who purchased the land")
     marketing_employee = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, blank=True, related_name='marketing_sales', help_text="Marketing employee who handled the sale")
     buyer_name = models.CharField(max_length=255, help_text="Name of the buyer")
-    buyer_contact = models.CharField(max_length=20, blank=True, help_text="Contact number of buyer")
+    buyer_contact = models.CharField(max_length=20, blank=True, db_index=True, help_text="Contact number of buyer")
     buyer_address = models.TextField(blank=True, help_text="Address of the buyer")
     
     # Sale details (amount fields removed)
@@ -506,7 +521,7 @@ class Installment(models.Model):
     
     # Payment details
     payment_type = models.CharField(max_length=20, choices=PAYMENT_TYPE_CHOICES, default='cash')
-    payment_reference = models.CharField(max_length=255, blank=True, help_text="Cheque number, transaction ID, etc.")
+    payment_reference = models.CharField(max_length=255, blank=True, db_index=True, help_text="Cheque number, transaction ID, etc.")
     
     # Dates
     due_date = models.DateField(help_text="Due date for this installment")
@@ -520,7 +535,7 @@ class Installment(models.Model):
     # Payment record fields (merged from PaymentRecord model)
     rtgs_number = models.CharField(max_length=100, blank=True, help_text="RTGS number")
     from_bank = models.CharField(max_length=255, blank=True, help_text="Sender bank name")
-    utr_reference = models.CharField(max_length=100, blank=True, help_text="UTR reference number")
+    utr_reference = models.CharField(max_length=100, blank=True, db_index=True, help_text="UTR reference number")
     ifsc_code = models.CharField(max_length=11, blank=True, help_text="IFSC code")
     bank_name = models.CharField(max_length=255, blank=True, help_text="Bank name")
     cheque_photo = models.ImageField(upload_to='payment_photos/', blank=True, null=True, help_text="Cheque photo")
@@ -570,10 +585,10 @@ class Client(models.Model):
     
     # Contact Information
     email = models.EmailField()
-    mobile_no = models.CharField(max_length=15)
+    mobile_no = models.CharField(max_length=15, db_index=True)
     another_mobile_no = models.CharField(max_length=15, blank=True, null=True)
-    whatsapp_no = models.CharField(max_length=15)
-    pan_no = models.CharField(max_length=20, blank=True, null=True)
+    whatsapp_no = models.CharField(max_length=15, db_index=True)
+    pan_no = models.CharField(max_length=20, blank=True, null=True, db_index=True)
     adhar_card_no = models.CharField(max_length=20, blank=True, null=True)
     
     # Address and Investment Details
@@ -599,6 +614,10 @@ class Client(models.Model):
         ordering = ['-created_at']
         verbose_name = "Client"
         verbose_name_plural = "Clients"
+        indexes = [
+            models.Index(fields=['-created_at'], name='client_created_idx'),
+            models.Index(fields=['client_type', '-created_at'], name='client_type_created_idx'),
+        ]
     
     def __str__(self):
         return f"{self.client_name} ({self.get_client_type_display()})"
@@ -671,12 +690,17 @@ class Reminder(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     completed_at = models.DateTimeField(null=True, blank=True)
+    # Set by the reminder dispatcher once the due notification has been sent
+    delivered_at = models.DateTimeField(null=True, blank=True)
     
     class Meta:
         db_table = 'core_reminder'
         ordering = ['-reminder_time', '-created_at']
         verbose_name = "Reminder"
         verbose_name_plural = "Reminders"
+        indexes = [
+            models.Index(fields=['status', 'reminder_time'], name='reminder_status_time_idx'),
+        ]
     
     def __str__(self):
         return f"{self.title} - {self.reminder_time.strftime('%d/%m/%Y %H:%M')}"
@@ -689,3 +713,77 @@ class Reminder(models.Model):
         self.completed_at = timezone.now()
         self.save()
 
+
+
+# --- Resource Version Model ---
+class ResourceVersion(models.Model):
+    """Version counter bumped whenever a cached list resource changes (see core/conditional.py)"""
+    name = models.CharField(max_length=50, unique=True)
+    version = models.PositiveBigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "Resource Version"
+        verbose_name_plural = "Resource Versions"
+
+    def __str__(self):
+        return f"{self.name} v{self.version}"
+
+
+# --- Search Document Model ---
+class SearchDocument(models.Model):
+    """Denormalized, normalized search text for one Land, Client or AssignedTask (see core/search.py)"""
+    KIND_CHOICES = [
+        ('land', 'Land'),
+        ('client', 'Client'),
+        ('assigned_task', 'Assigned Task'),
+    ]
+    kind = models.CharField(max_length=20, choices=KIND_CHOICES)
+    object_id = models.PositiveBigIntegerField()
+    title = models.CharField(max_length=255)
+    document = models.TextField()
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "Search Document"
+        verbose_name_plural = "Search Documents"
+        unique_together = ['kind', 'object_id']
+
+    def __str__(self):
+        return f"{self.get_kind_display()} #{self.object_id}: {self.title}"
+
+
+# --- Task Reporting Model ---
+class TaskDailyStat(models.Model):
+    """
+    One day's AssignedTask throughput and SLA totals for an employee, task and
+    district, kept current from task state changes (see core/reporting.py)
+    """
+    day = models.DateField()
+    employee = models.ForeignKey(User, on_delete=models.CASCADE, related_name='task_daily_stats')
+    task = models.ForeignKey(Task, on_delete=models.CASCADE, related_name='daily_stats')
+    district = models.ForeignKey(District, on_delete=models.CASCADE, related_name='task_daily_stats')
+
+    # Tasks that reached each step on this day
+    assigned = models.PositiveIntegerField(default=0)
+    started = models.PositiveIntegerField(default=0)
+    submitted = models.PositiveIntegerField(default=0)
+    completed = models.PositiveIntegerField(default=0)
+    # Completions with a due date, split by whether they met it
+    completed_on_time = models.PositiveIntegerField(default=0)
+    completed_late = models.PositiveIntegerField(default=0)
+    # Start -> submission time of the day's submissions
+    work_seconds = models.PositiveBigIntegerField(default=0)
+    work_count = models.PositiveIntegerField(default=0)
+    # Submission -> admin approval time of the day's approvals
+    approval_seconds = models.PositiveBigIntegerField(default=0)
+    approval_count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        verbose_name = "Task Daily Stat"
+        verbose_name_plural = "Task Daily Stats"
+        # Leads with day, so it also serves the date range reads
+        unique_together = ['day', 'employee', 'task', 'district']
+
+    def __str__(self):
+        return f"{self.day}: task {self.task_id}, employee {self.employee_id}, district {self.district_id}"
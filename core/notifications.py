@@ -0,0 +1,71 @@
+from django.dispatch import Signal
+from django.utils import timezone
+
+from .models import User, Notification
+
+
+# Sent once per notify() call with the list of Notification rows that were
+# actually written. Push delivery (web push, SMS, email) should connect here
+# instead of hooking every view that creates notifications.
+notifications_created = Signal()
+
+
+def _recipient_id(recipient):
+    return recipient if isinstance(recipient, int) else recipient.pk
+
+
+def notify(recipients, message, coalesce_window=None):
+    """
+    Create one Notification per recipient in a single bulk insert.
+
+    recipients: iterable of User instances or user ids
+    message: a string, or a callable taking the recipient and returning the string
+    coalesce_window: optional timedelta; recipients who already received the
+        same message within the window are skipped
+    """
+    pairs = []
+    for recipient in recipients:
+        text = message(recipient) if callable(message) else message
+        pairs.append((_recipient_id(recipient), text))
+    return notify_many(pairs, coalesce_window=coalesce_window)
+
+
+def notify_many(pairs, coalesce_window=None):
+    """
+    Create notifications from (recipient, message) pairs in a single bulk insert.
+
+    Duplicate pairs in the batch are collapsed, and with coalesce_window set,
+    pairs already delivered within the window are skipped as well.
+    """
+    seen = set()
+    rows = []
+    for recipient, text in pairs:
+        key = (_recipient_id(recipient), text[:255])
+        if key not in seen:
+            seen.add(key)
+            rows.append(key)
+
+    if not rows:
+        return []
+
+    if coalesce_window is not None:
+        recent = set(Notification.objects.filter(
+            user_id__in={user_id for user_id, _ in rows},
+            message__in={text for _, text in rows},
+            timestamp__gte=timezone.now() - coalesce_window,
+        ).values_list('user_id', 'message'))
+        rows = [row for row in rows if row not in recent]
+        if not rows:
+            return []
+
+    notifications = Notification.objects.bulk_create([
+        Notification(user_id=user_id, message=text) for user_id, text in rows
+    ])
+    notifications_created.send(sender=Notification, notifications=notifications)
+    return notifications
+
+
+def notify_admins(message, coalesce_window=None):
+    """Notify every admin user; the admin ids are resolved in the same pass."""
+    admin_ids = User.objects.filter(role='admin').values_list('id', flat=True)
+    return notify(admin_ids, message, coalesce_window=coalesce_window)
@@ -0,0 +1,98 @@
+from functools import wraps
+
+from asgiref.sync import sync_to_async
+from django.contrib import messages
+from django.contrib.auth import logout
+from django.contrib.auth.views import redirect_to_login
+from django.http import JsonResponse
+from django.shortcuts import redirect
+
+from .models import User
+
+
+def is_admin(user):
+    return user.role == 'admin'
+
+
+def is_marketing_or_admin(user):
+    return user.role == 'admin' or (user.role == 'employee' and user.employee_type == 'marketing')
+
+
+def _denied(api):
+    if api:
+        return JsonResponse({'success': False, 'message': 'Unauthorized'}, status=403)
+    return redirect('login')
+
+
+def _role_required(check, view_func):
+    """
+    Build a view decorator that also does login_required's job.
+
+    Anonymous users are sent to the login page; authenticated users failing
+    check get a 403 JSON body for api views or a redirect to login for pages.
+    Usable bare (@admin_required) or with options (@admin_required(api=True)).
+    """
+    def decorator(view_func):
+        @wraps(view_func)
+        def _view(request, *args, **kwargs):
+            if not request.user.is_authenticated:
+                return redirect_to_login(request.get_full_path())
+            denied = check(request)
+            if denied is not None:
+                return denied
+            return view_func(request, *args, **kwargs)
+        return _view
+
+    if view_func is not None:
+        return decorator(view_func)
+    return decorator
+
+
+def admin_required(view_func=None, api=False):
+    return _role_required(lambda request: None if is_admin(request.user) else _denied(api), view_func)
+
+
+def marketing_or_admin_required(view_func=None, api=False):
+    return _role_required(lambda request: None if is_marketing_or_admin(request.user) else _denied(api), view_func)
+
+
+def active_employee_required(view_func=None, employee_type=None, api=False):
+    """Employees only (optionally of one employee_type); inactive accounts are logged out"""
+    def check(request):
+        user = request.user
+        if user.role != 'employee' or (employee_type and user.employee_type != employee_type):
+            return _denied(api)
+        if user.status != 'active':
+            if api:
+                return JsonResponse({'success': False, 'message': 'Your account is inactive'}, status=403)
+            messages.error(request, 'Your account is inactive. Please contact administrator.')
+            logout(request)
+            return redirect('login')
+        return None
+    return _role_required(check, view_func)
+
+
+def primary_admin():
+    """
+    (id, username) of the admin employees chat with, or None when there is no admin.
+
+    Not cached: an indexed one-row lookup costs the same as reading a cache
+    version, and a per-worker copy would miss admins and employees added
+    through another worker.
+    """
+    return User.objects.filter(role='admin').order_by('id').values_list('id', 'username').first()
+
+
+def employee_usernames():
+    """{id: username} of every employee, read fresh like primary_admin()"""
+    return dict(User.objects.filter(role='employee').order_by('id').values_list('id', 'username'))
+
+
+async def aprimary_admin():
+    """primary_admin() for async views"""
+    return await sync_to_async(primary_admin)()
+
+
+async def aemployee_usernames():
+    """employee_usernames() for async views"""
+    return await sync_to_async(employee_usernames)()
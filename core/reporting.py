@@ -0,0 +1,280 @@
+import datetime
+import threading
+from contextlib import contextmanager
+
+from django.apps import apps as global_apps
+from django.db import transaction
+from django.db.models import Q, Sum
+from django.db.models.signals import pre_save, post_save, post_delete
+from django.utils import timezone
+
+from .models import AssignedTask, TaskDailyStat
+
+
+REPORT_BATCH_SIZE = 1000
+# (employee, task) scopes recomputed per query
+REFRESH_CHUNK_SIZE = 100
+
+STAT_KEY = ['day', 'employee', 'task', 'district']
+COUNTERS = [
+    'assigned', 'started', 'submitted', 'completed', 'completed_on_time', 'completed_late',
+    'work_seconds', 'work_count', 'approval_seconds', 'approval_count',
+]
+
+# AssignedTask columns the stats are computed from
+SOURCE_COLUMNS = [
+    'employee_id', 'task_id', 'land__district_id', 'status', 'assigned_date', 'started_date',
+    'completion_submitted_date', 'completed_date', 'admin_approval_date', 'due_date',
+]
+# The steps' dates; a row counts towards the days these fall on
+DATE_COLUMNS = SOURCE_COLUMNS[4:9]
+SOURCE_FIELDS = {
+    'employee', 'employee_id', 'task', 'task_id', 'land', 'land_id', 'status', 'assigned_date', 'started_date',
+    'completion_submitted_date', 'completed_date', 'admin_approval_date', 'due_date',
+}
+
+# group: (stats columns grouped on, ordering)
+REPORT_GROUPS = {
+    'employee': (['employee_id', 'employee__full_name', 'employee__username'], ['employee__full_name', 'employee__username']),
+    'task': (['task_id', 'task__name', 'task__position'], ['task__position', 'task__name']),
+    'district': (['district_id', 'district__name'], ['district__name']),
+    'day': (['day'], ['day']),
+}
+
+
+def _day(value):
+    return timezone.localtime(value).date() if timezone.is_aware(value) else value.date()
+
+
+def _seconds(start, end):
+    return int((end - start).total_seconds())
+
+
+def _add_row(stats, row):
+    """
+    Count one AssignedTask row (SOURCE_COLUMNS values) into stats, a dict of
+    (day, employee_id, task_id, district_id) -> counters. Each step counts on
+    the day it happened; durations count on the day they ended.
+    """
+    employee_id, task_id, district_id, status, assigned, started, submitted, completed, approved, due = row
+
+    def add(when, **counts):
+        bucket = stats.setdefault((_day(when), employee_id, task_id, district_id), dict.fromkeys(COUNTERS, 0))
+        for counter, amount in counts.items():
+            bucket[counter] += amount
+
+    if assigned:
+        add(assigned, assigned=1)
+    if started:
+        add(started, started=1)
+    if submitted:
+        add(submitted, submitted=1)
+        if started and submitted >= started:
+            add(submitted, work_seconds=_seconds(started, submitted), work_count=1)
+    if status != 'complete':
+        return
+    if completed:
+        counts = {'completed': 1}
+        if due:
+            counts['completed_on_time' if completed <= due else 'completed_late'] = 1
+        add(completed, **counts)
+    if approved and submitted and approved >= submitted:
+        add(approved, approval_seconds=_seconds(submitted, approved), approval_count=1)
+
+
+def _row_days(row):
+    return {_day(value) for value in row[4:9] if value}
+
+
+def stat_scopes(scopes=None, **filters):
+    """
+    Add the (employee_id, task_id) -> days that the AssignedTask rows
+    matching filters count towards to scopes (a new dict when None).
+
+    Collect scopes before and after changing tasks, then pass the union to
+    refresh_stats, so days a task leaves are recomputed as well as the days
+    it reaches.
+    """
+    scopes = {} if scopes is None else scopes
+    rows = AssignedTask.objects.filter(**filters).values_list(*SOURCE_COLUMNS).order_by()
+    for row in rows.iterator(chunk_size=REPORT_BATCH_SIZE):
+        scopes.setdefault(row[:2], set()).update(_row_days(row))
+    return scopes
+
+
+def _on_days(days):
+    """AssignedTask rows with a step on any of days (local dates, like _day)"""
+    query = Q()
+    for column in DATE_COLUMNS:
+        query |= Q(**{f'{column}__date__in': days})
+    return query
+
+
+def refresh_stats(scopes):
+    """
+    Recompute the stats rows of each (employee_id, task_id) -> days in scopes
+    from the AssignedTask rows with a step on those days.
+
+    Rows are upserted on the unique key and only the ones left empty are
+    deleted, so two saves refreshing the same day at once cannot collide.
+    """
+    scopes = [(scope, days) for scope, days in scopes.items() if days]
+    for start in range(0, len(scopes), REFRESH_CHUNK_SIZE):
+        chunk = dict(scopes[start:start + REFRESH_CHUNK_SIZE])
+        sources = Q()
+        targets = Q()
+        for (employee_id, task_id), days in chunk.items():
+            sources |= Q(employee_id=employee_id, task_id=task_id) & _on_days(days)
+            targets |= Q(employee_id=employee_id, task_id=task_id, day__in=days)
+
+        stats = {}
+        for row in AssignedTask.objects.filter(sources).values_list(*SOURCE_COLUMNS).order_by():
+            _add_row(stats, row)
+        stats = {key: counters for key, counters in stats.items() if key[0] in chunk[key[1:3]]}
+        with transaction.atomic():
+            TaskDailyStat.objects.bulk_create([
+                TaskDailyStat(day=day, employee_id=employee_id, task_id=task_id, district_id=district_id, **counters)
+                for (day, employee_id, task_id, district_id), counters in stats.items()
+            ], batch_size=REPORT_BATCH_SIZE, update_conflicts=True, unique_fields=STAT_KEY, update_fields=COUNTERS)
+            existing = TaskDailyStat.objects.filter(targets).values_list('id', 'day', 'employee_id', 'task_id', 'district_id')
+            emptied = [row[0] for row in existing if row[1:] not in stats]
+            if emptied:
+                TaskDailyStat.objects.filter(id__in=emptied).delete()
+
+
+def rebuild_stats(get_model=global_apps.get_model):
+    """
+    Recompute every stats row from AssignedTask: the initial fill, and the
+    repair for changes the incremental refresh does not follow (a land moved
+    to another district, queryset deletes of AssignedTask, raw SQL).
+    """
+    task_model = get_model('core', 'AssignedTask')
+    stat_model = get_model('core', 'TaskDailyStat')
+
+    stats = {}
+    rows = task_model.objects.values_list(*SOURCE_COLUMNS).order_by()
+    for row in rows.iterator(chunk_size=REPORT_BATCH_SIZE):
+        _add_row(stats, row)
+    with transaction.atomic():
+        stat_model.objects.all().delete()
+        stat_model.objects.bulk_create([
+            stat_model(day=day, employee_id=employee_id, task_id=task_id, district_id=district_id, **counters)
+            for (day, employee_id, task_id, district_id), counters in stats.items()
+        ], batch_size=REPORT_BATCH_SIZE)
+    return len(stats)
+
+
+# --- Reading reports ---
+
+DEFAULT_REPORT_DAYS = 30
+
+
+def report_range(start=None, end=None):
+    """Parse ?start=/?end= (YYYY-MM-DD); defaults to the last DEFAULT_REPORT_DAYS days. Raises ValueError."""
+    end = datetime.date.fromisoformat(end) if end else timezone.localdate()
+    start = datetime.date.fromisoformat(start) if start else end - datetime.timedelta(days=DEFAULT_REPORT_DAYS - 1)
+    if start > end:
+        raise ValueError('start is after end')
+    return start, end
+
+
+def _with_rates(row):
+    on_time, late = row['completed_on_time'], row['completed_late']
+    row['on_time_rate'] = round(on_time * 100 / (on_time + late), 1) if on_time + late else None
+    row['avg_work_hours'] = round(row['work_seconds'] / row['work_count'] / 3600, 1) if row['work_count'] else None
+    row['avg_approval_hours'] = (
+        round(row['approval_seconds'] / row['approval_count'] / 3600, 1) if row['approval_count'] else None
+    )
+    return row
+
+
+def _label(group, row):
+    if group == 'employee':
+        full_name, username = row.pop('employee__full_name'), row.pop('employee__username')
+        return full_name or username
+    if group == 'task':
+        row.pop('task__position')
+        return row.pop('task__name')
+    if group == 'district':
+        return row.pop('district__name')
+    return row['day'].isoformat()
+
+
+def task_report(start, end, group=None, **filters):
+    """
+    Task throughput and SLA totals for start..end (inclusive), read only from
+    TaskDailyStat: one dict for the whole range, or a list of dicts per
+    employee, task, district or day when group is given. Rates and averages
+    are None when nothing was measured.
+    """
+    stats = TaskDailyStat.objects.filter(day__range=(start, end), **filters)
+    sums = {counter: Sum(counter, default=0) for counter in COUNTERS}
+    if group is None:
+        return _with_rates(stats.aggregate(**sums))
+
+    columns, ordering = REPORT_GROUPS[group]
+    rows = []
+    for row in stats.values(*columns).annotate(**sums).order_by(*ordering):
+        row['label'] = _label(group, row)
+        rows.append(_with_rates(row))
+    return rows
+
+
+# --- Keeping stats current ---
+
+def _touches(update_fields):
+    return update_fields is None or bool(set(update_fields) & SOURCE_FIELDS)
+
+
+def _assigned_task_saving(sender, instance, update_fields=None, raw=False, **kwargs):
+    # The days the task counted towards before this save
+    if instance.pk is not None and not raw and _touches(update_fields):
+        instance._stat_scopes = stat_scopes(id=instance.pk)
+
+
+def _assigned_task_saved(sender, instance, update_fields=None, raw=False, **kwargs):
+    if raw or not _touches(update_fields):
+        return
+    scopes = instance.__dict__.pop('_stat_scopes', None)
+    refresh_stats(stat_scopes(scopes, id=instance.pk))
+
+
+_deferred = threading.local()
+
+
+@contextmanager
+def deferred_refresh():
+    """
+    Collect the stats refreshes of the AssignedTask deletes made inside the
+    block (a land delete cascades to every task on the land) and run them as
+    one refresh_stats at the end. Nothing is refreshed if the block raises.
+    """
+    if getattr(_deferred, 'scopes', None) is not None:
+        yield
+        return
+    _deferred.scopes = scopes = {}
+    try:
+        yield
+    finally:
+        _deferred.scopes = None
+    refresh_stats(scopes)
+
+
+def _assigned_task_deleted(sender, instance, **kwargs):
+    # The deleted row's own dates give the days it counted towards
+    scope = (instance.employee_id, instance.task_id)
+    days = {_day(getattr(instance, column)) for column in DATE_COLUMNS if getattr(instance, column)}
+    deferred = getattr(_deferred, 'scopes', None)
+    if deferred is None:
+        refresh_stats({scope: days})
+    else:
+        deferred.setdefault(scope, set()).update(days)
+
+
+def connect_signals():
+    # Deletes of single tasks and lands refresh here; bulk_delete_lands
+    # batches them with deferred_refresh. Employee, task and district deletes
+    # cascade to their own stats rows.
+    pre_save.connect(_assigned_task_saving, sender=AssignedTask, dispatch_uid='reporting_assigned_task_saving')
+    post_save.connect(_assigned_task_saved, sender=AssignedTask, dispatch_uid='reporting_assigned_task_saved')
+    post_delete.connect(_assigned_task_deleted, sender=AssignedTask, dispatch_uid='reporting_assigned_task_deleted')
@@ -0,0 +1,362 @@
+import unicodedata
+
+from django.apps import apps as global_apps
+from django.db import connection
+from django.db.models import BooleanField, Q
+from django.db.models.expressions import RawSQL
+from django.db.models.signals import post_save, post_delete
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.http import urlencode
+
+from .models import User, Task, Land, Client, AssignedTask, District, Taluka, Village, SearchDocument, LandSale, Installment
+
+
+LAND = 'land'
+CLIENT = 'client'
+ASSIGNED_TASK = 'assigned_task'
+
+SEARCH_KINDS = [LAND, CLIENT, ASSIGNED_TASK]
+
+INDEX_BATCH_SIZE = 1000
+FTS_TABLE = 'core_searchdocument_fts'
+
+# kind: (model name, columns read for the title and document)
+SEARCH_SOURCES = {
+    LAND: ('Land', ['name', 'old_sr_no', 'new_sr_no', 'village__name', 'taluka__name', 'district__name']),
+    CLIENT: ('Client', ['client_name', 'email', 'mobile_no', 'another_mobile_no', 'whatsapp_no', 'pan_no']),
+    ASSIGNED_TASK: ('AssignedTask', ['task__name', 'land__name', 'land__village__name', 'employee__full_name', 'employee__username']),
+}
+
+
+def search_terms(text):
+    """
+    Split text into lowercase word tokens.
+
+    Letters, digits and combining marks (Gujarati vowel signs) form words;
+    everything else separates them, so documents and queries are tokenized
+    the same way on every database.
+    """
+    text = str(text or '').casefold()
+    return ''.join(ch if unicodedata.category(ch)[0] in 'LNM' else ' ' for ch in text).split()
+
+
+def _title(kind, values):
+    if kind == ASSIGNED_TASK:
+        return f"{values[0]} - {values[1]}"[:255]
+    return str(values[0] or '')[:255]
+
+
+def index_objects(kind, get_model=global_apps.get_model, **filters):
+    """
+    Rebuild the search documents of the kind's rows matching filters
+    (all rows when no filter is given) with batched upserts.
+    """
+    model_name, columns = SEARCH_SOURCES[kind]
+    model = get_model('core', model_name)
+    document_model = get_model('core', 'SearchDocument')
+    now = timezone.now()
+
+    rows = model.objects.filter(**filters).values_list('id', *columns).order_by().iterator(chunk_size=INDEX_BATCH_SIZE)
+    batch = []
+    for object_id, *values in rows:
+        batch.append(document_model(
+            kind=kind,
+            object_id=object_id,
+            title=_title(kind, values),
+            document=' '.join(search_terms(' '.join(str(value) for value in values if value))),
+            updated_at=now,
+        ))
+        if len(batch) >= INDEX_BATCH_SIZE:
+            _upsert(document_model, batch)
+            batch = []
+    if batch:
+        _upsert(document_model, batch)
+
+
+def _upsert(document_model, documents):
+    document_model.objects.bulk_create(
+        documents,
+        update_conflicts=True,
+        unique_fields=['kind', 'object_id'],
+        update_fields=['title', 'document', 'updated_at'],
+    )
+
+
+def rebuild_index(get_model=global_apps.get_model):
+    """Reindex every kind and drop documents whose row no longer exists"""
+    document_model = get_model('core', 'SearchDocument')
+    for kind, (model_name, _) in SEARCH_SOURCES.items():
+        index_objects(kind, get_model=get_model)
+        live_ids = get_model('core', model_name).objects.values('id')
+        document_model.objects.filter(kind=kind).exclude(object_id__in=live_ids).delete()
+
+
+_fts_available = None
+
+
+def _has_fts_table():
+    global _fts_available
+    if _fts_available is None:
+        _fts_available = FTS_TABLE in connection.introspection.table_names()
+    return _fts_available
+
+
+def matching_documents(kind, query):
+    """
+    SearchDocument queryset of the kind whose text contains every query word
+    as a word prefix. PostgreSQL uses the GIN to_tsvector index, SQLite the
+    FTS5 table; other databases fall back to a LIKE per word.
+    """
+    terms = search_terms(query)
+    documents = SearchDocument.objects.filter(kind=kind)
+    if not terms:
+        return documents.none()
+
+    if connection.vendor == 'postgresql':
+        # Same expression as the core_searchdocument_document_gin index
+        return documents.filter(RawSQL(
+            "to_tsvector('simple', document) @@ to_tsquery('simple', %s)",
+            [' & '.join(f'{term}:*' for term in terms)],
+            output_field=BooleanField(),
+        ))
+
+    if connection.vendor == 'sqlite' and _has_fts_table():
+        return documents.filter(id__in=RawSQL(
+            f'SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s',
+            [' '.join(f'"{term}"*' for term in terms)],
+        ))
+
+    for term in terms:
+        documents = documents.filter(document__icontains=term)
+    return documents
+
+
+def live_documents(kind, query):
+    """matching_documents limited to documents whose row still exists (see connect_signals)"""
+    model = global_apps.get_model('core', SEARCH_SOURCES[kind][0])
+    return matching_documents(kind, query).filter(object_id__in=model.objects.values('id'))
+
+
+def search_filter(queryset, kind, query):
+    """Narrow queryset to the rows whose search document matches query"""
+    return queryset.filter(id__in=matching_documents(kind, query).values('object_id'))
+
+
+# --- Quick search ---
+
+QUICK_SEARCH_LIMIT = 5
+QUICK_SEARCH_MAX_LIMIT = 20
+QUICK_SEARCH_MIN_LENGTH = 2
+
+# Hit ranks: an identifier equal to the query, an identifier starting with it, a text match
+RANK_EXACT, RANK_PREFIX, RANK_TEXT = 0, 1, 2
+
+
+def _identifier_query(fields, query):
+    """startswith on each (indexed) identifier column, as typed and upper-cased (PAN, UTR)"""
+    condition = Q()
+    for field in fields:
+        for variant in {query, query.upper()}:
+            condition |= Q(**{f'{field}__startswith': variant})
+    return condition
+
+
+def _identifier_rank(instance, fields, query):
+    query = query.upper()
+    values = [str(getattr(instance, field) or '').upper() for field in fields]
+    return RANK_EXACT if query in values else RANK_PREFIX
+
+
+def _collect(hits, seen, kind, instances, rank, describe):
+    for instance in instances:
+        if (kind, instance.id) in seen:
+            continue
+        seen.add((kind, instance.id))
+        hit = {'kind': kind, 'id': instance.id, 'rank': rank(instance) if callable(rank) else rank}
+        hit.update(describe(instance))
+        hits.append(hit)
+
+
+def _describe_land(user):
+    def describe(land):
+        return {
+            'title': land.name,
+            'subtitle': f"Old S.No. {land.old_sr_no or '-'}, New S.No. {land.new_sr_no or '-'} - {land.village.name}",
+            'url': reverse('land-tasks', args=[land.id]) if user.role == 'admin' else reverse('inventory_land'),
+        }
+    return describe
+
+
+def _describe_client(client):
+    return {
+        'title': client.client_name,
+        'subtitle': ' - '.join(value for value in [client.mobile_no, client.pan_no] if value),
+        'url': f"{reverse('admin-clients')}?{urlencode({'search': client.mobile_no})}",
+    }
+
+
+def _describe_land_sale(sale):
+    return {
+        'title': sale.buyer_name,
+        'subtitle': f"{sale.land.name} - {sale.get_status_display()}",
+        'url': reverse('sold_land'),
+    }
+
+
+def _describe_installment(installment):
+    return {
+        'title': f"Installment {installment.installment_number} - {installment.land_sale.land.name}",
+        'subtitle': ' - '.join(value for value in [
+            installment.utr_reference and f"UTR {installment.utr_reference}",
+            installment.payment_reference,
+            installment.get_status_display(),
+        ] if value),
+        'url': reverse('land_installments'),
+    }
+
+
+def _describe_user(user):
+    return {
+        'title': user.get_display_name(),
+        'subtitle': f"{user.username} - {user.get_role_display()}",
+        'url': reverse('admin-employees'),
+    }
+
+
+def quick_search(user, query, limit=QUICK_SEARCH_LIMIT):
+    """
+    Ranked hits across lands, clients, land sales, installments and users.
+
+    Identifier columns (survey numbers, mobile and WhatsApp numbers, PAN,
+    buyer contact, UTR and payment references, username) are matched by
+    indexed prefix; buyer and employee names by a case-insensitive prefix
+    on an UPPER() index (PostgreSQL, migration 0010); other names go through
+    the search documents. Every query is capped at limit rows, so
+    the cost is bounded regardless of table size. Marketing employees only
+    see their own sales and installments; users are visible to admins only.
+    """
+    query = query.strip()
+    if len(query) < QUICK_SEARCH_MIN_LENGTH:
+        return []
+    limit = max(1, min(limit, QUICK_SEARCH_MAX_LIMIT))
+    is_admin = user.role == 'admin'
+    hits = []
+    seen = set()
+
+    land_fields = ['old_sr_no', 'new_sr_no']
+    lands = Land.objects.select_related('village')
+    _collect(hits, seen, 'land', lands.filter(_identifier_query(land_fields, query)).order_by('-id')[:limit],
+             lambda land: _identifier_rank(land, land_fields, query), _describe_land(user))
+    _collect(hits, seen, 'land', search_filter(lands, LAND, query).order_by('-id')[:limit], RANK_TEXT, _describe_land(user))
+
+    client_fields = ['mobile_no', 'whatsapp_no', 'pan_no']
+    _collect(hits, seen, 'client', Client.objects.filter(_identifier_query(client_fields, query)).order_by('-id')[:limit],
+             lambda client: _identifier_rank(client, client_fields, query), _describe_client)
+    _collect(hits, seen, 'client', search_filter(Client.objects.all(), CLIENT, query).order_by('-id')[:limit],
+             RANK_TEXT, _describe_client)
+
+    sales = LandSale.objects.select_related('land')
+    installments = Installment.objects.select_related('land_sale__land')
+    if not is_admin:
+        sales = sales.filter(marketing_employee=user)
+        installments = installments.filter(land_sale__marketing_employee=user)
+
+    sale_fields = ['buyer_contact']
+    _collect(hits, seen, 'land_sale', sales.filter(_identifier_query(sale_fields, query)).order_by('-id')[:limit],
+             lambda sale: _identifier_rank(sale, sale_fields, query), _describe_land_sale)
+    _collect(hits, seen, 'land_sale', sales.filter(buyer_name__istartswith=query).order_by('-id')[:limit],
+             RANK_TEXT, _describe_land_sale)
+
+    installment_fields = ['utr_reference', 'payment_reference']
+    _collect(hits, seen, 'installment',
+             installments.filter(_identifier_query(installment_fields, query)).order_by('-id')[:limit],
+             lambda installment: _identifier_rank(installment, installment_fields, query), _describe_installment)
+
+    if is_admin:
+        user_fields = ['username', 'mobile']
+        _collect(hits, seen, 'user', User.objects.filter(_identifier_query(user_fields, query)).order_by('-id')[:limit],
+                 lambda found: _identifier_rank(found, user_fields, query), _describe_user)
+        _collect(hits, seen, 'user', User.objects.filter(full_name__istartswith=query).order_by('-id')[:limit],
+                 RANK_TEXT, _describe_user)
+
+    # Stable sort keeps the per-entity order (newest first) within a rank
+    hits.sort(key=lambda hit: hit['rank'])
+    per_kind = {}
+    ranked = []
+    for hit in hits:
+        per_kind[hit['kind']] = per_kind.get(hit['kind'], 0) + 1
+        if per_kind[hit['kind']] <= limit:
+            ranked.append(hit)
+    return ranked
+
+
+# --- Keeping documents current ---
+
+ASSIGNED_TASK_SEARCH_FIELDS = {'task', 'task_id', 'land', 'land_id', 'employee', 'employee_id'}
+
+
+def _touches(update_fields, fields):
+    return update_fields is None or bool(set(update_fields) & fields)
+
+
+def _land_saved(sender, instance, update_fields=None, **kwargs):
+    index_objects(LAND, id=instance.id)
+    if _touches(update_fields, {'name', 'village', 'village_id'}):
+        index_objects(ASSIGNED_TASK, land_id=instance.id)
+
+
+def _client_saved(sender, instance, **kwargs):
+    index_objects(CLIENT, id=instance.id)
+
+
+def _assigned_task_saved(sender, instance, update_fields=None, **kwargs):
+    # Status and completion saves do not change the searchable text
+    if _touches(update_fields, ASSIGNED_TASK_SEARCH_FIELDS):
+        index_objects(ASSIGNED_TASK, id=instance.id)
+
+
+def _task_saved(sender, instance, created=False, update_fields=None, **kwargs):
+    if not created and _touches(update_fields, {'name'}):
+        index_objects(ASSIGNED_TASK, task_id=instance.id)
+
+
+def _user_saved(sender, instance, created=False, update_fields=None, **kwargs):
+    if not created and _touches(update_fields, {'full_name', 'username'}):
+        index_objects(ASSIGNED_TASK, employee_id=instance.id)
+
+
+def _location_saved(sender, instance, created=False, **kwargs):
+    if created:
+        return
+    if sender is Village:
+        index_objects(LAND, village_id=instance.id)
+        index_objects(ASSIGNED_TASK, land__village_id=instance.id)
+    elif sender is Taluka:
+        index_objects(LAND, taluka_id=instance.id)
+    else:
+        index_objects(LAND, district_id=instance.id)
+
+
+DELETED_KINDS = {Land: LAND, Client: CLIENT, AssignedTask: ASSIGNED_TASK}
+
+
+def _document_deleted(sender, instance, **kwargs):
+    SearchDocument.objects.filter(kind=DELETED_KINDS[sender], object_id=instance.id).delete()
+
+
+def connect_signals():
+    # Deletes cascaded from lands, tasks and employees reach the AssignedTask
+    # handler one task at a time. Queries still join back to live rows
+    # (search_filter, live_documents) for rows removed without signals, and
+    # rebuild_search_index prunes those orphans.
+    post_save.connect(_land_saved, sender=Land, dispatch_uid='search_land_saved')
+    post_save.connect(_client_saved, sender=Client, dispatch_uid='search_client_saved')
+    post_save.connect(_assigned_task_saved, sender=AssignedTask, dispatch_uid='search_assigned_task_saved')
+    post_save.connect(_task_saved, sender=Task, dispatch_uid='search_task_saved')
+    post_save.connect(_user_saved, sender=User, dispatch_uid='search_user_saved')
+    for model in (District, Taluka, Village):
+        post_save.connect(_location_saved, sender=model, dispatch_uid=f'search_{model.__name__}_saved')
+    post_delete.connect(_document_deleted, sender=Land, dispatch_uid='search_land_deleted')
+    post_delete.connect(_document_deleted, sender=Client, dispatch_uid='search_client_deleted')
+    post_delete.connect(_document_deleted, sender=AssignedTask, dispatch_uid='search_assigned_task_deleted')
@@ -2,11 +2,17 @@
 
 // Global variables
 let currentClientId = null;
+let currentClientPage = 1;
 
 // Initialize page
 document.addEventListener('DOMContentLoaded', function() {
     console.log('Admin Clients page loaded');
     initializeEventListeners();
+    
+    // The clients page renders its rows from /api/clients/; other pages only reuse the modals
+    if (document.getElementById('clientsPagination')) {
+        loadClients(1);
+    }
 });
 
 // Initialize event listeners
@@ -40,6 +46,178 @@ function initializeEventListeners() {
         searchClients();
     });
     }
+    
+    // Client status filter change (only if element exists)
+    const clientActiveFilter = document.getElementById('clientActiveFilter');
+    if (clientActiveFilter) {
+        clientActiveFilter.addEventListener('change', function() {
+            searchClients();
+        });
+    }
+    
+    // Client import file picker (only if element exists)
+    const clientImportFile = document.getElementById('clientImportFile');
+    if (clientImportFile) {
+        clientImportFile.addEventListener('change', function() {
+            if (this.files.length) {
+                importClients(this.files[0]);
+                this.value = '';
+            }
+        });
+    }
+}
+
+// Escape values before placing them in row markup
+function escapeHtml(value) {
+    const div = document.createElement('div');
+    div.textContent = value == null ? '' : String(value);
+    return div.innerHTML;
+}
+
+// Current filter values, as sent to /api/clients/
+function getClientFilters() {
+    const filters = {};
+    const searchInput = document.getElementById('searchInput');
+    const clientTypeFilter = document.getElementById('clientTypeFilter');
+    const clientActiveFilter = document.getElementById('clientActiveFilter');
+    
+    if (searchInput && searchInput.value.trim()) filters.search = searchInput.value.trim();
+    if (clientTypeFilter && clientTypeFilter.value) filters.client_type = clientTypeFilter.value;
+    if (clientActiveFilter && clientActiveFilter.value) filters.is_active = clientActiveFilter.value;
+    return filters;
+}
+
+// Load one page of clients from the server
+async function loadClients(page = 1) {
+    const paginationBar = document.getElementById('clientsPaginationBar');
+    const filters = getClientFilters();
+    const params = new URLSearchParams({ ...filters, page, page_size: paginationBar.dataset.pageSize });
+    
+    // Keep the filters in the address bar so reloads and shared links keep them
+    const url = new URL(window.location);
+    ['search', 'client_type', 'is_active'].forEach(key => url.searchParams.delete(key));
+    Object.entries(filters).forEach(([key, value]) => url.searchParams.set(key, value));
+    window.history.replaceState(null, '', url.toString());
+    
+    try {
+        const response = await fetch(`/api/clients/?${params}`, {
+            method: 'GET',
+            headers: {
+                'X-CSRFToken': getCSRFToken(),
+            }
+        });
+        const data = await response.json();
+        
+        if (!data.success) {
+            showNotification('Error: ' + data.message, 'error');
+            return;
+        }
+        
+        currentClientPage = data.page;
+        renderClientRows(data.clients);
+        renderClientPagination(data);
+        updateClientTypeCounts(data.type_counts);
+    } catch (error) {
+        console.error('Error loading clients:', error);
+        showNotification('Failed to load clients. Please try again.', 'error');
+    }
+}
+
+// Render the client table body
+function renderClientRows(clients) {
+    const tbody = document.querySelector('#clientsTable tbody');
+    
+    if (clients.length === 0) {
+        tbody.innerHTML = `
+            <tr>
+                <td colspan="7" class="text-center py-4">
+                    <div class="text-muted">
+                        <i class="bi bi-people" style="font-size: 48px;"></i>
+                        <h5 class="mt-3">No Clients Found</h5>
+                        <p>Start by adding your first client.</p>
+                        <button class="btn btn-primary" onclick="showAddClientModal()">
+                            <i class="bi bi-plus-circle me-1"></i>Add Client
+                        </button>
+                    </div>
+                </td>
+            </tr>
+        `;
+        return;
+    }
+    
+    tbody.innerHTML = clients.map(client => `
+        <tr class="client-item" data-client-id="${client.id}">
+            <td>
+                <div class="d-flex align-items-center">
+                    <div class="avatar-circle me-3">
+                        ${escapeHtml(client.client_name.charAt(0).toUpperCase())}
+                    </div>
+                    <div>
+                        <strong>${escapeHtml(client.client_name)}</strong>
+                        ${client.search_property_title ? `<br><small class="text-muted">${escapeHtml(client.search_property_title)}</small>` : ''}
+                    </div>
+                </div>
+            </td>
+            <td>
+                <span class="badge bg-info">${escapeHtml(client.client_type_display)}</span>
+            </td>
+            <td>${escapeHtml(client.email)}</td>
+            <td>${escapeHtml(client.mobile_no)}</td>
+            <td>${escapeHtml(client.whatsapp_no)}</td>
+            <td>${escapeHtml(client.created_at)}</td>
+            <td>
+                <div class="btn-group" role="group">
+                    <button class="btn btn-sm btn-outline-primary" onclick="viewClientDetails(${client.id})" title="View Details">
+                        <i class="bi bi-eye"></i>
+                    </button>
+                    <button class="btn btn-sm btn-outline-warning" onclick="editClient(${client.id})" title="Edit Client">
+                        <i class="bi bi-pencil"></i>
+                    </button>
+                    <button class="btn btn-sm btn-outline-danger" onclick="deleteClient(${client.id})" title="Delete Client">
+                        <i class="bi bi-trash"></i>
+                    </button>
+                </div>
+            </td>
+        </tr>
+    `).join('');
+}
+
+// Render the page summary and a compact page list around the current page
+function renderClientPagination(data) {
+    const summary = document.getElementById('clientsSummary');
+    const pagination = document.getElementById('clientsPagination');
+    
+    const first = data.count === 0 ? 0 : (data.page - 1) * data.page_size + 1;
+    const last = Math.min(data.page * data.page_size, data.count);
+    summary.textContent = `Showing ${first}-${last} of ${data.count} clients`;
+    
+    const pages = new Set([1, data.total_pages]);
+    for (let page = data.page - 2; page <= data.page + 2; page++) {
+        if (page >= 1 && page <= data.total_pages) pages.add(page);
+    }
+    
+    const items = [];
+    let previous = 0;
+    [...pages].sort((a, b) => a - b).forEach(page => {
+        if (page - previous > 1) {
+            items.push('<li class="page-item disabled"><span class="page-link">&hellip;</span></li>');
+        }
+        items.push(`
+            <li class="page-item ${page === data.page ? 'active' : ''}">
+                <a class="page-link" href="#" onclick="loadClients(${page}); return false;">${page}</a>
+            </li>
+        `);
+        previous = page;
+    });
+    pagination.innerHTML = data.total_pages > 1 ? items.join('') : '';
+}
+
+// Show the per-type counts next to each type in the filter
+function updateClientTypeCounts(typeCounts) {
+    document.querySelectorAll('#clientTypeFilter option[data-label]').forEach(option => {
+        const count = typeCounts[option.value] || 0;
+        option.textContent = `${option.dataset.label} (${count})`;
+    });
 }
 
 // Show add client modal
@@ -94,8 +272,10 @@ async function handleAddClient(event) {
             if (typeof window.refreshClientDropdown === 'function') {
                 // We're on the inventory page, refresh the client dropdown
                 await window.refreshClientDropdown();
+            } else if (document.getElementById('clientsPagination')) {
+                // We're on the admin clients page, show the new client on the first page
+                loadClients(1);
             } else {
-                // We're on the admin clients page, reload the page
             setTimeout(() => {
                 window.location.reload();
             }, 1000);
@@ -113,6 +293,53 @@ async function handleAddClient(event) {
     }
 }
 
+// Import clients from a CSV/XLSX lead list
+async function importClients(file) {
+    const report = document.getElementById('clientImportReport');
+    const formData = new FormData();
+    formData.append('file', file);
+    showNotification(`Importing ${file.name}...`, 'info');
+    
+    try {
+        const response = await fetch('/api/clients/import/', {
+            method: 'POST',
+            headers: {
+                'X-CSRFToken': getCSRFToken(),
+            },
+            body: formData
+        });
+        const data = await response.json();
+        
+        if (!data.success) {
+            showNotification('Error: ' + data.message, 'error');
+            return;
+        }
+        
+        showNotification(data.message, data.skipped ? 'warning' : 'success');
+        if (data.errors.length) {
+            const rows = data.errors.slice(0, 50).map(error =>
+                `<li>Row ${error.row}: ${escapeHtml(error.errors.join('; '))}</li>`
+            ).join('');
+            const more = data.errors.length > 50 ? `<li>... and ${data.errors.length - 50} more</li>` : '';
+            report.innerHTML = `
+                <div class="alert alert-warning alert-dismissible mb-0">
+                    <strong>${escapeHtml(data.message)}</strong>
+                    <ul class="mb-0 mt-2 small">${rows}${more}</ul>
+                    <button type="button" class="btn-close" data-bs-dismiss="alert" aria-label="Close"></button>
+                </div>`;
+            report.classList.remove('d-none');
+        } else {
+            report.classList.add('d-none');
+        }
+        if (data.created) {
+            loadClients(1);
+        }
+    } catch (error) {
+        console.error('Error importing clients:', error);
+        showNotification('Failed to import clients. Please try again.', 'error');
+    }
+}
+
 // Edit client
 async function editClient(clientId) {
     console.log('Editing client:', clientId);
@@ -276,29 +503,14 @@ async function deleteClient(clientId) {
         if (data.success) {
             showNotification('Client deleted successfully!', 'success');
             
-            // Remove client row from table
-            const clientRow = document.querySelector(`tr[data-client-id="${clientId}"]`);
-            if (clientRow) {
-                clientRow.remove();
-            }
-            
-            // Check if table is empty
-            const tbody = document.querySelector('#clientsTable tbody');
-            if (tbody.children.length === 0) {
-                tbody.innerHTML = `
-                    <tr>
-                        <td colspan="7" class="text-center py-4">
-                            <div class="text-muted">
-                                <i class="bi bi-people" style="font-size: 48px;"></i>
-                                <h5 class="mt-3">No Clients Found</h5>
-                                <p>Start by adding your first client.</p>
-                                <button class="btn btn-primary" onclick="showAddClientModal()">
-                                    <i class="bi bi-plus-circle me-1"></i>Add Client
-                                </button>
-                            </div>
-                        </td>
-                    </tr>
-                `;
+            // Reload the current page so pagination and type counts stay right
+            if (document.getElementById('clientsPagination')) {
+                loadClients(currentClientPage);
+            } else {
+                const clientRow = document.querySelector(`tr[data-client-id="${clientId}"]`);
+                if (clientRow) {
+                    clientRow.remove();
+                }
             }
         } else {
             showNotification('Error: ' + data.message, 'error');
@@ -508,29 +720,16 @@ async function viewClientDetails(clientId) {
 
 // Search clients
 function searchClients() {
-    const searchQuery = document.getElementById('searchInput').value;
-    const clientType = document.getElementById('clientTypeFilter').value;
-    
-    // Build URL with search parameters
-    const url = new URL(window.location);
-    url.searchParams.set('search', searchQuery);
-    url.searchParams.set('client_type', clientType);
-    
-    // Redirect to filtered results
-    window.location.href = url.toString();
+    loadClients(1);
 }
 
 // Clear filters
 function clearFilters() {
     document.getElementById('searchInput').value = '';
     document.getElementById('clientTypeFilter').value = '';
+    document.getElementById('clientActiveFilter').value = '';
     
-    // Redirect to unfiltered results
-    const url = new URL(window.location);
-    url.searchParams.delete('search');
-    url.searchParams.delete('client_type');
-    
-    window.location.href = url.toString();
+    loadClients(1);
 }
 
 // Get CSRF token
@@ -765,3 +964,4 @@ window.deleteClient = deleteClient;
 window.viewClientDetails = viewClientDetails;
 window.searchClients = searchClients;
 window.clearFilters = clearFilters;
+window.loadClients = loadClients;
@@ -513,27 +513,24 @@ async function loadLandDataForEdit(landId) {
       console.log('Land data keys:', Object.keys(landData));
       
       // Start both operations in parallel
-      const districtLoadPromise = fetch('/api/location/districts/')
-        .then(response => response.ok ? response.json() : Promise.reject('Failed to load districts'))
-        .then(data => {
-          if (data.success) {
+      const districtLoadPromise = LocationBundle.districts('Gujarat')
+        .then(districts => {
             // Populate district dropdown
             const districtSelect = document.getElementById('edit_district');
             districtSelect.innerHTML = '<option value="">Select District</option>';
-            data.districts.forEach(district => {
+            districts.forEach(district => {
               const option = document.createElement('option');
               option.value = district.id;
               option.textContent = district.name;
               districtSelect.appendChild(option);
             });
-            console.log(`Loaded ${data.districts.length} districts for edit modal`);
+            console.log(`Loaded ${districts.length} districts for edit modal`);
             
             // Re-initialize event listeners for the restored form
             initializeEditFormEventListeners();
             
             // Populate location dropdowns
             return populateLocationDropdowns(landData);
-          }
         })
         .catch(error => {
           console.error('Error loading districts for edit modal:', error);
@@ -830,21 +827,15 @@ async function handleDistrictChangeEdit() {
     talukaSelect.innerHTML = '<option value="">Select Taluka</option>';
     villageSelect.innerHTML = '<option value="">Select Village</option>';
     
-    // Load talukas for selected district using API
-    const response = await fetch(`/api/location/districts/${selectedDistrict}/talukas/`);
-    if (response.ok) {
-      const data = await response.json();
-      if (data.success) {
-        // Populate taluka dropdown
-        data.talukas.forEach(taluka => {
+    // Load talukas for selected district from the cached location bundle
+    const talukas = await LocationBundle.talukas(selectedDistrict);
+    talukas.forEach(taluka => {
       const option = document.createElement('option');
-          option.value = taluka.id;
-          option.textContent = taluka.name;
+      option.value = taluka.id;
+      option.textContent = taluka.name;
       talukaSelect.appendChild(option);
     });
-        console.log(`Loaded ${data.talukas.length} talukas for district ${selectedDistrict}`);
-      }
-    }
+    console.log(`Loaded ${talukas.length} talukas for district ${selectedDistrict}`);
   } catch (error) {
     console.error('Error loading talukas in edit modal:', error);
   }
@@ -870,21 +861,15 @@ async function handleTalukaChangeEdit() {
   // Clear village dropdown
   villageSelect.innerHTML = '<option value="">Select Village</option>';
   
-    // Load villages for selected taluka using API
-    const response = await fetch(`/api/location/talukas/${selectedTaluka}/villages/`);
-    if (response.ok) {
-      const data = await response.json();
-      if (data.success) {
-        // Populate village dropdown
-        data.villages.forEach(village => {
+    // Load villages for selected taluka from the cached location bundle
+    const villages = await LocationBundle.villages(selectedTaluka);
+    villages.forEach(village => {
       const option = document.createElement('option');
-          option.value = village.id;
-          option.textContent = village.name;
+      option.value = village.id;
+      option.textContent = village.name;
       villageSelect.appendChild(option);
     });
-        console.log(`Loaded ${data.villages.length} villages for taluka ${selectedTaluka}`);
-      }
-    }
+    console.log(`Loaded ${villages.length} villages for taluka ${selectedTaluka}`);
   } catch (error) {
     console.error('Error loading villages in edit modal:', error);
   }
@@ -797,26 +797,15 @@ async function showSellLandModal(landId) {
             throw new Error(landData.message || 'Failed to load land details');
         }
         
-        // Fetch clients data
-        const clientsResponse = await fetch('/api/clients/', {
-            method: 'GET',
-            headers: {
-                'X-CSRFToken': getCSRFToken(),
-                'Content-Type': 'application/json',
-            },
-        });
-        
-        const clientsData = await clientsResponse.json();
-        
         hideLoadingOverlay();
         
         // Check if there's an existing sale
         if (saleData.success && saleData.has_sale) {
             // Show existing sale in read-only mode
-            populateSellLandFormWithExistingSale(landData.land, clientsData.clients, window.marketingEmployees, saleData.sale, saleData.installments);
+            populateSellLandFormWithExistingSale(landData.land, window.marketingEmployees, saleData.sale, saleData.installments);
         } else {
             // Show new sale form
-            populateSellLandForm(landData.land, clientsData.clients, window.marketingEmployees);
+            populateSellLandForm(landData.land, window.marketingEmployees);
         }
         
         // Initialize installments for new sales
@@ -835,8 +824,67 @@ async function showSellLandModal(landId) {
     }
 }
 
+// Client picker: the sale modal's client select is filled on demand from
+// /api/clients/picker/ as the user types a name or mobile number
+let clientPickerTimer = null;
+let clientPickerRequestId = 0;
+
+async function loadClientOptions(query = '', selected = null) {
+    const clientSelect = document.getElementById('sellClient');
+    const requestId = ++clientPickerRequestId;
+    
+    try {
+        const params = new URLSearchParams({ q: query });
+        const response = await fetch(`/api/clients/picker/?${params}`);
+        const data = await response.json();
+        
+        // Ignore responses that arrive after a newer keystroke
+        if (requestId !== clientPickerRequestId || !data.success) return;
+        
+        clientSelect.innerHTML = '<option value="">Choose a client...</option>';
+        const clients = data.clients;
+        if (selected && !clients.some(client => client.id === selected.id)) {
+            clients.unshift(selected);
+        }
+        
+        if (clients.length > 0) {
+            clients.forEach(client => {
+                const option = document.createElement('option');
+                option.value = client.id;
+                option.textContent = client.mobile ? `${client.name} (${client.mobile})` : client.name;
+                clientSelect.appendChild(option);
+            });
+            if (selected) {
+                clientSelect.value = selected.id;
+            } else if (query && clients.length === 1) {
+                clientSelect.value = clients[0].id;
+            }
+        } else {
+            const option = document.createElement('option');
+            option.value = '';
+            option.textContent = query ? 'No matching clients' : 'No clients available';
+            option.disabled = true;
+            clientSelect.appendChild(option);
+        }
+    } catch (error) {
+        console.error('Error loading clients:', error);
+    }
+}
+
+function initClientPicker() {
+    const searchInput = document.getElementById('sellClientSearch');
+    if (!searchInput || searchInput.dataset.bound) return;
+    
+    searchInput.dataset.bound = 'true';
+    searchInput.addEventListener('input', function() {
+        clearTimeout(clientPickerTimer);
+        const query = this.value.trim();
+        clientPickerTimer = setTimeout(() => loadClientOptions(query), 200);
+    });
+}
+
 // Populate sell land form with data
-function populateSellLandForm(land, clients, employees) {
+function populateSellLandForm(land, employees) {
     // Set land ID
     document.getElementById('sellLandId').value = land.id;
     
@@ -848,24 +896,10 @@ function populateSellLandForm(land, clients, employees) {
     document.getElementById('sellLandSataPrakar').textContent = land.sata_prakar;
     document.getElementById('sellLandBroker').textContent = land.broker_name || 'Not specified';
     
-    // Populate clients dropdown
-    const clientSelect = document.getElementById('sellClient');
-    clientSelect.innerHTML = '<option value="">Choose a client...</option>';
-    
-    if (clients && clients.length > 0) {
-        clients.forEach(client => {
-            const option = document.createElement('option');
-            option.value = client.id;
-            option.textContent = `${client.client_name} (${client.get_client_type_display})`;
-            clientSelect.appendChild(option);
-        });
-    } else {
-        const option = document.createElement('option');
-        option.value = '';
-        option.textContent = 'No clients available';
-        option.disabled = true;
-        clientSelect.appendChild(option);
-    }
+    // Populate clients dropdown with the newest clients; typing narrows it
+    initClientPicker();
+    document.getElementById('sellClientSearch').value = '';
+    loadClientOptions('');
     
     // Populate marketing employees dropdown
     const employeeSelect = document.getElementById('sellMarketingEmployee');
@@ -914,7 +948,7 @@ function populateSellLandForm(land, clients, employees) {
 }
 
 // Populate sell land form with existing sale data (read-only mode)
-function populateSellLandFormWithExistingSale(land, clients, employees, sale, installments) {
+function populateSellLandFormWithExistingSale(land, employees, sale, installments) {
     // Set land ID
     document.getElementById('sellLandId').value = land.id;
     
@@ -926,21 +960,10 @@ function populateSellLandFormWithExistingSale(land, clients, employees, sale, in
     document.getElementById('sellLandSataPrakar').textContent = land.sata_prakar;
     document.getElementById('sellLandBroker').textContent = land.broker_name || 'Not specified';
     
-    // Populate clients dropdown
-    const clientSelect = document.getElementById('sellClient');
-    clientSelect.innerHTML = '<option value="">Choose a client...</option>';
-    
-    if (clients && clients.length > 0) {
-        clients.forEach(client => {
-            const option = document.createElement('option');
-            option.value = client.id;
-            option.textContent = `${client.client_name} (${client.get_client_type_display})`;
-            if (sale.client_name && client.client_name === sale.client_name) {
-                option.selected = true;
-            }
-            clientSelect.appendChild(option);
-        });
-    }
+    // Populate clients dropdown, keeping the sale's client selected
+    initClientPicker();
+    document.getElementById('sellClientSearch').value = '';
+    loadClientOptions('', sale.client_id ? { id: sale.client_id, name: sale.client_name, mobile: sale.client_mobile } : null);
     
     // Populate marketing employees dropdown
     const employeeSelect = document.getElementById('sellMarketingEmployee');
@@ -982,6 +1005,7 @@ function populateSellLandFormWithExistingSale(land, clients, employees, sale, in
 // Set sell form to read-only or editable mode
 function setSellFormReadOnly(isReadOnly) {
     const formElements = [
+        'sellClientSearch',
         'sellClient',
         'sellMarketingEmployee', 
         'sellDate',
@@ -2189,40 +2213,11 @@ function showAddClientModalFromInventory() {
 
 // Refresh client dropdown after adding a new client
 async function refreshClientDropdown() {
-    try {
-        const response = await fetch('/api/clients/', {
-            method: 'GET',
-            headers: {
-                'X-CSRFToken': getCSRFToken(),
-                'Content-Type': 'application/json',
-            },
-        });
-        
-        if (response.ok) {
-            const data = await response.json();
-            const clientSelect = document.getElementById('sellClient');
-            
-            // Clear existing options
-            clientSelect.innerHTML = '<option value="">Choose a client...</option>';
-            
-            if (data.clients && data.clients.length > 0) {
-                data.clients.forEach(client => {
-                    const option = document.createElement('option');
-                    option.value = client.id;
-                    option.textContent = `${client.client_name} (${client.get_client_type_display})`;
-                    clientSelect.appendChild(option);
-                });
-            } else {
-                const option = document.createElement('option');
-                option.value = '';
-                option.textContent = 'No clients available';
-                option.disabled = true;
-                clientSelect.appendChild(option);
-            }
-        }
-    } catch (error) {
-        console.error('Error refreshing client dropdown:', error);
+    const searchInput = document.getElementById('sellClientSearch');
+    if (searchInput) {
+        searchInput.value = '';
     }
+    await loadClientOptions('');
 }
 
 // Show installments management modal
@@ -1,6 +1,7 @@
 /**
  * Location API Handler for Gujarat State
- * Handles district, taluka, and village dropdowns via API calls
+ * Handles district, taluka, and village dropdowns from the cached LocationBundle
+ * (location_bundle.js must be loaded first)
  */
 
 class LocationAPI {
@@ -80,14 +81,7 @@ class LocationAPI {
     async loadDistricts() {
         try {
             console.log('Loading districts...');
-            const response = await fetch(`${this.baseURL}/districts/`);
-            const data = await response.json();
-            
-            if (data.success) {
-                this.populateDistricts(data.districts);
-            } else {
-                console.error('Failed to load districts:', data.error);
-            }
+            this.populateDistricts(await LocationBundle.districts('Gujarat'));
         } catch (error) {
             console.error('Error loading districts:', error);
         }
@@ -130,23 +124,8 @@ class LocationAPI {
         
         try {
             console.log('Loading talukas for district ID:', districtId);
-            const response = await fetch(`${this.baseURL}/districts/${districtId}/talukas/`);
-            console.log('API response:', response);
-            
-            if (!response.ok) {
-                throw new Error(`HTTP error! status: ${response.status}`);
-            }
-            
-            const data = await response.json();
-            console.log('API response data:', data);
-            
-            if (data.success) {
-                console.log('Successfully loaded talukas:', data.talukas);
-                this.populateTalukas(data.talukas);
-                this.clearVillages();
-            } else {
-                console.error('Failed to load talukas:', data.error);
-            }
+            this.populateTalukas(await LocationBundle.talukas(districtId));
+            this.clearVillages();
         } catch (error) {
             console.error('Error loading talukas:', error);
         }
@@ -179,14 +158,7 @@ class LocationAPI {
         
         try {
             console.log('Loading villages for taluka:', talukaId);
-            const response = await fetch(`${this.baseURL}/talukas/${talukaId}/villages/`);
-            const data = await response.json();
-            
-            if (data.success) {
-                this.populateVillages(data.villages);
-            } else {
-                console.error('Failed to load villages:', data.error);
-            }
+            this.populateVillages(await LocationBundle.villages(talukaId));
         } catch (error) {
             console.error('Error loading villages:', error);
         }
@@ -230,16 +202,19 @@ class LocationAPI {
 
     // Public methods for external use
     refreshDistricts() {
+        LocationBundle.invalidate();
         this.loadDistricts();
     }
 
     refreshTalukas() {
+        LocationBundle.invalidate();
         if (this.districtSelect?.value) {
             this.onDistrictChange();
         }
     }
 
     refreshVillages() {
+        LocationBundle.invalidate();
         if (this.talukaSelect?.value) {
             this.onTalukaChange();
         }
@@ -0,0 +1,105 @@
+/**
+ * Location Bundle Cache
+ * Loads the full District -> Taluka -> Village hierarchy once from
+ * /api/location/bundle/, keeps it in localStorage and revalidates it with
+ * the server ETag, so dropdowns never re-fetch slices of the village table.
+ */
+
+const LocationBundle = (function () {
+    const BUNDLE_URL = '/api/location/bundle/';
+    const STORAGE_KEY = 'locationBundle';
+    let bundlePromise = null;
+
+    function readStored() {
+        try {
+            return JSON.parse(localStorage.getItem(STORAGE_KEY));
+        } catch (error) {
+            return null;
+        }
+    }
+
+    function store(bundle) {
+        try {
+            localStorage.setItem(STORAGE_KEY, JSON.stringify(bundle));
+        } catch (error) {
+            // Storage full or disabled - the in-memory copy is still used
+            console.warn('Could not store location bundle:', error);
+        }
+    }
+
+    function indexBundle(bundle) {
+        const talukasByDistrict = {};
+        const villagesByTaluka = {};
+
+        bundle.talukas.forEach(([id, name, districtId]) => {
+            (talukasByDistrict[districtId] = talukasByDistrict[districtId] || []).push({ id, name });
+        });
+        bundle.villages.forEach(([id, name, talukaId]) => {
+            (villagesByTaluka[talukaId] = villagesByTaluka[talukaId] || []).push({ id, name });
+        });
+
+        return {
+            version: bundle.version,
+            districts: bundle.districts.map(([id, name, state]) => ({ id, name, state })),
+            talukasByDistrict,
+            villagesByTaluka
+        };
+    }
+
+    async function fetchBundle() {
+        const stored = readStored();
+        const headers = {};
+        if (stored && stored.version) {
+            headers['If-None-Match'] = `"${stored.version}"`;
+        }
+
+        // localStorage is the cache; skip the HTTP cache so a 304 reaches us
+        const response = await fetch(BUNDLE_URL, { headers, cache: 'no-store' });
+        if (response.status === 304 && stored) {
+            console.log('Location bundle unchanged, using stored copy', stored.version);
+            return indexBundle(stored);
+        }
+        if (!response.ok) {
+            throw new Error(`HTTP error! status: ${response.status}`);
+        }
+
+        const bundle = await response.json();
+        store(bundle);
+        console.log('Location bundle loaded', bundle.version);
+        return indexBundle(bundle);
+    }
+
+    return {
+        load() {
+            if (!bundlePromise) {
+                bundlePromise = fetchBundle().catch(error => {
+                    bundlePromise = null;
+                    throw error;
+                });
+            }
+            return bundlePromise;
+        },
+
+        // Call after adding a location so the next load revalidates with the server
+        invalidate() {
+            bundlePromise = null;
+        },
+
+        async districts(state) {
+            const bundle = await this.load();
+            return state ? bundle.districts.filter(district => district.state === state) : bundle.districts;
+        },
+
+        async talukas(districtId) {
+            const bundle = await this.load();
+            return bundle.talukasByDistrict[districtId] || [];
+        },
+
+        async villages(talukaId) {
+            const bundle = await this.load();
+            return bundle.villagesByTaluka[talukaId] || [];
+        }
+    };
+})();
+
+window.LocationBundle = LocationBundle;
@@ -333,6 +333,7 @@ function enableEditMode() {
     modalTitle.innerHTML = '<i class="bi bi-pencil me-2"></i>Edit Land Sale';
     
     // Enable form fields
+    document.getElementById('sellClientSearch').disabled = false;
     document.getElementById('sellClient').disabled = false;
     document.getElementById('sellMarketingEmployee').disabled = false;
     document.getElementById('sellDate').readOnly = false;
@@ -365,6 +366,7 @@ function disableEditMode() {
     modalTitle.innerHTML = '<i class="bi bi-info-circle me-2"></i>Land Sale Details';
     
     // Disable form fields
+    document.getElementById('sellClientSearch').disabled = true;
     document.getElementById('sellClient').disabled = true;
     document.getElementById('sellMarketingEmployee').disabled = true;
     document.getElementById('sellDate').readOnly = true;
@@ -115,14 +115,7 @@ class VillageManager {
         }
 
         try {
-            const response = await fetch(`/api/location/districts/${districtId}/talukas/`);
-            const data = await response.json();
-
-            if (data.success) {
-                this.populateModalTalukas(data.talukas);
-            } else {
-                this.showAlert('Failed to load talukas', 'danger');
-            }
+            this.populateModalTalukas(await LocationBundle.talukas(districtId));
         } catch (error) {
             console.error('Error loading talukas:', error);
             this.showAlert('Error loading talukas', 'danger');
@@ -137,19 +130,14 @@ class VillageManager {
         }
 
         try {
-            const response = await fetch(`/api/location/talukas/${talukaId}/villages/`);
-            const data = await response.json();
+            const villages = await LocationBundle.villages(talukaId);
 
-            if (data.success) {
-                // Show existing villages for this taluka to help avoid duplicates
-                if (data.villages.length > 0) {
-                    // Show a simple warning with existing village names
-                    this.showDuplicateWarning(data.villages);
-                } else {
-                    this.showAlert('No villages exist in this taluka yet. You can add the first one!', 'success');
-                }
+            // Show existing villages for this taluka to help avoid duplicates
+            if (villages.length > 0) {
+                // Show a simple warning with existing village names
+                this.showDuplicateWarning(villages);
             } else {
-                this.showAlert('Failed to load villages', 'danger');
+                this.showAlert('No villages exist in this taluka yet. You can add the first one!', 'success');
             }
         } catch (error) {
             console.error('Error loading villages:', error);
@@ -262,16 +250,42 @@ class VillageManager {
 
 
 
-    // Search functionality
+    // Search functionality - prefix typeahead served by /api/location/villages/search/
     handleSearch(searchTerm) {
-        if (!this.allVillages) return;
+        clearTimeout(this.searchTimer);
+        const term = searchTerm.trim();
         
-        const filteredVillages = this.allVillages.filter(village => 
-            village.name.toLowerCase().includes(searchTerm.toLowerCase())
-        );
+        if (!term) {
+            if (!this.allVillages) return;
+            this.populateVillageTable(this.allVillages);
+            this.updateRecordCount(this.allVillages.length);
+            return;
+        }
         
-        this.populateVillageTable(filteredVillages);
-        this.updateRecordCount(filteredVillages.length);
+        this.searchTimer = setTimeout(() => this.searchVillages(term), 150);
+    }
+    
+    async searchVillages(term) {
+        const requestId = (this.searchRequestId || 0) + 1;
+        this.searchRequestId = requestId;
+        
+        try {
+            const params = new URLSearchParams({ q: term, limit: 50 });
+            const response = await fetch(`/api/location/villages/search/?${params}`);
+            const data = await response.json();
+            
+            // Ignore responses that arrive after a newer keystroke
+            if (requestId !== this.searchRequestId) return;
+            
+            if (data.success) {
+                this.populateVillageTable(data.villages);
+                this.updateRecordCount(data.villages.length);
+            } else {
+                this.showAlert(data.error || 'Failed to search villages', 'danger');
+            }
+        } catch (error) {
+            console.error('Error searching villages:', error);
+        }
     }
     
     // Update record count
@@ -351,14 +365,7 @@ class VillageManager {
     // Load districts in modal
     async loadModalDistricts() {
         try {
-            const response = await fetch('/api/location/districts/');
-            const data = await response.json();
-            
-            if (data.success) {
-                this.populateModalDistricts(data.districts);
-            } else {
-                this.showAlert('Failed to load districts', 'danger');
-            }
+            this.populateModalDistricts(await LocationBundle.districts('Gujarat'));
         } catch (error) {
             console.error('Error loading districts:', error);
             this.showAlert('Error loading districts', 'danger');
@@ -462,7 +469,8 @@ class VillageManager {
                     modal.hide();
                 }
                 
-                // Refresh the village list
+                // Refresh the village list and drop the stale location bundle
+                LocationBundle.invalidate();
                 this.loadVillageList();
                 
             } else {
@@ -0,0 +1,76 @@
+from typing import NamedTuple
+
+from django.db.models import Prefetch
+
+from .caching import get_cached
+from .models import Task, TaskManage
+
+
+class CatalogEmployee(NamedTuple):
+    employee_id: int
+    employee_name: str
+
+
+class CatalogTask(NamedTuple):
+    """A Task with the employees it is assigned to (through TaskManage)"""
+    id: int
+    name: str
+    position: int
+    is_default: bool
+    completion_days: int
+    marketing_task: bool
+    employees: tuple
+
+    # Names the land templates already use for the assignment columns
+    @property
+    def assigned_employees_display(self):
+        return ', '.join(employee.employee_name for employee in self.employees)
+
+    @property
+    def assigned_employees_count(self):
+        return len(self.employees)
+
+    @property
+    def assigned_employees_details(self):
+        return self.employees
+
+
+def build_task_catalog():
+    """
+    Load every task with its assigned employees in two queries.
+
+    Returns a tuple of CatalogTask ordered by position and name; each task's
+    employees are ordered by username like TaskManage.
+    """
+    tasks = Task.objects.order_by('position', 'name').prefetch_related(Prefetch(
+        'task_manages',
+        queryset=TaskManage.objects.select_related('employee').order_by('employee__username'),
+    ))
+    return tuple(
+        CatalogTask(
+            id=task.id,
+            name=task.name,
+            position=task.position,
+            is_default=task.is_default,
+            completion_days=task.completion_days,
+            marketing_task=task.marketing_task,
+            employees=tuple(
+                CatalogEmployee(task_manage.employee_id, task_manage.employee.get_display_name())
+                for task_manage in task.task_manages.all()
+            ),
+        )
+        for task in tasks
+    )
+
+
+def task_catalog(marketing_task=None):
+    """
+    The cached catalog, optionally only marketing or non-marketing tasks.
+
+    Cached in the task_catalog namespace, which Task, TaskManage and User
+    (employee names) saves and deletes invalidate.
+    """
+    catalog = get_cached('task_catalog', 'tasks', build_task_catalog)
+    if marketing_task is None:
+        return catalog
+    return tuple(task for task in catalog if task.marketing_task == marketing_task)
@@ -1,7 +1,12 @@
 from django.test import TestCase
+from django.utils import timezone
 from django.contrib.auth import get_user_model
-from .models import User, Task, Land, TaskManage, SataPrakar
+from .models import User, Task, Land, TaskManage, SataPrakar, Notification
+from .notifications import notify, notify_many, notify_admins
 import datetime
+import io
+import os
+import tempfile
 
 User = get_user_model()
 
@@ -102,3 +107,1327 @@ class SataPrakarIntegrationTest(TestCase):
         self.land.sata_prakar = 'Another Sata Prakar'
         self.land.save()
         self.assertEqual(self.land.sata_prakar, 'Another Sata Prakar')
+
+
+class NotifyServiceTest(TestCase):
+    def setUp(self):
+        """Set up an admin and two employees to notify"""
+        self.admin = User.objects.create_user(
+            username='admin1', password='testpass123', role='admin', email='admin1@example.com'
+        )
+        self.emp1 = User.objects.create_user(
+            username='emp1', password='testpass123', role='employee', email='emp1@example.com'
+        )
+        self.emp2 = User.objects.create_user(
+            username='emp2', password='testpass123', role='employee', email='emp2@example.com'
+        )
+
+    def test_notify_creates_one_row_per_recipient(self):
+        """Test that notify accepts users and ids and writes one row each"""
+        created = notify([self.emp1, self.emp2.id], 'Hello team')
+        self.assertEqual(len(created), 2)
+        self.assertEqual(Notification.objects.filter(message='Hello team').count(), 2)
+
+    def test_notify_with_message_template(self):
+        """Test that a callable message is rendered per recipient"""
+        notify([self.emp1, self.emp2], lambda user: f'Hi {user.username}')
+        self.assertTrue(Notification.objects.filter(user=self.emp1, message='Hi emp1').exists())
+        self.assertTrue(Notification.objects.filter(user=self.emp2, message='Hi emp2').exists())
+
+    def test_notify_admins_only_targets_admins(self):
+        """Test that notify_admins skips employees"""
+        notify_admins('Admin broadcast')
+        self.assertEqual(list(Notification.objects.values_list('user_id', flat=True)), [self.admin.id])
+
+    def test_duplicates_are_coalesced(self):
+        """Test that duplicates in a batch and within the window are skipped"""
+        notify_many([(self.emp1, 'Ping'), (self.emp1, 'Ping')])
+        self.assertEqual(Notification.objects.filter(user=self.emp1).count(), 1)
+
+        notify([self.emp1, self.emp2], 'Ping', coalesce_window=datetime.timedelta(minutes=1))
+        self.assertEqual(Notification.objects.filter(user=self.emp1).count(), 1)
+        self.assertEqual(Notification.objects.filter(user=self.emp2).count(), 1)
+
+        notify([self.emp1], 'Ping')
+        self.assertEqual(Notification.objects.filter(user=self.emp1).count(), 2)
+
+
+class BulkDeleteLandsTest(TestCase):
+    def setUp(self):
+        """Set up lands with assigned tasks, a sale and an installment"""
+        from .models import District, Taluka, Village, AssignedTask, LandSale, Installment
+        district = District.objects.create(name='Test District')
+        taluka = Taluka.objects.create(name='Test Taluka', district=district)
+        village = Village.objects.create(name='Test Village', taluka=taluka)
+        self.employee = User.objects.create_user(
+            username='emp', password='testpass123', role='employee', email='emp@example.com'
+        )
+        self.task = Task.objects.create(name='Survey', position=1)
+        self.lands = []
+        for i in range(3):
+            land = Land.objects.create(
+                name=f'Land {i}', district=district, taluka=taluka, village=village,
+                sata_prakar='Test', total_area=100
+            )
+            AssignedTask.objects.create(land=land, task=self.task, employee=self.employee)
+            sale = LandSale.objects.create(land=land, buyer_name='Buyer', sale_date=datetime.date.today())
+            Installment.objects.create(
+                land_sale=sale, installment_number=1, percentage=100, due_date=datetime.date.today()
+            )
+            self.lands.append(land)
+
+    def test_bulk_delete_cascades_for_selected_lands(self):
+        """Test that selected lands and their dependents are removed together"""
+        from .bulk_operations import bulk_delete_lands
+        from .models import AssignedTask, Installment
+        ids = [str(self.lands[0].id), str(self.lands[1].id)]
+        deleted_names, failures = bulk_delete_lands(ids)
+        self.assertEqual(sorted(deleted_names), ['Land 0', 'Land 1'])
+        self.assertEqual(failures, {})
+        self.assertEqual(list(Land.objects.values_list('id', flat=True)), [self.lands[2].id])
+        self.assertEqual(AssignedTask.objects.count(), 1)
+        self.assertEqual(Installment.objects.count(), 1)
+
+    def test_bulk_delete_reports_missing_and_invalid_ids(self):
+        """Test that unknown ids are reported without aborting the batch"""
+        from .bulk_operations import bulk_delete_lands
+        deleted_names, failures = bulk_delete_lands([self.lands[0].id, 99999, 'abc'])
+        self.assertEqual(deleted_names, ['Land 0'])
+        self.assertEqual(failures, {99999: 'Land not found', 'abc': 'Invalid land ID'})
+
+
+class BulkEmployeeActionTest(TestCase):
+    def setUp(self):
+        """Set up two leaving employees, a colleague and open tasks"""
+        from .models import District, Taluka, Village, AssignedTask, Message
+        district = District.objects.create(name='Test District')
+        taluka = Taluka.objects.create(name='Test Taluka', district=district)
+        village = Village.objects.create(name='Test Village', taluka=taluka)
+        self.leaving = [
+            User.objects.create_user(username=f'leaving{i}', password='testpass123', role='employee', email=f'leaving{i}@example.com')
+            for i in range(2)
+        ]
+        self.colleague = User.objects.create_user(
+            username='colleague', password='testpass123', role='employee', email='colleague@example.com'
+        )
+        self.land = Land.objects.create(
+            name='Land', district=district, taluka=taluka, village=village, sata_prakar='Test', total_area=100
+        )
+        self.tasks = [Task.objects.create(name=f'Task {i}', position=i) for i in range(3)]
+        AssignedTask.objects.create(land=self.land, task=self.tasks[0], employee=self.leaving[0])
+        AssignedTask.objects.create(land=self.land, task=self.tasks[1], employee=self.leaving[0], status='complete')
+        # The colleague already holds Task 2 on this land, so this row conflicts
+        AssignedTask.objects.create(land=self.land, task=self.tasks[2], employee=self.leaving[1])
+        AssignedTask.objects.create(land=self.land, task=self.tasks[2], employee=self.colleague)
+        Message.objects.create(sender=self.leaving[0], receiver=self.colleague, content='Bye')
+
+    def test_dry_run_reports_counts_without_changes(self):
+        """Test that a dry run only counts dependent rows"""
+        from .bulk_operations import bulk_employee_action
+        report = bulk_employee_action([u.id for u in self.leaving], 'delete', dry_run=True)
+        self.assertEqual(report['employees'], 2)
+        self.assertEqual(report['counts']['assigned_tasks'], 3)
+        self.assertEqual(report['counts']['open_assigned_tasks'], 2)
+        self.assertEqual(report['counts']['messages'], 1)
+        self.assertEqual(User.objects.filter(role='employee').count(), 3)
+
+    def test_deactivate(self):
+        """Test that deactivation is applied to the whole batch"""
+        from .bulk_operations import bulk_employee_action
+        report = bulk_employee_action([u.id for u in self.leaving] + [99999], 'deactivate')
+        self.assertEqual(report['employees'], 2)
+        self.assertEqual(report['failures'], {99999: 'Employee not found'})
+        self.assertEqual(User.objects.filter(status='inactive').count(), 2)
+
+    def test_delete_with_reassignment(self):
+        """Test that open tasks move to the colleague before the employees are deleted"""
+        from .bulk_operations import bulk_employee_action
+        from .models import AssignedTask
+        report = bulk_employee_action([u.id for u in self.leaving], 'delete', reassign_to=self.colleague)
+        self.assertEqual(report['reassigned_tasks'], 1)
+        self.assertEqual(len(report['conflicts']), 1)
+        self.assertFalse(User.objects.filter(username__startswith='leaving').exists())
+        self.assertEqual(
+            sorted(AssignedTask.objects.filter(employee=self.colleague).values_list('task__name', flat=True)),
+            ['Task 0', 'Task 2']
+        )
+        self.assertTrue(TaskManage.objects.filter(task=self.tasks[0], employee=self.colleague).exists())
+
+
+class BulkReassignTasksTest(TestCase):
+    def setUp(self):
+        """Set up an employee on leave with several open tasks"""
+        from .models import District, Taluka, Village, AssignedTask
+        district = District.objects.create(name='Test District')
+        taluka = Taluka.objects.create(name='Test Taluka', district=district)
+        village = Village.objects.create(name='Test Village', taluka=taluka)
+        self.admin = User.objects.create_user(
+            username='admin1', password='testpass123', role='admin', email='admin1@example.com'
+        )
+        self.on_leave = User.objects.create_user(
+            username='onleave', password='testpass123', role='employee', email='onleave@example.com'
+        )
+        self.colleague = User.objects.create_user(
+            username='colleague', password='testpass123', role='employee', email='colleague@example.com'
+        )
+        self.land = Land.objects.create(
+            name='Land', district=district, taluka=taluka, village=village, sata_prakar='Test', total_area=100
+        )
+        self.assigned = [
+            AssignedTask.objects.create(
+                land=self.land, task=Task.objects.create(name=f'Task {i}', position=i), employee=self.on_leave
+            )
+            for i in range(4)
+        ]
+        self.assigned[3].status = 'complete'
+        self.assigned[3].save()
+        AssignedTask.objects.create(land=self.land, task=self.assigned[2].task, employee=self.colleague)
+
+    def test_bulk_reassign_by_filter(self):
+        """Test that open tasks move in one request and conflicts are reported"""
+        import json
+        from .models import AssignedTask
+        self.client.force_login(self.admin)
+        response = self.client.post(
+            '/api/admin/assigned-tasks/bulk-reassign/',
+            json.dumps({'to_employee': self.colleague.id, 'from_employee': self.on_leave.id}),
+            content_type='application/json'
+        )
+        data = response.json()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(data['reassigned'], 2)
+        self.assertEqual(data['conflicts'], [self.assigned[2].id])
+        self.assertEqual(
+            set(AssignedTask.objects.filter(employee=self.on_leave).values_list('id', flat=True)),
+            {self.assigned[2].id, self.assigned[3].id}
+        )
+        self.assertEqual(Notification.objects.filter(user=self.on_leave).count(), 1)
+        self.assertEqual(Notification.objects.filter(user=self.colleague).count(), 1)
+
+    def test_bulk_reassign_by_id_list(self):
+        """Test that an explicit id list is honoured and unknown ids reported"""
+        from .bulk_operations import bulk_reassign_tasks
+        report = bulk_reassign_tasks(self.colleague, task_ids=[self.assigned[0].id, 99999])
+        self.assertEqual(report['reassigned'], 1)
+        self.assertEqual(report['failures'], {99999: 'Task not found'})
+        self.assertEqual(report['per_employee'], {self.on_leave.id: 1})
+
+
+class BulkTaskTransitionTest(TestCase):
+    def setUp(self):
+        """Set up tasks in a mix of workflow states"""
+        from .models import District, Taluka, Village, AssignedTask
+        district = District.objects.create(name='Test District')
+        taluka = Taluka.objects.create(name='Test Taluka', district=district)
+        village = Village.objects.create(name='Test Village', taluka=taluka)
+        self.admin = User.objects.create_user(
+            username='admin1', password='testpass123', role='admin', email='admin1@example.com'
+        )
+        self.employee = User.objects.create_user(
+            username='emp', password='testpass123', role='employee', email='emp@example.com'
+        )
+        land = Land.objects.create(
+            name='Land', district=district, taluka=taluka, village=village, sata_prakar='Test', total_area=100
+        )
+        self.assigned = []
+        for i, status in enumerate(['pending_approval', 'pending_approval', 'in_progress']):
+            self.assigned.append(AssignedTask.objects.create(
+                land=land, task=Task.objects.create(name=f'Task {i}', position=i),
+                employee=self.employee, status=status
+            ))
+
+    def test_bulk_approve_only_touches_pending_approval(self):
+        """Test that approval skips tasks not awaiting approval and reports per row"""
+        import json
+        from .models import AssignedTask
+        self.client.force_login(self.admin)
+        ids = [task.id for task in self.assigned] + [99999]
+        response = self.client.post(
+            '/api/admin/assigned-tasks/bulk-action/',
+            json.dumps({'action': 'approve', 'task_ids': ids, 'admin_notes': 'Month end'}),
+            content_type='application/json'
+        )
+        data = response.json()
+        self.assertEqual(data['updated'], 2)
+        self.assertEqual(data['results'][str(self.assigned[0].id)], 'approved')
+        self.assertEqual(data['results'][str(self.assigned[2].id)], 'Task is in progress')
+        self.assertEqual(data['results']['99999'], 'Task not found')
+        self.assertEqual(AssignedTask.objects.filter(status='complete', admin_approval_notes='Month end').count(), 2)
+        self.assertEqual(Notification.objects.filter(user=self.employee).count(), 2)
+
+    def test_bulk_reject_and_mark_complete(self):
+        """Test the reject and mark_complete transitions"""
+        from .bulk_operations import bulk_transition_tasks
+        from .models import AssignedTask
+        results, changed = bulk_transition_tasks([self.assigned[0].id], 'reject', 'Redo')
+        self.assertEqual(results, {self.assigned[0].id: 'rejected'})
+        self.assertEqual(AssignedTask.objects.get(id=self.assigned[0].id).status, 'in_progress')
+
+        results, changed = bulk_transition_tasks([self.assigned[1].id, self.assigned[2].id], 'mark_complete')
+        self.assertEqual(len(changed), 1)
+        self.assertEqual(AssignedTask.objects.get(id=self.assigned[2].id).status, 'complete')
+
+
+class LocationBundleTest(TestCase):
+    def setUp(self):
+        """Set up a small location hierarchy"""
+        from .models import District, Taluka, Village
+        self.user = User.objects.create_user(
+            username='emp', password='testpass123', role='employee', email='emp@example.com'
+        )
+        self.district = District.objects.create(name='Test District')
+        self.taluka = Taluka.objects.create(name='Test Taluka', district=self.district)
+        Village.objects.create(name='Test Village', taluka=self.taluka)
+        self.client.force_login(self.user)
+
+    def test_bundle_contains_hierarchy(self):
+        """Test that the bundle lists districts, talukas and villages with parent ids"""
+        response = self.client.get('/api/location/bundle/')
+        data = response.json()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(data['districts'], [[self.district.id, 'Test District', 'Gujarat']])
+        self.assertEqual(data['talukas'], [[self.taluka.id, 'Test Taluka', self.district.id]])
+        self.assertEqual(data['villages'][0][1:], ['Test Village', self.taluka.id])
+        self.assertEqual(response['ETag'], f'"{data["version"]}"')
+
+    def test_conditional_get_until_location_added(self):
+        """Test that a matching ETag gets a 304 until a village is added"""
+        from .models import Village
+        etag = self.client.get('/api/location/bundle/')['ETag']
+        response = self.client.get('/api/location/bundle/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+        Village.objects.create(name='New Village', taluka=self.taluka)
+        response = self.client.get('/api/location/bundle/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()['villages']), 2)
+
+
+class ConditionalListApiTest(TestCase):
+    def setUp(self):
+        """Set up an admin and one task"""
+        self.admin = User.objects.create_user(
+            username='admin', password='testpass123', role='admin', email='admin@example.com'
+        )
+        Task.objects.create(name='Survey', position=1)
+        self.client.force_login(self.admin)
+
+    def test_tasks_api_not_modified_until_task_changes(self):
+        """Test that a matching ETag gets a 304 until a task is added"""
+        response = self.client.get('/api/tasks/')
+        self.assertEqual(response.status_code, 200)
+        etag = response['ETag']
+
+        response = self.client.get('/api/tasks/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+        Task.objects.create(name='Mapping', position=2)
+        response = self.client.get('/api/tasks/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()), 2)
+
+    def test_etag_depends_on_role(self):
+        """Test that users with different roles never share a cached list"""
+        admin_etag = self.client.get('/api/tasks/')['ETag']
+        employee = User.objects.create_user(
+            username='emp', password='testpass123', role='employee', email='emp@example.com'
+        )
+        self.client.force_login(employee)
+        response = self.client.get('/api/tasks/', HTTP_IF_NONE_MATCH=admin_etag)
+        self.assertEqual(response.status_code, 200)
+
+
+class VillageSearchTest(TestCase):
+    def setUp(self):
+        """Set up villages across two talukas"""
+        from .models import District, Taluka, Village
+        self.user = User.objects.create_user(
+            username='emp', password='testpass123', role='employee', email='emp@example.com'
+        )
+        district = District.objects.create(name='Test District')
+        self.taluka = Taluka.objects.create(name='North', district=district)
+        other_taluka = Taluka.objects.create(name='South', district=district)
+        for name in ['Amreli', 'Amod', 'Anand', 'Bhuj']:
+            Village.objects.create(name=name, taluka=self.taluka)
+        Village.objects.create(name='Amla', taluka=other_taluka)
+        self.client.force_login(self.user)
+
+    def test_prefix_search_is_case_insensitive_and_sorted(self):
+        """Test that villages are matched by name prefix with their taluka and district"""
+        response = self.client.get('/api/location/villages/search/', {'q': 'am'})
+        villages = response.json()['villages']
+        self.assertEqual([village['name'] for village in villages], ['Amla', 'Amod', 'Amreli'])
+        self.assertEqual(villages[0]['taluka_name'], 'South')
+        self.assertEqual(villages[0]['district_name'], 'Test District')
+
+    def test_search_within_taluka_and_limit(self):
+        """Test the taluka filter and result cap"""
+        response = self.client.get('/api/location/villages/search/', {
+            'q': 'Am', 'taluka_id': self.taluka.id, 'limit': 1
+        })
+        self.assertEqual([village['name'] for village in response.json()['villages']], ['Amod'])
+
+    def test_new_village_is_searchable(self):
+        """Test that the prefix index picks up villages added after it was built"""
+        from .models import Village
+        self.client.get('/api/location/villages/search/', {'q': 'B'})
+        Village.objects.create(name='Bhavnagar', taluka=self.taluka)
+        response = self.client.get('/api/location/villages/search/', {'q': 'bh'})
+        self.assertEqual([village['name'] for village in response.json()['villages']], ['Bhavnagar', 'Bhuj'])
+
+
+class LoadLocationsTest(TestCase):
+    def test_bundled_file_loads_once(self):
+        """Test that re-running the loader inserts nothing the second time"""
+        from django.core.management import call_command
+        from .models import District, Taluka, Village
+        call_command('load_locations', stdout=io.StringIO())
+        counts = (District.objects.count(), Taluka.objects.count(), Village.objects.count())
+        self.assertTrue(all(counts))
+
+        output = io.StringIO()
+        call_command('load_locations', stdout=output)
+        self.assertEqual(counts, (District.objects.count(), Taluka.objects.count(), Village.objects.count()))
+        self.assertIn('Villages: 0 inserted', output.getvalue())
+
+    def test_csv_rows_diffed_against_existing(self):
+        """Test that only missing rows from a CSV file are inserted"""
+        from .locations import read_location_rows, load_location_rows
+        from .models import District, Taluka, Village
+        district = District.objects.create(name='Kutch')
+        Village.objects.create(name='Mandvi', taluka=Taluka.objects.create(name='Mandvi', district=district))
+
+        with tempfile.NamedTemporaryFile('w', suffix='.csv', delete=False) as handle:
+            handle.write('state,district,taluka,village\n')
+            handle.write('Gujarat,Kutch,Mandvi,Mandvi\n')
+            handle.write('Gujarat,Kutch,Mandvi,Bidada\n')
+            handle.write('Gujarat,Kutch,Bhuj,Madhapar\n')
+            handle.write('Gujarat,Kutch,Bhuj,Madhapar\n')
+        self.addCleanup(os.remove, handle.name)
+
+        report = load_location_rows(read_location_rows(handle.name))
+        self.assertEqual(report['districts'], {'inserted': 0, 'skipped': 1})
+        self.assertEqual(report['talukas'], {'inserted': 1, 'skipped': 1})
+        self.assertEqual(report['villages'], {'inserted': 2, 'skipped': 1})
+        self.assertEqual(Village.objects.filter(taluka__district=district).count(), 3)
+
+
+class SearchIndexTest(TestCase):
+    def setUp(self):
+        """Set up a land with an assigned task and a client"""
+        from .models import District, Taluka, Village, AssignedTask, Client
+        district = District.objects.create(name='Kutch')
+        taluka = Taluka.objects.create(name='Bhuj', district=district)
+        self.village = Village.objects.create(name='Madhapar', taluka=taluka)
+        self.admin = User.objects.create_user(
+            username='admin', password='testpass123', role='admin', email='admin@example.com'
+        )
+        self.employee = User.objects.create_user(
+            username='ravi', password='testpass123', role='employee', email='ravi@example.com', full_name='Ravi Patel'
+        )
+        self.land = Land.objects.create(
+            name='Green Acres', district=district, taluka=taluka, village=self.village,
+            sata_prakar='Test', total_area=100, old_sr_no='123/4'
+        )
+        self.task = Task.objects.create(name='Boundary Survey', position=1)
+        self.assigned = AssignedTask.objects.create(land=self.land, task=self.task, employee=self.employee)
+        self.client_record = Client.objects.create(
+            client_name='Meera Shah', email='meera@example.com', mobile_no='9876543210', whatsapp_no='9876543210'
+        )
+        self.client.force_login(self.admin)
+
+    def search_ids(self, kind, query):
+        from .search import matching_documents
+        return list(matching_documents(kind, query).values_list('object_id', flat=True))
+
+    def test_documents_match_word_prefixes_across_joins(self):
+        """Test that every query word must prefix-match the joined fields"""
+        from .search import LAND, ASSIGNED_TASK, CLIENT
+        self.assertEqual(self.search_ids(ASSIGNED_TASK, 'bound madh'), [self.assigned.id])
+        self.assertEqual(self.search_ids(ASSIGNED_TASK, 'ravi pat'), [self.assigned.id])
+        self.assertEqual(self.search_ids(ASSIGNED_TASK, 'ravi mehta'), [])
+        self.assertEqual(self.search_ids(LAND, '123'), [self.land.id])
+        self.assertEqual(self.search_ids(CLIENT, '98765'), [self.client_record.id])
+
+    def test_documents_follow_renames_and_reassignment(self):
+        """Test that renaming a task and moving the task to another employee reindex it"""
+        from .search import ASSIGNED_TASK
+        from .bulk_operations import bulk_reassign_tasks
+        self.task.name = 'Title Check'
+        self.task.save()
+        self.assertEqual(self.search_ids(ASSIGNED_TASK, 'boundary'), [])
+        self.assertEqual(self.search_ids(ASSIGNED_TASK, 'title'), [self.assigned.id])
+
+        other = User.objects.create_user(
+            username='kiran', password='testpass123', role='employee', email='kiran@example.com'
+        )
+        bulk_reassign_tasks(other, task_ids=[self.assigned.id])
+        self.assertEqual(self.search_ids(ASSIGNED_TASK, 'kiran'), [self.assigned.id])
+
+    def test_assigned_tasks_api_and_unified_search(self):
+        """Test the search parameter of the assigned task list and the unified endpoint"""
+        response = self.client.get('/api/admin/assigned-tasks/', {'search': 'madhapar'})
+        self.assertEqual([task['id'] for task in response.json()['results']], [self.assigned.id])
+
+        response = self.client.get('/api/search/', {'q': 'meera'})
+        results = response.json()['results']
+        self.assertEqual(results['client'], [{'id': self.client_record.id, 'title': 'Meera Shah'}])
+        self.assertEqual(results['land'], [])
+
+    def test_deletes_remove_assigned_task_documents(self):
+        """Test that land deletes, single and bulk, take the cascaded task documents with them"""
+        from .bulk_operations import bulk_delete_lands
+        from .models import AssignedTask, SearchDocument
+        other_land = Land.objects.create(
+            name='Dry Patch', district=self.land.district, taluka=self.land.taluka, village=self.village,
+            sata_prakar='Test', total_area=20
+        )
+        AssignedTask.objects.create(land=other_land, task=self.task, employee=self.employee)
+        self.land.delete()
+        self.assertEqual(SearchDocument.objects.filter(kind='assigned_task').count(), 1)
+        bulk_delete_lands([other_land.id])
+        self.assertFalse(SearchDocument.objects.filter(kind__in=['land', 'assigned_task']).exists())
+
+    def test_unified_search_skips_deleted_rows(self):
+        """Test that documents left behind by a delete without signals are not returned"""
+        from django.db import connection
+        with connection.cursor() as cursor:
+            cursor.execute('DELETE FROM core_assignedtask WHERE id = %s', [self.assigned.id])
+        response = self.client.get('/api/search/', {'q': 'boundary', 'kind': 'assigned_task'})
+        self.assertEqual(response.json()['results']['assigned_task'], [])
+
+    def test_rebuild_drops_deleted_rows(self):
+        """Test that the rebuild command removes documents of deleted rows"""
+        from django.core.management import call_command
+        from django.db import connection
+        from .models import SearchDocument
+        with connection.cursor() as cursor:
+            cursor.execute('DELETE FROM core_assignedtask WHERE id = %s', [self.assigned.id])
+        self.assertTrue(SearchDocument.objects.filter(kind='assigned_task').exists())
+        call_command('rebuild_search_index', stdout=io.StringIO())
+        self.assertFalse(SearchDocument.objects.filter(kind='assigned_task').exists())
+        self.assertEqual(SearchDocument.objects.count(), 2)
+
+
+class QuickSearchTest(TestCase):
+    def setUp(self):
+        """Set up a sold land with an installment, a client and a marketing employee"""
+        from .models import District, Taluka, Village, Client, LandSale, Installment
+        district = District.objects.create(name='Kutch')
+        taluka = Taluka.objects.create(name='Bhuj', district=district)
+        village = Village.objects.create(name='Madhapar', taluka=taluka)
+        self.admin = User.objects.create_user(
+            username='admin', password='testpass123', role='admin', email='admin@example.com'
+        )
+        self.marketing = User.objects.create_user(
+            username='seller', password='testpass123', role='employee', employee_type='marketing',
+            email='seller@example.com'
+        )
+        self.land = Land.objects.create(
+            name='Green Acres', district=district, taluka=taluka, village=village,
+            sata_prakar='Test', total_area=100, old_sr_no='512', new_sr_no='512/A'
+        )
+        Client.objects.create(
+            client_name='Meera Shah', email='meera@example.com', mobile_no='9876543210',
+            whatsapp_no='9876543210', pan_no='ABCDE1234F'
+        )
+        self.sale = LandSale.objects.create(
+            land=self.land, buyer_name='Meera Shah', buyer_contact='9876543210',
+            sale_date=datetime.date(2025, 1, 1), marketing_employee=self.admin
+        )
+        self.installment = Installment.objects.create(
+            land_sale=self.sale, installment_number=1, percentage=50,
+            due_date=datetime.date(2025, 2, 1), utr_reference='UTR512998'
+        )
+
+    def quick_search(self, user, query):
+        self.client.force_login(user)
+        return self.client.get('/api/search/quick/', {'q': query}).json()['results']
+
+    def test_hits_are_typed_and_ranked(self):
+        """Test that exact identifier matches rank before prefix and text matches"""
+        results = self.quick_search(self.admin, '512')
+        self.assertEqual(results[0]['kind'], 'land')
+        self.assertEqual(results[0]['rank'], 0)
+        self.assertEqual(results[0]['url'], f'/dashboard/admin/land/{self.land.id}/tasks/')
+
+        results = self.quick_search(self.admin, 'abcde1234f')
+        self.assertEqual([(hit['kind'], hit['rank']) for hit in results], [('client', 0)])
+
+        results = self.quick_search(self.admin, 'utr512')
+        self.assertEqual([(hit['kind'], hit['id']) for hit in results], [('installment', self.installment.id)])
+
+        kinds = {hit['kind'] for hit in self.quick_search(self.admin, '98765')}
+        self.assertEqual(kinds, {'client', 'land_sale'})
+
+    def test_marketing_scope(self):
+        """Test that marketing employees do not see other people's sales or users"""
+        kinds = {hit['kind'] for hit in self.quick_search(self.marketing, 'meera')}
+        self.assertEqual(kinds, {'client'})
+        self.assertEqual(self.quick_search(self.marketing, 'admin'), [])
+
+
+class ClientListApiTest(TestCase):
+    def setUp(self):
+        """Set up clients of several types created by two users"""
+        from .models import Client
+        self.admin = User.objects.create_user(
+            username='admin', password='testpass123', role='admin', email='admin@example.com'
+        )
+        self.marketing = User.objects.create_user(
+            username='seller', password='testpass123', role='employee', employee_type='marketing',
+            email='seller@example.com', full_name='Seller'
+        )
+        for i in range(5):
+            Client.objects.create(
+                client_name=f'Lead {i}', client_type='lead_generation', email=f'lead{i}@example.com',
+                mobile_no=f'98000000{i:02d}', whatsapp_no=f'98000000{i:02d}', created_by=self.marketing
+            )
+        Client.objects.create(
+            client_name='Owner', client_type='property_owner', email='owner@example.com',
+            mobile_no='9700000000', whatsapp_no='9700000000', created_by=self.admin, is_active=False
+        )
+        self.client.force_login(self.admin)
+
+    def test_pages_and_type_counts(self):
+        """Test that a page holds page_size clients and the type counts ignore the type filter"""
+        response = self.client.get('/api/clients/', {'page_size': 2, 'page': 2, 'client_type': 'lead_generation'})
+        data = response.json()
+        self.assertEqual(data['count'], 5)
+        self.assertEqual(data['total_pages'], 3)
+        self.assertEqual([client['client_name'] for client in data['clients']], ['Lead 2', 'Lead 1'])
+        self.assertEqual(data['clients'][0]['created_by'], 'Seller')
+        self.assertEqual(data['type_counts'], {
+            'property_owner': 1, 'lead_generation': 5, 'web_by_reference': 0, 'direct_visit': 0
+        })
+
+    def test_filters(self):
+        """Test the created_by, is_active, search and date filters"""
+        data = self.client.get('/api/clients/', {'created_by': self.admin.id}).json()
+        self.assertEqual([client['client_name'] for client in data['clients']], ['Owner'])
+
+        data = self.client.get('/api/clients/', {'is_active': 'false'}).json()
+        self.assertEqual(data['count'], 1)
+
+        data = self.client.get('/api/clients/', {'search': 'lead 3'}).json()
+        self.assertEqual([client['client_name'] for client in data['clients']], ['Lead 3'])
+
+        data = self.client.get('/api/clients/', {'date_from': '2000-01-01', 'date_to': '2000-12-31'}).json()
+        self.assertEqual(data['count'], 0)
+
+        response = self.client.get('/api/clients/', {'date_from': 'yesterday'})
+        self.assertEqual(response.status_code, 400)
+
+    def test_clients_page_renders_without_rows(self):
+        """Test that the clients page is a shell filled in from the API"""
+        response = self.client.get('/dashboard/admin/clients/', {'search': 'Owner'})
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, 'value="Owner"')
+        self.assertNotContains(response, 'owner@example.com')
+
+
+class ClientPickerTest(TestCase):
+    def setUp(self):
+        """Set up a few clients and a marketing employee"""
+        from .models import Client
+        self.marketing = User.objects.create_user(
+            username='seller', password='testpass123', role='employee', employee_type='marketing',
+            email='seller@example.com'
+        )
+        for name, mobile in [('Meera Shah', '9876500001'), ('Mehul Desai', '9812300002'), ('Arjun Rao', '9876500003')]:
+            Client.objects.create(client_name=name, email=f'{mobile}@example.com', mobile_no=mobile, whatsapp_no=mobile)
+        self.client.force_login(self.marketing)
+
+    def test_matches_name_or_mobile_prefix(self):
+        """Test that names match by word prefix and digits by mobile prefix"""
+        data = self.client.get('/api/clients/picker/', {'q': 'me'}).json()
+        self.assertEqual({client['name'] for client in data['clients']}, {'Meera Shah', 'Mehul Desai'})
+        self.assertEqual(set(data['clients'][0]), {'id', 'name', 'mobile'})
+
+        data = self.client.get('/api/clients/picker/', {'q': '98765'}).json()
+        self.assertEqual([client['name'] for client in data['clients']], ['Arjun Rao', 'Meera Shah'])
+
+    def test_empty_query_lists_newest_with_limit(self):
+        """Test that an empty query returns the newest clients up to the limit"""
+        data = self.client.get('/api/clients/picker/', {'limit': 2}).json()
+        self.assertEqual([client['name'] for client in data['clients']], ['Arjun Rao', 'Mehul Desai'])
+
+
+class ClientImportTest(TestCase):
+    CSV = (
+        'Name,Mobile,Email,PAN,Aadhaar,Type\n'
+        'Meera Shah,+91 98765 00001,meera@example.com,abcde1234f,,\n'
+        'Bad Mobile,12345,bad@example.com,,,\n'
+        'Existing,9876500009,existing@example.com,,,\n'
+        '\n'
+        'Repeat,09876500001,repeat@example.com,,,\n'
+        'Owner,9876500002,owner@example.com,,1234 5678 9012,Property Owner\n'
+    )
+
+    def setUp(self):
+        """Set up an admin and a client whose mobile is already taken"""
+        from .models import Client
+        self.admin = User.objects.create_user(
+            username='admin', password='testpass123', role='admin', email='admin@example.com'
+        )
+        Client.objects.create(client_name='Existing', email='e@example.com', mobile_no='9876500009', whatsapp_no='9876500009')
+        self.client.force_login(self.admin)
+
+    def upload(self, **data):
+        from django.core.files.uploadedfile import SimpleUploadedFile
+        return self.client.post('/api/clients/import/', {
+            'file': SimpleUploadedFile('clients.csv', self.CSV.encode(), content_type='text/csv'), **data
+        }).json()
+
+    def test_import_reports_row_errors(self):
+        """Test that valid rows are created and bad or duplicate rows are reported by row number"""
+        from .models import Client
+        data = self.upload()
+        self.assertTrue(data['success'])
+        self.assertEqual((data['total'], data['created'], data['skipped']), (5, 2, 3))
+        self.assertEqual([error['row'] for error in data['errors']], [3, 4, 6])
+        self.assertIn('already exists', data['errors'][1]['errors'][0])
+        self.assertIn('earlier in the file', data['errors'][2]['errors'][0])
+
+        meera = Client.objects.get(mobile_no='9876500001')
+        self.assertEqual((meera.pan_no, meera.whatsapp_no, meera.client_type), ('ABCDE1234F', '9876500001', 'lead_generation'))
+        self.assertEqual(meera.created_by, self.admin)
+        self.assertEqual(Client.objects.get(mobile_no='9876500002').client_type, 'property_owner')
+        # bulk_create bypasses signals; imported clients must still be searchable
+        self.assertEqual(self.client.get('/api/clients/picker/', {'q': 'meera'}).json()['clients'][0]['mobile'], '9876500001')
+
+    def test_dry_run_writes_nothing(self):
+        """Test that a dry run validates without creating clients"""
+        from .models import Client
+        data = self.upload(dry_run='true')
+        self.assertEqual(data['created'], 2)
+        self.assertEqual(Client.objects.count(), 1)
+
+    def test_xlsx_and_command(self):
+        """Test importing an XLSX workbook through the management command"""
+        from django.core.management import call_command
+        from openpyxl import Workbook
+        from .models import Client
+        workbook = Workbook()
+        workbook.active.append(['Client Name', 'Mobile No', 'Email'])
+        workbook.active.append(['Numeric Cell', 9876500005, 'numeric@example.com'])
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'clients.xlsx')
+            workbook.save(path)
+            out = io.StringIO()
+            call_command('import_clients', path, '--created-by', 'admin', stdout=out)
+        self.assertIn('Imported 1 of 1 rows', out.getvalue())
+        self.assertTrue(Client.objects.filter(mobile_no='9876500005', created_by=self.admin).exists())
+
+    def test_values_the_database_would_reject_are_row_errors(self):
+        """Test that non-finite, oversized or over-precise amounts and over-long names are reported per row"""
+        from .clients import import_clients
+        from .models import Client
+        rows = [
+            {'client_name': 'Not A Number', 'mobile_no': '9876500011', 'email': 'a@example.com', 'approx_investment': 'NaN'},
+            {'client_name': 'Too Big', 'mobile_no': '9876500012', 'email': 'b@example.com', 'approx_investment': '1e20'},
+            {'client_name': 'Too Precise', 'mobile_no': '9876500013', 'email': 'c@example.com', 'approx_investment': '10.125'},
+            {'client_name': 'x' * 300, 'mobile_no': '9876500014', 'email': 'd@example.com'},
+            {'client_name': 'Fine', 'mobile_no': '9876500015', 'email': 'e@example.com', 'approx_investment': '1,50,000.50'},
+        ]
+        report = import_clients(rows)
+        self.assertEqual((report['created'], report['skipped']), (1, 4))
+        self.assertEqual([error['row'] for error in report['errors']], [2, 3, 4, 5])
+        self.assertIn('must be a number', report['errors'][0]['errors'][0])
+        self.assertIn('at most 255 characters', report['errors'][3]['errors'][0])
+        self.assertEqual(str(Client.objects.get(mobile_no='9876500015').approx_investment), '150000.50')
+
+    def test_failed_batch_does_not_abort_the_import(self):
+        """Test that a batch the database rejects is reported and later batches still import"""
+        from unittest import mock
+        from django.db import DataError
+        from .clients import import_clients
+        from .models import Client
+        rows = [
+            {'client_name': 'First', 'mobile_no': '9876500021', 'email': 'a@example.com'},
+            {'client_name': 'Second', 'mobile_no': '9876500022', 'email': 'b@example.com'},
+        ]
+        bulk_create = Client.objects.bulk_create
+
+        def reject_first(clients):
+            if clients[0].mobile_no == '9876500021':
+                raise DataError('value too long')
+            return bulk_create(clients)
+
+        with mock.patch.object(Client.objects, 'bulk_create', side_effect=reject_first):
+            report = import_clients(rows, batch_size=1)
+        self.assertEqual((report['created'], report['skipped']), (1, 1))
+        self.assertIn('value too long', report['errors'][0]['errors'][0])
+        self.assertTrue(Client.objects.filter(mobile_no='9876500022').exists())
+
+
+class ReminderDispatchTest(TestCase):
+    def setUp(self):
+        """Set up a user with reminders before and after now"""
+        from .models import Reminder
+        self.user = User.objects.create_user(
+            username='owner', password='testpass123', role='admin', email='owner@example.com'
+        )
+        now = timezone.now()
+        for title, offset in [('Missed call', -7200), ('Due now', -30), ('Tomorrow', 86400)]:
+            Reminder.objects.create(
+                title=title, description=title, created_by=self.user, assigned_to=self.user,
+                reminder_time=now + datetime.timedelta(seconds=offset),
+            )
+
+    def test_delivers_due_reminders_once(self):
+        """Test that overdue reminders are caught up in batches and never delivered twice"""
+        from .models import Notification, Reminder
+        from .reminders import dispatch_due_reminders
+        self.assertEqual(dispatch_due_reminders(batch_size=1), 2)
+        self.assertEqual(
+            sorted(Notification.objects.filter(user=self.user).values_list('message', flat=True))[0][:22],
+            'Reminder: Due now (due'
+        )
+        self.assertEqual(Notification.objects.count(), 2)
+        self.assertFalse(Reminder.objects.get(title='Tomorrow').delivered_at)
+
+        self.assertEqual(dispatch_due_reminders(), 0)
+        self.assertEqual(dispatch_due_reminders(lookahead=datetime.timedelta(days=2)), 1)
+        self.assertEqual(Notification.objects.count(), 3)
+
+    def test_completed_reminders_are_skipped(self):
+        """Test that completed reminders do not notify"""
+        from django.core.management import call_command
+        from .models import Notification, Reminder
+        Reminder.objects.get(title='Missed call').mark_completed()
+        out = io.StringIO()
+        call_command('dispatch_reminders', '--once', stdout=out)
+        self.assertIn('Delivered 1 reminder', out.getvalue())
+        self.assertEqual(Notification.objects.count(), 1)
+
+
+class CacheNamespaceTest(TestCase):
+    def setUp(self):
+        """Start every test from an empty cache"""
+        from django.core.cache import cache
+        cache.clear()
+        self.admin = User.objects.create_user(
+            username='admin', password='testpass123', role='admin', email='admin@example.com'
+        )
+
+    def test_hits_misses_and_signal_invalidation(self):
+        """Test that values are reused until a model in the namespace is saved"""
+        from .caching import get_cached, cache_stats
+        calls = []
+
+        def compute():
+            calls.append(1)
+            return User.objects.filter(role='employee').count()
+
+        self.assertEqual(get_cached('employees', 'count', compute), 0)
+        self.assertEqual(get_cached('employees', 'count', compute), 0)
+        self.assertEqual(len(calls), 1)
+
+        User.objects.create_user(username='dev', password='testpass123', role='employee', email='dev@example.com')
+        self.assertEqual(get_cached('employees', 'count', compute), 1)
+        self.assertEqual(len(calls), 2)
+        self.assertEqual((cache_stats()['employees']['hits'], cache_stats()['employees']['misses']), (1, 2))
+
+    def test_versions_are_shared_through_the_database(self):
+        """Test that a version moved by another process retires this process's entries"""
+        from django.db.models import F
+        from .caching import get_cached
+        from .models import ResourceVersion
+        self.assertEqual(get_cached('employees', 'count', lambda: 'old'), 'old')
+        # What a write handled by another worker leaves behind: the counter moved, this cache untouched
+        ResourceVersion.objects.filter(name='cache.employees').update(version=F('version') + 1)
+        self.assertEqual(get_cached('employees', 'count', lambda: 'new'), 'new')
+
+    def test_cache_stats_command_flags_a_process_local_cache(self):
+        """Test that cache_stats says when its counters are only its own process's"""
+        from django.core.management import call_command
+        out = io.StringIO()
+        call_command('cache_stats', '--invalidate', 'employees', stdout=out)
+        self.assertIn('locmem', out.getvalue())
+        self.assertIn('Invalidated employees', out.getvalue())
+
+    def test_bulk_status_change_invalidates_namespaces(self):
+        """Test that queryset updates in bulk actions still retire cached employee data"""
+        from . import bulk_operations
+        from .caching import namespace_version
+        employee = User.objects.create_user(
+            username='dev', password='testpass123', role='employee', employee_type='backoffice', email='dev@example.com'
+        )
+        before = namespace_version('employees'), namespace_version('dashboard_stats')
+        bulk_operations.bulk_employee_action([employee.id], 'deactivate')
+        after = namespace_version('employees'), namespace_version('dashboard_stats')
+        self.assertNotEqual(before[0], after[0])
+        self.assertNotEqual(before[1], after[1])
+
+    def test_admin_dashboard_counts(self):
+        """Test that the cached dashboard counts follow new employees"""
+        self.client.force_login(self.admin)
+        self.assertEqual(self.client.get('/dashboard/admin/').context['backoffice_devs'], 0)
+        User.objects.create_user(
+            username='dev', password='testpass123', role='employee', employee_type='backoffice', email='dev@example.com'
+        )
+        self.assertEqual(self.client.get('/dashboard/admin/').context['backoffice_devs'], 1)
+
+
+class SessionMaintenanceTest(TestCase):
+    def test_prune_removes_only_expired_sessions(self):
+        """Test that expired sessions are deleted in batches and live ones kept"""
+        from django.contrib.sessions.models import Session
+        from .maintenance import clear_expired_sessions
+        now = timezone.now()
+        for index in range(5):
+            Session.objects.create(session_key=f'expired{index}', session_data='', expire_date=now - datetime.timedelta(days=1))
+        Session.objects.create(session_key='live', session_data='', expire_date=now + datetime.timedelta(days=1))
+
+        self.assertEqual(clear_expired_sessions(batch_size=2), 5)
+        self.assertEqual(list(Session.objects.values_list('session_key', flat=True)), ['live'])
+
+    def test_login_page_does_not_create_session(self):
+        """Test that viewing the login page and logging out leave no session rows behind"""
+        from django.contrib.sessions.models import Session
+        self.client.get('/login/')
+        self.assertEqual(Session.objects.count(), 0)
+
+        User.objects.create_user(username='admin', password='testpass123', role='admin', email='admin@example.com')
+        self.client.post('/login/', {'username': 'admin', 'password': 'testpass123'})
+        self.assertEqual(Session.objects.count(), 1)
+        self.client.get('/logout/')
+        self.assertEqual(Session.objects.count(), 0)
+
+
+class PermissionDecoratorTest(TestCase):
+    def setUp(self):
+        """Set up an admin, a marketing employee and an inactive employee"""
+        from django.core.cache import cache
+        cache.clear()
+        self.admin = User.objects.create_user(
+            username='admin', password='testpass123', role='admin', email='admin@example.com'
+        )
+        self.marketing = User.objects.create_user(
+            username='seller', password='testpass123', role='employee', employee_type='marketing',
+            status='active', email='seller@example.com'
+        )
+        self.inactive = User.objects.create_user(
+            username='gone', password='testpass123', role='employee', employee_type='backoffice',
+            status='inactive', email='gone@example.com'
+        )
+
+    def test_role_checks(self):
+        """Test anonymous, wrong-role and allowed access through the decorators"""
+        response = self.client.get('/api/employees/')
+        self.assertEqual(response.status_code, 302)
+        self.assertIn('/login/?next=/api/employees/', response['Location'])
+
+        self.client.force_login(self.marketing)
+        self.assertEqual(self.client.get('/api/employees/').status_code, 403)
+        self.assertEqual(self.client.get('/dashboard/admin/').status_code, 302)
+        self.assertTrue(self.client.get('/api/clients/').json()['success'])
+
+    def test_inactive_employee_is_logged_out(self):
+        """Test that inactive employees are logged out of employee pages"""
+        self.client.force_login(self.inactive)
+        response = self.client.get('/dashboard/employee/chat/')
+        self.assertEqual(response.status_code, 302)
+        self.assertNotIn('_auth_user_id', self.client.session)
+
+    def test_unread_counts_use_one_grouped_query(self):
+        """Test that chat unread counts come from one grouped query and see new employees at once"""
+        from .models import Message
+        Message.objects.create(sender=self.marketing, receiver=self.admin, content='hello')
+        Message.objects.create(sender=self.marketing, receiver=self.admin, content='again')
+        Message.objects.create(sender=self.admin, receiver=self.marketing, content='reply')
+
+        self.client.force_login(self.admin)
+        self.assertEqual(self.client.get('/chat/unread_count', {'all': '1'}).json()['unread_counts'], {'seller': 2, 'gone': 0})
+        # session + user + employees + unread aggregate
+        with self.assertNumQueries(4):
+            self.assertEqual(self.client.get('/chat/unread_count').json()['unread_count'], 2)
+
+        # Added without the User signals, as another worker's write looks to this one
+        newcomer = User.objects.create(username='newcomer', role='employee', email='newcomer@example.com')
+        Message.objects.create(sender=newcomer, receiver=self.admin, content='hi')
+        self.assertEqual(self.client.get('/chat/unread_count').json()['unread_count'], 3)
+        self.client.post('/chat/mark_read/')
+        self.assertEqual(self.client.get('/chat/unread_count').json()['unread_count'], 0)
+
+        self.client.force_login(self.marketing)
+        self.assertEqual(self.client.get('/chat/unread_count').json()['unread_count'], 1)
+
+
+class ImportCostTest(TestCase):
+    def test_urlconf_does_not_load_report_stack(self):
+        """Test that importing the URLconf in a fresh interpreter leaves ReportLab and PIL unloaded"""
+        from django.core.management import call_command
+        out = io.StringIO()
+        call_command('import_benchmark', '--runs', '1', stdout=out)
+        self.assertIn('Heavy modules loaded: none', out.getvalue())
+
+
+class StaticPipelineTest(TestCase):
+    def test_collectstatic_minifies_hashes_and_compresses(self):
+        """Test that collectstatic writes minified, hashed, gzipped assets, skips backups and serves them immutable"""
+        from django.core.management import call_command
+        from django.test import Client as HttpClient, override_settings
+        with tempfile.TemporaryDirectory() as source, tempfile.TemporaryDirectory() as root:
+            os.makedirs(os.path.join(source, 'js'))
+            with open(os.path.join(source, 'js', 'app.js'), 'w') as handle:
+                handle.write('// comment\nfunction add(first, second) {\n    return first + second;\n}\n' * 50)
+            with open(os.path.join(source, 'js', 'app.js.backup'), 'w') as handle:
+                handle.write('var old = 1;\n')
+            with override_settings(
+                STATIC_ROOT=root,
+                STATICFILES_DIRS=[source],
+                STATICFILES_FINDERS=['django.contrib.staticfiles.finders.FileSystemFinder'],
+            ):
+                call_command('collectstatic', interactive=False, verbosity=0)
+                names = os.listdir(os.path.join(root, 'js'))
+                hashed = [name for name in names if name.startswith('app.') and name.endswith('.js') and name != 'app.js']
+                self.assertEqual(len(hashed), 1)
+                self.assertIn(hashed[0] + '.gz', names)
+                self.assertNotIn('app.js.backup', names)
+                with open(os.path.join(root, 'js', hashed[0])) as handle:
+                    minified = handle.read()
+                self.assertNotIn('// comment', minified)
+                self.assertLess(len(minified), len('function add(first, second) {\n    return first + second;\n}\n') * 50)
+
+                response = HttpClient().get(f'/static/js/{hashed[0]}')
+                self.assertIn('immutable', response['Cache-Control'])
+
+
+class AsyncPollingViewTest(TestCase):
+    def setUp(self):
+        """Set up an admin and an employee with messages, notifications and a reminder"""
+        from django.core.cache import cache
+        from .models import Message, Reminder
+        cache.clear()
+        self.admin = User.objects.create_user(
+            username='admin', password='testpass123', role='admin', email='admin@example.com'
+        )
+        self.employee = User.objects.create_user(
+            username='field', password='testpass123', role='employee', status='active', email='field@example.com'
+        )
+        Message.objects.create(sender=self.employee, receiver=self.admin, content='hello')
+        Message.objects.create(sender=self.admin, receiver=self.employee, content='reply')
+        notify([self.admin], 'Land sold')
+        Reminder.objects.create(
+            title='Call buyer', description='Call buyer', created_by=self.admin, assigned_to=self.admin,
+            reminder_time=timezone.now() + datetime.timedelta(hours=1),
+        )
+
+    def responses(self, user, sync_view, async_view, path):
+        """Render path through the sync and the async view as user and return both JSON bodies"""
+        import json
+        from asgiref.sync import async_to_sync
+        from django.test import AsyncRequestFactory, RequestFactory
+
+        async def auser():
+            return user
+        request = RequestFactory().get(path)
+        request.user = user
+        async_request = AsyncRequestFactory().get(path)
+        async_request.user = user
+        async_request.auser = auser
+        return json.loads(sync_view(request).content), json.loads(async_to_sync(async_view)(async_request).content)
+
+    def test_async_views_match_sync_views(self):
+        """Test that the async polling views return what the sync views return"""
+        from .views import chat, installments
+        for user in (self.admin, self.employee):
+            for sync_view, async_view, path in [
+                (chat.chat_unread_count, chat.achat_unread_count, '/chat/unread_count?all=1'),
+                (chat.chat_unread_count, chat.achat_unread_count, '/chat/unread_count'),
+                (chat.user_notifications, chat.auser_notifications, '/notifications/user/'),
+                (installments.get_reminders_api, installments.aget_reminders_api, '/api/reminders/'),
+            ]:
+                expected, actual = self.responses(user, sync_view, async_view, path)
+                self.assertEqual(actual, expected)
+
+        expected, _ = self.responses(self.admin, chat.chat_unread_count, chat.achat_unread_count, '/chat/unread_count?all=1')
+        self.assertEqual(expected, {'unread_counts': {'field': 1}})
+        _, actual = self.responses(self.admin, installments.get_reminders_api, installments.aget_reminders_api, '/api/reminders/')
+        self.assertEqual([reminder['title'] for reminder in actual['reminders']], ['Call buyer'])
+
+
+class TableFragmentCacheTest(TestCase):
+    def setUp(self):
+        """Set up an admin, an inventory land and a sold land"""
+        from django.core.cache import cache
+        from .models import District, Taluka, Village
+        cache.clear()
+        self.admin = User.objects.create_user(
+            username='admin', password='testpass123', role='admin', email='admin@example.com'
+        )
+        district = District.objects.create(name='Anand')
+        taluka = Taluka.objects.create(name='Borsad', district=district)
+        self.village = Village.objects.create(name='Kasari', taluka=taluka)
+        self.inventory = Land.objects.create(
+            name='Patel Farm', district=district, taluka=taluka, village=self.village,
+            sata_prakar='Juni', total_area=100, status='inventory'
+        )
+        self.sold = Land.objects.create(
+            name='Shah Plot', district=district, taluka=taluka, village=self.village,
+            sata_prakar='Navi', total_area=50, status='in_process'
+        )
+        self.client.force_login(self.admin)
+
+    def test_rows_follow_saves_not_silent_updates(self):
+        """Test that cached rows are reused until the land is saved"""
+        self.assertContains(self.client.get('/inventory/'), 'Patel Farm')
+        # A queryset update sends no signal and leaves updated_at alone
+        Land.objects.filter(id=self.inventory.id).update(name='Renamed Farm')
+        self.assertContains(self.client.get('/inventory/'), 'Patel Farm')
+
+        self.inventory.refresh_from_db()
+        self.inventory.save()
+        response = self.client.get('/inventory/')
+        self.assertContains(response, 'Renamed Farm')
+        self.assertNotContains(response, 'Patel Farm')
+
+    def test_sales_and_village_names_refresh_cards(self):
+        """Test that a new sale and a village rename reach the cached cards"""
+        from .models import LandSale
+        self.assertNotContains(self.client.get('/sold-lands/'), 'Mehta')
+        LandSale.objects.create(land=self.sold, buyer_name='Mehta', sale_date=datetime.date.today())
+        self.assertContains(self.client.get('/sold-lands/'), 'Mehta')
+
+        self.village.name = 'Kasari Navu'
+        self.village.save()
+        self.assertContains(self.client.get('/sold-lands/'), 'Kasari Navu')
+
+    def test_tables_follow_versions_moved_by_other_workers(self):
+        """Test that a land_tables version bumped in the database re-renders this worker's cached table"""
+        from django.db.models import F
+        from .models import ResourceVersion
+        self.assertContains(self.client.get('/inventory/'), 'Patel Farm')
+        # Another worker's delete: its signal bumps the shared counter, this worker's cache is untouched
+        Land.objects.filter(id=self.inventory.id).update(status='sold')
+        ResourceVersion.objects.filter(name='cache.land_tables').update(version=F('version') + 1)
+        self.assertNotContains(self.client.get('/inventory/'), 'Patel Farm')
+
+    def test_cached_table_skips_land_query(self):
+        """Test that a warm table fragment renders without querying the land rows"""
+        Land.objects.create(
+            name='Desai Wadi', district=self.village.taluka.district, taluka=self.village.taluka,
+            village=self.village, sata_prakar='Juni', total_area=75
+        )
+        self.client.get('/dashboard/admin/land/')
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+        with CaptureQueriesContext(connection) as queries:
+            self.assertContains(self.client.get('/dashboard/admin/land/'), 'Kasari')
+        self.assertFalse([query for query in queries if 'core_village' in query['sql']])
+
+
+class TaskCatalogTest(TestCase):
+    def setUp(self):
+        """Set up two tasks, one marketing, and their assigned employees"""
+        from django.core.cache import cache
+        cache.clear()
+        self.ravi = User.objects.create_user(
+            username='ravi', password='testpass123', role='employee', full_name='Ravi Patel', email='ravi@example.com'
+        )
+        self.meena = User.objects.create_user(
+            username='meena', password='testpass123', role='employee', email='meena@example.com'
+        )
+        self.survey = Task.objects.create(name='Survey', position=1, completion_days=5)
+        self.listing = Task.objects.create(name='Listing', position=2, marketing_task=True)
+        TaskManage.objects.create(task=self.survey, employee=self.ravi)
+        TaskManage.objects.create(task=self.survey, employee=self.meena)
+
+    def test_catalog_loads_in_two_queries_and_is_cached(self):
+        """Test that a miss costs two queries and a hit only the version lookup"""
+        from .task_catalog import task_catalog
+        with self.assertNumQueries(3):
+            catalog = task_catalog()
+        with self.assertNumQueries(1):
+            self.assertEqual(task_catalog(), catalog)
+
+        survey, listing = catalog
+        self.assertEqual(survey.name, 'Survey')
+        self.assertEqual(survey.completion_days, 5)
+        self.assertEqual(survey.assigned_employees_display, 'meena, Ravi Patel')
+        self.assertEqual(survey.assigned_employees_count, 2)
+        self.assertEqual(listing.assigned_employees_count, 0)
+        self.assertEqual(task_catalog(marketing_task=False), (survey,))
+        self.assertEqual(task_catalog(marketing_task=True), (listing,))
+
+    def test_task_manage_and_employee_changes_invalidate(self):
+        """Test that assignment changes and employee renames reach the catalog"""
+        from .task_catalog import task_catalog
+        task_catalog()
+        TaskManage.objects.filter(task=self.survey, employee=self.meena).delete()
+        self.assertEqual(task_catalog()[0].assigned_employees_display, 'Ravi Patel')
+
+        self.ravi.full_name = 'Ravi Shah'
+        self.ravi.save()
+        self.assertEqual(task_catalog()[0].assigned_employees_display, 'Ravi Shah')
+
+        self.survey.completion_days = 7
+        self.survey.save()
+        self.assertEqual(task_catalog()[0].completion_days, 7)
+
+
+class TaskReportingTest(TestCase):
+    def setUp(self):
+        """Set up an admin, an employee and a land task due in three days"""
+        from .models import District, Taluka, Village, AssignedTask
+        district = District.objects.create(name='Anand')
+        taluka = Taluka.objects.create(name='Borsad', district=district)
+        village = Village.objects.create(name='Kasari', taluka=taluka)
+        self.admin = User.objects.create_user(
+            username='admin', password='testpass123', role='admin', email='admin@example.com'
+        )
+        self.employee = User.objects.create_user(
+            username='ravi', password='testpass123', role='employee', full_name='Ravi Patel', email='ravi@example.com'
+        )
+        self.land = Land.objects.create(
+            name='Patel Farm', district=district, taluka=taluka, village=village, sata_prakar='Juni', total_area=100
+        )
+        self.survey = Task.objects.create(name='Survey', position=1, completion_days=3)
+        self.assigned = AssignedTask.objects.create(
+            land=self.land, task=self.survey, employee=self.employee, completion_days=3,
+            due_date=timezone.now() + datetime.timedelta(days=3)
+        )
+
+    def stats(self):
+        from .models import TaskDailyStat
+        return sorted(TaskDailyStat.objects.values_list(
+            'day', 'employee_id', 'task_id', 'district_id', 'assigned', 'started', 'submitted', 'completed',
+            'completed_on_time', 'completed_late', 'work_seconds', 'work_count', 'approval_seconds', 'approval_count',
+        ))
+
+    def test_workflow_saves_keep_daily_stats_current(self):
+        """Test that each workflow step is counted and a rejection takes the submission back"""
+        from .reporting import report_range, task_report
+        start, end = report_range()
+        self.assertEqual(task_report(start, end)['assigned'], 1)
+
+        task = self.assigned
+        task.status = 'in_progress'
+        task.started_date = timezone.now() - datetime.timedelta(hours=5)
+        task.save(update_fields=['status', 'started_date'])
+        task.submit_for_approval(notes='Done')
+        self.assertEqual(task_report(start, end)['submitted'], 1)
+        self.assertEqual(task_report(start, end)['avg_work_hours'], 5.0)
+
+        task.reject_completion('Missing map')
+        self.assertEqual(task_report(start, end)['submitted'], 0)
+
+        task.submit_for_approval(notes='Map added')
+        task.approve_completion()
+        totals = task_report(start, end)
+        self.assertEqual((totals['started'], totals['submitted'], totals['completed']), (1, 1, 1))
+        self.assertEqual(totals['on_time_rate'], 100.0)
+        self.assertEqual(totals['approval_count'], 1)
+
+    def test_bulk_operations_match_a_full_rebuild(self):
+        """Test that queryset-level transitions and reassignment refresh the stats"""
+        from .bulk_operations import bulk_reassign_tasks, bulk_transition_tasks
+        from .models import AssignedTask
+        from .reporting import rebuild_stats
+        other = User.objects.create_user(
+            username='meena', password='testpass123', role='employee', email='meena@example.com'
+        )
+        second = AssignedTask.objects.create(
+            land=self.land, task=Task.objects.create(name='Mapping', position=2), employee=self.employee
+        )
+        for assigned in (self.assigned, second):
+            assigned.mark_in_progress()
+            assigned.submit_for_approval()
+        bulk_transition_tasks([self.assigned.id], 'approve')
+        bulk_reassign_tasks(other, task_ids=[second.id])
+
+        incremental = self.stats()
+        rebuild_stats()
+        self.assertEqual(self.stats(), incremental)
+        self.assertEqual({row[1] for row in incremental if row[6]}, {self.employee.id, other.id})
+
+    def test_refresh_updates_rows_in_place(self):
+        """Test that a save upserts the day's row instead of replacing it, and ignores other days' tasks"""
+        from .models import AssignedTask, TaskDailyStat
+        from .reporting import rebuild_stats
+        earlier = AssignedTask.objects.create(
+            land=Land.objects.create(
+                name='Shah Plot', district=self.land.district, taluka=self.land.taluka, village=self.land.village,
+                sata_prakar='Navi', total_area=50
+            ),
+            task=self.survey, employee=self.employee,
+        )
+        AssignedTask.objects.filter(id=earlier.id).update(assigned_date=timezone.now() - datetime.timedelta(days=40))
+        rebuild_stats()
+        today = TaskDailyStat.objects.get(day=timezone.localdate())
+
+        self.assigned.mark_in_progress()
+        today.refresh_from_db()
+        self.assertEqual((today.assigned, today.started), (1, 1))
+        self.assertEqual(TaskDailyStat.objects.count(), 2)
+
+    def test_deletes_take_tasks_out_of_the_stats(self):
+        """Test that single and bulk land deletes and task deletes refresh the stats"""
+        from .bulk_operations import bulk_delete_lands
+        from .models import AssignedTask
+        from .reporting import rebuild_stats
+        mapping = Task.objects.create(name='Mapping', position=2)
+        other_land = Land.objects.create(
+            name='Shah Plot', district=self.land.district, taluka=self.land.taluka, village=self.land.village,
+            sata_prakar='Navi', total_area=50
+        )
+        kept = AssignedTask.objects.create(land=other_land, task=self.survey, employee=self.employee)
+        dropped = AssignedTask.objects.create(land=other_land, task=mapping, employee=self.employee)
+        third_land = Land.objects.create(
+            name='Desai Wadi', district=self.land.district, taluka=self.land.taluka, village=self.land.village,
+            sata_prakar='Juni', total_area=75
+        )
+        AssignedTask.objects.create(land=third_land, task=mapping, employee=self.employee)
+
+        dropped.delete()
+        self.land.delete()
+        bulk_delete_lands([third_land.id])
+        incremental = self.stats()
+        rebuild_stats()
+        self.assertEqual(self.stats(), incremental)
+        self.assertEqual([(row[2], row[4]) for row in incremental], [(kept.task_id, 1)])
+
+    def test_team_auto_completion_is_counted(self):
+        """Test that approving one assignment counts the teammates it auto-completes"""
+        from .models import AssignedTask
+        from .reporting import report_range, rebuild_stats, task_report
+        start, end = report_range()
+        self.client.force_login(self.admin)
+        for number, path in enumerate(['/api/tasks/{}/approve-completion/', '/approve_task_completion/{}/']):
+            task = Task.objects.create(name=f'Team task {number}', position=number + 2)
+            lead, teammate = [
+                AssignedTask.objects.create(land=self.land, task=task, employee=User.objects.create_user(
+                    username=f'team{number}{member}', password='testpass123', role='employee',
+                    email=f'team{number}{member}@example.com'
+                ))
+                for member in range(2)
+            ]
+            lead.submit_for_approval()
+            response = self.client.post(path.format(lead.id), {'action': 'approve'})
+            self.assertTrue(response.json()['success'])
+            teammate.refresh_from_db()
+            self.assertEqual(teammate.status, 'complete')
+            self.assertEqual(task_report(start, end, task_id=task.id)['completed'], 2)
+
+        incremental = self.stats()
+        rebuild_stats()
+        self.assertEqual(self.stats(), incremental)
+
+    def test_report_api_groups_and_permissions(self):
+        """Test the grouped API response, its validation and that it is admin only"""
+        self.client.force_login(self.admin)
+        response = self.client.get('/api/reports/tasks/', {'group': 'employee'})
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(data['totals']['assigned'], 1)
+        self.assertEqual([(row['label'], row['assigned']) for row in data['rows']], [('Ravi Patel', 1)])
+        self.assertNotIn('employee__username', data['rows'][0])
+
+        self.assertEqual(self.client.get('/api/reports/tasks/', {'group': 'land'}).status_code, 400)
+        self.assertEqual(self.client.get('/api/reports/tasks/', {'start': '2026-13-01'}).status_code, 400)
+        self.assertContains(self.client.get('/dashboard/admin/reports/tasks/'), 'Survey')
+
+        self.client.force_login(self.employee)
+        self.assertEqual(self.client.get('/api/reports/tasks/').status_code, 403)
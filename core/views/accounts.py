@@ -0,0 +1,133 @@
+from django.contrib import messages
+from django.contrib.auth import authenticate, login, logout, update_session_auth_hash
+from django.contrib.auth.decorators import login_required
+from django.http import HttpResponse
+from django.shortcuts import render, redirect
+
+
+def user_login(request):
+    # Clear any existing messages to prevent old system messages from appearing
+    # This is crucial to prevent ADDland validation errors from showing on login page
+    # (marking the storage used clears the stored messages when the response is
+    # written, and only touches the session if messages were actually stored)
+    storage = messages.get_messages(request)
+    storage.used = True
+    
+    if request.method == 'POST':
+        username = request.POST.get('username')
+        password = request.POST.get('password')
+        user = authenticate(request, username=username, password=password)
+        if user is not None:
+            # Check if employee is active (only for employee role)
+            if user.role == 'employee' and user.status != 'active':
+                messages.error(request, 'Your account is inactive. Please contact administrator.')
+                return render(request, 'login.html', {'next': request.GET.get('next', '')})
+            
+            login(request, user)
+            # Debug: Print user role
+            print(f"User authenticated: {user.username}, Role: {user.role}, Status: {user.status}")
+            
+            # Check if there's a next parameter for redirect (from GET or POST)
+            next_url = request.GET.get('next') or request.POST.get('next')
+            if next_url and next_url.startswith('/'):
+                # Redirect to the intended page
+                return redirect(next_url)
+            
+            # Default redirect based on user role and employee type
+            if user.role == 'admin':
+                print("Redirecting to admin dashboard")
+                return redirect('admin-dashboard')
+            elif user.role == 'employee' and user.employee_type == 'marketing':
+                print("Redirecting to marketing employee dashboard")
+                return redirect('marketing-dashboard')
+            else:
+                print("Redirecting to employee dashboard")
+                return redirect('employee-dashboard')
+        else:
+            messages.error(request, 'Invalid username or password')
+    
+    # Store the next parameter in the context for the login form
+    context = {
+        'next': request.GET.get('next', '')
+    }
+    return render(request, 'login.html', context)
+
+def user_logout(request):
+    # Clear all messages before logout to prevent them from appearing on login page
+    storage = messages.get_messages(request)
+    storage.used = True  # Mark all messages as used/read
+    
+    # logout() flushes the session, so there is nothing else to clear in it
+    logout(request)
+    return redirect('login')
+
+def index(request):
+    """
+    Root path handler - redirects to login if not authenticated,
+    or to appropriate dashboard if authenticated
+    """
+    if request.user.is_authenticated:
+        # User is already logged in, redirect to appropriate dashboard
+        if request.user.role == 'admin':
+            return redirect('admin-dashboard')
+        else:
+            return redirect('employee-dashboard')
+    else:
+        # User is not logged in, redirect to login page
+        return redirect('login')
+
+def home(request):
+    """
+    Home path handler - same logic as index
+    """
+    return index(request)
+
+@login_required
+def profile(request):
+    user = request.user
+    if request.method == 'POST':
+        # Handle mobile number update for admin users
+        if user.role == 'admin':
+            user.mobile = request.POST.get('mobile', user.mobile)
+        
+        # Handle profile picture update
+        if 'profile_pic' in request.FILES:
+            user.profile_pic = request.FILES['profile_pic']
+        
+        # Handle password change with current password verification
+        new_password = request.POST.get('new_password')
+        confirm_password = request.POST.get('confirm_password')
+        current_password = request.POST.get('current_password')
+        
+        if new_password or confirm_password:
+            # Password change requested - verify current password
+            if not current_password:
+                messages.error(request, 'Current password is required to change password.')
+                return redirect('profile')
+            
+            if not user.check_password(current_password):
+                messages.error(request, 'Current password is incorrect.')
+                return redirect('profile')
+            
+            if not new_password:
+                messages.error(request, 'New password is required.')
+                return redirect('profile')
+            
+            if new_password != confirm_password:
+                messages.error(request, 'New passwords do not match.')
+                return redirect('profile')
+            
+            # All validations passed - update password
+            user.set_password(new_password)
+            update_session_auth_hash(request, user)
+            messages.success(request, 'Password updated successfully.')
+        
+        # Save user profile
+        user.save()
+        messages.success(request, 'Profile updated successfully.')
+        return redirect('profile')
+    
+    return render(request, 'profile.html', {'user': user})
+
+def users_index(request):
+    return HttpResponse('Users app index')
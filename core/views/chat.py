@@ -0,0 +1,268 @@
+import datetime
+import json
+
+from django.contrib import messages
+from django.contrib.auth.decorators import login_required
+from django.db.models import Q, Count
+from django.http import JsonResponse, HttpResponse
+from django.shortcuts import render, redirect
+from django.views.decorators.http import require_GET
+
+from ..models import User, Message, Notification
+from ..notifications import notify
+from ..permissions import admin_required, active_employee_required, primary_admin, employee_usernames, aprimary_admin, aemployee_usernames
+
+
+# Repeated identical chat messages within this window raise a single notification
+CHAT_NOTIFICATION_WINDOW = datetime.timedelta(minutes=1)
+
+@admin_required
+def admin_chat_index(request):
+    developers = User.objects.filter(role='employee')
+    return render(request, 'admin_chat_index.html', {
+        'developers': developers,
+    })
+
+@admin_required
+def admin_chat(request, developer_username):
+    try:
+        developer = User.objects.get(username=developer_username, role='employee')
+    except User.DoesNotExist:
+        messages.error(request, 'Employee not found')
+        return redirect('admin_chat_index')
+    
+    developers = User.objects.filter(role='employee')
+    messages_list = Message.objects.filter(
+        (Q(sender=request.user, receiver=developer) | Q(sender=developer, receiver=request.user))
+    ).order_by('timestamp')
+    
+    # Mark messages as read when admin visits chat page
+    Message.objects.filter(sender=developer, receiver=request.user, read_by_admin=False).update(read_by_admin=True)
+    
+    if request.method == 'POST':
+        content = request.POST['content']
+        Message.objects.create(sender=request.user, receiver=developer, content=content)
+        notify([developer], f"New chat message from {request.user.username}: {content[:40]}", coalesce_window=CHAT_NOTIFICATION_WINDOW)
+        return redirect('admin_chat', developer_username=developer_username)
+    return render(request, 'admin_chat.html', {
+        'developers': developers,
+        'messages': messages_list,
+        'developer_username': developer_username,
+        'current_developer': developer,
+    })
+
+@active_employee_required
+def employee_chat(request):
+    admin = primary_admin()
+    admin_id, admin_username = admin if admin else (None, None)
+    messages_list = Message.objects.filter(
+        (Q(sender=request.user, receiver_id=admin_id) | Q(sender_id=admin_id, receiver=request.user))
+    ).order_by('timestamp')
+    
+    # Mark messages as read when user visits chat page
+    if admin_id:
+        Message.objects.filter(sender_id=admin_id, receiver=request.user, read_by_dev=False).update(read_by_dev=True)
+    
+    if request.method == 'POST':
+        content = request.POST['content']
+        Message.objects.create(sender=request.user, receiver_id=admin_id, content=content)
+        if admin_id:
+            notify([admin_id], f"New chat message from {request.user.username}: {content[:40]}", coalesce_window=CHAT_NOTIFICATION_WINDOW)
+        return redirect('employee-chat')
+    return render(request, 'employee_chat.html', {
+        'messages': messages_list,
+        'admin_username': admin_username,
+    })
+
+@login_required
+def send_message_ajax(request):
+    if request.method == 'POST':
+        try:
+            data = json.loads(request.body)
+            content = data.get('content', '').strip()
+            receiver_username = data.get('receiver_username', '')
+            
+            if not content or not receiver_username:
+                return JsonResponse({'success': False, 'error': 'Missing content or receiver'}, status=400)
+            
+            # Get receiver user
+            try:
+                receiver = User.objects.get(username=receiver_username)
+            except User.DoesNotExist:
+                return JsonResponse({'success': False, 'error': 'Receiver not found'}, status=404)
+            
+            # Create message
+            message = Message.objects.create(
+                sender=request.user,
+                receiver=receiver,
+                content=content
+            )
+            
+            # Create notification
+            notify([receiver], f"New chat message from {request.user.username}: {content[:40]}", coalesce_window=CHAT_NOTIFICATION_WINDOW)
+            
+            # Return message data
+            return JsonResponse({
+                'success': True,
+                'message': {
+                    'id': message.id,
+                    'content': message.content,
+                    'timestamp': message.timestamp.isoformat(),
+                    'sender_username': message.sender.username,
+                    'sender_full_name': message.sender.full_name or message.sender.username
+                }
+            })
+            
+        except json.JSONDecodeError:
+            return JsonResponse({'success': False, 'error': 'Invalid JSON'}, status=400)
+        except Exception as e:
+            return JsonResponse({'success': False, 'error': str(e)}, status=500)
+    
+    return JsonResponse({'success': False, 'error': 'Method not allowed'}, status=405)
+
+@login_required
+def get_chat_messages_ajax(request):
+    if request.method == 'GET':
+        try:
+            other_user_username = request.GET.get('username', '')
+            
+            if not other_user_username:
+                return JsonResponse({'success': False, 'error': 'Missing username parameter'}, status=400)
+            
+            # Get other user
+            try:
+                other_user = User.objects.get(username=other_user_username)
+            except User.DoesNotExist:
+                return JsonResponse({'success': False, 'error': 'User not found'}, status=404)
+            
+            # Get messages between current user and other user
+            messages = Message.objects.filter(
+                (Q(sender=request.user, receiver=other_user) | Q(sender=other_user, receiver=request.user))
+            ).order_by('timestamp')
+            
+            # Mark messages as read
+            if request.user.role == 'admin':
+                Message.objects.filter(sender=other_user, receiver=request.user, read_by_admin=False).update(read_by_admin=True)
+            else:
+                Message.objects.filter(sender=other_user, receiver=request.user, read_by_dev=False).update(read_by_dev=True)
+            
+            # Format messages for JSON response
+            messages_data = []
+            for msg in messages:
+                messages_data.append({
+                    'id': msg.id,
+                    'content': msg.content,
+                    'timestamp': msg.timestamp.isoformat(),
+                    'sender_username': msg.sender.username,
+                    'sender_full_name': msg.sender.full_name or msg.sender.username,
+                    'is_sent': msg.sender == request.user
+                })
+            
+            return JsonResponse({
+                'success': True,
+                'messages': messages_data
+            })
+            
+        except Exception as e:
+            return JsonResponse({'success': False, 'error': str(e)}, status=500)
+    
+    return JsonResponse({'success': False, 'error': 'Method not allowed'}, status=405)
+
+def _admin_unread_response(request, employees, unread):
+    if request.GET.get('all') == '1':
+        unread_counts = {username: unread.get(employee_id, 0) for employee_id, username in employees.items()}
+        return JsonResponse({'unread_counts': unread_counts})
+    return JsonResponse({'unread_count': sum(unread.values())})
+
+def _admin_unread_rows(user, employees):
+    return Message.objects.filter(
+        sender_id__in=list(employees), receiver=user, read_by_admin=False
+    ).order_by().values('sender_id').annotate(count=Count('id')).values_list('sender_id', 'count')
+
+def _employee_unread(user, admin):
+    return Message.objects.filter(sender_id=admin[0] if admin else None, receiver=user, read_by_dev=False)
+
+@login_required
+def chat_unread_count(request):
+    user = request.user
+    if user.role == 'admin':
+        employees = employee_usernames()
+        return _admin_unread_response(request, employees, dict(_admin_unread_rows(user, employees)))
+    else:
+        return JsonResponse({'unread_count': _employee_unread(user, primary_admin()).count()})
+
+# Async twins of the polling endpoints, routed instead of the sync views when
+# the app is served over ASGI (settings.ASYNC_POLLING) so an idle poller does
+# not hold a worker thread. Under WSGI each call would pay for an event loop.
+
+@login_required
+async def achat_unread_count(request):
+    user = await request.auser()
+    if user.role == 'admin':
+        employees = await aemployee_usernames()
+        unread = {sender_id: count async for sender_id, count in _admin_unread_rows(user, employees)}
+        return _admin_unread_response(request, employees, unread)
+    else:
+        return JsonResponse({'unread_count': await _employee_unread(user, await aprimary_admin()).acount()})
+
+def notifications_index(request):
+    return HttpResponse('Notifications app index')
+
+@login_required
+def mark_read(request):
+    if request.method == 'POST':
+        notification_id = request.POST.get('notification_id')
+        if notification_id:
+            # Mark specific notification as read
+            try:
+                notification = Notification.objects.get(id=notification_id, user=request.user)
+                notification.is_read = True
+                notification.save()
+                return JsonResponse({'success': True})
+            except Notification.DoesNotExist:
+                return JsonResponse({'success': False, 'error': 'Notification not found'}, status=404)
+        else:
+            # Mark all notifications as read
+            Notification.objects.filter(user=request.user, is_read=False).update(is_read=True)
+            return JsonResponse({'success': True})
+    return JsonResponse({'success': False, 'error': 'Invalid request'}, status=400)
+
+@login_required
+def mark_chat_read(request):
+    if request.method == 'POST':
+        if request.user.role == 'admin':
+            # Mark all messages from employees as read by admin
+            Message.objects.filter(
+                sender__role='employee', receiver=request.user, read_by_admin=False
+            ).update(read_by_admin=True)
+        else:
+            # Mark all messages from admin as read by employee
+            admin = primary_admin()
+            if admin:
+                Message.objects.filter(sender_id=admin[0], receiver=request.user, read_by_dev=False).update(read_by_dev=True)
+        return JsonResponse({'success': True})
+    return JsonResponse({'success': False, 'error': 'Invalid request'}, status=400)
+
+def _notification_rows(user):
+    return Notification.objects.filter(user=user).order_by('-timestamp').values('id', 'message', 'is_read', 'timestamp')
+
+def _serialize_notification(n):
+    return {
+        'id': n['id'],
+        'message': n['message'],
+        'is_read': n['is_read'],
+        'timestamp': n['timestamp'].isoformat()
+    }
+
+@require_GET
+@login_required
+def user_notifications(request):
+    data = [_serialize_notification(n) for n in _notification_rows(request.user)]
+    return JsonResponse(data, safe=False)
+
+@require_GET
+@login_required
+async def auser_notifications(request):
+    user = await request.auser()
+    data = [_serialize_notification(n) async for n in _notification_rows(user)]
+    return JsonResponse(data, safe=False)
@@ -0,0 +1,348 @@
+import datetime
+
+from django.http import JsonResponse
+from django.shortcuts import render
+from django.views.decorators.http import require_POST, require_GET
+
+from ..models import Client
+from ..clients import (
+    filter_clients, client_type_counts, serialize_client, pick_clients, read_client_rows, import_clients,
+    CLIENT_PAGE_SIZE, CLIENT_MAX_PAGE_SIZE, CLIENT_PICKER_LIMIT,
+)
+from ..conditional import conditional_resource
+from ..permissions import marketing_or_admin_required
+
+
+@marketing_or_admin_required
+def admin_clients(request):
+    """Admin clients page - accessible to admin and marketing employees"""
+    # Rows, type counts and pagination are loaded from get_clients_api
+    context = {
+        'search_query': request.GET.get('search', ''),
+        'client_type_filter': request.GET.get('client_type', ''),
+        'is_active_filter': request.GET.get('is_active', ''),
+        'client_type_choices': Client.CLIENT_TYPE_CHOICES,
+        'page_size': CLIENT_PAGE_SIZE,
+    }
+    return render(request, 'admin_clients.html', context)
+
+@marketing_or_admin_required
+def add_client(request):
+    """Add new client"""
+    if request.method == 'POST':
+        try:
+            # Get form data
+            client_type = request.POST.get('client_type')
+            search_property_title = request.POST.get('search_property_title', '')
+            client_name = request.POST.get('client_name')
+            email = request.POST.get('email')
+            mobile_no = request.POST.get('mobile_no')
+            another_mobile_no = request.POST.get('another_mobile_no', '')
+            whatsapp_no = request.POST.get('whatsapp_no')
+            pan_no = request.POST.get('pan_no', '')
+            adhar_card_no = request.POST.get('adhar_card_no', '')
+            address = request.POST.get('address', '')
+            approx_investment = request.POST.get('approx_investment', '')
+            choice_in_particular_property = request.POST.get('choice_in_particular_property', '')
+            dob = request.POST.get('dob', '')
+            anniversary = request.POST.get('anniversary', '')
+            any_event = request.POST.get('any_event', '')
+            remark = request.POST.get('remark', '')
+            is_active = request.POST.get('is_active') == 'on'  # Checkbox returns 'on' when checked
+            
+            # Validate required fields
+            if not all([client_name, email, mobile_no, whatsapp_no]):
+                return JsonResponse({'success': False, 'message': 'Please fill all required fields'})
+            
+            # Additional validation
+            import re
+            
+            # Mobile number validation (10 digits)
+            if mobile_no and not re.match(r'^\d{10}$', mobile_no):
+                return JsonResponse({'success': False, 'message': 'Mobile number must be exactly 10 digits.'})
+            
+            # Another mobile number validation (10 digits)
+            if another_mobile_no and not re.match(r'^\d{10}$', another_mobile_no):
+                return JsonResponse({'success': False, 'message': 'Another mobile number must be exactly 10 digits.'})
+            
+            # WhatsApp number validation (10 digits)
+            if whatsapp_no and not re.match(r'^\d{10}$', whatsapp_no):
+                return JsonResponse({'success': False, 'message': 'WhatsApp number must be exactly 10 digits.'})
+            
+            # PAN number validation (10 characters: 5 letters, 4 digits, 1 letter)
+            if pan_no and not re.match(r'^[A-Za-z]{5}[0-9]{4}[A-Za-z]{1}$', pan_no):
+                return JsonResponse({'success': False, 'message': 'PAN number must be in format: ABCDE1234F (5 letters, 4 digits, 1 letter).'})
+            
+            # Aadhar card validation (12 digits)
+            if adhar_card_no and not re.match(r'^\d{12}$', adhar_card_no):
+                return JsonResponse({'success': False, 'message': 'Aadhar card number must be exactly 12 digits.'})
+            
+            # Create client
+            client = Client.objects.create(
+                client_type=client_type,
+                search_property_title=search_property_title if search_property_title else None,
+                client_name=client_name,
+                email=email,
+                mobile_no=mobile_no,
+                another_mobile_no=another_mobile_no if another_mobile_no else None,
+                whatsapp_no=whatsapp_no,
+                pan_no=pan_no.upper() if pan_no else None,
+                adhar_card_no=adhar_card_no if adhar_card_no else None,
+                address=address if address else None,
+                approx_investment=float(approx_investment) if approx_investment else None,
+                choice_in_particular_property=choice_in_particular_property if choice_in_particular_property else None,
+                dob=datetime.datetime.strptime(dob, '%Y-%m-%d').date() if dob else None,
+                anniversary=datetime.datetime.strptime(anniversary, '%Y-%m-%d').date() if anniversary else None,
+                any_event=datetime.datetime.strptime(any_event, '%Y-%m-%d').date() if any_event else None,
+                remark=remark if remark else None,
+                is_active=is_active,
+                created_by=request.user
+            )
+            
+            return JsonResponse({'success': True, 'message': 'Client added successfully', 'client_id': client.id})
+            
+        except Exception as e:
+            return JsonResponse({'success': False, 'message': f'Error adding client: {str(e)}'})
+    
+    return JsonResponse({'success': False, 'message': 'Invalid request method'})
+
+@marketing_or_admin_required
+def edit_client(request, client_id):
+    """Edit existing client"""
+    try:
+        client = Client.objects.get(id=client_id)
+    except Client.DoesNotExist:
+        return JsonResponse({'success': False, 'message': 'Client not found'})
+    
+    if request.method == 'GET':
+        # Return client data for editing
+        client_data = {
+            'id': client.id,
+            'client_type': client.client_type,
+            'search_property_title': client.search_property_title or '',
+            'client_name': client.client_name,
+            'email': client.email,
+            'mobile_no': client.mobile_no,
+            'another_mobile_no': client.another_mobile_no or '',
+            'whatsapp_no': client.whatsapp_no,
+            'pan_no': client.pan_no or '',
+            'adhar_card_no': client.adhar_card_no or '',
+            'address': client.address or '',
+            'approx_investment': client.approx_investment or '',
+            'choice_in_particular_property': client.choice_in_particular_property or '',
+            'dob': client.dob.strftime('%Y-%m-%d') if client.dob else '',
+            'anniversary': client.anniversary.strftime('%Y-%m-%d') if client.anniversary else '',
+            'any_event': client.any_event.strftime('%Y-%m-%d') if client.any_event else '',
+            'remark': client.remark or '',
+            'is_active': client.is_active,
+            'created_at': client.created_at.strftime('%d/%m/%Y %H:%M') if client.created_at else ''
+        }
+        return JsonResponse({'success': True, 'client': client_data})
+    
+    if request.method == 'POST':
+        try:
+            # Get form data
+            client_type = request.POST.get('client_type', client.client_type)
+            client_name = request.POST.get('client_name', client.client_name)
+            email = request.POST.get('email', client.email)
+            mobile_no = request.POST.get('mobile_no', client.mobile_no)
+            another_mobile_no = request.POST.get('another_mobile_no', '')
+            whatsapp_no = request.POST.get('whatsapp_no', client.whatsapp_no)
+            pan_no = request.POST.get('pan_no', '')
+            adhar_card_no = request.POST.get('adhar_card_no', '')
+            
+            # Additional validation
+            import re
+            
+            # Mobile number validation (10 digits)
+            if mobile_no and not re.match(r'^\d{10}$', mobile_no):
+                return JsonResponse({'success': False, 'message': 'Mobile number must be exactly 10 digits.'})
+            
+            # Another mobile number validation (10 digits)
+            if another_mobile_no and not re.match(r'^\d{10}$', another_mobile_no):
+                return JsonResponse({'success': False, 'message': 'Another mobile number must be exactly 10 digits.'})
+            
+            # WhatsApp number validation (10 digits)
+            if whatsapp_no and not re.match(r'^\d{10}$', whatsapp_no):
+                return JsonResponse({'success': False, 'message': 'WhatsApp number must be exactly 10 digits.'})
+            
+            # PAN number validation (10 characters: 5 letters, 4 digits, 1 letter)
+            if pan_no and not re.match(r'^[A-Za-z]{5}[0-9]{4}[A-Za-z]{1}$', pan_no):
+                return JsonResponse({'success': False, 'message': 'PAN number must be in format: ABCDE1234F (5 letters, 4 digits, 1 letter).'})
+            
+            # Aadhar card validation (12 digits)
+            if adhar_card_no and not re.match(r'^\d{12}$', adhar_card_no):
+                return JsonResponse({'success': False, 'message': 'Aadhar card number must be exactly 12 digits.'})
+            
+            # Update client fields
+            client.client_type = client_type
+            client.search_property_title = request.POST.get('search_property_title', '') or None
+            client.client_name = client_name
+            client.email = email
+            client.mobile_no = mobile_no
+            client.another_mobile_no = another_mobile_no if another_mobile_no else None
+            client.whatsapp_no = whatsapp_no
+            client.pan_no = pan_no.upper() if pan_no else None
+            client.adhar_card_no = adhar_card_no if adhar_card_no else None
+            client.address = request.POST.get('address', '') or None
+            client.approx_investment = float(request.POST.get('approx_investment', '')) if request.POST.get('approx_investment') else None
+            client.choice_in_particular_property = request.POST.get('choice_in_particular_property', '') or None
+            
+            # Handle date fields
+            dob = request.POST.get('dob', '')
+            anniversary = request.POST.get('anniversary', '')
+            any_event = request.POST.get('any_event', '')
+            
+            client.dob = datetime.datetime.strptime(dob, '%Y-%m-%d').date() if dob else None
+            client.anniversary = datetime.datetime.strptime(anniversary, '%Y-%m-%d').date() if anniversary else None
+            client.any_event = datetime.datetime.strptime(any_event, '%Y-%m-%d').date() if any_event else None
+            
+            # Handle remark field
+            remark = request.POST.get('remark', '')
+            client.remark = remark if remark else None
+            
+            # Handle is_active field
+            is_active = request.POST.get('is_active') == 'on'  # Checkbox returns 'on' when checked
+            client.is_active = is_active
+            
+            client.save()
+            
+            return JsonResponse({'success': True, 'message': 'Client updated successfully'})
+            
+        except Exception as e:
+            return JsonResponse({'success': False, 'message': f'Error updating client: {str(e)}'})
+    
+    return JsonResponse({'success': False, 'message': 'Invalid request method'})
+
+@marketing_or_admin_required
+def delete_client(request, client_id):
+    """Delete client"""
+    try:
+        client = Client.objects.get(id=client_id)
+        client.delete()
+        return JsonResponse({'success': True, 'message': 'Client deleted successfully'})
+    except Client.DoesNotExist:
+        return JsonResponse({'success': False, 'message': 'Client not found'})
+    except Exception as e:
+        return JsonResponse({'success': False, 'message': f'Error deleting client: {str(e)}'})
+
+@marketing_or_admin_required(api=True)
+@conditional_resource('clients')
+def get_clients_api(request):
+    """
+    API endpoint to list clients one page at a time.
+    Filters: search, client_type, created_by, date_from, date_to, is_active;
+    type_counts breaks the filtered clients down by type (ignoring client_type).
+    """
+    try:
+        base_clients, client_type = filter_clients(request.GET)
+        page = int(request.GET.get('page') or 1)
+        page_size = min(max(int(request.GET.get('page_size') or CLIENT_PAGE_SIZE), 1), CLIENT_MAX_PAGE_SIZE)
+    except ValueError as e:
+        return JsonResponse({'success': False, 'message': str(e)}, status=400)
+    
+    try:
+        from django.core.paginator import Paginator
+        
+        clients = base_clients.filter(client_type=client_type) if client_type else base_clients
+        clients = clients.select_related('created_by').order_by('-created_at', '-id')
+        page_obj = Paginator(clients, page_size).get_page(page)
+        
+        return JsonResponse({
+            'success': True,
+            'clients': [serialize_client(client) for client in page_obj],
+            'count': page_obj.paginator.count,
+            'page': page_obj.number,
+            'total_pages': page_obj.paginator.num_pages,
+            'page_size': page_size,
+            'type_counts': client_type_counts(base_clients),
+        })
+    except Exception as e:
+        return JsonResponse({'success': False, 'message': str(e)})
+
+@marketing_or_admin_required(api=True)
+@require_GET
+def client_picker_api(request):
+    """Typeahead for the sale modals: id, name and mobile of clients matching ?q="""
+    try:
+        limit = min(max(int(request.GET.get('limit') or CLIENT_PICKER_LIMIT), 1), CLIENT_PICKER_LIMIT)
+    except ValueError:
+        return JsonResponse({'success': False, 'message': 'Invalid limit'}, status=400)
+    
+    return JsonResponse({'success': True, 'clients': pick_clients(request.GET.get('q', ''), limit=limit)})
+
+@marketing_or_admin_required(api=True)
+@require_POST
+def import_clients_api(request):
+    """
+    Bulk import clients from an uploaded CSV or XLSX file.
+
+    Rows are validated and inserted in batches; invalid rows and mobiles
+    that already exist are skipped and listed with their row number.
+    Pass dry_run=true to validate the file without saving anything.
+    """
+    upload = request.FILES.get('file')
+    if not upload:
+        return JsonResponse({'success': False, 'message': 'Please choose a CSV or XLSX file'}, status=400)
+    
+    client_type = request.POST.get('client_type') or 'lead_generation'
+    if client_type not in dict(Client.CLIENT_TYPE_CHOICES):
+        return JsonResponse({'success': False, 'message': 'Invalid client_type'}, status=400)
+    dry_run = request.POST.get('dry_run', '').lower() in ('true', '1', 'on')
+    
+    try:
+        report = import_clients(
+            read_client_rows(upload, upload.name),
+            created_by=request.user,
+            client_type=client_type,
+            dry_run=dry_run,
+        )
+    except (ValueError, UnicodeDecodeError) as e:
+        return JsonResponse({'success': False, 'message': f'Could not read {upload.name}: {e}'}, status=400)
+    
+    verb = 'can be imported' if dry_run else 'imported'
+    return JsonResponse({
+        'success': True,
+        'message': f"{report['created']} of {report['total']} clients {verb}, {report['skipped']} skipped",
+        'dry_run': dry_run,
+        **report,
+    })
+
+@marketing_or_admin_required(api=True)
+def get_client_details_api(request, client_id):
+    """API endpoint to get detailed client information for viewing"""
+    try:
+        client = Client.objects.get(id=client_id)
+        
+        # Get client type display name
+        client_type_display = client.get_client_type_display()
+        
+        client_data = {
+            'id': client.id,
+            'client_type': client.client_type,
+            'client_type_display': client_type_display,
+            'search_property_title': client.search_property_title or 'Not specified',
+            'client_name': client.client_name,
+            'email': client.email,
+            'mobile_no': client.mobile_no,
+            'another_mobile_no': client.another_mobile_no or 'Not provided',
+            'whatsapp_no': client.whatsapp_no,
+            'pan_no': client.pan_no or 'Not provided',
+            'adhar_card_no': client.adhar_card_no or 'Not provided',
+            'address': client.address or 'Not provided',
+            'approx_investment': f'₹{client.approx_investment:,.2f}' if client.approx_investment else 'Not specified',
+            'choice_in_particular_property': client.choice_in_particular_property or 'Not specified',
+            'dob': client.dob.strftime('%d/%m/%Y') if client.dob else 'Not provided',
+            'anniversary': client.anniversary.strftime('%d/%m/%Y') if client.anniversary else 'Not provided',
+            'any_event': client.any_event.strftime('%d/%m/%Y') if client.any_event else 'Not provided',
+            'remark': client.remark or 'No remarks added',
+            'created_at': client.created_at.strftime('%d/%m/%Y at %H:%M') if client.created_at else 'Unknown',
+            'created_by': client.created_by.full_name if client.created_by else 'System'
+        }
+        
+        return JsonResponse({'success': True, 'client_details': client_data})
+        
+    except Client.DoesNotExist:
+        return JsonResponse({'success': False, 'message': 'Client not found'})
+    except Exception as e:
+        return JsonResponse({'success': False, 'message': str(e)})
@@ -0,0 +1,306 @@
+from django.db.models import Q, Count
+from django.shortcuts import render
+from django.utils import timezone
+
+from ..models import User, Task, Land, AssignedTask
+from ..caching import get_cached
+from ..permissions import admin_required, active_employee_required
+
+
+def _admin_dashboard_counts():
+    """Employee, task and assigned task counts shown on the admin dashboard"""
+    employee_counts = User.objects.filter(role='employee').aggregate(
+        marketing_devs=Count('id', filter=Q(employee_type='marketing')),
+        backoffice_devs=Count('id', filter=Q(employee_type='backoffice')),
+        legal_devs=Count('id', filter=Q(employee_type='legal_team')),
+        other_devs=Count('id', filter=Q(employee_type='other')),
+    )
+    task_counts = Task.objects.aggregate(
+        total_tasks=Count('id'),
+        default_tasks=Count('id', filter=Q(is_default=True)),
+        non_default_tasks=Count('id', filter=Q(is_default=False)),
+    )
+    status_counts = AssignedTask.objects.aggregate(
+        pending_approval_tasks=Count('id', filter=Q(status='pending_approval')),
+        overdue_tasks=Count('id', filter=Q(due_date__lt=timezone.now(), status__in=['pending', 'in_progress'])),
+        pending_tasks=Count('id', filter=Q(status='pending')),
+        in_progress_tasks=Count('id', filter=Q(status='in_progress')),
+    )
+    return {**employee_counts, **task_counts, **status_counts}
+
+@admin_required
+def admin_dashboard(request):
+    # Get tasks using the new Task model
+    tasks = Task.objects.all()
+    # Sort employees by status (active first, then inactive) and then by id
+    developers = User.objects.filter(role='employee').extra(
+        select={'status_order': "CASE WHEN status = 'active' THEN 0 ELSE 1 END"}
+    ).order_by('status_order', 'id')
+    active_developers = developers.filter(status='active')
+    lands = Land.objects.all()
+    
+    # Employee, task and status counts are cached until one of those tables changes
+    counts = get_cached('dashboard_stats', 'admin_counts', _admin_dashboard_counts)
+    
+    from ..models import AssignedTask
+    from django.utils import timezone
+    
+    # Get all assigned tasks
+    assigned_tasks = AssignedTask.objects.all().select_related('task', 'land', 'employee')
+    
+    # Get detailed information for each category
+    pending_approval_details = assigned_tasks.filter(status='pending_approval')[:5]  # Top 5 for display
+    overdue_details = assigned_tasks.filter(
+        due_date__lt=timezone.now(),
+        status__in=['pending', 'in_progress']
+    )[:5]
+    pending_details = assigned_tasks.filter(status='pending')[:5]
+    in_progress_details = assigned_tasks.filter(status='in_progress')[:5]
+    
+    # Filter out marketing employees for the Add Task modal
+    non_marketing_employees = developers.exclude(employee_type='marketing')
+    
+    context = {
+        'tasks': tasks,
+        'developers': developers,
+        'employees': non_marketing_employees,  # Exclude marketing employees for Add Task modal
+        'active_developers': active_developers,
+        'lands': lands,
+        # Employee type, task and task status statistics
+        **counts,
+        # Detailed information for each category
+        'pending_approval_details': pending_approval_details,
+        'overdue_details': overdue_details,
+        'pending_details': pending_details,
+        'in_progress_details': in_progress_details,
+    }
+    return render(request, 'admin_dashboard.html', context)
+
+@active_employee_required
+def employee_dashboard(request):
+    # Get only land-based assigned tasks for this employee from core_assignedtask
+    from ..models import AssignedTask
+    from datetime import datetime, timedelta
+    
+    assigned_land_tasks = AssignedTask.objects.filter(
+        employee=request.user
+    ).select_related('land', 'task').order_by('-assigned_date')
+    
+    # Calculate statistics
+    total_assigned_tasks = assigned_land_tasks.count()
+    pending_tasks = assigned_land_tasks.filter(status='pending').count()
+    in_progress_tasks = assigned_land_tasks.filter(status='in_progress').count()
+    completed_tasks = assigned_land_tasks.filter(status='complete').count()
+    
+    # Calculate overdue tasks count using due_date field (same logic as admin dashboard)
+    overdue_tasks_count = assigned_land_tasks.filter(
+        due_date__lt=timezone.now(),
+        status__in=['pending', 'in_progress']
+    ).count()
+    
+    # Calculate overdue and upcoming tasks using due_date field like admin dashboard
+    
+    # Get detailed task information for each category (like admin dashboard)
+    today = timezone.now().date()
+    
+    # Get pending tasks details
+    pending_details = assigned_land_tasks.filter(status='pending')
+    
+    # Get overdue tasks details
+    overdue_details = assigned_land_tasks.filter(
+        due_date__lt=timezone.now(),
+        status__in=['pending', 'in_progress']
+    )
+    
+    # Calculate days overdue for each overdue task
+    for task in overdue_details:
+        if task.due_date:
+            task.days_overdue = (timezone.now().date() - task.due_date.date()).days
+        else:
+            task.days_overdue = 0
+    
+    # Get in progress tasks details
+    in_progress_details = assigned_land_tasks.filter(status='in_progress')
+    
+    # Get upcoming tasks details (due within next 3 days and not completed)
+    upcoming_details = assigned_land_tasks.filter(
+        due_date__gte=timezone.now(),
+        due_date__lte=timezone.now() + timedelta(days=3),
+        status__in=['pending', 'in_progress']
+    )
+    
+    # Calculate days until due for each upcoming task
+    for task in upcoming_details:
+        if task.due_date:
+            task.days_until_due = (task.due_date.date() - timezone.now().date()).days
+        else:
+            task.days_until_due = 0
+    
+    # Convert to list format for template (keeping backward compatibility)
+    overdue_tasks = []
+    upcoming_tasks = []
+    
+    for assigned_task in overdue_details:
+                overdue_tasks.append({
+                    'title': assigned_task.task.name,
+            'deadline': assigned_task.due_date.strftime('%b %d, %Y') if assigned_task.due_date else 'No due date',
+            'days_overdue': (today - assigned_task.due_date.date()).days if assigned_task.due_date else 0,
+                    'land_name': assigned_task.land.name if assigned_task.land else 'Unknown'
+                })
+    
+    for assigned_task in upcoming_details:
+                upcoming_tasks.append({
+                    'title': assigned_task.task.name,
+            'deadline': assigned_task.due_date.strftime('%b %d, %Y') if assigned_task.due_date else 'No due date',
+            'days_until_due': (assigned_task.due_date.date() - today).days if assigned_task.due_date else 0,
+                    'land_name': assigned_task.land.name if assigned_task.land else 'Unknown'
+                })
+    
+    # Get recent land assignments
+    recent_land_assignments = assigned_land_tasks
+    
+    context = {
+        'assigned_land_tasks': assigned_land_tasks,
+        'total_assigned_tasks': total_assigned_tasks,
+        'pending_tasks': pending_tasks,
+        'in_progress_tasks': in_progress_tasks,
+        'completed_tasks': completed_tasks,
+        'overdue_tasks_count': overdue_tasks_count,
+        'recent_land_assignments': recent_land_assignments,
+        'overdue_tasks': overdue_tasks,
+        'upcoming_tasks': upcoming_tasks,
+        'today': today,
+        # Detailed information for each category (like admin dashboard)
+        'pending_details': pending_details,
+        'overdue_details': overdue_details,
+        'in_progress_details': in_progress_details,
+        'upcoming_details': upcoming_details,
+    }
+    return render(request, 'employee_dashboard.html', context)
+
+@active_employee_required(employee_type='marketing')
+def marketing_dashboard(request):
+    """Marketing employee dashboard with access to inventory"""
+    # Get only land-based assigned tasks for this marketing employee from core_assignedtask
+    from ..models import AssignedTask
+    from datetime import datetime, timedelta
+    
+    assigned_land_tasks = AssignedTask.objects.filter(
+        employee=request.user
+    ).select_related('land', 'task').order_by('-assigned_date')
+    
+    # Calculate statistics
+    total_assigned_tasks = assigned_land_tasks.count()
+    pending_tasks = assigned_land_tasks.filter(status='pending').count()
+    in_progress_tasks = assigned_land_tasks.filter(status='in_progress').count()
+    completed_tasks = assigned_land_tasks.filter(status='complete').count()
+    
+    # Calculate overdue tasks count using due_date field (same logic as admin dashboard)
+    overdue_tasks_count = assigned_land_tasks.filter(
+        due_date__lt=timezone.now(),
+        status__in=['pending', 'in_progress']
+    ).count()
+    
+    # Calculate overdue and upcoming tasks using due_date field like admin dashboard
+    
+    # Get detailed task information for each category (like admin dashboard)
+    today = timezone.now().date()
+    
+    # Get pending tasks details
+    pending_details = assigned_land_tasks.filter(status='pending')
+    
+    # Get overdue tasks details
+    overdue_details = assigned_land_tasks.filter(
+        due_date__lt=timezone.now(),
+        status__in=['pending', 'in_progress']
+    )
+    
+    # Calculate days overdue for each overdue task
+    for task in overdue_details:
+        if task.due_date:
+            task.days_overdue = (timezone.now().date() - task.due_date.date()).days
+        else:
+            task.days_overdue = 0
+    
+    # Get in progress tasks details
+    in_progress_details = assigned_land_tasks.filter(status='in_progress')
+    
+    # Get upcoming tasks details (due within next 3 days and not completed)
+    upcoming_details = assigned_land_tasks.filter(
+        due_date__gte=timezone.now(),
+        due_date__lte=timezone.now() + timedelta(days=3),
+        status__in=['pending', 'in_progress']
+    )
+    
+    # Calculate days until due for each upcoming task
+    for task in upcoming_details:
+        if task.due_date:
+            task.days_until_due = (task.due_date.date() - timezone.now().date()).days
+        else:
+            task.days_until_due = 0
+    
+    # Convert to list format for template (keeping backward compatibility)
+    overdue_tasks = []
+    upcoming_tasks = []
+    
+    for assigned_task in overdue_details:
+                overdue_tasks.append({
+                    'title': assigned_task.task.name,
+            'deadline': assigned_task.due_date.strftime('%b %d, %Y') if assigned_task.due_date else 'No due date',
+            'days_overdue': (today - assigned_task.due_date.date()).days if assigned_task.due_date else 0,
+                    'land_name': assigned_task.land.name if assigned_task.land else 'Unknown'
+                })
+    
+    for assigned_task in upcoming_details:
+                upcoming_tasks.append({
+                    'title': assigned_task.task.name,
+            'deadline': assigned_task.due_date.strftime('%b %d, %Y') if assigned_task.due_date else 'No due date',
+            'days_until_due': (assigned_task.due_date.date() - today).days if assigned_task.due_date else 0,
+                    'land_name': assigned_task.land.name if assigned_task.land else 'Unknown'
+                })
+    
+    # Get recent land assignments
+    recent_land_assignments = assigned_land_tasks
+    
+    # Calculate installment counts for marketing employee
+    from ..models import Installment, LandSale
+    
+    # Get installments for lands sold by this marketing employee
+    marketing_installments = Installment.objects.filter(
+        land_sale__marketing_employee=request.user
+    ).select_related('land_sale', 'land_sale__land', 'land_sale__client')
+    
+    # Calculate upcoming installments (due within next 7 days and not paid)
+    upcoming_installments_count = marketing_installments.filter(
+        due_date__gte=timezone.now().date(),
+        due_date__lte=timezone.now().date() + timedelta(days=7),
+        status__in=['pending', 'partial']
+    ).count()
+    
+    # Calculate overdue installments (past due date and not paid)
+    overdue_installments_count = marketing_installments.filter(
+        due_date__lt=timezone.now().date(),
+        status__in=['pending', 'partial']
+    ).count()
+    
+    context = {
+        'assigned_land_tasks': assigned_land_tasks,
+        'total_assigned_tasks': total_assigned_tasks,
+        'pending_tasks': pending_tasks,
+        'in_progress_tasks': in_progress_tasks,
+        'completed_tasks': completed_tasks,
+        'overdue_tasks_count': overdue_tasks_count,
+        'overdue_tasks': overdue_tasks,
+        'upcoming_tasks': upcoming_tasks,
+        'recent_land_assignments': recent_land_assignments,
+        'user': request.user,
+        # Detailed information for each category (like admin dashboard)
+        'pending_details': pending_details,
+        'overdue_details': overdue_details,
+        'in_progress_details': in_progress_details,
+        'upcoming_details': upcoming_details,
+        # Installment counts
+        'upcoming_installments_count': upcoming_installments_count,
+        'overdue_installments_count': overdue_installments_count,
+    }
+    return render(request, 'marketing_dashboard.html', context)
@@ -0,0 +1,419 @@
+import json
+import re
+
+from django.contrib import messages
+from django.contrib.auth import logout, update_session_auth_hash
+from django.contrib.auth.decorators import login_required
+from django.http import JsonResponse
+from django.shortcuts import render, redirect
+
+from ..models import User
+from ..notifications import notify, notify_admins
+from .. import bulk_operations
+from ..conditional import conditional_resource
+from ..caching import fragment_versions, get_cached
+from ..permissions import admin_required
+
+
+@admin_required
+def admin_employees(request):
+    # Sort employees by status (active first, then inactive) and then by id
+    developers = User.objects.filter(role='employee').extra(
+        select={'status_order': "CASE WHEN status = 'active' THEN 0 ELSE 1 END"}
+    ).order_by('status_order', 'id')
+    active_developers = developers.filter(status='active')
+    
+    # Calculate employee type statistics (including all types)
+    marketing_devs = developers.filter(employee_type='marketing').count()
+    backoffice_devs = developers.filter(employee_type='backoffice').count()
+    legal_devs = developers.filter(employee_type='legal_team').count()
+    other_devs = developers.filter(employee_type='other').count()
+    
+    context = {
+        'developers': developers,
+        'active_developers': active_developers,
+        'marketing_devs': marketing_devs,
+        'backoffice_devs': backoffice_devs,
+        'legal_devs': legal_devs,
+        'other_devs': other_devs,
+        # Table rows and mobile cards; the edit modals are rendered every time
+        **fragment_versions('employees'),
+    }
+    return render(request, 'admin_employees.html', context)
+
+@login_required
+def employee_profile(request):
+    user = request.user
+    
+    # Check if employee is active
+    if user.role == 'employee' and user.status != 'active':
+        messages.error(request, 'Your account is inactive. Please contact administrator.')
+        logout(request)
+        return redirect('login')
+    
+    if request.method == 'POST':
+        # Handle profile picture update
+        if 'profile_pic' in request.FILES:
+            user.profile_pic = request.FILES['profile_pic']
+        
+        # Handle password change with current password verification
+        new_password = request.POST.get('new_password')
+        confirm_password = request.POST.get('confirm_password')
+        current_password = request.POST.get('current_password')
+        
+        if new_password or confirm_password:
+            # Password change requested - verify current password
+            if not current_password:
+                messages.error(request, 'Current password is required to change password.')
+                return redirect('employee-profile')
+            
+            if not user.check_password(current_password):
+                messages.error(request, 'Current password is incorrect.')
+                return redirect('employee-profile')
+            
+            if not new_password:
+                messages.error(request, 'New password is required.')
+                return redirect('employee-profile')
+            
+            if new_password != confirm_password:
+                messages.error(request, 'New passwords do not match.')
+                return redirect('employee-profile')
+            
+            # All validations passed - update password
+            user.set_password(new_password)
+            update_session_auth_hash(request, user)
+            messages.success(request, 'Password updated successfully.')
+        
+        # Save user profile
+        user.save()
+        messages.success(request, 'Profile updated successfully.')
+        return redirect('employee-profile')
+    
+    # Simple profile view - no need for complex task statistics
+    return render(request, 'employee_profile.html', {
+        'user': user,
+    })
+
+@admin_required
+def add_employee_page(request):
+    """Dedicated page for adding employees"""
+    return render(request, 'add_employee.html')
+
+@login_required
+def add_employee(request):
+    if request.method == 'POST' and request.user.role == 'admin':
+        # Get all form fields
+        username = request.POST.get('username', '').strip()
+        password = request.POST['password']
+        full_name = request.POST.get('full_name', '')
+        email = request.POST.get('email', '')
+        mobile = request.POST.get('mobile', '')
+        location = request.POST.get('location', '')
+        address = request.POST.get('address', '')
+        employee_type = request.POST.get('employee_type', '')
+        status = request.POST.get('status', 'active')
+        profile_pic = request.FILES.get('profile_pic')
+        
+        # Validate username
+        if not username:
+            if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
+                return JsonResponse({'success': False, 'message': 'Username is required'})
+            messages.error(request, 'Username is required')
+            return redirect('admin-employees')
+        
+        # Check if username already exists
+        if User.objects.filter(username=username).exists():
+            if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
+                return JsonResponse({'success': False, 'message': 'Username already exists'})
+            messages.error(request, 'Username already exists')
+            return redirect('admin-employees')
+        
+        # Check if email already exists
+        if email and User.objects.filter(email=email).exists():
+            if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
+                return JsonResponse({'success': False, 'message': 'Email already exists'})
+            messages.error(request, 'Email already exists')
+            return redirect('admin-employees')
+        
+        # Ensure username meets Django requirements (max 150 chars, alphanumeric + underscore)
+        if len(username) > 150:
+            username = username[:150]
+        username = re.sub(r'[^a-zA-Z0-9_]', '', username)
+        
+        # No custom employee_id generation - using default auto-incrementing ID
+        
+        try:
+            from django.db import transaction
+            
+            with transaction.atomic():
+                # Create user with all fields
+                user = User.objects.create_user(
+                    username=username,
+                    password=password,
+                    full_name=full_name,
+                    email=email,
+                    mobile=mobile,
+                    location=location,
+                    address=address,
+                    role='employee',  # Default role
+                    employee_type=employee_type,
+                    status=status,
+                    profile_pic=profile_pic
+                )
+                
+                # Handle profile picture upload
+                if profile_pic:
+                    user.profile_pic = profile_pic
+                    user.save()
+            
+            # Create notification for all admins about new employee
+            notify_admins(f"New employee '{full_name}' ({username}) has been added to the system")
+            
+            # Return JSON response for AJAX requests - Optimized for faster response
+            if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
+                return JsonResponse({
+                    'success': True, 
+                    'message': 'Employee added successfully!',
+                    'employee': {
+                        'id': user.id,
+                        'username': user.username,
+                        'full_name': user.full_name,
+                        'email': user.email,
+                        'role': user.role,
+                        'employee_type': user.employee_type
+                    }
+                })
+            
+            messages.success(request, 'Employee added successfully')
+            if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
+                return JsonResponse({'success': True, 'message': 'Employee added successfully'})
+            return redirect('admin-employees')
+            
+        except Exception as e:
+            if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
+                return JsonResponse({'success': False, 'message': f'Error creating employee: {str(e)}'})
+            messages.error(request, f'Error creating employee: {str(e)}')
+            if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
+                return JsonResponse({'success': False, 'message': f'Error creating employee: {str(e)}'})
+            return redirect('admin-employees')
+    
+    # Handle GET requests
+    if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
+        return JsonResponse({'success': False, 'message': 'Invalid request method'})
+    return redirect('admin-employees')
+
+@login_required
+def edit_employee(request, dev_id):
+    if request.method == 'POST' and request.user.role == 'admin':
+        try:
+            user = User.objects.get(id=dev_id)
+            
+            # Update all fields
+            user.username = request.POST['username']
+            user.full_name = request.POST.get('full_name', '')
+            user.email = request.POST.get('email', '')
+            user.mobile = request.POST['mobile']
+            user.location = request.POST.get('location', '')
+            user.address = request.POST.get('address', '')
+            user.status = request.POST.get('status', 'active')
+            user.employee_type = request.POST.get('employee_type', '')
+            
+            # Handle password change
+            if request.POST.get('password'):
+                user.set_password(request.POST['password'])
+            
+            # Handle profile picture upload
+            profile_pic = request.FILES.get('profile_pic')
+            if profile_pic:
+                user.profile_pic = profile_pic
+            
+            user.save()
+            
+            # Return JSON response for AJAX requests
+            if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
+                return JsonResponse({
+                    'success': True, 
+                    'message': 'Employee updated successfully',
+                    'developer': {
+                        'id': user.id,
+                        'username': user.username,
+                        'full_name': user.full_name or '',
+                        'email': user.email or '',
+                        'mobile': user.mobile,
+                        'location': user.location or '',
+                        'role': user.role,
+                        'employee_type': user.employee_type or '',
+                        'profile_pic': user.profile_pic.url if user.profile_pic else None
+                    }
+                })
+            
+            messages.success(request, 'Employee updated successfully')
+        except User.DoesNotExist:
+            if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
+                return JsonResponse({'success': False, 'message': 'Employee not found'})
+            messages.error(request, 'Employee not found')
+        except Exception as e:
+            if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
+                return JsonResponse({'success': False, 'message': f'Error updating employee: {str(e)}'})
+            messages.error(request, f'Error updating employee: {str(e)}')
+    
+    # Handle GET requests for AJAX
+    if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
+        try:
+            user = User.objects.get(id=dev_id)
+            return JsonResponse({
+                'success': True,
+                'developer': {
+                    'id': user.id,
+                    'username': user.username,
+                    'full_name': user.full_name or '',
+                    'email': user.email or '',
+                    'mobile': user.mobile,
+                    'location': user.location or '',
+                    'address': user.address or '',
+                    'role': user.role,
+                    'employee_type': user.employee_type or '',
+                    'profile_pic': user.profile_pic.url if user.profile_pic else None
+                }
+            })
+        except User.DoesNotExist:
+            return JsonResponse({'success': False, 'message': 'Employee not found'})
+    
+    return redirect('admin-employees')
+
+@login_required
+def delete_employee(request, dev_id):
+    if request.method == 'POST' and request.user.role == 'admin':
+        User.objects.filter(id=dev_id).delete()
+        messages.success(request, 'Employee deleted successfully')
+    return redirect('admin-employees')
+
+@login_required
+def bulk_delete_employees(request):
+    if request.method == 'POST' and request.user.role == 'admin':
+        employee_ids = request.POST.getlist('employee_ids')
+        
+        try:
+            report = bulk_operations.bulk_employee_action(employee_ids, 'delete')
+            deleted_count = report['employees']
+        except Exception as e:
+            messages.error(request, f'Error deleting employee: {str(e)}')
+            deleted_count = 0
+        
+        if deleted_count > 0:
+            notify_admins(f"Bulk deletion: {deleted_count} employee(s) have been deleted from the system")
+            messages.success(request, f'{deleted_count} employee(s) deleted successfully')
+        else:
+            messages.warning(request, 'No employees were deleted')
+    else:
+        messages.warning(request, 'No employees were deleted')
+    
+    return redirect('admin-employees')
+
+@login_required
+def bulk_employee_action(request):
+    """
+    AJAX view to activate, deactivate, reassign open tasks of, or delete many employees at once.
+    Pass dry_run=true to get the number of dependent rows each action would touch.
+    """
+    if not request.user.is_authenticated or request.user.role != 'admin':
+        return JsonResponse({'success': False, 'message': 'Unauthorized'}, status=403)
+    
+    if request.method != 'POST':
+        return JsonResponse({'success': False, 'message': 'Method not allowed'}, status=405)
+    
+    try:
+        if request.content_type == 'application/json':
+            data = json.loads(request.body)
+            employee_ids = data.get('employee_ids', [])
+        else:
+            data = request.POST
+            employee_ids = request.POST.getlist('employee_ids')
+        
+        action = data.get('action', '')
+        dry_run = str(data.get('dry_run', 'false')).lower() == 'true'
+        reassign_to_id = data.get('reassign_to')
+        
+        if action not in bulk_operations.EMPLOYEE_ACTIONS:
+            return JsonResponse({'success': False, 'message': 'Invalid action specified'}, status=400)
+        
+        reassign_to = None
+        if reassign_to_id:
+            try:
+                reassign_to = User.objects.get(id=reassign_to_id, role='employee', status='active')
+            except (User.DoesNotExist, ValueError):
+                return JsonResponse({'success': False, 'message': 'Target employee not found or inactive'}, status=400)
+        elif action == 'reassign':
+            return JsonResponse({'success': False, 'message': 'Target employee is required to reassign tasks'}, status=400)
+        
+        report = bulk_operations.bulk_employee_action(employee_ids, action, reassign_to=reassign_to, dry_run=dry_run)
+        
+        if not dry_run and report['employees']:
+            if report['reassigned_tasks']:
+                notify([reassign_to], f"{report['reassigned_tasks']} open task(s) have been reassigned to you")
+            notify_admins(f"Bulk employee action '{action}' applied to {report['employees']} employee(s)")
+        
+        return JsonResponse({'success': True, **report})
+        
+    except json.JSONDecodeError:
+        return JsonResponse({'success': False, 'message': 'Invalid JSON data'}, status=400)
+    except Exception as e:
+        print(f"Error in bulk_employee_action: {str(e)}")
+        return JsonResponse({'success': False, 'message': str(e)}, status=500)
+
+@admin_required(api=True)
+@conditional_resource('employees')
+def get_employees_api(request):
+    """API endpoint to get all active employees"""
+    try:
+        def build_employee_list():
+            # Use is_active instead of status field (excluding marketing type)
+            employees = User.objects.filter(role='employee', is_active=True).exclude(employee_type='marketing').order_by('full_name', 'username')
+            return [{
+                'id': employee.id,
+                'full_name': employee.get_display_name(),
+                'username': employee.username,
+                'email': employee.email
+            } for employee in employees]
+        
+        employee_list = get_cached('employees', 'task_assignees', build_employee_list)
+        return JsonResponse({
+            'success': True,
+            'employees': employee_list
+        })
+        
+    except Exception as e:
+        print(f"Error in get_employees_api: {str(e)}")
+        return JsonResponse({'success': False, 'message': str(e)})
+
+@admin_required(api=True)
+def change_employee_status(request, employee_id):
+    """AJAX view to change employee status"""
+    if request.method == 'POST':
+        try:
+            from ..models import User
+            
+            employee = User.objects.get(id=employee_id, role='employee')
+            old_status = employee.status
+            # Toggle between 'active' and 'inactive'
+            employee.status = 'inactive' if employee.status == 'active' else 'active'
+            employee.save()
+            
+            status_text = employee.status.title()
+            
+            # Create notification for all admins about employee status change
+            notify_admins(f"Employee '{employee.get_display_name()}' status changed from {old_status.title()} to {status_text}")
+            
+            return JsonResponse({
+                'success': True, 
+                'message': f'Employee status changed to {status_text}',
+                'new_status': employee.status
+            })
+            
+        except User.DoesNotExist:
+            return JsonResponse({'success': False, 'message': 'Employee not found'})
+        except Exception as e:
+            print(f"Error in change_employee_status: {str(e)}")
+            return JsonResponse({'success': False, 'message': str(e)})
+    
+    return JsonResponse({'success': False, 'message': 'Invalid request method'})
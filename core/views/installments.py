@@ -0,0 +1,677 @@
+import json
+
+from django.contrib.auth.decorators import login_required
+from django.http import JsonResponse
+from django.shortcuts import render
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_http_methods
+
+from ..models import User, Installment, Reminder
+from ..permissions import marketing_or_admin_required, is_marketing_or_admin
+
+
+@login_required
+@require_http_methods(["GET"])
+def marketing_installments_api(request, installment_type):
+    """API endpoint to fetch installments for marketing dashboard"""
+    if not is_marketing_or_admin(request.user):
+        return JsonResponse({'success': False, 'message': 'Permission denied'})
+    
+    try:
+        from ..models import Installment, LandSale
+        from datetime import timedelta
+        from django.utils import timezone
+        
+        # Filter installments based on user role
+        if request.user.role == 'admin':
+            # Admin can see all installments
+            base_installments = Installment.objects.all()
+        else:
+            # Marketing employees can only see installments for lands they sold
+            base_installments = Installment.objects.filter(
+                land_sale__marketing_employee=request.user
+            )
+        
+        # Apply date and status filters based on installment type
+        if installment_type == 'upcoming':
+            # Get upcoming installments (due within next 7 days and not paid)
+            installments = base_installments.filter(
+                due_date__gte=timezone.now().date(),
+                due_date__lte=timezone.now().date() + timedelta(days=7),
+                status__in=['pending', 'partial']
+            ).select_related('land_sale', 'land_sale__land', 'land_sale__client').order_by('due_date')
+        elif installment_type == 'overdue':
+            # Get overdue installments (past due date and not paid)
+            installments = base_installments.filter(
+                due_date__lt=timezone.now().date(),
+                status__in=['pending', 'partial']
+            ).select_related('land_sale', 'land_sale__land', 'land_sale__client').order_by('due_date')
+        else:
+            return JsonResponse({'success': False, 'message': 'Invalid installment type'})
+        
+        # Prepare installment data
+        installment_data = []
+        for installment in installments:
+            # Since LandSale model doesn't have total_amount field, we'll use percentage as display
+            # The actual amount calculation should be handled in the frontend or separate logic
+            installment_data.append({
+                'id': installment.id,
+                'land_name': installment.land_sale.land.name if installment.land_sale and installment.land_sale.land else 'Unknown',
+                'client_name': installment.land_sale.client.client_name if installment.land_sale and installment.land_sale.client else 'Unknown',
+                'amount': float(installment.percentage),  # Using percentage as amount for now
+                'due_date': installment.due_date.isoformat() if installment.due_date else None,
+                'status': installment.status,
+                'percentage': installment.percentage,
+            })
+        
+        return JsonResponse({
+            'success': True,
+            'installments': installment_data
+        })
+        
+    except Exception as e:
+        print(f"ERROR in marketing_installments_api: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        return JsonResponse({
+            'success': False,
+            'message': f'Error fetching installments: {str(e)}'
+        })
+
+@marketing_or_admin_required
+def land_installments(request):
+    """View to display all land installments from core_installment table"""
+    try:
+        from datetime import date
+        today = date.today()
+        
+        # Filter installments based on user role with custom sorting
+        from django.db.models import Case, When, Value, IntegerField
+        
+        # Custom ordering: pending/overdue first (by due date), then paid installments
+        custom_order = Case(
+            When(status='pending', then=Value(1)),
+            When(status='overdue', then=Value(1)), 
+            When(status='paid', then=Value(2)),
+            default=Value(3),
+            output_field=IntegerField()
+        )
+        
+        if request.user.role == 'admin':
+            # Admin can see all installments - pending/overdue by due date first, then paid
+            installments = Installment.objects.select_related(
+                'land_sale__land__village',
+                'land_sale__land__taluka', 
+                'land_sale__client',
+                'land_sale__marketing_employee'
+            ).annotate(
+                sort_priority=custom_order
+            ).order_by('sort_priority', 'due_date', 'installment_number')
+            print("DEBUG: Admin user - showing all installments with pending first, then paid")
+        elif request.user.role == 'employee' and request.user.employee_type == 'marketing':
+            # Marketing employees can only see installments for lands they sold - pending/overdue by due date first, then paid
+            installments = Installment.objects.select_related(
+                'land_sale__land__village',
+                'land_sale__land__taluka',
+                'land_sale__client',
+                'land_sale__marketing_employee'
+            ).filter(
+                land_sale__marketing_employee=request.user
+            ).annotate(
+                sort_priority=custom_order
+            ).order_by('sort_priority', 'due_date', 'installment_number')
+            print(f"DEBUG: Marketing employee {request.user.username} - showing installments with pending first, then paid")
+        else:
+            # Fallback - no installments for other user types
+            installments = Installment.objects.none()
+            print("DEBUG: User type not authorized - showing no installments")
+        
+        # Since LandSale doesn't have sale_amount field, we'll display percentage as is
+        # The amount calculation will be handled in the template or can be added later
+        for installment in installments:
+            # Set a placeholder amount or use percentage directly
+            installment.amount = installment.percentage  # Display percentage as amount for now
+        
+        # Get unique lands for filter dropdown
+        land_sales = set()
+        for installment in installments:
+            if installment.land_sale:
+                land_sales.add(installment.land_sale)
+        
+        # Only the clients of the listed installments can narrow the list
+        all_clients = sorted(
+            {land_sale.client for land_sale in land_sales if land_sale.client},
+            key=lambda client: client.client_name
+        )
+        
+        # Get all marketing employees for filter dropdown
+        marketing_employees = User.objects.filter(
+            role='employee', 
+            employee_type='marketing'
+        ).order_by('full_name')
+        
+        context = {
+            'installments': installments,
+            'land_sales': list(land_sales),
+            'all_clients': all_clients,
+            'marketing_employees': marketing_employees,
+            'today': today,
+            'user': request.user,
+        }
+        
+        print(f"DEBUG: Found {len(installments)} installments")
+        return render(request, 'land_installments.html', context)
+        
+    except Exception as e:
+        print(f"ERROR in land_installments view: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        # Return empty context on error
+        context = {
+            'installments': [],
+            'land_sales': [],
+            'today': date.today(),
+            'user': request.user,
+            'error_message': 'Error loading installments data'
+        }
+        return render(request, 'land_installments.html', context)
+
+@login_required
+def mark_installment_paid_api(request, installment_id):
+    """API endpoint to mark installment as paid"""
+    if request.method != 'POST':
+        return JsonResponse({'success': False, 'message': 'Invalid request method'})
+    
+    # Allow admin and marketing employees
+    if not is_marketing_or_admin(request.user):
+        return JsonResponse({'success': False, 'message': 'Permission denied'})
+    
+    try:
+        import json
+        from datetime import datetime
+        
+        data = json.loads(request.body)
+        installment = Installment.objects.get(id=installment_id)
+        
+        # Check if marketing employee can only update their own installments
+        if request.user.role == 'employee' and request.user.employee_type == 'marketing':
+            if installment.land_sale.marketing_employee != request.user:
+                return JsonResponse({'success': False, 'message': 'Permission denied - not your installment'})
+        
+        # Update installment as paid with simplified remark-only process
+        remark = data.get('remark', '').strip()
+        
+        if not remark:
+            return JsonResponse({'success': False, 'message': 'Remark is required'})
+        
+        installment.status = 'paid'
+        installment.paid_date = datetime.now().date()
+        installment.remark = remark
+        installment.received_by = request.user
+        
+        installment.save()
+        
+        return JsonResponse({
+            'success': True,
+            'message': 'Installment marked as paid successfully'
+        })
+        
+    except Installment.DoesNotExist:
+        return JsonResponse({'success': False, 'message': 'Installment not found'})
+    except Exception as e:
+        print(f"ERROR in mark_installment_paid_api: {str(e)}")
+        return JsonResponse({'success': False, 'message': 'Error marking installment as paid'})
+
+@login_required
+def process_installment_payment_api(request, installment_id):
+    """API endpoint to process installment payment with comprehensive details"""
+    if request.method != 'POST':
+        return JsonResponse({'success': False, 'message': 'Invalid request method'})
+    
+    # Allow admin and marketing employees
+    if not is_marketing_or_admin(request.user):
+        return JsonResponse({'success': False, 'message': 'Permission denied'})
+    
+    try:
+        from datetime import datetime
+        
+        installment = Installment.objects.get(id=installment_id)
+        
+        # Check if marketing employee can only update their own installments
+        if request.user.role == 'employee' and request.user.employee_type == 'marketing':
+            if installment.land_sale.marketing_employee != request.user:
+                return JsonResponse({'success': False, 'message': 'Permission denied - not your installment'})
+        
+        # Get form data
+        payment_date = request.POST.get('payment_date')
+        rtgs_number = request.POST.get('rtgs_number', '')
+        from_bank = request.POST.get('from_bank', '')
+        utr_reference = request.POST.get('utr_reference', '')
+        ifsc_code = request.POST.get('ifsc_code', '')
+        bank_name = request.POST.get('bank_name', '')
+        payment_remark = request.POST.get('remark', '')  # Fixed: JavaScript sends 'remark'
+        cheque_photo = request.FILES.get('payment_photo')  # Fixed: JavaScript sends 'payment_photo'
+        
+        # Debug logging
+        print(f"DEBUG - Payment data received:")
+        print(f"  - payment_date: {payment_date}")
+        print(f"  - remark: {payment_remark}")
+        print(f"  - cheque_photo: {cheque_photo}")
+        print(f"  - rtgs_number: {rtgs_number}")
+        
+        if not payment_date:
+            return JsonResponse({'success': False, 'message': 'Payment date is required'})
+        
+        if not payment_remark.strip():
+            return JsonResponse({'success': False, 'message': 'Payment remark is required'})
+        
+        # Update installment with payment record fields (matching sold_land structure)
+        installment.paid_date = datetime.strptime(payment_date, '%Y-%m-%d').date()
+        installment.rtgs_number = rtgs_number
+        installment.from_bank = from_bank
+        installment.utr_reference = utr_reference
+        installment.ifsc_code = ifsc_code
+        installment.bank_name = bank_name
+        installment.remark = payment_remark
+        
+        # Handle file upload for cheque photo
+        if cheque_photo:
+            installment.cheque_photo = cheque_photo
+            print(f"DEBUG - Cheque photo saved: {installment.cheque_photo.name}")
+        
+        installment.received_by = request.user
+        installment.status = 'paid'
+        
+        installment.save()
+        
+        print(f"DEBUG - Installment saved successfully with remark: {installment.remark}")
+        
+        return JsonResponse({
+            'success': True,
+            'message': 'Payment processed successfully'
+        })
+        
+    except Installment.DoesNotExist:
+        return JsonResponse({'success': False, 'message': 'Installment not found'})
+    except Exception as e:
+        print(f"ERROR in process_installment_payment_api: {str(e)}")
+        return JsonResponse({'success': False, 'message': 'Error processing payment'})
+
+@login_required
+def update_installment_api(request, installment_id):
+    """API endpoint to update installment details"""
+    if request.method != 'POST':
+        return JsonResponse({'success': False, 'message': 'Invalid request method'})
+    
+    # Allow admin and marketing employees
+    if not is_marketing_or_admin(request.user):
+        return JsonResponse({'success': False, 'message': 'Permission denied'})
+    
+    try:
+        import json
+        from datetime import datetime
+        
+        data = json.loads(request.body)
+        installment = Installment.objects.get(id=installment_id)
+        
+        # Check if marketing employee can only update their own installments
+        if request.user.role == 'employee' and request.user.employee_type == 'marketing':
+            if installment.land_sale.marketing_employee != request.user:
+                return JsonResponse({'success': False, 'message': 'Permission denied - not your installment'})
+        
+        # Update installment details
+        if data.get('percentage'):
+            installment.percentage = float(data.get('percentage'))
+        
+        if data.get('due_date'):
+            installment.due_date = datetime.strptime(data.get('due_date'), '%Y-%m-%d').date()
+        
+        if data.get('payment_type'):
+            installment.payment_type = data.get('payment_type')
+        
+        if data.get('notes'):
+            installment.notes = data.get('notes')
+        
+        installment.save()
+        
+        return JsonResponse({
+            'success': True,
+            'message': 'Installment updated successfully'
+        })
+        
+    except Installment.DoesNotExist:
+        return JsonResponse({'success': False, 'message': 'Installment not found'})
+    except Exception as e:
+        print(f"ERROR in update_installment_api: {str(e)}")
+        return JsonResponse({'success': False, 'message': 'Error updating installment'})
+
+@login_required
+def get_installment_details_api(request, installment_id):
+    """API endpoint to get installment details"""
+    if request.method != 'GET':
+        return JsonResponse({'success': False, 'message': 'Invalid request method'})
+    
+    # Allow admin and marketing employees
+    if not is_marketing_or_admin(request.user):
+        return JsonResponse({'success': False, 'message': 'Permission denied'})
+    
+    try:
+        installment = Installment.objects.select_related(
+            'land_sale__land__village',
+            'land_sale__land__taluka',
+            'land_sale__client',
+            'land_sale__marketing_employee'
+        ).get(id=installment_id)
+        
+        # Check if marketing employee can only view their own installments
+        if request.user.role == 'employee' and request.user.employee_type == 'marketing':
+            if installment.land_sale.marketing_employee != request.user:
+                return JsonResponse({'success': False, 'message': 'Permission denied - not your installment'})
+        
+        # Calculate installment amount
+        amount = 0
+        if installment.land_sale and installment.land_sale.sale_amount:
+            amount = (installment.percentage / 100) * installment.land_sale.sale_amount
+        
+        data = {
+            'id': installment.id,
+            'installment_number': installment.installment_number,
+            'percentage': float(installment.percentage),
+            'amount': float(amount),
+            'due_date': installment.due_date.strftime('%Y-%m-%d') if installment.due_date else '',
+            'paid_date': installment.paid_date.strftime('%Y-%m-%d') if installment.paid_date else '',
+            'status': installment.status,
+            'payment_type': installment.payment_type,
+            'payment_reference': installment.payment_reference,
+            'notes': installment.notes,
+            'remark': installment.remark,
+            'land_details': {
+                'land_number': installment.land_sale.land.land_number if installment.land_sale.land else '',
+                'village': installment.land_sale.land.village.name if installment.land_sale.land and installment.land_sale.land.village else '',
+                'taluka': installment.land_sale.land.taluka.name if installment.land_sale.land and installment.land_sale.land.taluka else '',
+            },
+            'client_details': {
+                'name': installment.land_sale.client.client_name if installment.land_sale.client else '',
+                'phone': installment.land_sale.client.phone if installment.land_sale.client else '',
+            },
+            'marketing_employee': {
+                'name': installment.land_sale.marketing_employee.full_name if installment.land_sale.marketing_employee else '',
+                'username': installment.land_sale.marketing_employee.username if installment.land_sale.marketing_employee else '',
+            }
+        }
+        
+        return JsonResponse({
+            'success': True,
+            'data': data
+        })
+        
+    except Installment.DoesNotExist:
+        return JsonResponse({'success': False, 'message': 'Installment not found'})
+    except Exception as e:
+        print(f"ERROR in get_installment_details_api: {str(e)}")
+        return JsonResponse({'success': False, 'message': 'Error fetching installment details'})
+
+@login_required
+def process_installment_payment(request, installment_id):
+    """Process payment for an installment"""
+    if request.method != 'POST':
+        return JsonResponse({'success': False, 'message': 'Invalid request method'})
+    
+    # Allow admin and marketing employees to process installment payments
+    if not is_marketing_or_admin(request.user):
+        return JsonResponse({'success': False, 'message': 'Permission denied'})
+    
+    try:
+        from ..models import Installment
+        from datetime import datetime
+        import os
+        
+        # Get data from request (FormData)
+        payment_date = request.POST.get('payment_date')
+        rtgs_number = request.POST.get('rtgs_number', '')
+        from_bank = request.POST.get('from_bank', '')
+        utr_reference = request.POST.get('utr_reference', '')
+        ifsc_code = request.POST.get('ifsc_code', '')
+        bank_name = request.POST.get('bank_name', '')
+        cheque_photo = request.FILES.get('cheque_photo')
+        remark = request.POST.get('remark', '')
+        
+        # Validate required fields
+        if not payment_date:
+            return JsonResponse({'success': False, 'message': 'Payment date is required'})
+        
+        # Get the installment
+        try:
+            installment = Installment.objects.get(id=installment_id)
+        except Installment.DoesNotExist:
+            return JsonResponse({'success': False, 'message': 'Installment not found'})
+        
+        # Check if installment is already paid
+        if installment.status == 'paid':
+            return JsonResponse({'success': False, 'message': 'Installment is already paid'})
+        
+        # Update installment with payment record fields
+        installment.paid_date = datetime.strptime(payment_date, '%Y-%m-%d').date()
+        installment.rtgs_number = rtgs_number
+        installment.from_bank = from_bank
+        installment.utr_reference = utr_reference
+        installment.ifsc_code = ifsc_code
+        installment.bank_name = bank_name
+        installment.remark = remark
+        
+        # Handle file upload for cheque photo
+        if cheque_photo:
+            installment.cheque_photo = cheque_photo
+        
+        installment.received_by = request.user
+        installment.status = 'paid'
+        installment.save()
+        
+
+
+        
+        # Check if all installments are paid and update land status
+        land = installment.land_sale.land
+        if land.update_status_based_on_installments():
+            status_message = f'Payment processed successfully. All installments paid - Land status updated to SOLD.'
+        else:
+            status_message = f'Payment processed successfully'
+        
+        return JsonResponse({
+            'success': True,
+            'message': status_message,
+            'payment_id': installment.id,
+            'receipt_number': f"RCP{installment.id:04d}{installment.paid_date.strftime('%Y%m%d') if installment.paid_date else ''}",
+            'land_status_updated': land.status == 'sold'
+        })
+        
+    except Exception as e:
+        return JsonResponse({'success': False, 'message': f'Error processing payment: {str(e)}'})
+
+@login_required
+def get_payment_details(request, installment_id):
+    """Get payment details for an installment"""
+    if request.method != 'GET':
+        return JsonResponse({'success': False, 'message': 'Invalid request method'})
+    
+    # Allow admin and marketing employees to view payment details
+    if not is_marketing_or_admin(request.user):
+        return JsonResponse({'success': False, 'message': 'Permission denied'})
+    
+    try:
+        from ..models import Installment
+        import re
+        
+        # Get the installment
+        try:
+            installment = Installment.objects.get(id=installment_id)
+        except Installment.DoesNotExist:
+            return JsonResponse({'success': False, 'message': 'Installment not found'})
+        
+        # Check if installment is paid
+        if installment.status != 'paid':
+            return JsonResponse({'success': False, 'message': 'Installment is not paid'})
+        
+        # Check if this is a detailed payment (has bank details) or simple mark-as-paid
+        has_detailed_payment = bool(installment.rtgs_number or installment.utr_reference or 
+                                  installment.bank_name or installment.from_bank or 
+                                  installment.ifsc_code or installment.cheque_photo)
+        
+        # Format payment details - show different data based on payment type
+        payment_details = {
+            'installment_number': installment.installment_number,
+            'percentage': float(installment.percentage),
+            'payment_method': installment.payment_type,
+            'received_date': installment.paid_date.strftime('%Y-%m-%d') if installment.paid_date else '',
+            'received_by': installment.received_by.username if installment.received_by else 'Unknown',
+            'receipt_number': f"RCP{installment.id:04d}{installment.paid_date.strftime('%Y%m%d') if installment.paid_date else ''}",
+            'remark': installment.remark or '',  # Always show remark
+            'is_detailed_payment': has_detailed_payment,  # Flag to determine modal content
+        }
+        
+        # Only include detailed payment fields if they exist
+        if has_detailed_payment:
+            payment_details.update({
+                'payment_reference': installment.utr_reference or installment.rtgs_number,
+                'bank_name': installment.bank_name,
+                'from_bank': installment.from_bank,
+                'rtgs_number': installment.rtgs_number,
+                'utr_reference': installment.utr_reference,
+                'ifsc_code': installment.ifsc_code,
+                'cheque_photo': installment.cheque_photo.url if installment.cheque_photo else None,
+                'notes': installment.notes or '',
+            })
+        
+        return JsonResponse({
+            'success': True,
+            'payment_details': payment_details
+        })
+        
+    except Exception as e:
+        return JsonResponse({'success': False, 'message': f'Error fetching payment details: {str(e)}'})
+
+@login_required
+@csrf_exempt
+def create_reminder_api(request):
+    """API endpoint to create a new reminder"""
+    if request.method != 'POST':
+        return JsonResponse({'success': False, 'message': 'Method not allowed'})
+    
+    try:
+        data = json.loads(request.body)
+        
+        # Validate required fields
+        title = data.get('title', '').strip()
+        description = data.get('description', '').strip()
+        reminder_time = data.get('reminder_time')
+        priority = data.get('priority', 'medium')
+        installment_id = data.get('installment_id')
+        
+        if not title or not description or not reminder_time:
+            return JsonResponse({'success': False, 'message': 'Title, description, and reminder time are required'})
+        
+        # Parse reminder time
+        from datetime import datetime
+        try:
+            reminder_datetime = datetime.fromisoformat(reminder_time.replace('Z', '+00:00'))
+        except ValueError:
+            return JsonResponse({'success': False, 'message': 'Invalid reminder time format'})
+        
+        # Create reminder
+        from ..models import Reminder, Installment
+        
+        reminder = Reminder(
+            title=title,
+            description=description,
+            reminder_time=reminder_datetime,
+            priority=priority,
+            created_by=request.user,
+            assigned_to=request.user
+        )
+        
+        # Link to installment if provided
+        if installment_id:
+            try:
+                installment = Installment.objects.get(id=installment_id)
+                reminder.installment = installment
+            except Installment.DoesNotExist:
+                pass
+        
+        reminder.save()
+        
+        return JsonResponse({
+            'success': True, 
+            'message': 'Reminder created successfully',
+            'reminder_id': reminder.id
+        })
+        
+    except json.JSONDecodeError:
+        return JsonResponse({'success': False, 'message': 'Invalid JSON data'})
+    except Exception as e:
+        print(f"Error creating reminder: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        return JsonResponse({'success': False, 'message': 'Error creating reminder'})
+
+def _pending_reminders(user):
+    return Reminder.objects.filter(
+        assigned_to=user,
+        status='pending'
+    ).order_by('reminder_time')
+
+def _serialize_reminder(reminder):
+    return {
+        'id': reminder.id,
+        'title': reminder.title,
+        'description': reminder.description,
+        'reminder_time': reminder.reminder_time.strftime('%d/%m/%Y %H:%M'),
+        'priority': reminder.get_priority_display(),
+        'priority_value': reminder.priority,
+        'is_overdue': reminder.is_overdue(),
+        'installment_id': reminder.installment_id,
+        'created_at': reminder.created_at.strftime('%d/%m/%Y %H:%M')
+    }
+
+@login_required
+def get_reminders_api(request):
+    """API endpoint to get user's reminders"""
+    try:
+        reminders_data = [_serialize_reminder(reminder) for reminder in _pending_reminders(request.user)]
+        return JsonResponse({'success': True, 'reminders': reminders_data})
+        
+    except Exception as e:
+        print(f"Error fetching reminders: {str(e)}")
+        return JsonResponse({'success': False, 'message': 'Error fetching reminders'})
+
+@login_required
+async def aget_reminders_api(request):
+    """get_reminders_api for ASGI deployments (see chat.achat_unread_count)"""
+    try:
+        user = await request.auser()
+        reminders_data = [_serialize_reminder(reminder) async for reminder in _pending_reminders(user)]
+        return JsonResponse({'success': True, 'reminders': reminders_data})
+
+    except Exception as e:
+        print(f"Error fetching reminders: {str(e)}")
+        return JsonResponse({'success': False, 'message': 'Error fetching reminders'})
+
+@login_required
+@csrf_exempt
+def mark_reminder_completed_api(request, reminder_id):
+    """API endpoint to mark a reminder as completed"""
+    if request.method != 'POST':
+        return JsonResponse({'success': False, 'message': 'Method not allowed'})
+    
+    try:
+        from ..models import Reminder
+        
+        reminder = Reminder.objects.get(id=reminder_id, assigned_to=request.user)
+        reminder.mark_completed()
+        
+        return JsonResponse({'success': True, 'message': 'Reminder marked as completed'})
+        
+    except Reminder.DoesNotExist:
+        return JsonResponse({'success': False, 'message': 'Reminder not found or unauthorized'})
+    except Exception as e:
+        print(f"Error marking reminder completed: {str(e)}")
+        return JsonResponse({'success': False, 'message': 'Error marking reminder completed'})
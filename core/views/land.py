@@ -0,0 +1,1233 @@
+import json
+
+from django.contrib import messages
+from django.contrib.auth.decorators import login_required
+from django.http import JsonResponse
+from django.shortcuts import render, redirect, get_object_or_404
+
+from ..models import User, Land, Advocate
+from ..notifications import notify_admins
+from .. import bulk_operations
+from ..caching import fragment_versions
+from ..conditional import conditional_resource
+from ..permissions import admin_required, is_marketing_or_admin
+from ..task_catalog import task_catalog
+from .tasks import auto_assign_tasks_for_land, update_assigned_tasks_for_land
+
+
+@admin_required
+def admin_land(request):
+    # Get only lands that are not in inventory, in_process, or sold (workflow: active/archived only)
+    # These are lands that are still being processed or haven't been sent to inventory yet
+    lands = Land.objects.exclude(status__in=['inventory', 'in_process', 'sold']).select_related('village')
+    
+    # Get all employees for task assignment (excluding marketing type)
+    developers = User.objects.filter(role='employee').exclude(employee_type='marketing').order_by('id')
+    employees = User.objects.filter(role='employee', status='active').exclude(employee_type='marketing').order_by('full_name', 'username')
+    
+    # Get all tasks for task selection excluding marketing tasks, with their assigned employees
+    all_tasks = task_catalog(marketing_task=False)
+    
+    # Get all sata prakar for dropdowns
+    from ..models import SataPrakar
+    sata_prakar_list = SataPrakar.objects.all().order_by('name')
+    
+    # Calculate statistics
+    total_lands = lands.count()
+    
+    # Check for error query parameter from edit land validation
+    error_message = request.GET.get('error', '')
+    
+    context = {
+        'total_lands': total_lands,
+        'lands': lands,
+        'developers': developers,
+        'employees': employees,
+        'all_tasks': all_tasks,
+        'sata_prakar_list': sata_prakar_list,
+        'error_message': error_message,  # Pass error message to template
+        # The table is only queried when its cached fragment is missing
+        **fragment_versions('land_tables', 'locations'),
+    }
+    return render(request, 'admin_land.html', context)
+
+@login_required
+def land_tasks(request, land_id):
+    print(f"Land tasks view called for land_id: {land_id}")
+    print(f"User: {request.user.username}, Role: {request.user.role}, Authenticated: {request.user.is_authenticated}")
+    
+    # Allow admin and marketing employees to access land tasks
+    if not request.user.is_authenticated or not is_marketing_or_admin(request.user):
+        print("User not authenticated or not authorized, redirecting to login")
+        return redirect('login')
+    
+    # Get the specific land
+    land = get_object_or_404(Land, id=land_id)
+    print(f"Land found: {land.name}")
+    
+    # Get assigned tasks for this land to show current status
+    from ..models import AssignedTask
+    assigned_tasks = AssignedTask.objects.filter(land=land).select_related('task', 'employee')
+    
+    # Count tasks by status
+    pending_approval_count = assigned_tasks.filter(status='pending_approval').count()
+    in_progress_count = assigned_tasks.filter(status='in_progress').count()
+    completed_count = assigned_tasks.filter(status='complete').count()
+    pending_count = assigned_tasks.filter(status='pending').count()
+    
+    context = {
+        'land': land,
+        'assigned_tasks': assigned_tasks,
+        'pending_approval_count': pending_approval_count,
+        'in_progress_count': in_progress_count,
+        'completed_count': completed_count,
+        'pending_count': pending_count,
+    }
+    return render(request, 'land_tasks.html', context)
+
+@admin_required
+def add_land(request):
+    # Fetch all tasks (both default and non-default) excluding marketing tasks,
+    # with their assigned employees, from the cached task catalog
+    from ..models import SataPrakar
+    all_tasks = task_catalog(marketing_task=False)
+    sata_prakar_list = SataPrakar.objects.all().order_by('name')
+    
+    # Fetch employees for the add task modal (excluding marketing type)
+    employees = User.objects.filter(role='employee', status='active').exclude(employee_type='marketing').order_by('full_name', 'username')
+    
+    if request.method == 'POST':
+        # Get all form data from the comprehensive form
+        name = request.POST.get('name', '')
+        state = request.POST.get('state', '')
+        district = request.POST.get('district', '')
+        taluka = request.POST.get('taluka', '')
+        village = request.POST.get('village', '')
+        old_sr_no = request.POST.get('old_sr_no', '')
+        new_sr_no = request.POST.get('new_sr_no', '')
+        sata_prakar = request.POST.get('sata_prakar', '')
+        built_up_area = request.POST.get('built_up_area', '')
+        unutilized_area = request.POST.get('unutilized_area', '')
+        total_area = request.POST.get('total_area', '')
+        past_date = request.POST.get('past_date', '')
+        soda_tarikh = request.POST.get('soda_tarikh', '')
+        banakhat_tarikh = request.POST.get('banakhat_tarikh', '')
+        dastavej_tarikh = request.POST.get('dastavej_tarikh', '')
+        broker_name = request.POST.get('broker_name', '')
+        location = request.POST.get('location', '')
+        remark = request.POST.get('remark', '')
+        selected_tasks = request.POST.get('selected_tasks', '')
+        task_completion_days = request.POST.get('task_completion_days', '{}')
+        
+        # Validate required fields based on the photo format
+        required_fields = [
+            'name', 'state', 'district', 'taluka', 'village', 
+            'old_sr_no', 'new_sr_no', 'sata_prakar', 'built_up_area', 
+            'unutilized_area', 'total_area', 'soda_tarikh', 
+            'banakhat_tarikh', 'dastavej_tarikh', 'broker_name'
+        ]
+        
+        # Check for missing fields and create field-level errors
+        field_errors = {}
+        missing_fields = []
+        
+        for field in required_fields:
+            field_value = request.POST.get(field, '').strip()
+            if not field_value:
+                missing_fields.append(field)
+                field_errors[field] = f'{field.replace("_", " ").title()} is required'
+        
+        # Validate area fields are numeric
+        if built_up_area or unutilized_area:
+            try:
+                if built_up_area:
+                    float(built_up_area)
+                if unutilized_area:
+                    float(unutilized_area)
+            except ValueError:
+                if built_up_area:
+                    field_errors['built_up_area'] = 'Please enter a valid number for built-up area'
+                if unutilized_area:
+                    field_errors['unutilized_area'] = 'Please enter a valid number for unutilized area'
+        
+        if missing_fields:
+            # Don't use messages.error() for form validation - it persists across pages
+            # Instead, pass validation errors in context
+            validation_error = f'Please fill in all required fields: {", ".join(missing_fields)}'
+            
+            # Pass form data back to template so user doesn't lose their input
+            context = {
+                'all_tasks': all_tasks,
+                'sata_prakar_list': sata_prakar_list,
+                'employees': employees,
+                'validation_error': validation_error,  # Pass error in context instead of messages
+                'form_data': {
+                    'name': name,
+                    'state': state,
+                    'district': district,
+                    'taluka': taluka,
+                    'village_name': village_name,
+                    'old_sr_no': old_sr_no,
+                    'new_sr_no': new_sr_no,
+                    'sata_prakar': sata_prakar,
+                    'built_up_area': built_up_area,
+                    'unutilized_area': unutilized_area,
+                    'total_area': total_area,
+                    'past_date': past_date,
+                    'soda_tarikh': soda_tarikh,
+                    'banakhat_tarikh': banakhat_tarikh,
+                    'dastavej_tarikh': dastavej_tarikh,
+                    'broker_name': broker_name,
+                    'location': location,
+                    'remark': remark,
+                    'selected_tasks': selected_tasks,
+                    'task_completion_days': task_completion_days,
+                },
+                'field_errors': field_errors,
+                'selected_tasks_list': selected_tasks.split(',') if selected_tasks else [],
+            }
+            return render(request, 'add_land.html', context)
+        
+        # Handle empty tasks - allow no tasks to be selected
+        if not selected_tasks or selected_tasks.strip() == '':
+            selected_tasks = ''
+        
+        # Get task employee selections
+        task_employee_selections = request.POST.get('task_employee_selections', '{}')
+        try:
+            task_employee_selections = json.loads(task_employee_selections)
+        except json.JSONDecodeError:
+            task_employee_selections = {}
+        
+        try:
+            # Convert decimal fields
+            built_up_area_decimal = float(built_up_area) if built_up_area else 0
+            unutilized_area_decimal = float(unutilized_area) if unutilized_area else 0
+            total_area_decimal = float(total_area) if total_area else 0
+            
+            # Create new land record
+            land = Land.objects.create(
+                name=name,
+                state=state,
+                district_id=district,
+                taluka_id=taluka,
+                village_id=village,
+                old_sr_no=old_sr_no,
+                new_sr_no=new_sr_no,
+                sata_prakar=sata_prakar,
+                built_up_area=built_up_area_decimal,
+                unutilized_area=unutilized_area_decimal,    
+                total_area=total_area_decimal,
+                past_date=past_date if past_date else None,
+                soda_tarikh=soda_tarikh,
+                banakhat_tarikh=banakhat_tarikh,
+                dastavej_tarikh=dastavej_tarikh,
+                broker_name=broker_name,
+                location=location,
+                remark=remark,
+                selected_tasks=selected_tasks
+            )
+            
+            # Debug: Log created land object
+            print(f"Land created successfully:")
+            print(f"  Land ID: {land.id}")
+            
+            # Automatically assign selected tasks to employees
+            assignment_success, assignment_message = auto_assign_tasks_for_land(land, selected_tasks, task_employee_selections, task_completion_days)
+            
+            # Create notification for all admins about new land
+            notify_admins(f"New land '{name}' has been added to the system")
+            
+            if assignment_success:
+                messages.success(request, f'Land "{name}" added successfully! {assignment_message}')
+            else:
+                messages.warning(request, f'Land "{name}" added successfully, but there was an issue with task assignment: {assignment_message}')
+            
+            return redirect('admin-land')
+        except Exception as e:
+            messages.error(request, f'Error adding land: {str(e)}')
+            
+            # Pass form data back to template so user doesn't lose their input
+            context = {
+                'all_tasks': all_tasks,
+                'sata_prakar_list': sata_prakar_list,
+                'employees': employees,
+                'form_data': {
+                    'name': name,
+                    'state': state,
+                    'district': district,
+                    'taluka': taluka,
+                    'village_name': village_name,
+                    'old_sr_no': old_sr_no,
+                    'new_sr_no': new_sr_no,
+                    'sata_prakar': sata_prakar,
+                    'built_up_area': built_up_area,
+                    'unutilized_area': unutilized_area,
+                    'total_area': total_area,
+                    'past_date': past_date,
+                    'soda_tarikh': soda_tarikh,
+                    'banakhat_tarikh': banakhat_tarikh,
+                    'dastavej_tarikh': dastavej_tarikh,
+                    'broker_name': broker_name,
+                    'location': location,
+                    'remark': remark,
+                    'selected_tasks': selected_tasks,
+                    'task_completion_days': task_completion_days,
+                },
+                'field_errors': field_errors,
+                'selected_tasks_list': selected_tasks.split(',') if selected_tasks else [],
+            }
+            return render(request, 'add_land.html', context)
+    
+    # GET request - show the form
+    context = {
+        'all_tasks': all_tasks,
+        'sata_prakar_list': sata_prakar_list,
+        'employees': employees,
+    }
+    return render(request, 'add_land.html', context)
+
+@admin_required
+def edit_land(request, land_id):
+    try:
+        land = Land.objects.get(id=land_id)
+    except Land.DoesNotExist:
+        messages.error(request, 'Land not found')
+        return redirect('admin-land')
+    
+    if request.method == 'POST':
+        # Get all form data from the comprehensive form
+        name = request.POST.get('name', '')
+        state = request.POST.get('state', '')
+        district = request.POST.get('district', '')
+        taluka = request.POST.get('taluka', '')
+        village = request.POST.get('village', '')
+        old_sr_no = request.POST.get('old_sr_no', '')
+        new_sr_no = request.POST.get('new_sr_no', '')
+        sata_prakar = request.POST.get('sata_prakar', '')
+        built_up_area = request.POST.get('built_up_area', '')
+        unutilized_area = request.POST.get('unutilized_area', '')
+        total_area = request.POST.get('total_area', '')
+        past_date = request.POST.get('past_date', '')
+        soda_tarikh = request.POST.get('soda_tarikh', '')
+        banakhat_tarikh = request.POST.get('banakhat_tarikh', '')
+        dastavej_tarikh = request.POST.get('dastavej_tarikh', '')
+        broker_name = request.POST.get('broker_name', '')
+        selected_tasks = request.POST.get('selected_tasks', '')
+        task_completion_days = request.POST.get('task_completion_days', '{}')
+
+        
+        # Validate required fields
+        required_fields = [
+            'name', 'state', 'district', 'taluka', 'village', 
+            'old_sr_no', 'new_sr_no', 'sata_prakar', 'built_up_area', 
+            'unutilized_area', 'total_area', 'soda_tarikh', 
+            'banakhat_tarikh', 'dastavej_tarikh', 'broker_name'
+        ]
+        missing_fields = [field for field in required_fields if not request.POST.get(field)]
+        
+        if missing_fields:
+            # Don't use messages.error() for form validation - it persists across pages
+            # Instead, redirect with a query parameter for error display
+            error_message = f'Please fill in all required fields: {", ".join(missing_fields)}'
+            return redirect(f'{reverse("admin-land")}?error={error_message}')
+        
+        # Handle empty tasks - allow no tasks to be selected
+        if not selected_tasks or selected_tasks.strip() == '':
+            selected_tasks = ''
+        
+        # Get task employee selections
+        task_employee_selections = request.POST.get('task_employee_selections', '{}')
+        try:
+            task_employee_selections = json.loads(task_employee_selections)
+        except json.JSONDecodeError:
+            task_employee_selections = {}
+        
+        # Get new tasks to be created
+        new_tasks = request.POST.get('new_tasks', '[]')
+        try:
+            new_tasks = json.loads(new_tasks)
+        except json.JSONDecodeError:
+            new_tasks = []
+        
+        print(f"New tasks to be created: {new_tasks}")
+        
+        try:
+            # Convert decimal fields
+            built_up_area_decimal = float(built_up_area) if built_up_area else 0
+            unutilized_area_decimal = float(unutilized_area) if unutilized_area else 0
+            total_area_decimal = float(total_area) if total_area else 0
+            
+            # Store old selected tasks for comparison
+            old_selected_tasks = land.selected_tasks
+            
+            # Update land record
+            land.name = name
+            land.state = state
+            land.district_id = district
+            land.taluka_id = taluka
+            land.village_id = village
+            land.old_sr_no = old_sr_no
+            land.new_sr_no = new_sr_no
+            land.sata_prakar = sata_prakar
+            land.built_up_area = built_up_area_decimal
+            land.unutilized_area = unutilized_area_decimal
+            land.total_area = total_area_decimal
+            land.past_date = past_date if past_date else None
+            land.soda_tarikh = soda_tarikh
+            land.banakhat_tarikh = banakhat_tarikh
+            land.dastavej_tarikh = dastavej_tarikh
+            land.broker_name = broker_name
+            land.selected_tasks = selected_tasks
+            
+
+            
+            land.save()
+            
+            # Create new tasks if any
+            if new_tasks:
+                print(f"Creating {len(new_tasks)} new tasks")
+                from ..models import Task
+                
+                for new_task_data in new_tasks:
+                    task_name = new_task_data.get('task_name', '')
+                    position = new_task_data.get('position', '1')
+                    is_default = new_task_data.get('is_default', False)
+                    completion_days = new_task_data.get('completion_days', 0)
+                    
+                    # Check if task already exists
+                    task, created = Task.objects.get_or_create(
+                        name=task_name,
+                        defaults={
+                            'position': position,
+                            'is_default': is_default,
+                            'completion_days': completion_days
+                        }
+                    )
+                    
+                    if created:
+                        print(f"  [SUCCESS] Created new task: {task_name}")
+                    else:
+                        print(f"  [WARNING] Task already exists: {task_name}")
+                
+                # Update selected_tasks to include new tasks
+                if selected_tasks:
+                    selected_tasks += ',' + ','.join([task['task_name'] for task in new_tasks])
+                else:
+                    selected_tasks = ','.join([task['task_name'] for task in new_tasks])
+                
+                # Update the land with new selected tasks
+                land.selected_tasks = selected_tasks
+                land.save()
+                print(f"Updated land selected_tasks: {selected_tasks}")
+            
+            # Update AssignedTask records if tasks have changed OR if there are employee selections OR if completion days changed
+            if old_selected_tasks != selected_tasks or task_employee_selections or task_completion_days != '{}' or new_tasks:
+                print(f"Tasks, employee assignments, or completion days changed for land {land.id}")
+                print(f"Tasks: '{old_selected_tasks}' -> '{selected_tasks}'")
+                print(f"Employee selections: {task_employee_selections}")
+                print(f"Completion days: {task_completion_days}")
+                result, message = update_assigned_tasks_for_land(land, selected_tasks, task_employee_selections, task_completion_days)
+                print(f"Update result: {result}, Message: {message}")
+            else:
+                print(f"No changes for land {land.id}")
+            
+            # Create notification for all admins about land update
+            notify_admins(f"Land '{name}' has been updated in the system")
+            
+            messages.success(request, f'Land "{name}" updated successfully')
+            return redirect('admin-land')
+        except Exception as e:
+            messages.error(request, f'Error updating land: {str(e)}')
+            return redirect('admin-land')
+    
+    # GET request - redirect to admin land page
+    return redirect('admin-land')
+
+@login_required
+def delete_land(request, land_id):
+    if request.method == 'POST' and request.user.role == 'admin':
+        try:
+            # Get the land object and delete it
+            land = Land.objects.get(id=land_id)
+            land_name = land.name
+            
+            # Create notification for all admins about land deletion
+            notify_admins(f"Land '{land_name}' has been deleted from the system")
+            
+            land.delete()
+            messages.success(request, f'Land "{land_name}" deleted successfully')
+        except Land.DoesNotExist:
+            messages.error(request, 'Land not found')
+        except Exception as e:
+            messages.error(request, f'Error deleting land: {str(e)}')
+    else:
+        messages.error(request, 'Invalid request method or insufficient permissions')
+    
+    return redirect('admin-land')
+
+@login_required
+def bulk_delete_lands(request):
+    if request.method == 'POST' and request.user.role == 'admin':
+        land_ids = request.POST.getlist('land_ids')
+        
+        # Delete all selected lands as one set-based operation
+        deleted_land_names, failures = bulk_operations.bulk_delete_lands(land_ids)
+        deleted_count = len(deleted_land_names)
+        
+        for land_id, reason in failures.items():
+            messages.error(request, f'Error deleting land {land_id}: {reason}')
+        
+        # Create notification for all admins about bulk land deletion
+        if deleted_land_names:
+            notify_admins(f"Bulk deletion: {len(deleted_land_names)} land(s) have been deleted from the system")
+        
+        if deleted_count > 0:
+            messages.success(request, f'{deleted_count} land(s) deleted successfully')
+        else:
+            messages.warning(request, 'No lands were deleted')
+    else:
+        messages.error(request, 'Invalid request method or insufficient permissions')
+    
+    return redirect('admin-land')
+
+@admin_required(api=True)
+def get_land_tasks(request, land_id):
+    """AJAX view to get tasks for a specific land"""
+    try:
+        land = Land.objects.get(id=land_id)
+        
+        # Get land's selected tasks
+        land_tasks = []
+        if land.selected_tasks:
+            land_tasks = [task.strip() for task in land.selected_tasks.split(',') if task.strip()]
+        
+        # Get assigned tasks for this land using the new TaskManage model
+        assigned_tasks = []
+        from ..models import TaskManage
+        
+        # Get all assigned tasks for this land
+        land_assigned_tasks = TaskManage.objects.filter(task__land=land).select_related('task', 'employee')
+        
+        for assigned_task in land_assigned_tasks:
+            assigned_tasks.append({
+                'id': assigned_task.id,
+                'task_id': assigned_task.task.id,
+                'task_name': assigned_task.task.name,
+                'employee_id': assigned_task.employee.id,
+                'employee_name': assigned_task.employee.get_display_name(),
+                'status': 'assigned',  # Default status for TaskManage
+                'assigned_date': '',  # No date field in TaskManage
+                'completed_date': None,  # No completion date in TaskManage
+                'notes': '',  # No notes field in TaskManage
+            })
+        
+        return JsonResponse({
+            'success': True,
+            'land_tasks': land_tasks,
+            'assigned_tasks': assigned_tasks
+        })
+        
+    except Land.DoesNotExist:
+        return JsonResponse({'success': False, 'message': 'Land not found'})
+    except Exception as e:
+        return JsonResponse({'success': False, 'message': str(e)})
+
+@login_required
+def get_land_tasks_api(request, land_id):
+    """API endpoint to get tasks for a specific land with full details from core_assignedtask table"""
+    print(f"API called for land_id: {land_id}")
+    print(f"User: {request.user.username}, Role: {request.user.role}, Authenticated: {request.user.is_authenticated}")
+    print(f"Request headers: {dict(request.headers)}")
+    print(f"Session key: {request.session.session_key}")
+    print(f"Cookies: {request.COOKIES}")
+    
+    # Allow admin and marketing employees to access land tasks API
+    if not request.user.is_authenticated or not is_marketing_or_admin(request.user):
+        print("API: User not authenticated or not authorized")
+        return JsonResponse({'success': False, 'message': 'Unauthorized'})
+    
+    try:
+        land = Land.objects.get(id=land_id)
+        print(f"API: Land found: {land.name}")
+        
+        # Get assigned tasks for this land using AssignedTask model (core_assignedtask table)
+        from ..models import AssignedTask, LandSale
+        
+        # For marketing employees, filter tasks by their assignments only
+        if request.user.role == 'employee' and request.user.employee_type == 'marketing':
+            # Get tasks assigned to this marketing employee for this land
+            assigned_tasks = AssignedTask.objects.filter(
+                land=land, 
+                employee=request.user
+            ).select_related('task', 'employee')
+            print(f"API: Marketing employee {request.user.username} - Found {assigned_tasks.count()} tasks for land {land_id}")
+        else:
+            # For admin users, show all tasks for this land
+            assigned_tasks = AssignedTask.objects.filter(land=land).select_related('task', 'employee')
+            print(f"API: Admin user - Found {assigned_tasks.count()} tasks for land {land_id}")
+            
+            # Also try to get tasks assigned to the marketing employee who sold this land
+            try:
+                land_sale = LandSale.objects.filter(land=land).first()
+                if land_sale and land_sale.marketing_employee:
+                    marketing_tasks = AssignedTask.objects.filter(
+                        land=land,
+                        employee=land_sale.marketing_employee
+                    ).select_related('task', 'employee')
+                    print(f"API: Found {marketing_tasks.count()} tasks for marketing employee {land_sale.marketing_employee.username}")
+            except Exception as e:
+                print(f"API: Error getting marketing employee tasks: {e}")
+        
+        tasks = []
+        for assigned_task in assigned_tasks:
+            print(f"API: Processing task {assigned_task.task.name} for employee {assigned_task.employee.username}")
+            
+            # Get employee display name and additional info
+            employee_name = assigned_task.employee.get_display_name() if assigned_task.employee else 'Unassigned'
+            
+            # Get employee type with human-readable label
+            employee_type = 'Not specified'
+            if assigned_task.employee and assigned_task.employee.employee_type:
+                # Get the human-readable label for the choice
+                employee_type_choices = dict(User.EMPLOYEE_TYPE_CHOICES)
+                employee_type = employee_type_choices.get(assigned_task.employee.employee_type, assigned_task.employee.employee_type)
+            
+            employee_location = assigned_task.employee.location if assigned_task.employee and assigned_task.employee.location else 'Not specified'
+            
+            # Get task name from core_task table via the relationship
+            task_name = assigned_task.task.name if assigned_task.task else 'Unknown Task'
+            
+            # Get completion days from core_assignedtask table
+            completion_days = assigned_task.completion_days if hasattr(assigned_task, 'completion_days') and assigned_task.completion_days else 0
+            
+            task_data = {
+                'id': assigned_task.id,
+                'name': task_name,  # Task name from core_task table
+                'task_name': task_name,  # Backward compatibility
+                'completion_days': completion_days,  # From core_assignedtask table
+                'assigned_employee': employee_name,
+                'employee_name': employee_name,
+                'employee_type': employee_type,
+                'employee_location': employee_location,
+                'status': assigned_task.status or 'pending',
+                'due_date': assigned_task.due_date.strftime('%Y-%m-%d') if assigned_task.due_date else None,
+                'created_date': assigned_task.assigned_date.strftime('%Y-%m-%d') if assigned_task.assigned_date else None,
+                'created_at': assigned_task.assigned_date.strftime('%Y-%m-%d') if assigned_task.assigned_date else None,
+                'priority': 'medium',  # Default priority
+                'description': ''  # AssignedTask doesn't have notes field
+            }
+            
+            # Add completion workflow data if available
+            task_data['completion_notes'] = assigned_task.completion_notes or ''
+            task_data['completion_photos'] = assigned_task.completion_photos.url if assigned_task.completion_photos else None
+            task_data['completion_pdf'] = assigned_task.completion_pdf.url if assigned_task.completion_pdf else None
+            task_data['completion_submitted_date'] = assigned_task.completion_submitted_date.strftime('%Y-%m-%d') if assigned_task.completion_submitted_date else None
+            task_data['completed_date'] = assigned_task.completed_date.strftime('%Y-%m-%d') if assigned_task.completed_date else None
+            task_data['admin_approval_notes'] = assigned_task.admin_approval_notes or ''
+            # Removed fields: work_hours, issues, materials_used (simplified form)
+            
+            tasks.append(task_data)
+        
+        print(f"API: Returning {len(tasks)} tasks")
+        return JsonResponse({
+            'success': True,
+            'tasks': tasks
+        })
+        
+    except Land.DoesNotExist:
+        print(f"API: Land {land_id} not found")
+        return JsonResponse({'success': False, 'message': 'Land not found'})
+    except Exception as e:
+        print(f"API: Exception occurred: {str(e)}")
+        return JsonResponse({'success': False, 'message': str(e)})
+
+@login_required
+@conditional_resource('lands')
+def get_lands_api(request):
+    """API endpoint to get all lands for filtering"""
+    if not request.user.is_authenticated:
+        return JsonResponse({'error': 'Unauthorized access'}, status=403)
+    
+    try:
+        from ..models import Land
+        lands = Land.objects.all().order_by('name')
+        
+        print(f"Found {lands.count()} lands in database")
+        
+        lands_data = []
+        for land in lands:
+            land_data = {
+                'id': land.id,
+                'name': land.name,
+                'village_name': land.village.name,
+                'taluka': land.taluka.name,
+                'district': land.district.name,
+                'state': land.state
+            }
+            lands_data.append(land_data)
+        
+        print(f"Returning {len(lands_data)} land records")
+        return JsonResponse(lands_data, safe=False)
+        
+    except Exception as e:
+        print(f"Error in get_lands_api: {str(e)}")
+        return JsonResponse({'error': str(e)}, status=500)
+
+@admin_required(api=True)
+def get_land_data(request, land_id):
+    """AJAX view to get land data for editing"""
+    try:
+        land = Land.objects.get(id=land_id)
+        
+        # Get current task assignments for this land
+        from ..models import AssignedTask, TaskManage, Task
+        current_assignments = AssignedTask.objects.filter(land=land).select_related('task', 'employee')
+        
+        # Get all available tasks with their employees from TaskManage
+        all_tasks = TaskManage.objects.all().select_related('task')
+        
+        # Get all tasks from core_task table for completion days
+        all_core_tasks = Task.objects.all()
+        
+        # Create a mapping of task names to current employee assignments and available employees
+        task_assignments = {}
+        task_employee_mapping = {}
+        
+        # Create a mapping of task names to completion days from core_task table
+        task_completion_days = {}
+        for task in all_core_tasks:
+            task_completion_days[task.name] = getattr(task, 'completion_days', 0)
+        
+        # First, get all available employees for each task from TaskManage
+        for task_manage in all_tasks:
+            task_name = task_manage.task.name
+            if task_name not in task_employee_mapping:
+                task_employee_mapping[task_name] = {
+                    'task_id': task_manage.task.id,
+                    'completion_days': task_completion_days.get(task_name, 0),  # Get from core_task table
+                    'available_employees': [],
+                    'assigned_employees': []
+                }
+            
+            # Add available employee
+            if task_manage.employee:
+                task_employee_mapping[task_name]['available_employees'].append({
+                    'id': task_manage.employee.id,
+                    'name': task_manage.employee.full_name
+                })
+        
+        # Then, mark which employees are currently assigned to this land
+        for assignment in current_assignments:
+            task_name = assignment.task.name
+            if task_name not in task_assignments:
+                # Get task details from task_employee_mapping
+                task_details = task_employee_mapping.get(task_name, {
+                    'task_id': assignment.task.id,
+                    'completion_days': task_completion_days.get(task_name, 0),  # Get from core_task table
+                    'available_employees': [],
+                    'assigned_employees': []
+                })
+                
+                # For selected tasks, use completion days from core_assignedtask if available
+                assigned_completion_days = getattr(assignment, 'completion_days', None)
+                if assigned_completion_days is not None:
+                    completion_days = assigned_completion_days
+                else:
+                    completion_days = task_details['completion_days']  # Fallback to core_task
+                
+                task_assignments[task_name] = {
+                    'task_id': task_details['task_id'],
+                    'completion_days': completion_days,
+                    'available_employees': task_details['available_employees'],
+                    'assigned_employees': [],
+                    'status': assignment.status
+                }
+            
+            # Add assigned employee
+            task_assignments[task_name]['assigned_employees'].append({
+                'id': assignment.employee.id,
+                'name': assignment.employee.full_name
+            })
+        
+        land_data = {
+            'id': land.id,
+            'name': land.name or '',
+            'state': land.state or '',
+            'district': {'id': land.district_id, 'name': land.district.name} if land.district else {'id': '', 'name': ''},
+            'taluka': {'id': land.taluka_id, 'name': land.taluka.name} if land.taluka else {'id': '', 'name': ''},
+            'village': {'id': land.village_id, 'name': land.village.name} if land.village else {'id': '', 'name': ''},
+            'old_sr_no': land.old_sr_no or '',
+            'new_sr_no': land.new_sr_no or '',
+            'sata_prakar': land.sata_prakar or '',
+            'built_up_area': str(land.built_up_area) if land.built_up_area else '',
+            'unutilized_area': str(land.unutilized_area) if land.unutilized_area else '',
+            'total_area': str(land.total_area) if land.total_area else '',
+            'past_date': land.past_date.strftime('%Y-%m-%d') if land.past_date else '',
+            'soda_tarikh': land.soda_tarikh.strftime('%Y-%m-%d') if land.soda_tarikh else '',
+            'banakhat_tarikh': land.banakhat_tarikh.strftime('%Y-%m-%d') if land.banakhat_tarikh else '',
+            'dastavej_tarikh': land.dastavej_tarikh.strftime('%Y-%m-%d') if land.dastavej_tarikh else '',
+            'broker_name': land.broker_name or '',
+            'location': land.location or '',
+            'remark': land.remark or '',
+            'selected_tasks': land.selected_tasks or '',
+            'task_assignments': task_assignments
+        }
+        
+        return JsonResponse({
+            'success': True,
+            'land': land_data
+        })
+        
+    except Land.DoesNotExist:
+        return JsonResponse({'success': False, 'message': 'Land not found'})
+    except Exception as e:
+        return JsonResponse({'success': False, 'message': str(e)})
+
+@admin_required
+def sata_prakar(request):
+    """View for Sata Prakar management page"""
+    from ..models import SataPrakar
+    
+    sata_prakar_list = SataPrakar.objects.all()
+    
+    context = {
+        'sata_prakar_list': sata_prakar_list
+    }
+    
+    return render(request, 'Sata_prakar.html', context)
+
+@admin_required(api=True)
+def add_sata_prakar(request):
+    """AJAX view to add a new Sata Prakar"""
+    if request.method == 'POST':
+        try:
+            from ..models import SataPrakar
+            
+            # Debug: Log all POST data
+            print(f"POST data received: {dict(request.POST)}")
+            
+            name = request.POST.get('sata_name')
+            print(f"Extracted name: '{name}'")
+            
+            if not name:
+                return JsonResponse({'success': False, 'message': 'Name is required'})
+            
+            # Check if already exists
+            if SataPrakar.objects.filter(name=name).exists():
+                return JsonResponse({'success': False, 'message': 'Sata Prakar with this name already exists'})
+            
+            sata_prakar = SataPrakar.objects.create(name=name)
+            
+            return JsonResponse({
+                'success': True,
+                'message': 'Sata Prakar added successfully!',
+                'sata_id': sata_prakar.id
+            })
+            
+        except Exception as e:
+            print(f"Error in add_sata_prakar: {str(e)}")
+            return JsonResponse({'success': False, 'message': str(e)})
+    
+    return JsonResponse({'success': False, 'message': 'Invalid request method'})
+
+@admin_required(api=True)
+def get_sata_prakar(request, sata_id):
+    """AJAX view to get Sata Prakar data for editing"""
+    if request.method == 'GET':
+        try:
+            from ..models import SataPrakar
+            
+            sata_prakar = SataPrakar.objects.get(id=sata_id)
+            
+            return JsonResponse({
+                'success': True,
+                'sata': {
+                    'id': sata_prakar.id,
+                    'name': sata_prakar.name
+                }
+            })
+            
+        except SataPrakar.DoesNotExist:
+            return JsonResponse({'success': False, 'message': 'Sata Prakar not found'})
+        except Exception as e:
+            print(f"Error in get_sata_prakar: {str(e)}")
+            return JsonResponse({'success': False, 'message': str(e)})
+    
+    return JsonResponse({'success': False, 'message': 'Invalid request method'})
+
+@admin_required(api=True)
+def update_sata_prakar(request):
+    """AJAX view to update a Sata Prakar"""
+    if request.method == 'POST':
+        try:
+            from ..models import SataPrakar
+            
+            # Debug: Log all POST data
+            print(f"Update POST data received: {dict(request.POST)}")
+            
+            sata_id = request.POST.get('sata_id')
+            name = request.POST.get('sata_name')
+            print(f"Update - sata_id: '{sata_id}', name: '{name}'")
+            
+            if not all([sata_id, name]):
+                return JsonResponse({'success': False, 'message': 'All fields are required'})
+            
+            try:
+                sata_prakar = SataPrakar.objects.get(id=sata_id)
+            except SataPrakar.DoesNotExist:
+                return JsonResponse({'success': False, 'message': 'Sata Prakar not found'})
+            
+            # Check if name already exists for different record
+            if SataPrakar.objects.filter(name=name).exclude(id=sata_id).exists():
+                return JsonResponse({'success': False, 'message': 'Sata Prakar with this name already exists'})
+            
+            sata_prakar.name = name
+            sata_prakar.save()
+            
+            return JsonResponse({
+                'success': True,
+                'message': 'Sata Prakar updated successfully!'
+            })
+            
+        except Exception as e:
+            print(f"Error in update_sata_prakar: {str(e)}")
+            return JsonResponse({'success': False, 'message': str(e)})
+    
+    return JsonResponse({'success': False, 'message': 'Invalid request method'})
+
+@admin_required(api=True)
+def delete_sata_prakar(request, sata_id):
+    """AJAX view to delete a Sata Prakar"""
+    if request.method == 'POST':
+        try:
+            from ..models import SataPrakar
+            
+            sata_prakar = SataPrakar.objects.get(id=sata_id)
+            sata_name = sata_prakar.name
+            sata_prakar.delete()
+            
+            return JsonResponse({
+                'success': True,
+                'message': f'Sata Prakar "{sata_name}" deleted successfully!'
+            })
+            
+        except SataPrakar.DoesNotExist:
+            return JsonResponse({'success': False, 'message': 'Sata Prakar not found'})
+        except Exception as e:
+            print(f"Error in delete_sata_prakar: {str(e)}")
+            return JsonResponse({'success': False, 'message': str(e)})
+    
+    return JsonResponse({'success': False, 'message': 'Invalid request method'})
+
+@login_required
+def get_land_details_for_edit(request, land_id):
+    """
+    Get land details including assigned tasks for the edit modal
+    """
+    if not request.user.is_authenticated or request.user.role != 'admin':
+        return JsonResponse({'success': False, 'message': 'Unauthorized access'})
+    
+    try:
+        from ..models import Land, AssignedTask
+        
+        # Get the land
+        land = get_object_or_404(Land, id=land_id)
+        
+        # Get assigned tasks for this land
+        assigned_tasks = AssignedTask.objects.filter(
+            land=land
+        ).select_related('task', 'employee').order_by('task__name')
+        
+        # Format assigned tasks data
+        assigned_tasks_data = []
+        for assigned_task in assigned_tasks:
+            # Get all available employees for this task from TaskManage
+            from ..models import TaskManage
+            task_manages = TaskManage.objects.filter(task=assigned_task.task).select_related('employee')
+            
+            # Get all available employee names for this task
+            available_employees = []
+            for tm in task_manages:
+                emp_name = tm.employee.full_name or tm.employee.username
+                available_employees.append(emp_name)
+            
+            assigned_tasks_data.append({
+                'task_id': assigned_task.task.id,
+                'task_name': assigned_task.task.name,
+                'employee_name': assigned_task.employee.full_name or assigned_task.employee.username,
+                'available_employees': available_employees,
+                'completion_days': assigned_task.completion_days,
+                'status': assigned_task.status,
+                'assigned_date': assigned_task.assigned_date.strftime('%Y-%m-%d %H:%M') if assigned_task.assigned_date else None,
+                'due_date': assigned_task.due_date.strftime('%Y-%m-%d %H:%M') if assigned_task.due_date else None
+            })
+        
+        # Format land data
+        land_data = {
+            'id': land.id,
+            'name': land.name,
+            'state': land.state,
+            'district': land.district.name,
+            'taluka': land.taluka.name,
+            'village_name': land.village.name,
+            'old_sr_no': land.old_sr_no,
+            'new_sr_no': land.new_sr_no,
+            'sata_prakar': land.sata_prakar,
+            'built_up_area': str(land.built_up_area),
+            'unutilized_area': str(land.unutilized_area),
+            'total_area': str(land.total_area),
+            'past_date': land.past_date.strftime('%Y-%m-%d') if land.past_date else None,
+            'soda_tarikh': land.soda_tarikh.strftime('%Y-%m-%d') if land.soda_tarikh else None,
+            'banakhat_tarikh': land.banakhat_tarikh.strftime('%Y-%m-%d') if land.banakhat_tarikh else None,
+            'dastavej_tarikh': land.dastavej_tarikh.strftime('%Y-%m-%d') if land.dastavej_tarikh else None,
+            'broker_name': land.broker_name,
+            'selected_tasks': land.selected_tasks,
+            'assigned_tasks': assigned_tasks_data
+        }
+        
+        return JsonResponse({
+            'success': True,
+            'land': land_data
+        })
+        
+    except Exception as e:
+        return JsonResponse({
+            'success': False, 
+            'message': f'Error fetching land details: {str(e)}'
+        })
+
+@admin_required
+def advocate_list(request):
+    """View for the advocate list page"""
+    advocates = Advocate.objects.all().order_by('name')
+    context = {
+        'advocates': advocates
+    }
+    return render(request, 'advocate.html', context)
+
+@login_required
+def advocate_api(request):
+    """API endpoint to get all advocates"""
+    if not request.user.is_authenticated or request.user.role != 'admin':
+        return JsonResponse({'error': 'Unauthorized access'}, status=403)
+    
+    try:
+        advocates = Advocate.objects.all().order_by('name')
+        advocates_data = []
+        
+        for advocate in advocates:
+            advocate_data = {
+                'id': advocate.id,
+                'name': advocate.name,
+                'created_at': advocate.created_at.isoformat() if advocate.created_at else None,
+                'updated_at': advocate.updated_at.isoformat() if advocate.updated_at else None
+            }
+            advocates_data.append(advocate_data)
+        
+        return JsonResponse({'advocates': advocates_data})
+        
+    except Exception as e:
+        return JsonResponse({'error': str(e)}, status=500)
+
+@login_required
+def advocate_create_api(request):
+    """API endpoint to create a new advocate"""
+    if not request.user.is_authenticated or request.user.role != 'admin':
+        return JsonResponse({'error': 'Unauthorized access'}, status=403)
+    
+    if request.method != 'POST':
+        return JsonResponse({'error': 'Method not allowed'}, status=405)
+    
+    try:
+        data = json.loads(request.body)
+        name = data.get('name', '').strip()
+        
+        if not name:
+            return JsonResponse({'error': 'Name is required'}, status=400)
+        
+        # Check if advocate with same name already exists
+        if Advocate.objects.filter(name__iexact=name).exists():
+            return JsonResponse({'error': 'An advocate with this name already exists'}, status=400)
+        
+        advocate = Advocate.objects.create(name=name)
+        
+        advocate_data = {
+            'id': advocate.id,
+            'name': advocate.name,
+            'created_at': advocate.created_at.isoformat() if advocate.created_at else None,
+            'updated_at': advocate.updated_at.isoformat() if advocate.updated_at else None
+        }
+        
+        return JsonResponse({
+            'success': True,
+            'message': 'Advocate created successfully',
+            'advocate': advocate_data
+        })
+        
+    except json.JSONDecodeError:
+        return JsonResponse({'error': 'Invalid JSON data'}, status=400)
+    except Exception as e:
+        return JsonResponse({'error': str(e)}, status=500)
+
+@login_required
+def advocate_update_api(request, advocate_id):
+    """API endpoint to update an existing advocate"""
+    if not request.user.is_authenticated or request.user.role != 'admin':
+        return JsonResponse({'error': 'Unauthorized access'}, status=403)
+    
+    if request.method != 'PUT':
+        return JsonResponse({'error': 'Method not allowed'}, status=405)
+    
+    try:
+        advocate = get_object_or_404(Advocate, id=advocate_id)
+        data = json.loads(request.body)
+        name = data.get('name', '').strip()
+        
+        if not name:
+            return JsonResponse({'error': 'Name is required'}, status=400)
+        
+        # Check if another advocate with same name already exists
+        if Advocate.objects.filter(name__iexact=name).exclude(id=advocate_id).exists():
+            return JsonResponse({'error': 'Another advocate with this name already exists'}, status=400)
+        
+        advocate.name = name
+        advocate.save()
+        
+        advocate_data = {
+            'id': advocate.id,
+            'name': advocate.name,
+            'created_at': advocate.created_at.isoformat() if advocate.created_at else None,
+            'updated_at': advocate.updated_at.isoformat() if advocate.updated_at else None
+        }
+        
+        return JsonResponse({
+            'success': True,
+            'message': 'Advocate updated successfully',
+            'advocate': advocate_data
+        })
+        
+    except json.JSONDecodeError:
+        return JsonResponse({'error': 'Invalid JSON data'}, status=400)
+    except Exception as e:
+        return JsonResponse({'error': str(e)}, status=500)
+
+@login_required
+def advocate_delete_api(request, advocate_id):
+    """API endpoint to delete an advocate (hard delete)"""
+    if not request.user.is_authenticated or request.user.role != 'admin':
+        return JsonResponse({'error': 'Unauthorized access'}, status=403)
+    
+    if request.method != 'DELETE':
+        return JsonResponse({'error': 'Method not allowed'}, status=405)
+    
+    try:
+        advocate = get_object_or_404(Advocate, id=advocate_id)
+        advocate.delete()
+        
+        return JsonResponse({
+            'success': True,
+            'message': 'Advocate deleted successfully'
+        })
+        
+    except Exception as e:
+        return JsonResponse({'error': str(e)}, status=500)
+
+@login_required
+def send_land_to_inventory(request, land_id):
+    if request.method == 'POST':
+        try:
+            # Check if user is admin
+            if not request.user.is_authenticated or request.user.role != 'admin':
+                return JsonResponse({'success': False, 'error': 'Unauthorized access'}, status=403)
+            
+            # Get the land object
+            try:
+                land = Land.objects.get(id=land_id)
+            except Land.DoesNotExist:
+                return JsonResponse({'success': False, 'error': 'Land not found'}, status=404)
+            
+            # Check if land is already in inventory
+            if land.status == 'inventory':
+                return JsonResponse({'success': False, 'error': 'Land is already in inventory'}, status=400)
+            
+            # Update land status to inventory
+            land.status = 'inventory'
+            land.save()
+            
+            # Create notification for all admins
+            notify_admins(f"Land {land.id} - {land.name} has been moved to inventory by {request.user.username}")
+            
+            return JsonResponse({
+                'success': True,
+                'message': f'Land {land.id} - {land.name} has been successfully moved to inventory',
+                'land_id': land.id,
+                'land_name': land.name,
+                'new_status': land.status
+            })
+            
+        except Exception as e:
+            return JsonResponse({'success': False, 'error': str(e)}, status=500)
+    
+    return JsonResponse({'success': False, 'error': 'Method not allowed'}, status=405)
+
+@login_required
+def get_land_status_api(request, land_id):
+    """API endpoint to get land status directly from database"""
+    if request.method != 'GET':
+        return JsonResponse({'success': False, 'message': 'Invalid request method'})
+    
+    if request.user.role != 'admin':
+        return JsonResponse({'success': False, 'message': 'Permission denied'})
+    
+    try:
+        land = Land.objects.get(id=land_id)
+        return JsonResponse({
+            'success': True,
+            'land_id': land.id,
+            'land_name': land.name,
+            'status': land.status,
+            'status_display': land.get_status_display() if hasattr(land, 'get_status_display') else land.status
+        })
+    except Land.DoesNotExist:
+        return JsonResponse({'success': False, 'message': 'Land not found'})
+    except Exception as e:
+        return JsonResponse({'success': False, 'message': f'Error: {str(e)}'})
+
+@login_required
+def restore_land_from_inventory(request, land_id):
+    if request.method == 'POST':
+        try:
+            # Check if user is admin
+            if not request.user.is_authenticated or request.user.role != 'admin':
+                return JsonResponse({'success': False, 'error': 'Unauthorized access'}, status=403)
+            
+            # Get the land object
+            try:
+                land = Land.objects.get(id=land_id)
+            except Land.DoesNotExist:
+                return JsonResponse({'success': False, 'error': 'Land not found'}, status=404)
+            
+            # Check if land is in inventory
+            if land.status != 'inventory':
+                return JsonResponse({'success': False, 'error': 'Land is not in inventory'}, status=400)
+            
+            # Update land status to active
+            land.status = 'active'
+            land.save()
+            
+            # Create notification for all admins
+            notify_admins(f"Land {land.id} - {land.name} has been restored from inventory by {request.user.username}")
+            
+            return JsonResponse({
+                'success': True,
+                'message': f'Land {land.id} - {land.name} has been successfully restored from inventory',
+                'land_id': land.id,
+                'land_name': land.name,
+                'new_status': land.status
+            })
+            
+        except Exception as e:
+            return JsonResponse({'success': False, 'error': str(e)}, status=500)
+    
+    return JsonResponse({'success': False, 'error': 'Method not allowed'}, status=405)
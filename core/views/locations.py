@@ -0,0 +1,254 @@
+from django.contrib.auth.decorators import login_required
+from django.http import JsonResponse, HttpResponse
+from django.shortcuts import render
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date, quote_etag
+from django.views.decorators.http import require_GET
+
+from ..models import District, Taluka, Village
+from ..locations import location_version, get_location_bundle, search_villages, VILLAGE_SEARCH_LIMIT
+from ..conditional import conditional_resource
+from ..caching import get_cached
+from ..permissions import admin_required
+
+
+# Client cache lifetime for the location hierarchy bundle
+LOCATION_BUNDLE_MAX_AGE = 60 * 60 * 24
+
+@login_required
+@conditional_resource('locations')
+def location_api(request):
+    """API endpoint to get all districts for Gujarat"""
+    if request.method == 'GET':
+        try:
+            districts = District.objects.filter(state='Gujarat').order_by('name')
+            district_data = [{'id': district.id, 'name': district.name} for district in districts]
+            return JsonResponse({'success': True, 'districts': district_data})
+        except Exception as e:
+            return JsonResponse({'success': False, 'error': str(e)})
+    return JsonResponse({'success': False, 'error': 'Method not allowed'})
+
+@login_required
+@conditional_resource('locations')
+def taluka_api(request, district_id):
+    """API endpoint to get talukas for a specific district"""
+    if request.method == 'GET':
+        try:
+            talukas = Taluka.objects.filter(district_id=district_id).order_by('name')
+            taluka_data = [{'id': taluka.id, 'name': taluka.name} for taluka in talukas]
+            return JsonResponse({'success': True, 'talukas': taluka_data})
+        except Exception as e:
+            return JsonResponse({'success': False, 'error': str(e)})
+    return JsonResponse({'success': False, 'error': 'Method not allowed'})
+
+@login_required
+@conditional_resource('locations')
+def village_api(request, taluka_id):
+    """API endpoint to get villages for a specific taluka"""
+    if request.method == 'GET':
+        try:
+            villages = Village.objects.filter(taluka_id=taluka_id).order_by('name')
+            village_data = [{'id': village.id, 'name': village.name} for village in villages]
+            return JsonResponse({'success': True, 'villages': village_data})
+        except Exception as e:
+            return JsonResponse({'success': False, 'error': str(e)})
+    return JsonResponse({'success': False, 'error': 'Method not allowed'})
+
+@login_required
+@require_GET
+def village_search_api(request):
+    """
+    Typeahead API: villages whose name starts with ?q=, optionally within
+    ?taluka_id= or ?district_id=, capped at ?limit= results.
+    """
+    query = request.GET.get('q', '').strip()
+    if not query:
+        return JsonResponse({'success': True, 'villages': []})
+    
+    try:
+        taluka_id = int(request.GET['taluka_id']) if request.GET.get('taluka_id') else None
+        district_id = int(request.GET['district_id']) if request.GET.get('district_id') else None
+        limit = int(request.GET.get('limit') or VILLAGE_SEARCH_LIMIT)
+    except ValueError:
+        return JsonResponse({'success': False, 'error': 'Invalid taluka, district or limit'}, status=400)
+    
+    villages = search_villages(query, taluka_id=taluka_id, district_id=district_id, limit=limit)
+    return JsonResponse({'success': True, 'villages': villages})
+
+@login_required
+@require_GET
+def location_bundle_api(request):
+    """
+    API endpoint returning the whole District -> Taluka -> Village hierarchy.
+    Clients revalidate with If-None-Match / If-Modified-Since and get a 304 until a location changes.
+    """
+    version, last_modified = location_version()
+    etag = quote_etag(version)
+    last_modified_ts = int(last_modified.timestamp()) if last_modified else None
+    
+    response = get_conditional_response(request, etag=etag, last_modified=last_modified_ts)
+    if response is None:
+        response = HttpResponse(get_location_bundle(version), content_type='application/json')
+    
+    response['ETag'] = etag
+    if last_modified_ts:
+        response['Last-Modified'] = http_date(last_modified_ts)
+    # Browsers may keep the bundle for a day, then revalidate it with the ETag
+    patch_cache_control(response, private=True, max_age=LOCATION_BUNDLE_MAX_AGE, must_revalidate=True)
+    return response
+
+@login_required
+def add_village_api(request):
+    """API endpoint to add a new village"""
+    if request.method == 'POST':
+        try:
+            taluka_id = request.POST.get('taluka')
+            village_name = request.POST.get('village_name')
+            
+            if not taluka_id or not village_name:
+                return JsonResponse({'success': False, 'error': 'Taluka and village name are required'})
+            
+            taluka = Taluka.objects.get(id=taluka_id)
+            
+            # Check if village already exists in this taluka
+            if Village.objects.filter(name=village_name, taluka=taluka).exists():
+                return JsonResponse({
+                    'success': False, 
+                    'error': f'Village "{village_name}" already exists in taluka "{taluka.name}". Please use a different name or select a different taluka.'
+                })
+            
+            village = Village.objects.create(name=village_name, taluka=taluka)
+            
+            return JsonResponse({
+                'success': True, 
+                'village': {'id': village.id, 'name': village.name},
+                'message': 'Village added successfully'
+            })
+        except Taluka.DoesNotExist:
+            return JsonResponse({'success': False, 'error': 'Taluka not found'})
+        except Exception as e:
+            return JsonResponse({'success': False, 'error': str(e)})
+    return JsonResponse({'success': False, 'error': 'Method not allowed'})
+
+@login_required
+@conditional_resource('locations')
+def village_list_api(request):
+    """API endpoint to get all villages with taluka and district information"""
+    if request.method == 'GET':
+        try:
+            villages = Village.objects.select_related('taluka__district').all().order_by('taluka__district__name', 'taluka__name', 'name')
+            village_data = []
+            
+            for village in villages:
+                village_data.append({
+                    'id': village.id,
+                    'name': village.name,
+                    'taluka_name': village.taluka.name,
+                    'district_name': village.taluka.district.name,
+                    'created_at': village.created_at.isoformat() if village.created_at else None
+                })
+            
+            return JsonResponse({'success': True, 'villages': village_data})
+        except Exception as e:
+            return JsonResponse({'success': False, 'error': str(e)})
+    return JsonResponse({'success': False, 'error': 'Method not allowed'})
+
+@admin_required
+def village_management_view(request):
+    """View for the village management page"""
+    return render(request, 'village_management.html')
+
+@login_required
+def add_district_api(request):
+    """API endpoint to add a new district"""
+    if request.method == 'POST':
+        try:
+            district_name = request.POST.get('district_name')
+            state = request.POST.get('state', 'Gujarat')
+            
+            if not district_name:
+                return JsonResponse({'success': False, 'error': 'District name is required'})
+            
+            # Check if district already exists
+            if District.objects.filter(name=district_name).exists():
+                return JsonResponse({'success': False, 'error': 'District already exists'})
+            
+            district = District.objects.create(name=district_name, state=state)
+            
+            return JsonResponse({
+                'success': True, 
+                'district': {'id': district.id, 'name': district.name, 'state': district.state},
+                'message': 'District added successfully'
+            })
+        except Exception as e:
+            return JsonResponse({'success': False, 'error': str(e)})
+    return JsonResponse({'success': False, 'error': 'Method not allowed'})
+
+@login_required
+def add_taluka_api(request):
+    """API endpoint to add a new taluka"""
+    if request.method == 'POST':
+        try:
+            taluka_name = request.POST.get('taluka_name')
+            district_id = request.POST.get('district_id')
+            
+            if not taluka_name or not district_id:
+                return JsonResponse({'success': False, 'error': 'Taluka name and district are required'})
+            
+            try:
+                district = District.objects.get(id=district_id)
+            except District.DoesNotExist:
+                return JsonResponse({'success': False, 'error': 'District not found'})
+            
+            # Check if taluka already exists in this district
+            if Taluka.objects.filter(name=taluka_name, district=district).exists():
+                return JsonResponse({'success': False, 'error': 'Taluka already exists in this district'})
+            
+            taluka = Taluka.objects.create(name=taluka_name, district=district)
+            
+            return JsonResponse({
+                'success': True, 
+                'taluka': {'id': taluka.id, 'name': taluka.name, 'district': district.name},
+                'message': 'Taluka added successfully'
+            })
+        except Exception as e:
+            return JsonResponse({'success': False, 'error': str(e)})
+    return JsonResponse({'success': False, 'error': 'Method not allowed'})
+
+@login_required
+@conditional_resource('locations')
+def district_list_api(request):
+    """API endpoint to get all districts"""
+    if request.method == 'GET':
+        try:
+            district_data = get_cached('locations', 'districts', lambda: [
+                {'id': district.id, 'name': district.name, 'state': district.state}
+                for district in District.objects.all().order_by('name')
+            ])
+            return JsonResponse({'success': True, 'districts': district_data})
+        except Exception as e:
+            return JsonResponse({'success': False, 'error': str(e)})
+    return JsonResponse({'success': False, 'error': 'Method not allowed'})
+
+@login_required
+@conditional_resource('locations')
+def taluka_list_api(request):
+    """API endpoint to get all talukas with district information"""
+    if request.method == 'GET':
+        try:
+            talukas = Taluka.objects.select_related('district').all().order_by('district__name', 'name')
+            taluka_data = []
+            
+            for taluka in talukas:
+                taluka_data.append({
+                    'id': taluka.id,
+                    'name': taluka.name,
+                    'district_name': taluka.district.name,
+                    'district_id': taluka.district.id,
+                    'state': taluka.district.state
+                })
+            
+            return JsonResponse({'success': True, 'talukas': taluka_data})
+        except Exception as e:
+            return JsonResponse({'success': False, 'error': str(e)})
+    return JsonResponse({'success': False, 'error': 'Method not allowed'})
@@ -0,0 +1,393 @@
+import io
+import os
+import zipfile
+
+from django.contrib.auth.decorators import login_required
+from django.http import HttpResponse, JsonResponse
+from django.shortcuts import get_object_or_404, render
+from django.views.decorators.http import require_GET
+
+from .. import reporting
+from ..models import Land, AssignedTask
+from ..permissions import admin_required, is_marketing_or_admin
+
+
+@login_required
+def download_single_task(request, land_id, task_id):
+    """Download single task details as PDF"""
+    # Imported here so loading the URLconf does not pull in the PDF stack
+    from PIL import Image as PILImage
+    from reportlab.lib import colors
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.lib.units import inch
+    from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, Image
+    
+    # Check user permissions
+    if not request.user.is_authenticated or not is_marketing_or_admin(request.user):
+        return HttpResponse('Unauthorized', status=403)
+    
+    try:
+        # Get the land and task
+        land = get_object_or_404(Land, id=land_id)
+        assigned_task = get_object_or_404(AssignedTask, id=task_id, land=land)
+        
+        # Create PDF buffer
+        buffer = io.BytesIO()
+        doc = SimpleDocTemplate(buffer, pagesize=A4)
+        styles = getSampleStyleSheet()
+        story = []
+        
+        # Title
+        title_style = ParagraphStyle(
+            'CustomTitle',
+            parent=styles['Heading1'],
+            fontSize=18,
+            spaceAfter=30,
+            alignment=1  # Center alignment
+        )
+        story.append(Paragraph(f"Task Details Report", title_style))
+        story.append(Spacer(1, 20))
+        
+        # Land Information
+        land_data = [
+            ['Land Information', ''],
+            ['Land Name:', land.name],
+            ['Village:', land.village.name if land.village else 'N/A'],
+            ['Taluka:', land.taluka.name if land.taluka else 'N/A'],
+            ['District:', land.district.name if land.district else 'N/A'],
+            ['Total Area:', f"{land.total_area} sq ft" if land.total_area else 'N/A'],
+        ]
+        
+        land_table = Table(land_data, colWidths=[2*inch, 4*inch])
+        land_table.setStyle(TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, 0), 12),
+            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+            ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
+            ('GRID', (0, 0), (-1, -1), 1, colors.black)
+        ]))
+        story.append(land_table)
+        story.append(Spacer(1, 20))
+        
+        # Task Information
+        task_data = [
+            ['Task Information', ''],
+            ['Task Name:', assigned_task.task.name],
+            ['Task Type:', 'Marketing Task' if assigned_task.task.marketing_task else 'General Task'],
+            ['Assigned Employee:', assigned_task.employee.get_display_name()],
+            ['Status:', assigned_task.get_status_display()],
+            ['Assigned Date:', assigned_task.assigned_date.strftime('%B %d, %Y') if assigned_task.assigned_date else 'N/A'],
+            ['Due Date:', assigned_task.due_date.strftime('%B %d, %Y') if assigned_task.due_date else 'N/A'],
+            ['Completion Days:', str(assigned_task.completion_days) if assigned_task.completion_days else 'N/A'],
+        ]
+        
+        if assigned_task.completion_submitted_date:
+            task_data.append(['Submitted Date:', assigned_task.completion_submitted_date.strftime('%B %d, %Y')])
+        
+        if assigned_task.completion_notes:
+            task_data.append(['Employee Notes:', assigned_task.completion_notes])
+        
+        if assigned_task.admin_approval_notes:
+            task_data.append(['Admin Notes:', assigned_task.admin_approval_notes])
+        
+        if assigned_task.admin_approval_date:
+            task_data.append(['Admin Approval Date:', assigned_task.admin_approval_date.strftime('%B %d, %Y')])
+        
+        task_table = Table(task_data, colWidths=[2*inch, 4*inch])
+        task_table.setStyle(TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), colors.blue),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, 0), 12),
+            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+            ('BACKGROUND', (0, 1), (-1, -1), colors.lightblue),
+            ('GRID', (0, 0), (-1, -1), 1, colors.black),
+            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+        ]))
+        story.append(task_table)
+        story.append(Spacer(1, 20))
+        
+        # Add uploaded photo if exists
+        if assigned_task.completion_photos:
+            try:
+                photo_title = ParagraphStyle(
+                    'PhotoTitle',
+                    parent=styles['Heading2'],
+                    fontSize=14,
+                    spaceAfter=10
+                )
+                story.append(Paragraph("Task Completion Photo", photo_title))
+                
+                # Get the photo path
+                photo_path = assigned_task.completion_photos.path
+                if os.path.exists(photo_path):
+                    # Open and resize image if needed
+                    with PILImage.open(photo_path) as img:
+                        # Calculate dimensions to fit in PDF (max 4 inches wide)
+                        max_width = 4 * inch
+                        max_height = 3 * inch
+                        
+                        img_width, img_height = img.size
+                        aspect_ratio = img_width / img_height
+                        
+                        if img_width > max_width:
+                            new_width = max_width
+                            new_height = max_width / aspect_ratio
+                        else:
+                            new_width = img_width * 72 / 96  # Convert pixels to points
+                            new_height = img_height * 72 / 96
+                        
+                        if new_height > max_height:
+                            new_height = max_height
+                            new_width = max_height * aspect_ratio
+                        
+                        # Add image to PDF
+                        img_obj = Image(photo_path, width=new_width, height=new_height)
+                        story.append(img_obj)
+                        story.append(Spacer(1, 10))
+                        
+            except Exception as e:
+                story.append(Paragraph(f"Photo could not be loaded: {str(e)}", styles['Normal']))
+                story.append(Spacer(1, 10))
+        
+        
+        # Build PDF
+        doc.build(story)
+        buffer.seek(0)
+        
+        # Create response
+        response = HttpResponse(buffer.getvalue(), content_type='application/pdf')
+        response['Content-Disposition'] = f'attachment; filename="Task_{assigned_task.task.name}_{land.name}.pdf"'
+        return response
+        
+    except Exception as e:
+        print(f"Error generating task PDF: {str(e)}")
+        return HttpResponse('Error generating PDF', status=500)
+
+@login_required
+def download_bulk_tasks(request, land_id):
+    """Download multiple tasks as a ZIP file containing PDFs"""
+    # Imported here so loading the URLconf does not pull in the PDF stack
+    from PIL import Image as PILImage
+    from reportlab.lib import colors
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.lib.units import inch
+    from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, Image
+    
+    # Check user permissions
+    if not request.user.is_authenticated or not is_marketing_or_admin(request.user):
+        return HttpResponse('Unauthorized', status=403)
+    
+    try:
+        # Get task IDs from query parameters
+        task_ids_str = request.GET.get('task_ids', '')
+        if not task_ids_str:
+            return HttpResponse('No tasks selected', status=400)
+        
+        task_ids = [int(id.strip()) for id in task_ids_str.split(',') if id.strip().isdigit()]
+        if not task_ids:
+            return HttpResponse('Invalid task IDs', status=400)
+        
+        # Get the land and tasks
+        land = get_object_or_404(Land, id=land_id)
+        assigned_tasks = AssignedTask.objects.filter(id__in=task_ids, land=land).select_related('task', 'employee')
+        
+        if not assigned_tasks.exists():
+            return HttpResponse('No valid tasks found', status=404)
+        
+        # Create ZIP buffer
+        zip_buffer = io.BytesIO()
+        
+        with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
+            for assigned_task in assigned_tasks:
+                # Create PDF for each task
+                pdf_buffer = io.BytesIO()
+                doc = SimpleDocTemplate(pdf_buffer, pagesize=A4)
+                styles = getSampleStyleSheet()
+                story = []
+                
+                # Title
+                title_style = ParagraphStyle(
+                    'CustomTitle',
+                    parent=styles['Heading1'],
+                    fontSize=18,
+                    spaceAfter=30,
+                    alignment=1
+                )
+                story.append(Paragraph(f"Task: {assigned_task.task.name}", title_style))
+                story.append(Spacer(1, 20))
+                
+                # Task details table
+                task_data = [
+                    ['Task Information', ''],
+                    ['Task Name:', assigned_task.task.name],
+                    ['Task Type:', 'Marketing Task' if assigned_task.task.marketing_task else 'General Task'],
+                    ['Assigned Employee:', assigned_task.employee.get_display_name()],
+                    ['Status:', assigned_task.get_status_display()],
+                    ['Assigned Date:', assigned_task.assigned_date.strftime('%B %d, %Y') if assigned_task.assigned_date else 'N/A'],
+                    ['Due Date:', assigned_task.due_date.strftime('%B %d, %Y') if assigned_task.due_date else 'N/A'],
+                    ['Land:', land.name],
+                    ['Village:', land.village.name if land.village else 'N/A'],
+                ]
+                
+                if assigned_task.completion_submitted_date:
+                    task_data.append(['Submitted Date:', assigned_task.completion_submitted_date.strftime('%B %d, %Y')])
+                
+                if assigned_task.completion_notes:
+                    task_data.append(['Employee Notes:', assigned_task.completion_notes])
+                
+                if assigned_task.admin_approval_notes:
+                    task_data.append(['Admin Notes:', assigned_task.admin_approval_notes])
+                
+                if assigned_task.admin_approval_date:
+                    task_data.append(['Admin Approval Date:', assigned_task.admin_approval_date.strftime('%B %d, %Y')])
+                
+                task_table = Table(task_data, colWidths=[2*inch, 4*inch])
+                task_table.setStyle(TableStyle([
+                    ('BACKGROUND', (0, 0), (-1, 0), colors.blue),
+                    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+                    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+                    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+                    ('FONTSIZE', (0, 0), (-1, 0), 12),
+                    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+                    ('BACKGROUND', (0, 1), (-1, -1), colors.lightblue),
+                    ('GRID', (0, 0), (-1, -1), 1, colors.black),
+                    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+                ]))
+                story.append(task_table)
+                story.append(Spacer(1, 20))
+                
+                # Add uploaded photo if exists
+                if assigned_task.completion_photos:
+                    try:
+                        photo_title = ParagraphStyle(
+                            'PhotoTitle',
+                            parent=styles['Heading2'],
+                            fontSize=14,
+                            spaceAfter=10
+                        )
+                        story.append(Paragraph("Task Completion Photo", photo_title))
+                        
+                        # Get the photo path
+                        photo_path = assigned_task.completion_photos.path
+                        if os.path.exists(photo_path):
+                            # Open and resize image if needed
+                            with PILImage.open(photo_path) as img:
+                                # Calculate dimensions to fit in PDF (max 4 inches wide)
+                                max_width = 4 * inch
+                                max_height = 3 * inch
+                                
+                                img_width, img_height = img.size
+                                aspect_ratio = img_width / img_height
+                                
+                                if img_width > max_width:
+                                    new_width = max_width
+                                    new_height = max_width / aspect_ratio
+                                else:
+                                    new_width = img_width * 72 / 96  # Convert pixels to points
+                                    new_height = img_height * 72 / 96
+                                
+                                if new_height > max_height:
+                                    new_height = max_height
+                                    new_width = max_height * aspect_ratio
+                                
+                                # Add image to PDF
+                                img_obj = Image(photo_path, width=new_width, height=new_height)
+                                story.append(img_obj)
+                                story.append(Spacer(1, 10))
+                                
+                    except Exception as e:
+                        story.append(Paragraph(f"Photo could not be loaded: {str(e)}", styles['Normal']))
+                        story.append(Spacer(1, 10))
+                
+                
+                # Build PDF
+                doc.build(story)
+                pdf_buffer.seek(0)
+                
+                # Add PDF to ZIP
+                filename = f"Task_{assigned_task.id}_{assigned_task.task.name.replace(' ', '_')}.pdf"
+                zip_file.writestr(filename, pdf_buffer.getvalue())
+        
+        zip_buffer.seek(0)
+        
+        # Create response
+        response = HttpResponse(zip_buffer.getvalue(), content_type='application/zip')
+        response['Content-Disposition'] = f'attachment; filename="Land_{land.name}_Tasks_Bulk.zip"'
+        return response
+        
+    except Exception as e:
+        print(f"Error generating bulk task ZIP: {str(e)}")
+        return HttpResponse('Error generating ZIP file', status=500)
+
+
+# --- Task throughput and SLA reports (read from the TaskDailyStat aggregates only) ---
+
+REPORT_FILTERS = ['employee', 'task', 'district']
+
+# Dashboard tables: (group, title, icon)
+TASK_REPORT_BREAKDOWNS = [
+    ('employee', 'By Employee', 'bi-person'),
+    ('task', 'By Task', 'bi-list-task'),
+    ('district', 'By District', 'bi-geo-alt'),
+    ('day', 'By Day', 'bi-calendar3'),
+]
+
+
+def _report_filters(request):
+    """?employee=, ?task= and ?district= ids as TaskDailyStat filters. Raises ValueError."""
+    return {f'{name}_id': int(request.GET[name]) for name in REPORT_FILTERS if request.GET.get(name)}
+
+
+@admin_required(api=True)
+@require_GET
+def task_reports_api(request):
+    """
+    Task throughput and SLA metrics for ?start=..?end= (YYYY-MM-DD, default
+    the last 30 days): totals, plus rows per ?group= (employee, task,
+    district or day) when given. Optional ?employee=, ?task=, ?district= ids.
+    """
+    group = request.GET.get('group') or None
+    if group is not None and group not in reporting.REPORT_GROUPS:
+        return JsonResponse({'error': 'Invalid group'}, status=400)
+    try:
+        start, end = reporting.report_range(request.GET.get('start'), request.GET.get('end'))
+        filters = _report_filters(request)
+    except ValueError:
+        return JsonResponse({'error': 'Invalid date range or filter'}, status=400)
+
+    data = {
+        'start': start,
+        'end': end,
+        'totals': reporting.task_report(start, end, **filters),
+    }
+    if group:
+        data['group'] = group
+        data['rows'] = reporting.task_report(start, end, group, **filters)
+    return JsonResponse(data)
+
+
+@admin_required
+def task_reports(request):
+    """Task throughput and SLA dashboard over a date range"""
+    try:
+        start, end = reporting.report_range(request.GET.get('start'), request.GET.get('end'))
+    except ValueError:
+        start, end = reporting.report_range()
+
+    context = {
+        'start': start,
+        'end': end,
+        'totals': reporting.task_report(start, end),
+        'breakdowns': [
+            {'title': title, 'icon': icon, 'rows': reporting.task_report(start, end, group)}
+            for group, title, icon in TASK_REPORT_BREAKDOWNS
+        ],
+    }
+    return render(request, 'task_reports.html', context)
@@ -0,0 +1,681 @@
+from django.contrib.auth.decorators import login_required
+from django.db.models import Count, Prefetch, Q, Sum
+from django.http import JsonResponse
+from django.shortcuts import render
+
+from ..models import User, Land
+from ..caching import fragment_versions
+from ..notifications import notify_admins
+from ..permissions import marketing_or_admin_required, is_marketing_or_admin
+
+
+def _with_latest_sale(lands):
+    """Lands with their locations joined and their sales, newest first, prefetched as sales_newest_first"""
+    from ..models import LandSale
+    return lands.select_related('village', 'taluka', 'district').prefetch_related(Prefetch(
+        'sales',
+        queryset=LandSale.objects.select_related('marketing_employee').order_by('-created_at'),
+        to_attr='sales_newest_first',
+    ))
+
+@marketing_or_admin_required
+def inventory_land(request):
+    # Get only lands with 'inventory' status (lands ready for sale); the
+    # cards are only queried when their cached fragment is missing
+    inventory_lands = _with_latest_sale(Land.objects.filter(status='inventory').order_by('-id'))
+    
+    # Get all sata prakar for filtering
+    from ..models import SataPrakar, Client, Task
+    sata_prakar_list = SataPrakar.objects.all().order_by('name')
+    
+    # Get all marketing tasks for the task assignment dropdown in sell land modal
+    all_tasks = Task.objects.filter(marketing_task=True).order_by('position', 'name')
+    
+    # Get marketing employees for the sell land modal
+    if request.user.role == 'admin':
+        marketing_employees = User.objects.filter(role='employee', employee_type='marketing', status='active').order_by('full_name', 'username')
+    else:
+        # Marketing employees see only themselves
+        marketing_employees = User.objects.filter(id=request.user.id, role='employee', employee_type='marketing', status='active')
+    
+    # Calculate statistics
+    stats = inventory_lands.aggregate(
+        total=Count('id'),
+        area=Sum('total_area'),
+        sold=Count('id', filter=Q(status='sold')),
+        in_process=Count('id', filter=Q(status='in_process')),
+        inventory=Count('id', filter=Q(status='inventory')),
+    )
+    
+    # Get status distribution
+    land_statuses = Land.objects.aggregate(
+        active=Count('id', filter=Q(status='active')),
+        sold=Count('id', filter=Q(status='sold')),
+        archived=Count('id', filter=Q(status='archived')),
+    )
+    status_distribution = {
+        'inventory': stats['inventory'],
+        'sold_in_inventory': stats['sold'],
+        **land_statuses,
+    }
+    
+    context = {
+        'inventory_lands': inventory_lands,
+        'sata_prakar_list': sata_prakar_list,
+        'marketing_employees': marketing_employees,
+        'all_tasks': all_tasks,
+        'total_inventory_lands': stats['total'],
+        'total_area_inventory': stats['area'] or 0,
+        'sold_in_inventory': stats['sold'],
+        'in_process_in_inventory': stats['in_process'],
+        'inventory_only': stats['inventory'],
+        'status_distribution': status_distribution,
+        **fragment_versions('land_tables', 'locations'),
+    }
+    
+    return render(request, 'inventory.html', context)
+
+@marketing_or_admin_required
+def sold_land(request):
+    # Filter lands based on user role and marketing employee who sold them
+    if request.user.role == 'admin':
+        # Admin can see all sold and in_process lands
+        sold_lands = Land.objects.filter(status__in=['sold', 'in_process']).order_by('-id')
+        table_scope = 'all'
+    elif request.user.role == 'employee' and request.user.employee_type == 'marketing':
+        # Marketing employees can only see lands they sold
+        from ..models import LandSale
+        # Get lands that have sales records with current user as marketing_employee
+        sold_land_ids = LandSale.objects.filter(
+            marketing_employee=request.user
+        ).values_list('land_id', flat=True)
+        
+        sold_lands = Land.objects.filter(
+            id__in=sold_land_ids,
+            status__in=['sold', 'in_process']
+        ).order_by('-id')
+        table_scope = request.user.id
+    else:
+        # Fallback - no lands for other user types
+        sold_lands = Land.objects.none()
+        table_scope = 'none'
+    
+    # Sale information is prefetched with the lands when the table is rendered
+    sold_lands = _with_latest_sale(sold_lands)
+    
+    # Get marketing employees for sell modal - restrict to current user if user is marketing employee  
+    if request.user.role == 'employee' and request.user.employee_type == 'marketing':
+        # Marketing employees can only see themselves in the dropdown
+        marketing_employees = User.objects.filter(id=request.user.id, role='employee', employee_type='marketing', status='active')
+    else:
+        # Admin users can see all marketing employees
+        marketing_employees = User.objects.filter(role='employee', employee_type='marketing', status='active').order_by('full_name', 'username')
+    
+    # Get all tasks for task assignment functionality
+    from ..models import Task
+    all_tasks = Task.objects.all().order_by('position', 'name')
+    
+    # Calculate statistics for sold lands
+    stats = sold_lands.aggregate(
+        total=Count('id'),
+        in_process=Count('id', filter=Q(status='in_process')),
+        sold=Count('id', filter=Q(status='sold')),
+    )
+    
+    # Calculate total revenue (placeholder - you can add actual revenue calculation)
+    total_revenue = 0  # This can be calculated from actual sale amounts if available
+    
+    context = {
+        'sold_lands': sold_lands,
+        'marketing_employees': marketing_employees,
+        'all_tasks': all_tasks,
+        'total_sold_lands': stats['total'],
+        'in_process_lands_count': stats['in_process'],
+        'sold_lands_count': stats['sold'],
+        'total_revenue': total_revenue,
+        'table_scope': table_scope,
+        # Cards show the marketing employee's name
+        **fragment_versions('land_tables', 'locations', 'employees'),
+    }
+    
+    return render(request, 'sold_land.html', context)
+
+@login_required
+def mark_land_as_sold(request, land_id):
+    if request.method == 'POST':
+        try:
+            # Check if user is admin
+            if not request.user.is_authenticated or request.user.role != 'admin':
+                return JsonResponse({'success': False, 'error': 'Unauthorized access'}, status=403)
+            
+            # Get the land object
+            try:
+                land = Land.objects.get(id=land_id)
+            except Land.DoesNotExist:
+                return JsonResponse({'success': False, 'error': 'Land not found'}, status=404)
+            
+            # Check if land is already sold
+            if land.status == 'sold':
+                return JsonResponse({'success': False, 'error': 'Land is already marked as sold'}, status=400)
+            
+            # Update land status to sold
+            land.status = 'sold'
+            land.save()
+            
+            # Create notification for all admins
+            notify_admins(f"Land {land.id} - {land.name} has been marked as sold by {request.user.username}")
+            
+            return JsonResponse({
+                'success': True,
+                'message': f'Land {land.id} - {land.name} has been successfully marked as sold',
+                'land_id': land.id,
+                'land_name': land.name,
+                'new_status': land.status
+            })
+            
+        except Exception as e:
+            return JsonResponse({'success': False, 'error': str(e)}, status=500)
+    
+    return JsonResponse({'success': False, 'error': 'Method not allowed'}, status=405)
+
+@login_required
+def get_land_details(request, land_id):
+    """Get comprehensive land details for modal display"""
+    try:
+        land = Land.objects.select_related('district', 'taluka', 'village').get(id=land_id)
+        
+        # Allow admin and marketing employees to access land details
+        if not request.user.is_authenticated or not is_marketing_or_admin(request.user):
+            return JsonResponse({'success': False, 'message': 'Permission denied'})
+        
+        # Format dates
+        def format_date(date):
+            if date:
+                return date.strftime('%d/%m/%Y')
+            return 'Not specified'
+        
+        # Get tasks list
+        tasks_list = land.get_tasks_list()
+        
+        # Prepare comprehensive land data
+        land_data = {
+            'success': True,
+            'land': {
+                'id': land.id,
+                'name': land.name,
+                'status': land.get_status_display(),
+                'status_value': land.status,
+                
+                # Location Details
+                'state': land.state,
+                'district': land.district.name if land.district else 'Not specified',
+                'taluka': land.taluka.name if land.taluka else 'Not specified',
+                'village': land.village.name if land.village else 'Not specified',
+                'full_location': f"{land.village.name if land.village else 'N/A'}, {land.taluka.name if land.taluka else 'N/A'}, {land.district.name if land.district else 'N/A'}, {land.state}",
+                
+                # Identification Numbers
+                'old_sr_no': land.old_sr_no or 'Not specified',
+                'new_sr_no': land.new_sr_no or 'Not specified',
+                
+                # Area Information
+                'sata_prakar': land.sata_prakar,
+                'built_up_area': float(land.built_up_area) if land.built_up_area else 0,
+                'unutilized_area': float(land.unutilized_area) if land.unutilized_area else 0,
+                'total_area': float(land.total_area) if land.total_area else 0,
+                'area_unit': 'sq m',
+                
+                # Important Dates
+                'past_date': format_date(land.past_date),
+                'soda_tarikh': format_date(land.soda_tarikh),
+                'banakhat_tarikh': format_date(land.banakhat_tarikh),
+                'dastavej_tarikh': format_date(land.dastavej_tarikh),
+                
+                # Additional Information
+                'broker_name': land.broker_name or 'Not specified',
+                'location': land.location or 'Not specified',
+                'remark': land.remark or 'Not specified',
+                'selected_tasks': tasks_list,
+                'tasks_count': len(tasks_list),
+                
+                # Calculated Values
+                'total_value': land.get_total_value(),
+            }
+        }
+        
+        return JsonResponse(land_data)
+        
+    except Land.DoesNotExist:
+        return JsonResponse({'success': False, 'message': 'Land not found'})
+    except Exception as e:
+        return JsonResponse({'success': False, 'message': f'Error: {str(e)}'})
+
+@login_required
+def process_land_sale(request):
+    """Process land sale with installments"""
+    print(f"DEBUG: process_land_sale called - Method: {request.method}, User: {request.user.username}, Role: {request.user.role}")
+    
+    if request.method != 'POST':
+        return JsonResponse({'success': False, 'message': 'Invalid request method'})
+    
+    # Allow admin and marketing employees to update land sales
+    if not is_marketing_or_admin(request.user):
+        return JsonResponse({'success': False, 'message': 'Permission denied'})
+    
+    try:
+        from ..models import LandSale, Installment
+        import json
+        from datetime import datetime, timedelta
+        
+        # Get data from request
+        data = json.loads(request.body)
+        land_id = data.get('land_id')
+        installments_data = data.get('installments', [])
+        total_percentage = data.get('total_percentage', 0)
+        
+        # New sale data fields
+        client_id = data.get('client_id')
+        marketing_employee_id = data.get('marketing_employee_id')
+        sale_date = data.get('sale_date')
+        notes = data.get('notes', '')
+        
+        # Validate required fields
+        if not land_id:
+            return JsonResponse({'success': False, 'message': 'Land ID is required'})
+        
+        # Allow empty installments for direct land sales
+        # if not installments_data:
+        #     return JsonResponse({'success': False, 'message': 'Installments data is required'})
+        
+        if not client_id:
+            return JsonResponse({'success': False, 'message': 'Client selection is required'})
+        
+        if not marketing_employee_id:
+            return JsonResponse({'success': False, 'message': 'Marketing employee selection is required'})
+        
+        if not sale_date:
+            return JsonResponse({'success': False, 'message': 'Sale date is required'})
+        
+        # Get the land
+        try:
+            land = Land.objects.get(id=land_id)
+        except Land.DoesNotExist:
+            return JsonResponse({'success': False, 'message': 'Land not found'})
+        
+        # Get the client
+        try:
+            from ..models import Client
+            client = Client.objects.get(id=client_id)
+        except Client.DoesNotExist:
+            return JsonResponse({'success': False, 'message': 'Selected client not found'})
+        
+        # Get the marketing employee
+        try:
+            marketing_employee = User.objects.get(id=marketing_employee_id, role='employee', employee_type='marketing')
+        except User.DoesNotExist:
+            return JsonResponse({'success': False, 'message': 'Selected marketing employee not found'})
+        
+        # Parse sale date
+        try:
+            sale_date_obj = datetime.strptime(sale_date, '%Y-%m-%d').date()
+        except ValueError:
+            return JsonResponse({'success': False, 'message': 'Invalid sale date format'})
+        
+        # Create LandSale record with enhanced data
+        land_sale = LandSale.objects.create(
+            land=land,
+            client=client,
+            marketing_employee=marketing_employee,
+            buyer_name=client.client_name,
+            buyer_contact=client.mobile_no,
+            buyer_address=client.address or '',
+            sale_date=sale_date_obj,
+            status=land.status,  # Use land's status instead of hardcoded 'active'
+            notes=notes,
+            created_by=request.user
+        )
+        
+        # Create Installment records (if any)
+        created_installments = []
+        if installments_data:
+            for installment_data in installments_data:
+                # Get installment number from data
+                installment_number = installment_data.get('installment_number', 1)
+                
+                # Calculate due date based on days from today
+                days = int(installment_data.get('days', 0))
+                due_date = datetime.now().date() + timedelta(days=days)
+                
+                # Get percentage from installment data
+                percentage = float(installment_data.get('percentage', 0))
+                
+                # Get payment method from data
+                payment_method = installment_data.get('payment_method', 'cash')
+                
+                installment = Installment.objects.create(
+                    land_sale=land_sale,
+                    installment_number=installment_number,
+                    percentage=percentage,
+                    payment_type=payment_method,
+                    due_date=due_date,
+                    status='pending'
+                )
+                created_installments.append(installment)
+        
+        # Update land status to in_process (installments created but not all paid)
+        land.status = 'in_process'
+        land.save()
+        
+        # Auto-assign marketing tasks to the selected marketing employee
+        # Use user-updated completion days from task_assignments data if available
+        tasks_assigned = 0
+        task_assignments_data = data.get('task_assignments', [])
+        
+        print(f"DEBUG: Auto-assigning marketing tasks to employee: {marketing_employee.full_name} (ID: {marketing_employee.id})")
+        print(f"DEBUG: Received task_assignments_data: {task_assignments_data}")
+        
+        try:
+            from ..models import AssignedTask, Task
+            from datetime import datetime, timedelta
+            
+            # Get all marketing tasks from core_task table
+            marketing_tasks = Task.objects.filter(marketing_task=True).order_by('position', 'name')
+            print(f"DEBUG: Found {marketing_tasks.count()} marketing tasks to assign")
+            
+            for task in marketing_tasks:
+                # Check if this task is already assigned to this employee for this land
+                existing_assignment = AssignedTask.objects.filter(
+                    land=land,
+                    task=task,
+                    employee=marketing_employee
+                ).first()
+                
+                if not existing_assignment:
+                    # Look for user-updated completion days in task_assignments_data
+                    user_completion_days = None
+                    for task_data in task_assignments_data:
+                        if task_data.get('task_name') == task.name:
+                            user_completion_days = int(task_data.get('completion_days', 0))
+                            print(f"DEBUG: Found user-updated completion days for '{task.name}': {user_completion_days}")
+                            break
+                    
+                    # Use user-updated completion days if available, otherwise use default
+                    completion_days = user_completion_days if user_completion_days else task.completion_days
+                    
+                    # Calculate due date based on completion days (user-updated or default)
+                    due_date = datetime.now() + timedelta(days=completion_days)
+                    
+                    # Create the task assignment directly in core_assignedtask table
+                    # Links: land_id (core_land), task_id (core_task), employee_id (core_user)
+                    assigned_task = AssignedTask.objects.create(
+                        land=land,  # Foreign key to core_land
+                        task=task,  # Foreign key to core_task
+                        employee=marketing_employee,  # Foreign key to core_user (marketing employee)
+                        status='pending',
+                        completion_days=completion_days,  # Use user-updated or default completion days
+                        due_date=due_date
+                    )
+                    tasks_assigned += 1
+                    print(f"DEBUG: Marketing task '{task.name}' (ID: {task.id}) auto-assigned to {marketing_employee.full_name} (ID: {marketing_employee.id}) for land {land.id}")
+                    print(f"DEBUG: AssignedTask created with ID: {assigned_task.id} - Completion days: {completion_days} (user-updated: {user_completion_days is not None}) - Due date: {due_date.date()}")
+                else:
+                    print(f"DEBUG: Marketing task '{task.name}' already assigned to {marketing_employee.full_name} for land {land.id}")
+                
+        except Exception as task_error:
+            print(f"DEBUG: Error auto-assigning marketing tasks: {str(task_error)}")
+            # Don't fail the entire sale process if task assignment fails
+            pass
+        
+        # Prepare success message
+        if created_installments:
+            message = f'Land sale processed successfully with {len(created_installments)} installments'
+        else:
+            message = 'Land sale processed successfully. Land status updated to "In process"'
+            
+        if tasks_assigned > 0:
+            message += f'. {tasks_assigned} task(s) assigned to marketing employee'
+        
+        return JsonResponse({
+            'success': True,
+            'message': message,
+            'sale_id': land_sale.id,
+            'installments_count': len(created_installments),
+            'tasks_assigned': tasks_assigned
+        })
+        
+    except json.JSONDecodeError:
+        return JsonResponse({'success': False, 'message': 'Invalid JSON data'})
+    except Exception as e:
+        return JsonResponse({'success': False, 'message': f'Error processing sale: {str(e)}'})
+
+@login_required
+def get_land_installments(request, land_id):
+    """Get existing installments for a land"""
+    if request.method != 'GET':
+        return JsonResponse({'success': False, 'message': 'Invalid request method'})
+    
+    # Allow admin and marketing employees to view land installments
+    if not is_marketing_or_admin(request.user):
+        return JsonResponse({'success': False, 'message': 'Permission denied'})
+    
+    try:
+        from ..models import LandSale, Installment
+        from datetime import date
+        
+        # Get the land
+        try:
+            land = Land.objects.get(id=land_id)
+        except Land.DoesNotExist:
+            return JsonResponse({'success': False, 'message': 'Land not found'})
+        
+        # Get the most recent sale for this land
+        land_sale = LandSale.objects.filter(land=land).order_by('-created_at').first()
+        
+        if not land_sale:
+            return JsonResponse({
+                'success': True, 
+                'has_sale': False,
+                'message': 'No sale found for this land'
+            })
+        
+        # Get all installments for this sale
+        installments = Installment.objects.filter(land_sale=land_sale).order_by('installment_number')
+        
+        # Format installments data
+        installments_data = []
+        for installment in installments:
+            installments_data.append({
+                'id': installment.id,
+                'installment_number': installment.installment_number,
+                'percentage': float(installment.percentage),
+                'payment_type': installment.payment_type,
+                'due_date': installment.due_date.strftime('%Y-%m-%d'),
+                'paid_date': installment.paid_date.strftime('%Y-%m-%d') if installment.paid_date else None,
+                'status': installment.status,
+                'notes': installment.notes,
+                'is_overdue': installment.is_overdue(),
+                # Payment record fields
+                'rtgs_number': installment.rtgs_number,
+                'utr_reference': installment.utr_reference,
+                'bank_name': installment.bank_name,
+                'from_bank': installment.from_bank,
+                'ifsc_code': installment.ifsc_code,
+                'cheque_photo': installment.cheque_photo.url if installment.cheque_photo else None,
+                'received_by': installment.received_by.full_name if installment.received_by else None
+            })
+        
+        return JsonResponse({
+            'success': True,
+            'has_sale': True,
+            'sale': {
+                'id': land_sale.id,
+                'land_name': land_sale.land.name,
+                'buyer_name': land_sale.buyer_name,
+                'sale_date': land_sale.sale_date.strftime('%Y-%m-%d'),
+                'status': land_sale.status,
+                'client_id': land_sale.client_id,
+                'client_name': land_sale.client.client_name if land_sale.client else None,
+                'client_mobile': land_sale.client.mobile_no if land_sale.client else None,
+                'marketing_employee_name': land_sale.marketing_employee.full_name if land_sale.marketing_employee else None,
+                'notes': land_sale.notes or ''
+            },
+            'installments': installments_data,
+            'total_installments': len(installments_data),
+            'paid_installments': len([i for i in installments_data if i['status'] == 'paid']),
+            'pending_installments': len([i for i in installments_data if i['status'] == 'pending'])
+        })
+        
+    except Exception as e:
+        return JsonResponse({'success': False, 'message': f'Error fetching installments: {str(e)}'})
+
+@login_required
+def update_land_sale(request):
+    """Update existing land sale details"""
+    if request.method != 'POST':
+        return JsonResponse({'success': False, 'message': 'Invalid request method'})
+    
+    if request.user.role != 'admin':
+        return JsonResponse({'success': False, 'message': 'Permission denied'})
+    
+    try:
+        from ..models import LandSale, Client
+        import json
+        from datetime import datetime
+        
+        # Get data from request
+        data = json.loads(request.body)
+        land_id = data.get('land_id')
+        client_id = data.get('client_id')
+        marketing_employee_id = data.get('marketing_employee_id')
+        sale_date = data.get('sale_date')
+        notes = data.get('notes', '')
+        installments_data = data.get('installments', [])
+        total_percentage = data.get('total_percentage', 0)
+        
+        # Validate required fields
+        if not land_id:
+            return JsonResponse({'success': False, 'message': 'Land ID is required'})
+        
+        if not client_id:
+            return JsonResponse({'success': False, 'message': 'Client selection is required'})
+        
+        if not marketing_employee_id:
+            return JsonResponse({'success': False, 'message': 'Marketing employee selection is required'})
+        
+        if not sale_date:
+            return JsonResponse({'success': False, 'message': 'Sale date is required'})
+        
+        # Get the land
+        try:
+            land = Land.objects.get(id=land_id)
+        except Land.DoesNotExist:
+            return JsonResponse({'success': False, 'message': 'Land not found'})
+        
+        # Get the client
+        try:
+            client = Client.objects.get(id=client_id)
+        except Client.DoesNotExist:
+            return JsonResponse({'success': False, 'message': 'Selected client not found'})
+        
+        # Get the marketing employee
+        try:
+            marketing_employee = User.objects.get(id=marketing_employee_id, role='employee', employee_type='marketing')
+        except User.DoesNotExist:
+            return JsonResponse({'success': False, 'message': 'Selected marketing employee not found'})
+        
+        # Parse sale date
+        try:
+            sale_date_obj = datetime.strptime(sale_date, '%Y-%m-%d').date()
+        except ValueError:
+            return JsonResponse({'success': False, 'message': 'Invalid sale date format'})
+        
+        # Get the existing land sale
+        try:
+            land_sale = LandSale.objects.filter(land=land).order_by('-created_at').first()
+            if not land_sale:
+                return JsonResponse({'success': False, 'message': 'No existing sale found for this land'})
+        except Exception as e:
+            return JsonResponse({'success': False, 'message': f'Error finding existing sale: {str(e)}'})
+        
+        # Update the land sale
+        land_sale.client = client
+        land_sale.marketing_employee = marketing_employee
+        land_sale.buyer_name = client.client_name
+        land_sale.buyer_contact = client.mobile_no
+        land_sale.buyer_address = client.address or ''
+        land_sale.sale_date = sale_date_obj
+        land_sale.notes = notes
+        land_sale.save()
+        
+        # Update installments if provided
+        if installments_data:
+            from ..models import Installment
+            from datetime import timedelta
+            
+            # Get existing installments to preserve their status
+            existing_installments = Installment.objects.filter(land_sale=land_sale)
+            existing_installments_dict = {}
+            for inst in existing_installments:
+                # Use only installment_number as key since that's the unique constraint
+                existing_installments_dict[inst.installment_number] = inst
+            
+            # Track which installment numbers we've processed
+            processed_numbers = set()
+            
+            # Update or create installments
+            for installment_data in installments_data:
+                # Get installment number from data
+                installment_number = installment_data.get('installment_number', 1)
+                
+                # Calculate due date based on days from today
+                days = int(installment_data.get('days', 0))
+                due_date = datetime.now().date() + timedelta(days=days)
+                
+                # Get percentage from installment data
+                percentage = float(installment_data.get('percentage', 0))
+                
+                # Get payment method from data
+                payment_method = installment_data.get('payment_method', 'cash')
+                
+                # Get status from data (preserve paid status)
+                status = installment_data.get('status', 'pending')
+                
+                # Track this installment number
+                processed_numbers.add(installment_number)
+                
+                # Check if this installment already exists
+                if installment_number in existing_installments_dict:
+                    # Update existing installment (preserve status if it's paid)
+                    existing_installment = existing_installments_dict[installment_number]
+                    existing_installment.percentage = percentage
+                    existing_installment.payment_type = payment_method
+                    existing_installment.due_date = due_date
+                    # Only update status if it's not already paid
+                    if existing_installment.status != 'paid':
+                        existing_installment.status = status
+                    existing_installment.save()
+                else:
+                    # Create new installment
+                    Installment.objects.create(
+                        land_sale=land_sale,
+                        installment_number=installment_number,
+                        percentage=percentage,
+                        payment_type=payment_method,
+                        due_date=due_date,
+                        status=status
+                    )
+            
+            # Delete installments that are no longer in the data (but preserve paid ones)
+            for installment_number, existing_installment in existing_installments_dict.items():
+                if installment_number not in processed_numbers and existing_installment.status != 'paid':
+                    existing_installment.delete()
+        
+        return JsonResponse({
+            'success': True,
+            'message': 'Land sale updated successfully',
+            'sale_id': land_sale.id
+        })
+        
+    except json.JSONDecodeError:
+        return JsonResponse({'success': False, 'message': 'Invalid JSON data'})
+    except Exception as e:
+        return JsonResponse({'success': False, 'message': f'Error updating sale: {str(e)}'})
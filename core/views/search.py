@@ -0,0 +1,60 @@
+from django.contrib.auth.decorators import login_required
+from django.http import JsonResponse
+from django.views.decorators.http import require_GET
+
+from .. import search
+from ..permissions import is_marketing_or_admin
+
+
+SEARCH_RESULT_LIMIT = 10
+SEARCH_RESULT_MAX_LIMIT = 50
+
+
+@login_required
+@require_GET
+def search_api(request):
+    """
+    Unified search over the land, client and assigned task search documents.
+    ?q= words are matched as prefixes; ?kind= limits the result groups.
+    Admins see every kind, marketing employees lands and clients.
+    """
+    user = request.user
+    if user.role == 'admin':
+        allowed_kinds = search.SEARCH_KINDS
+    elif user.role == 'employee' and user.employee_type == 'marketing':
+        allowed_kinds = [search.LAND, search.CLIENT]
+    else:
+        return JsonResponse({'error': 'Unauthorized access'}, status=403)
+    
+    query = request.GET.get('q', '').strip()
+    kinds = [kind for kind in request.GET.getlist('kind') or allowed_kinds if kind in allowed_kinds]
+    try:
+        limit = max(1, min(int(request.GET.get('limit') or SEARCH_RESULT_LIMIT), SEARCH_RESULT_MAX_LIMIT))
+    except ValueError:
+        return JsonResponse({'error': 'Invalid limit'}, status=400)
+    
+    results = {}
+    for kind in kinds:
+        documents = search.live_documents(kind, query).order_by('-updated_at')[:limit]
+        results[kind] = [{'id': object_id, 'title': title} for object_id, title in documents.values_list('object_id', 'title')]
+    
+    return JsonResponse({'query': query, 'results': results})
+
+@login_required
+@require_GET
+def quick_search_api(request):
+    """
+    Global quick search: ranked, typed hits with links across lands, clients,
+    land sales, installments and (for admins) users, at most ?limit= per type.
+    """
+    user = request.user
+    if not is_marketing_or_admin(user):
+        return JsonResponse({'error': 'Unauthorized access'}, status=403)
+    
+    query = request.GET.get('q', '')
+    try:
+        limit = int(request.GET.get('limit') or search.QUICK_SEARCH_LIMIT)
+    except ValueError:
+        return JsonResponse({'error': 'Invalid limit'}, status=400)
+    
+    return JsonResponse({'query': query.strip(), 'results': search.quick_search(user, query, limit=limit)})
@@ -0,0 +1,2438 @@
+import datetime
+import json
+
+from django.contrib.auth.decorators import login_required
+from django.http import JsonResponse, HttpResponse
+from django.shortcuts import render, redirect, get_object_or_404
+from django.utils import timezone
+
+from ..models import User, Task, Land, AssignedTask
+from ..notifications import notify, notify_many, notify_admins
+from .. import bulk_operations, search
+from ..conditional import conditional_resource
+from ..permissions import (
+    admin_required, marketing_or_admin_required, active_employee_required, is_marketing_or_admin,
+)
+from ..reporting import refresh_stats, stat_scopes
+
+
+@admin_required
+def admin_assigned_tasks(request):
+    """Admin view for managing all assigned tasks"""
+    return render(request, 'admin_assigned_task.html')
+
+@active_employee_required
+def employee_tasks(request):
+    # Get only land-based assigned tasks for this employee from core_assignedtask
+    from ..models import AssignedTask
+    from datetime import datetime, timedelta
+    
+    # Get sort parameter from request
+    sort_by = request.GET.get('sort', 'due_date')
+    sort_order = request.GET.get('order', 'asc')
+    
+    # Base queryset
+    assigned_land_tasks = AssignedTask.objects.filter(
+        employee=request.user
+    ).select_related('land', 'task')
+    
+    # Apply sorting
+    if sort_by == 'due_date':
+        if sort_order == 'asc':
+            # Sort by due date ascending (earliest first), nulls last
+            assigned_land_tasks = assigned_land_tasks.extra(
+                select={'due_date_sort': 'CASE WHEN due_date IS NULL THEN 1 ELSE 0 END'}
+            ).order_by('due_date_sort', 'due_date')
+        else:
+            # Sort by due date descending (latest first), nulls last
+            assigned_land_tasks = assigned_land_tasks.extra(
+                select={'due_date_sort': 'CASE WHEN due_date IS NULL THEN 1 ELSE 0 END'}
+            ).order_by('due_date_sort', '-due_date')
+    elif sort_by == 'assigned_date':
+        if sort_order == 'asc':
+            assigned_land_tasks = assigned_land_tasks.order_by('assigned_date')
+        else:
+            assigned_land_tasks = assigned_land_tasks.order_by('-assigned_date')
+    elif sort_by == 'task_name':
+        if sort_order == 'asc':
+            assigned_land_tasks = assigned_land_tasks.order_by('task__name')
+        else:
+            assigned_land_tasks = assigned_land_tasks.order_by('-task__name')
+    elif sort_by == 'land_name':
+        if sort_order == 'asc':
+            assigned_land_tasks = assigned_land_tasks.order_by('land__name')
+        else:
+            assigned_land_tasks = assigned_land_tasks.order_by('-land__name')
+    elif sort_by == 'status':
+        if sort_order == 'asc':
+            assigned_land_tasks = assigned_land_tasks.order_by('status')
+        else:
+            assigned_land_tasks = assigned_land_tasks.order_by('-status')
+    elif sort_by == 'completion_days':
+        if sort_order == 'asc':
+            assigned_land_tasks = assigned_land_tasks.order_by('completion_days')
+        else:
+            assigned_land_tasks = assigned_land_tasks.order_by('-completion_days')
+    else:
+        # Default sorting by due date ascending
+        assigned_land_tasks = assigned_land_tasks.extra(
+            select={'due_date_sort': 'CASE WHEN due_date IS NULL THEN 1 ELSE 0 END'}
+        ).order_by('due_date_sort', 'due_date')
+    
+    # Calculate overdue status and remaining days using due_date field like admin dashboard
+    for assigned_task in assigned_land_tasks:
+        # Check if task is overdue using due_date field (same logic as admin dashboard)
+        if assigned_task.due_date and assigned_task.status != 'complete':
+            if assigned_task.due_date < timezone.now():
+                assigned_task.is_overdue = True
+                assigned_task.days_overdue = (timezone.now().date() - assigned_task.due_date.date()).days
+                assigned_task.remaining_days = 0  # Overdue tasks have 0 remaining days
+            else:
+                assigned_task.is_overdue = False
+                assigned_task.days_overdue = 0
+                # Calculate remaining days until due date
+                assigned_task.remaining_days = (assigned_task.due_date.date() - timezone.now().date()).days
+        else:
+            assigned_task.is_overdue = False
+            assigned_task.days_overdue = 0
+            assigned_task.remaining_days = None  # No due date set
+    
+    # Filter options
+    status_filter = request.GET.get('status', '')
+    task_filter = request.GET.get('task', '')
+    land_filter = request.GET.get('land', '')
+    
+    if status_filter:
+        assigned_land_tasks = assigned_land_tasks.filter(status=status_filter)
+    
+    if task_filter:
+        assigned_land_tasks = assigned_land_tasks.filter(task__name__icontains=task_filter)
+    
+    if land_filter:
+        assigned_land_tasks = assigned_land_tasks.filter(land__name__icontains=land_filter)
+    
+    # Calculate overdue tasks count for display
+    overdue_tasks_count = assigned_land_tasks.filter(
+        due_date__lt=timezone.now(),
+        status__in=['pending', 'in_progress']
+    ).count()
+    
+    context = {
+        'assigned_land_tasks': assigned_land_tasks,
+        'user': request.user,
+        'status_filter': status_filter,
+        'task_filter': task_filter,
+        'land_filter': land_filter,
+        'overdue_tasks_count': overdue_tasks_count,
+        'sort_by': sort_by,
+        'sort_order': sort_order,
+    }
+    return render(request, 'employee_tasks.html', context)
+
+@active_employee_required(employee_type='marketing')
+def marketing_tasks(request):
+    """Marketing employee tasks page - redirects to employee_tasks"""
+    # Redirect marketing employees to use the general employee_tasks view
+    from django.urls import reverse
+    return redirect('employee-tasks')
+
+def tasks_index(request):
+    return HttpResponse('Tasks app index')
+
+@admin_required(api=True)
+def add_task_api(request):
+    """API endpoint to add a new task"""
+    if request.method != 'POST':
+        return JsonResponse({'success': False, 'message': 'Method not allowed'})
+    
+    try:
+        data = json.loads(request.body)
+        
+        land_id = data.get('land_id')
+        task_name = data.get('task_name')
+        due_date = data.get('due_date')
+        priority = data.get('priority', 'medium')
+        employee_id = data.get('employee_id')
+        description = data.get('description', '')
+        marketing_task = data.get('marketing_task', False)
+        
+        if not all([land_id, task_name, due_date, employee_id]):
+            return JsonResponse({'success': False, 'message': 'Missing required fields'})
+        
+        # Get the land and employee
+        land = Land.objects.get(id=land_id)
+        employee = User.objects.get(id=employee_id, role='employee')
+        
+        # Create a new task
+        from ..models import Task
+        task = Task.objects.create(
+            name=task_name,
+            description=description,
+            is_default=False,
+            position=0,
+            marketing_task=marketing_task
+        )
+        
+        # Create AssignedTask
+        from ..models import AssignedTask
+        assigned_task = AssignedTask.objects.create(
+            land=land,
+            task=task,
+            employee=employee,
+            status='pending',
+            due_date=due_date,
+            notes=description
+        )
+        
+        return JsonResponse({
+            'success': True,
+            'message': 'Task added successfully',
+            'task_id': assigned_task.id
+        })
+        
+    except Land.DoesNotExist:
+        return JsonResponse({'success': False, 'message': 'Land not found'})
+    except User.DoesNotExist:
+        return JsonResponse({'success': False, 'message': 'Employee not found'})
+    except Exception as e:
+        return JsonResponse({'success': False, 'message': str(e)})
+
+@marketing_or_admin_required(api=True)
+def get_task_details_api(request, task_id):
+    """API endpoint to get task details from core_assignedtask table"""
+    try:
+        from ..models import AssignedTask
+        assigned_task = AssignedTask.objects.get(id=task_id)
+        
+        # Get employee display name and additional info
+        employee_name = assigned_task.employee.get_display_name() if assigned_task.employee else 'Unassigned'
+        
+        # Get employee type with human-readable label
+        employee_type = 'Not specified'
+        if assigned_task.employee and assigned_task.employee.employee_type:
+            # Get the human-readable label for the choice
+            employee_type_choices = dict(User.EMPLOYEE_TYPE_CHOICES)
+            employee_type = employee_type_choices.get(assigned_task.employee.employee_type, assigned_task.employee.employee_type)
+        
+        employee_location = assigned_task.employee.location if assigned_task.employee and assigned_task.employee.location else 'Not specified'
+        
+        # Get land information with safe access
+        land_name = 'Unknown'
+        land_location = 'Unknown'
+        
+        if assigned_task.land:
+            try:
+                land_name = assigned_task.land.name or 'Unknown'
+                land_location = assigned_task.land.village.name or 'Unknown'
+            except AttributeError as e:
+                print(f"Warning: Land object missing expected attributes: {e}")
+                land_name = 'Unknown'
+                land_location = 'Unknown'
+        
+        task_data = {
+            'id': assigned_task.id,
+            'task_name': assigned_task.task.name if assigned_task.task else 'Unknown Task',
+            'assigned_employee': employee_name,
+            'employee_name': employee_name,
+            'employee_type': employee_type,
+            'employee_location': employee_location,
+            'status': assigned_task.status or 'pending',
+            'due_date': assigned_task.due_date.strftime('%Y-%m-%d') if assigned_task.due_date else None,
+            'completion_days': assigned_task.completion_days or 0,
+            'created_date': assigned_task.assigned_date.strftime('%Y-%m-%d') if assigned_task.assigned_date else None,
+            'created_at': assigned_task.assigned_date.strftime('%Y-%m-%d') if assigned_task.assigned_date else None,
+            'priority': 'medium',  # Default priority
+            'description': assigned_task.completion_notes or '',  # Use completion notes as description
+            'land_name': land_name,
+            'land_location': land_location,
+            'land_village': land_location
+        }
+        
+        # Add completion workflow data if available (same as get_land_tasks_api)
+        task_data['completion_notes'] = assigned_task.completion_notes or ''
+        task_data['completion_photos'] = assigned_task.completion_photos.url if assigned_task.completion_photos else None
+        task_data['completion_pdf'] = assigned_task.completion_pdf.url if assigned_task.completion_pdf else None
+        task_data['completion_submitted_date'] = assigned_task.completion_submitted_date.strftime('%Y-%m-%d') if assigned_task.completion_submitted_date else None
+        task_data['completed_date'] = assigned_task.completed_date.strftime('%Y-%m-%d') if assigned_task.completed_date else None
+        task_data['admin_approval_notes'] = assigned_task.admin_approval_notes or ''
+        
+        # Debug logging for completion data
+        print(f"API Debug - Task {task_id} completion data:")
+        print(f"  - completion_notes: {task_data['completion_notes']}")
+        print(f"  - completion_photos: {task_data['completion_photos']}")
+        print(f"  - completion_pdf: {task_data['completion_pdf']}")
+        print(f"  - completion_submitted_date: {task_data['completion_submitted_date']}")
+        print(f"  - admin_approval_notes: {task_data['admin_approval_notes']}")
+        
+        # Debug logging for land data
+        print(f"API Debug - Task {task_id} land data:")
+        print(f"  - land object exists: {assigned_task.land is not None}")
+        if assigned_task.land:
+            print(f"  - land name: {assigned_task.land.name}")
+            print(f"  - land village_name: {getattr(assigned_task.land.village, 'name', 'Attribute not found')}")
+            print(f"  - land attributes: {[attr for attr in dir(assigned_task.land) if not attr.startswith('_')]}")
+        
+        return JsonResponse({
+            'success': True,
+            'task': task_data
+        })
+        
+    except AssignedTask.DoesNotExist:
+        return JsonResponse({'success': False, 'message': 'Task not found'})
+    except Exception as e:
+        return JsonResponse({'success': False, 'message': str(e)})
+
+@admin_required(api=True)
+def approve_task_api(request, task_id):
+    """API endpoint to approve/complete a task"""
+    if request.method != 'POST':
+        return JsonResponse({'success': False, 'message': 'Method not allowed'})
+    
+    try:
+        from ..models import AssignedTask
+        assigned_task = AssignedTask.objects.get(id=task_id)
+        assigned_task.status = 'complete'
+        assigned_task.save(update_fields=['status'])
+        
+        # Create notification for employee
+        notify([assigned_task.employee], f"Task '{assigned_task.task.name}' has been approved and marked as completed by admin")
+        
+        return JsonResponse({
+            'success': True,
+            'message': 'Task marked as completed'
+        })
+        
+    except AssignedTask.DoesNotExist:
+        return JsonResponse({'success': False, 'message': 'Task not found'})
+    except Exception as e:
+        return JsonResponse({'success': False, 'message': str(e)})
+
+@admin_required(api=True)
+def delete_task_api(request, task_id):
+    """API endpoint to delete a task"""
+    if request.method != 'DELETE':
+        return JsonResponse({'success': False, 'message': 'Method not allowed'})
+    
+    try:
+        from ..models import AssignedTask
+        assigned_task = AssignedTask.objects.get(id=task_id)
+        
+        # Delete the task itself if it's not a default task
+        if not assigned_task.task.is_default:
+            assigned_task.task.delete()
+        else:
+            # Just delete the assignment
+            assigned_task.delete()
+        
+        return JsonResponse({
+            'success': True,
+            'message': 'Task deleted successfully'
+        })
+        
+    except AssignedTask.DoesNotExist:
+        return JsonResponse({'success': False, 'message': 'Task not found'})
+    except Exception as e:
+        return JsonResponse({'success': False, 'message': str(e)})
+
+@login_required
+def start_task_api(request, task_id):
+    """API endpoint for employee to start a task"""
+    if not request.user.is_authenticated or request.user.role != 'employee':
+        return JsonResponse({'success': False, 'message': 'Unauthorized'})
+    
+    if request.method != 'POST':
+        return JsonResponse({'success': False, 'message': 'Method not allowed'})
+    
+    try:
+        from ..models import AssignedTask
+        assigned_task = AssignedTask.objects.get(id=task_id, employee=request.user)
+        assigned_task.mark_in_progress()
+        
+        # Create notification for admin
+        notify_admins(f"Employee {request.user.get_display_name()} has started task '{assigned_task.task.name}'")
+        
+        return JsonResponse({
+            'success': True,
+            'message': 'Task started successfully'
+        })
+        
+    except AssignedTask.DoesNotExist:
+        return JsonResponse({'success': False, 'message': 'Task not found'})
+    except Exception as e:
+        return JsonResponse({'success': False, 'message': str(e)})
+
+@login_required
+def submit_task_completion_api(request, task_id):
+    """API endpoint for employee to submit task completion for approval"""
+    if not request.user.is_authenticated or request.user.role != 'employee':
+        return JsonResponse({'success': False, 'message': 'Unauthorized'})
+    
+    if request.method != 'POST':
+        return JsonResponse({'success': False, 'message': 'Method not allowed'})
+    
+    try:
+        from ..models import AssignedTask
+        assigned_task = AssignedTask.objects.get(id=task_id, employee=request.user)
+        
+        # Get form data (simplified form)
+        notes = request.POST.get('notes', '')
+        photos = request.FILES.get('photos')
+        pdf = request.FILES.get('pdf')
+        
+        # Debug logging
+        print(f"Task completion submission - Task ID: {task_id}, User: {request.user.username}")
+        print(f"Notes: {notes}")
+        print(f"Photos: {photos}")
+        print(f"PDF: {pdf}")
+        
+        # Validate required fields
+        if not notes.strip():
+            return JsonResponse({'success': False, 'message': 'Completion notes are required'})
+        
+        # Submit for approval with simplified data
+        assigned_task.submit_for_approval(
+            notes=notes,
+            photos=photos,
+            pdf=pdf
+        )
+        
+        # Create notification for admin
+        notify_admins(f"Task '{assigned_task.task.name}' completion submitted for approval by {request.user.get_display_name()}")
+        
+        print(f"Task {task_id} submitted for approval successfully")
+        
+        return JsonResponse({
+            'success': True,
+            'message': 'Task completion submitted for approval'
+        })
+        
+    except AssignedTask.DoesNotExist:
+        print(f"Task {task_id} not found for user {request.user.username}")
+        return JsonResponse({'success': False, 'message': 'Task not found'})
+    except Exception as e:
+        print(f"Error in submit_task_completion_api: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        return JsonResponse({'success': False, 'message': str(e)})
+
+def _complete_team_assignments(assigned_task):
+    """
+    Complete the other open assignments of the same task on the same land
+    in one UPDATE. Returns the employee ids of the team members completed.
+    """
+    team = list(AssignedTask.objects.filter(
+        land=assigned_task.land,
+        task=assigned_task.task,
+        status__in=['pending_approval', 'in_progress', 'pending']
+    ).exclude(id=assigned_task.id).values_list('id', 'employee_id'))
+    team_ids = [assignment_id for assignment_id, _ in team]
+    if team_ids:
+        scopes = stat_scopes(id__in=team_ids)
+        AssignedTask.objects.filter(id__in=team_ids).update(
+            status='complete',
+            completed_date=timezone.now(),
+            admin_approval_notes=f"Auto-completed: Task approved for {assigned_task.employee.get_display_name()}"
+        )
+        # Queryset updates skip the signals that keep the task stats current
+        refresh_stats(stat_scopes(scopes, id__in=team_ids))
+    return [employee_id for _, employee_id in team]
+
+@admin_required(api=True)
+def approve_task_completion_api(request, task_id):
+    """API endpoint for admin to approve task completion"""
+    if request.method != 'POST':
+        return JsonResponse({'success': False, 'message': 'Method not allowed'})
+    
+    try:
+        from ..models import AssignedTask
+        assigned_task = AssignedTask.objects.get(id=task_id)
+        
+        # Get admin notes
+        admin_notes = request.POST.get('admin_notes', '')
+        
+        # Approve completion
+        assigned_task.approve_completion(admin_notes)
+        
+        # Complete the task for everyone else assigned to it on the same land too
+        team_member_ids = _complete_team_assignments(assigned_task)
+        
+        # Queue notification for each affected employee
+        pending_notifications = [
+            (employee_id, f"Task '{assigned_task.task.name}' has been completed (approved for team member {assigned_task.employee.get_display_name()})")
+            for employee_id in team_member_ids
+        ]
+        
+        # Notify the original employee and the rest of the team in one insert
+        pending_notifications.append((assigned_task.employee_id, f"Task '{assigned_task.task.name}' completion has been approved by admin"))
+        notify_many(pending_notifications)
+        
+        return JsonResponse({
+            'success': True,
+            'message': 'Task completion approved successfully'
+        })
+        
+    except AssignedTask.DoesNotExist:
+        return JsonResponse({'success': False, 'message': 'Task not found'})
+    except Exception as e:
+        return JsonResponse({'success': False, 'message': str(e)})
+
+@admin_required(api=True)
+def reject_task_completion_api(request, task_id):
+    """API endpoint for admin to reject task completion"""
+    if request.method != 'POST':
+        return JsonResponse({'success': False, 'message': 'Method not allowed'})
+    
+    try:
+        from ..models import AssignedTask
+        assigned_task = AssignedTask.objects.get(id=task_id)
+        
+        # Get admin notes
+        admin_notes = request.POST.get('admin_notes', '')
+        
+        # Reject completion
+        assigned_task.reject_completion(admin_notes)
+        
+        # Create notification for employee
+        notify([assigned_task.employee], f"Task '{assigned_task.task.name}' completion has been rejected by admin. Please review and resubmit.")
+        
+        return JsonResponse({
+            'success': True,
+            'message': 'Task completion rejected'
+        })
+        
+    except AssignedTask.DoesNotExist:
+        return JsonResponse({'success': False, 'message': 'Task not found'})
+    except Exception as e:
+        return JsonResponse({'success': False, 'message': str(e)})
+
+@admin_required(api=True)
+def reassign_task_api(request, task_id):
+    """API endpoint for admin to reassign a task to the same employee with notes"""
+    if request.method != 'POST':
+        return JsonResponse({'success': False, 'message': 'Method not allowed'})
+    
+    try:
+        from ..models import AssignedTask
+        assigned_task = AssignedTask.objects.get(id=task_id)
+        
+        # Get reassignment notes
+        reassignment_notes = request.POST.get('reassignment_notes', '')
+        
+        # Reassign the task to the same employee but with new notes
+        assigned_task.status = 'in_progress'  # Set to in_progress status
+        assigned_task.assigned_date = datetime.datetime.now()
+        
+        # Store reassignment notes for the employee to see
+        assigned_task.admin_approval_notes = f"Task reassigned with notes: {reassignment_notes}".strip()
+        
+        assigned_task.save(update_fields=['status', 'assigned_date', 'admin_approval_notes'])
+        
+        # Create notification for employee
+        notify([assigned_task.employee], f"Task '{assigned_task.task.name}' has been reassigned to you with new instructions")
+        
+        return JsonResponse({
+            'success': True,
+            'message': f'Task successfully reassigned to {assigned_task.employee.get_display_name()}'
+        })
+        
+    except AssignedTask.DoesNotExist:
+        return JsonResponse({'success': False, 'message': 'Task not found'})
+    except Exception as e:
+        return JsonResponse({'success': False, 'message': str(e)})
+
+@admin_required
+def tasks(request):
+    """View for simplified task management page"""
+    from ..models import Task, User
+    
+    # Get all tasks with their assigned employees
+    tasks = Task.objects.prefetch_related('task_manages__employee').all()
+    
+    # Get all employees for the dropdown (excluding marketing type)
+    employees = User.objects.filter(role='employee', status='active').exclude(employee_type='marketing').order_by('full_name')
+    
+    context = {
+        'tasks': tasks,
+        'employees': employees
+    }
+    
+    return render(request, 'task.html', context)
+
+@admin_required(api=True)
+def add_task(request):
+    """AJAX view to add a new task"""
+    if request.method == 'POST':
+        try:
+            from ..models import Task, User
+            
+            task_name = request.POST.get('task_name')
+            position = request.POST.get('position')
+            selected_employees = request.POST.get('selected_employees')
+            is_default = request.POST.get('is_default')
+            completion_days = request.POST.get('completion_days')
+            marketing_task = request.POST.get('marketing_task', 'false')
+            
+            if not all([task_name, position, selected_employees, is_default, completion_days]):
+                return JsonResponse({'success': False, 'message': 'All required fields must be filled'})
+            
+            # Convert is_default to boolean
+            is_default_bool = is_default.lower() == 'true'
+            
+            # Convert marketing_task to boolean
+            marketing_task_bool = marketing_task.lower() == 'true'
+            
+            # Convert completion_days to integer
+            try:
+                completion_days_int = int(completion_days)
+                if completion_days_int < 0:
+                    return JsonResponse({'success': False, 'message': 'Completion days must be 0 or greater'})
+            except ValueError:
+                return JsonResponse({'success': False, 'message': 'Completion days must be a valid number'})
+            
+            # Parse selected employees (comma-separated IDs)
+            employee_ids = [eid.strip() for eid in selected_employees.split(',') if eid.strip()]
+            
+            # Handle special case for marketing_employee placeholder
+            if employee_ids == ['marketing_employee']:
+                # For marketing tasks, we don't assign to a specific employee initially
+                employees = []
+            else:
+                if not employee_ids:
+                    return JsonResponse({'success': False, 'message': 'At least one employee must be selected'})
+                
+                # Get the employees
+                employees = []
+                for employee_id_str in employee_ids:
+                    # Skip marketing_employee placeholder if mixed with real IDs
+                    if employee_id_str == 'marketing_employee':
+                        continue
+                    try:
+                        employee = User.objects.get(id=employee_id_str, role='employee')
+                        employees.append(employee)
+                    except User.DoesNotExist:
+                        return JsonResponse({'success': False, 'message': f'Employee with ID {employee_id_str} not found'})
+            
+            # Create the task
+            task = Task.objects.create(
+                name=task_name,
+                position=int(position),
+                is_default=is_default_bool,
+                completion_days=completion_days_int,
+                marketing_task=marketing_task_bool
+            )
+            
+            # Create TaskManage records for each employee
+            from ..models import TaskManage
+            for employee in employees:
+                TaskManage.objects.create(
+                    task=task,
+                    employee=employee
+                )
+            
+            # Create notification for employees about new task assignment
+            notify(employees, f"New task '{task_name}' has been created and assigned to you")
+            
+            # Create notification for all admins about new task
+            notify_admins(f"New task '{task_name}' has been created and assigned to {len(employees)} employee(s)")
+            
+            return JsonResponse({
+                'success': True,
+                'message': f'Task created successfully and assigned to {len(employees)}) employee(s)!',
+                'task_id': task.id
+            })
+            
+        except Exception as e:
+            print(f"Error in add_assigned_task: {str(e)}")
+            return JsonResponse({'success': False, 'message': str(e)})
+    
+    return JsonResponse({'success': False, 'message': 'Invalid request method'})
+
+@admin_required(api=True)
+def add_task_for_land(request):
+    """AJAX view to add a new task specifically for a land in edit modal"""
+    if request.method == 'POST':
+        try:
+            from ..models import Task, User, AssignedTask, TaskManage
+            
+            task_name = request.POST.get('task_name')
+            position = request.POST.get('position')
+            assign_employee = request.POST.get('assign_employee')
+            is_default = request.POST.get('is_default')
+            completion_days = request.POST.get('completion_days')
+            land_id = request.POST.get('land_id')
+            marketing_task = request.POST.get('marketing_task', 'false')
+            
+            if not all([task_name, position, assign_employee, is_default, completion_days, land_id]):
+                return JsonResponse({'success': False, 'message': 'All required fields must be filled'})
+            
+            # Convert is_default to boolean
+            is_default_bool = is_default.lower() == 'true'
+            
+            # Convert marketing_task to boolean
+            marketing_task_bool = marketing_task.lower() == 'true'
+            
+            # Convert completion_days to integer
+            try:
+                completion_days_int = int(completion_days)
+                if completion_days_int < 0:
+                    return JsonResponse({'success': False, 'message': 'Completion days must be 0 or greater'})
+            except ValueError:
+                return JsonResponse({'success': False, 'message': 'Completion days must be a valid number'})
+            
+            # Get the employee
+            try:
+                employee = User.objects.get(id=assign_employee, role='employee')
+            except User.DoesNotExist:
+                return JsonResponse({'success': False, 'message': f'Employee with ID {assign_employee} not found'})
+            
+            # Get the land
+            try:
+                land = Land.objects.get(id=land_id)
+            except Land.DoesNotExist:
+                return JsonResponse({'success': False, 'message': f'Land with ID {land_id} not found'})
+            
+            # Create the task
+            task = Task.objects.create(
+                name=task_name,
+                position=int(position),
+                is_default=is_default_bool,
+                completion_days=completion_days_int,
+                marketing_task=marketing_task_bool
+            )
+            
+            # Create TaskManage record for the employee
+            task_manage = TaskManage.objects.create(
+                task=task,
+                employee=employee
+            )
+            
+            # Create AssignedTask record linking task to land
+            assigned_task = AssignedTask.objects.create(
+                land=land,
+                task=task,
+                employee=employee,
+                status='pending',
+                due_date=timezone.now() + datetime.timedelta(days=completion_days_int),
+                completion_days=completion_days_int
+            )
+            
+            # Create notification for employee about new task assignment
+            notify([employee], f"New task '{task_name}' has been created and assigned to you for land '{land.name}'")
+            
+            # Create notification for all admins about new task
+            notify_admins(f"New task '{task_name}' has been created and assigned to {employee.get_display_name()} for land '{land.name}'")
+            
+            print(f"Task created successfully: Task ID {task.id}, TaskManage ID {task_manage.id}, AssignedTask ID {assigned_task.id}")
+            print(f"Task details: name='{task.name}', position={task.position}, is_default={task.is_default}, completion_days={task.completion_days}")
+            print(f"AssignedTask details: land_id={assigned_task.land.id}, task_id={assigned_task.task.id}, employee_id={assigned_task.employee.id}")
+            
+            return JsonResponse({
+                'success': True,
+                'message': f'Task "{task_name}" created successfully and assigned to {employee.get_display_name()}!',
+                'task_id': task.id,
+                'assigned_task_id': assigned_task.id
+            })
+            
+        except Exception as e:
+            print(f"Error in add_task_for_land: {str(e)}")
+            import traceback
+            traceback.print_exc()
+            return JsonResponse({'success': False, 'message': f'Error creating task: {str(e)}'})
+    
+    return JsonResponse({'success': False, 'message': 'Invalid request method'})
+
+@admin_required(api=True)
+def get_task_employee_info(request):
+    """AJAX view to get employee information for tasks from core_taskmanage and core_task"""
+
+    if request.method == 'GET':
+        try:
+            from ..models import Task, TaskManage, User
+            
+            # Get all tasks with their assigned employees
+            task_employees = {}
+            
+            # Query TaskManage to get task-employee relationships
+            task_manages = TaskManage.objects.select_related('task', 'employee').all()
+            
+            for task_manage in task_manages:
+                task_name = task_manage.task.name
+                employee_name = task_manage.employee.get_display_name()
+                employee_id = task_manage.employee.id
+                employee_role = task_manage.employee.role
+                completion_days = task_manage.task.completion_days
+                
+                if task_name not in task_employees:
+                    task_employees[task_name] = {
+                        'employees': [],
+                        'completion_days': completion_days
+                    }
+                
+                task_employees[task_name]['employees'].append({
+                    'id': employee_id,
+                    'name': employee_name,
+                    'role': employee_role
+                })
+            
+            print(f"Task employee info fetched: {len(task_employees)} tasks with employee data")
+            
+            return JsonResponse({
+                'success': True,
+                'task_employees': task_employees
+            })
+
+        except Exception as e:
+            print(f"Error in get_task_employee_info: {str(e)}")
+            import traceback
+            traceback.print_exc()
+            return JsonResponse({'success': False, 'message': f'Error fetching task employee info: {str(e)}'})
+
+    return JsonResponse({'success': False, 'message': 'Invalid request method'})
+
+@admin_required(api=True)
+def get_task(request, task_id):
+    """AJAX view to get task data for editing"""
+    if request.method == 'GET':
+        try:
+            from ..models import Task
+            
+            task = Task.objects.get(id=task_id)
+            
+            # Get assigned employees through TaskManage model
+            from ..models import TaskManage
+            assigned_employees = []
+            assigned_tasks = TaskManage.objects.filter(task=task).select_related('employee')
+            for assigned_task in assigned_tasks:
+                assigned_employees.append({
+                    'id': assigned_task.employee.id, 
+                    'name': assigned_task.employee.full_name or assigned_task.employee.username
+                })
+            
+            return JsonResponse({
+                'success': True,
+                'task': {
+                    'id': task.id,
+                    'name': task.name,
+                    'position': task.position,
+                    'assigned_employees': assigned_employees,
+                    'is_default': task.is_default,
+                    'completion_days': task.completion_days,
+                    'marketing_task': task.marketing_task
+                }
+            })
+            
+        except Task.DoesNotExist:
+            return JsonResponse({'success': False, 'message': 'Task not found'})
+        except Exception as e:
+            print(f"Error in get_task: {str(e)}")
+            return JsonResponse({'success': False, 'message': str(e)})
+    
+    return JsonResponse({'success': False, 'message': 'Invalid request method'})
+
+@admin_required(api=True)
+def update_task(request):
+    """AJAX view to update an existing task"""
+    if request.method == 'POST':
+        try:
+            from ..models import Task, User
+            
+            task_id = request.POST.get('task_id')
+            task_name = request.POST.get('task_name')
+            position = request.POST.get('position')
+            selected_employees = request.POST.get('selected_employees')
+            is_default = request.POST.get('is_default')
+            completion_days = request.POST.get('completion_days')
+            marketing_task = request.POST.get('marketing_task', 'false')
+            
+            if not all([task_id, task_name, position, selected_employees, is_default, completion_days]):
+                return JsonResponse({'success': False, 'message': 'All required fields must be filled'})
+            
+            # Get the task
+            try:
+                task = Task.objects.get(id=task_id)
+            except Task.DoesNotExist:
+                return JsonResponse({'success': False, 'message': 'Task not found'})
+            
+            # Convert is_default to boolean
+            is_default_bool = is_default.lower() == 'true'
+            
+            # Convert marketing_task to boolean
+            marketing_task_bool = marketing_task.lower() == 'true'
+            
+            # Convert completion_days to integer
+            try:
+                completion_days_int = int(completion_days)
+                if completion_days_int < 0:
+                    return JsonResponse({'success': False, 'message': 'Completion days must be 0 or greater'})
+            except ValueError:
+                return JsonResponse({'success': False, 'message': 'Completion days must be a valid number'})
+            
+            # Parse selected employees (comma-separated IDs)
+            employee_ids = [eid.strip() for eid in selected_employees.split(',') if eid.strip()]
+            if not employee_ids:
+                return JsonResponse({'success': False, 'message': 'At least one employee must be selected'})
+            
+            # Get the employees
+            employees = []
+            for employee_id_str in employee_ids:
+                try:
+                    employee = User.objects.get(id=employee_id_str, role='employee')
+                    employees.append(employee)
+                except User.DoesNotExist:
+                    return JsonResponse({'success': False, 'message': f'Employee with ID {employee_id_str} not found'})
+            
+            # Get land_id if provided
+            land_id = request.POST.get('land_id')
+            land = None
+            if land_id:
+                try:
+                    from ..models import Land
+                    land = Land.objects.get(id=land_id)
+                except Land.DoesNotExist:
+                    return JsonResponse({'success': False, 'message': f'Land with ID {land_id} not found'})
+            
+            # Update the task
+            task.name = task_name
+            task.position = int(position)
+            task.is_default = is_default_bool
+            task.completion_days = completion_days_int
+            task.marketing_task = marketing_task_bool
+            task.land = land
+            task.save()
+            
+            # Update assigned employees through TaskManage model
+            from ..models import TaskManage
+            
+            # Remove existing assignments for this task
+            TaskManage.objects.filter(task=task).delete()
+            
+            # Create new assignments for each employee
+            for employee in employees:
+                TaskManage.objects.create(
+                    task=task,
+                    employee=employee
+                )
+            
+            return JsonResponse({
+                'success': True,
+                'message': f'Task updated successfully and assigned to {len(employees)} employee(s)!'
+            })
+            
+        except Exception as e:
+            print(f"Error in update_assigned_task: {str(e)}")
+            return JsonResponse({'success': False, 'message': str(e)})
+    
+    return JsonResponse({'success': False, 'message': 'Invalid request method'})
+
+@admin_required(api=True)
+def delete_task(request, task_id):
+    """AJAX view to delete a task"""
+    if request.method == 'DELETE':
+        try:
+            from ..models import Task
+            
+            task = Task.objects.get(id=task_id)
+            task_name = task.name
+            task.delete()
+            
+            return JsonResponse({
+                'success': True,
+                'message': f'Task "{task_name}" deleted successfully!'
+            })
+            
+        except Task.DoesNotExist:
+            return JsonResponse({'success': False, 'message': 'Task not found'})
+        except Exception as e:
+            print(f"Error in delete_task: {str(e)}")
+            return JsonResponse({'success': False, 'message': str(e)})
+    
+    return JsonResponse({'success': False, 'message': 'Invalid request method'})
+
+@admin_required(api=True)
+def create_task_manage(request):
+    """AJAX view to create a new TaskManage"""
+    if request.method == 'POST':
+        try:
+            from ..models import TaskManage, Task, User
+            
+            task_id = request.POST.get('task_id')
+            employee_id = request.POST.get('employee_id')
+            
+            if not all([task_id, employee_id]):
+                return JsonResponse({'success': False, 'message': 'Task and Employee are required'})
+            
+            # Check if assignment already exists
+            if TaskManage.objects.filter(task_id=task_id, employee_id=employee_id).exists():
+                return JsonResponse({'success': False, 'message': 'This task is already assigned to this employee'})
+            
+            # Create the assignment
+            task_manage = TaskManage.objects.create(
+                task_id=task_id,
+                employee_id=employee_id
+            )
+            
+            return JsonResponse({
+                'success': True,
+                'message': 'Task assigned successfully!',
+                'task_manage_id': task_manage.id
+            })
+            
+        except Exception as e:
+            print(f"Error in create_task_manage: {str(e)}")
+            return JsonResponse({'success': False, 'message': str(e)})
+    
+    return JsonResponse({'success': False, 'message': 'Invalid request method'})
+
+@admin_required(api=True)
+def delete_task_manage(request, task_manage_id):
+    """AJAX view to delete a TaskManage"""
+    if request.method == 'DELETE':
+        try:
+            from ..models import TaskManage
+            
+            task_manage = TaskManage.objects.get(id=task_manage_id)
+            task_manage.delete()
+            
+            return JsonResponse({
+                'success': True,
+                'message': 'Task assignment deleted successfully!'
+            })
+            
+        except TaskManage.DoesNotExist:
+            return JsonResponse({'success': False, 'message': 'Assigned Task not found'})
+        except Exception as e:
+            print(f"Error in delete_task_manage: {str(e)}")
+            return JsonResponse({'success': False, 'message': str(e)})
+    
+    return JsonResponse({'success': False, 'message': 'Invalid request method'})
+
+def auto_assign_tasks_for_land(land, selected_tasks=None, task_employee_selections=None, task_completion_days=None):
+    """
+    Automatically assign selected tasks to employees for a newly submitted land
+    based on the core_task and core_taskmanage tables
+    task_employee_selections: dict mapping task names to selected employee names
+    task_completion_days: dict mapping task names to completion days data
+    """
+    try:
+        from ..models import Task, TaskManage, AssignedTask, User
+        
+        print(f"auto_assign_tasks_for_land called with:")
+        print(f"  Land: {land.name}")
+        print(f"  Selected tasks: {selected_tasks}")
+        print(f"  Task employee selections: {task_employee_selections}")
+        print(f"  Task employee selections type: {type(task_employee_selections)}")
+        if task_employee_selections:
+            print(f"  Task employee selections keys: {list(task_employee_selections.keys())}")
+            for key, value in task_employee_selections.items():
+                print(f"    {key}: '{value}' (type: {type(value)})")
+                if isinstance(value, str):
+                    split_names = [name.strip() for name in value.split(',') if name.strip()]
+                    print(f"      Split into: {split_names}")
+        
+        # Parse task completion days data
+        if task_completion_days:
+            try:
+                task_completion_days = json.loads(task_completion_days)
+                print(f"  Task completion days: {task_completion_days}")
+            except json.JSONDecodeError:
+                print(f"  Warning: Invalid JSON in task_completion_days: {task_completion_days}")
+                task_completion_days = {}
+        else:
+            task_completion_days = {}
+            print(f"  No task completion days provided")
+        
+        if not selected_tasks or selected_tasks.strip() == '':
+            return True, "No tasks selected for assignment - no automatic assignments needed"
+        
+        # Parse selected tasks (comma-separated string)
+        task_names = [task.strip() for task in selected_tasks.split(',') if task.strip()]
+        print(f"Parsed task names: {task_names}")
+        
+        if not task_names:
+            return True, "No valid tasks found - no automatic assignments needed"
+        
+        # Get the actual Task objects for the selected task names
+        selected_task_objects = Task.objects.filter(name__in=task_names)
+        print(f"Found {selected_task_objects.count()} task objects")
+        
+        if not selected_task_objects.exists():
+            return False, f"No valid tasks found for: {', '.join(task_names)}"
+        
+        # Create AssignedTask records for each selected task and employee combination
+        created_count = 0
+        total_assignments = 0
+        pending_notifications = []
+        
+        for task in selected_task_objects:
+            task_name = task.name
+            print(f"\nProcessing task: {task_name}")
+            
+            # Check if specific employees are selected for this task
+            if task_employee_selections and task_name in task_employee_selections:
+                # Use specifically selected employees (can be single or multiple)
+                selected_employee_names = task_employee_selections[task_name]
+                print(f"  Using specifically selected employees: {selected_employee_names}")
+                
+                # Handle both single employee (string) and multiple employees (comma-separated)
+                if isinstance(selected_employee_names, str):
+                    employee_name_list = [name.strip() for name in selected_employee_names.split(',') if name.strip()]
+                    print(f"    Split employee names: {employee_name_list}")
+                else:
+                    employee_name_list = [selected_employee_names]
+                    print(f"    Single employee name: {employee_name_list}")
+                
+                selected_employee_objects = []
+                print(f"    Looking for {len(employee_name_list)} employees...")
+                for employee_name in employee_name_list:
+                    # Find employee by name (case-insensitive)
+                    employee = User.objects.filter(
+                        full_name__iexact=employee_name,
+                        role='employee',
+                        status='active'
+                    ).first()
+                    
+                    if not employee:
+                        # Try to find by username as fallback
+                        employee = User.objects.filter(
+                            username__iexact=employee_name,
+                            role='employee',
+                            status='active'
+                        ).first()
+                    
+                    if employee:
+                        selected_employee_objects.append(employee)
+                        print(f"    Found employee: {employee.full_name} (ID: {employee.id})")
+                        
+                        # Ensure TaskManage relationship exists for selected employee
+                        task_manage, created = TaskManage.objects.get_or_create(
+                            task=task,
+                            employee=employee
+                        )
+                        if created:
+                            print(f"    Created TaskManage relationship: {task.name} -> {employee.full_name}")
+                    else:
+                        print(f"    WARNING: Employee not found: {employee_name}")
+                
+                if not selected_employee_objects:
+                    print(f"    WARNING: No valid employees found from selection: {selected_employee_names}")
+                    # No fallback - if specific employees are selected but not found, don't assign the task
+                    print(f"    No fallback - task {task_name} will not be assigned")
+                
+            else:
+                # No employees selected for this task - don't assign to anyone
+                print(f"  No employees selected for task: {task_name} - task will not be assigned")
+                selected_employee_objects = []
+            
+            if not selected_employee_objects:
+                print(f"  WARNING: No employees found for task: {task_name}")
+                continue
+            
+            # Create assignments for all selected employees
+            print(f"  Creating assignments for {len(selected_employee_objects)} employees...")
+            for employee in selected_employee_objects:
+                print(f"    Creating AssignedTask for employee: {employee.full_name} (ID: {employee.id})")
+                
+                # Check if custom completion days are provided for this task
+                custom_completion_days = None
+                if task_name in task_completion_days:
+                    custom_completion_days = task_completion_days[task_name].get('days', task.completion_days)
+                    print(f"      Using custom completion days: {custom_completion_days} (original: {task.completion_days})")
+                else:
+                    custom_completion_days = task.completion_days
+                    print(f"      Using default completion days: {custom_completion_days}")
+                
+                # Create an AssignedTask for this land, task, and employee
+                assigned_task, created = AssignedTask.objects.get_or_create(
+                    land=land,
+                    task=task,
+                    employee=employee,
+                    defaults={
+                        'status': 'pending',
+                        'completion_days': custom_completion_days,
+                        'due_date': timezone.now() + timezone.timedelta(days=custom_completion_days) if custom_completion_days > 0 else None
+                    }
+                )
+                if created:
+                    created_count += 1
+                    print(f"      [SUCCESS] Created new AssignedTask (ID: {assigned_task.id})")
+                    
+                    # Queue notification for employee about new task assignment
+                    pending_notifications.append((employee, f"New task '{task.name}' has been assigned to you for land '{land.name}'"))
+                else:
+                    print(f"      - AssignedTask already exists (ID: {assigned_task.id})")
+                    # Update completion days if they changed
+                    if custom_completion_days != assigned_task.completion_days:
+                        old_days = assigned_task.completion_days
+                        assigned_task.completion_days = custom_completion_days
+                        assigned_task.due_date = timezone.now() + timezone.timedelta(days=custom_completion_days) if custom_completion_days > 0 else None
+                        assigned_task.save()
+                        print(f"      ✓ Updated completion days from {old_days} to {custom_completion_days}")
+                
+                total_assignments += 1
+        
+        notify_many(pending_notifications)
+        
+        print(f"\nAssignment Summary:")
+        print(f"  Total tasks processed: {len(selected_task_objects)}")
+        print(f"  Total assignments created: {created_count}")
+        print(f"  Total assignments (including existing): {total_assignments}")
+        
+        if created_count > 0:
+            return True, f"Successfully assigned {created_count} new tasks to employees. Total assignments: {total_assignments}"
+        elif total_assignments > 0:
+            return True, f"All {total_assignments} task assignments already exist"
+        else:
+            return False, "No task assignments were created"
+        
+    except Exception as e:
+        print(f"Error in auto_assign_tasks_for_land: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        return False, f"Error assigning tasks: {str(e)}"
+
+def update_assigned_tasks_for_land(land, selected_tasks, task_employee_selections=None, task_completion_days=None):
+    """
+    Update AssignedTask records when land tasks are modified
+    This function intelligently updates only what's necessary:
+    - Preserves existing assignments for unchanged tasks
+    - Creates new assignments for newly added tasks
+    - Updates assignments only for tasks with employee changes
+    - Updates completion days if they changed
+    """
+    try:
+        from ..models import Task, TaskManage, AssignedTask, User
+        from django.utils import timezone
+        
+        # Get current task assignments for comparison
+        current_assignments = AssignedTask.objects.filter(land=land).select_related('task', 'employee')
+        current_task_employee_map = {assignment.task.name: assignment.employee.full_name for assignment in current_assignments}
+        
+        print(f"Current assignments: {current_task_employee_map}")
+        print(f"New employee selections: {task_employee_selections}")
+        print(f"Selected tasks: '{selected_tasks}'")
+        
+        # Parse task completion days data
+        if task_completion_days:
+            try:
+                task_completion_days = json.loads(task_completion_days)
+                print(f"Task completion days: {task_completion_days}")
+            except json.JSONDecodeError:
+                print(f"Warning: Invalid JSON in task_completion_days: {task_completion_days}")
+                task_completion_days = {}
+        else:
+            task_completion_days = {}
+            print(f"No task completion days provided")
+        
+        # Parse selected tasks
+        if selected_tasks and selected_tasks.strip():
+            new_task_names = [task.strip() for task in selected_tasks.split(',') if task.strip()]
+        else:
+            new_task_names = []
+        
+        current_task_names = set(current_task_employee_map.keys())
+        new_task_names_set = set(new_task_names)
+        
+        # Determine what needs to be done
+        tasks_to_add = new_task_names_set - current_task_names
+        tasks_to_remove = current_task_names - new_task_names_set
+        tasks_to_keep = current_task_names & new_task_names_set
+        
+        print(f"Task analysis:")
+        print(f"  Tasks to add: {tasks_to_add}")
+        print(f"  Tasks to remove: {tasks_to_remove}")
+        print(f"  Tasks to keep: {tasks_to_keep}")
+        
+        # Remove tasks that are no longer selected
+        if tasks_to_remove:
+            print(f"Removing {len(tasks_to_remove)} unselected tasks")
+            AssignedTask.objects.filter(land=land, task__name__in=tasks_to_remove).delete()
+        
+        # Handle employee assignments for existing tasks - support multiple employees per task
+        tasks_with_employee_changes = []  # Track tasks with employee changes
+        if task_employee_selections:
+            print(f"Processing employee selections for existing tasks: {task_employee_selections}")
+            for task_name in tasks_to_keep:
+                if task_name in task_employee_selections and task_employee_selections[task_name]:
+                    new_employee_names = task_employee_selections[task_name]
+                    print(f"Processing employee assignments for existing task '{task_name}': {new_employee_names}")
+                    
+                    # Parse employee names (comma-separated string)
+                    if isinstance(new_employee_names, str):
+                        employee_name_list = [name.strip() for name in new_employee_names.split(',') if name.strip()]
+                    else:
+                        employee_name_list = [new_employee_names]
+                    
+                    print(f"Employee list for task '{task_name}': {employee_name_list}")
+                    
+                    # Get current assignments for this task
+                    current_task_assignments = current_assignments.filter(task__name=task_name)
+                    current_employee_names = [assignment.employee.full_name for assignment in current_task_assignments]
+                    
+                    print(f"Current employees for task '{task_name}': {current_employee_names}")
+                    print(f"New employees for task '{task_name}': {employee_name_list}")
+                    
+                    # Find the task object
+                    task = Task.objects.filter(name=task_name).first()
+                    if not task:
+                        print(f"WARNING: Task not found: {task_name}")
+                        continue
+                    
+                    # Remove assignments for employees no longer selected
+                    employees_to_remove = set(current_employee_names) - set(employee_name_list)
+                    if employees_to_remove:
+                        print(f"Removing {len(employees_to_remove)} unselected employees for task '{task_name}': {employees_to_remove}")
+                        for employee_name in employees_to_remove:
+                            employee = User.objects.filter(
+                                full_name__iexact=employee_name,
+                                role='employee',
+                                status='active'
+                            ).first()
+                            if employee:
+                                AssignedTask.objects.filter(
+                                    land=land,
+                                    task=task,
+                                    employee=employee
+                                ).delete()
+                                print(f"  ✓ Removed assignment: {task_name} -> {employee_name}")
+                    
+                    # Add/update assignments for newly selected employees
+                    for employee_name in employee_name_list:
+                        employee = User.objects.filter(
+                            full_name__iexact=employee_name,
+                            role='employee',
+                            status='active'
+                        ).first()
+                        
+                        if not employee:
+                            # Try to find by username as fallback
+                            employee = User.objects.filter(
+                                username__iexact=employee_name,
+                                role='employee',
+                                status='active'
+                            ).first()
+                        
+                        if employee:
+                            # Check if assignment already exists
+                            existing_assignment = AssignedTask.objects.filter(
+                                land=land,
+                                task=task,
+                                employee=employee
+                            ).first()
+                            
+                            if existing_assignment:
+                                print(f"  - Assignment already exists: {task_name} -> {employee_name}")
+                            else:
+                                # Create new assignment
+                                # Get completion days for this task
+                                custom_completion_days = None
+                                if task_completion_days and task_name in task_completion_days:
+                                    custom_completion_days = task_completion_days[task_name].get('days', task.completion_days)
+                                else:
+                                    custom_completion_days = task.completion_days
+                                
+                                new_assignment = AssignedTask.objects.create(
+                                    land=land,
+                                    task=task,
+                                    employee=employee,
+                                    status='pending',
+                                    completion_days=custom_completion_days,
+                                    due_date=timezone.now() + timezone.timedelta(days=custom_completion_days) if custom_completion_days > 0 else None
+                                )
+                                print(f"  ✓ Created new assignment: {task_name} -> {employee_name}")
+                                
+                                # Track that this task had employee changes
+                                if task_name not in tasks_with_employee_changes:
+                                    tasks_with_employee_changes.append(task_name)
+                                
+                                # Ensure TaskManage relationship exists
+                                task_manage, created = TaskManage.objects.get_or_create(
+                                    task=task,
+                                    employee=employee
+                                )
+                                if created:
+                                    print(f"    Created TaskManage relationship: {task_name} -> {employee_name}")
+                        else:
+                            print(f"  WARNING: Employee not found: {employee_name}")
+        
+        # Update completion days for existing tasks if they changed
+        if task_completion_days:
+            print(f"Checking for completion days updates in {len(task_completion_days)} tasks")
+            for task_name, completion_data in task_completion_days.items():
+                if task_name in current_task_names:
+                    # Get ALL assignments for this task (not just the first one)
+                    task_assignments = current_assignments.filter(task__name=task_name)
+                    if task_assignments.exists():
+                        first_assignment = task_assignments.first()
+                        new_days = completion_data.get('days', first_assignment.completion_days)
+                        
+                        # Update ALL assignments for this task with the new completion days
+                        updated_count = 0
+                        for assignment in task_assignments:
+                            if new_days != assignment.completion_days:
+                                old_days = assignment.completion_days
+                                assignment.completion_days = new_days
+                                assignment.due_date = timezone.now() + timezone.timedelta(days=new_days) if new_days > 0 else None
+                                assignment.save()
+                                updated_count += 1
+                                print(f"  ✓ Updated completion days for '{task_name}' (Employee: {assignment.employee.full_name}): {old_days} -> {new_days} days")
+                        
+                        if updated_count == 0:
+                            print(f"  - Completion days unchanged for '{task_name}': {new_days} days (all {task_assignments.count()} employees)")
+                        else:
+                            print(f"  ✓ Updated completion days for {updated_count} employees assigned to '{task_name}'")
+        
+        # Create new assignments for newly added tasks
+        pending_notifications = []
+        if tasks_to_add:
+            print(f"Creating new assignments for {len(tasks_to_add)} newly added tasks")
+            for task_name in tasks_to_add:
+                # Check if user has selected specific employees for this task
+                if task_employee_selections and task_name in task_employee_selections:
+                    selected_employee_names = task_employee_selections[task_name]
+                    print(f"  Using user-selected employees for '{task_name}': {selected_employee_names}")
+                    
+                    # Handle both single employee (string) and multiple employees (comma-separated)
+                    if isinstance(selected_employee_names, str):
+                        employee_name_list = [name.strip() for name in selected_employee_names.split(',') if name.strip()]
+                    else:
+                        employee_name_list = [selected_employee_names]
+                    
+                    for employee_name in employee_name_list:
+                        # Find employee by name
+                        employee = User.objects.filter(
+                            full_name__iexact=employee_name,
+                            role='employee',
+                            status='active'
+                        ).first()
+                        
+                        if not employee:
+                            # Try to find by username as fallback
+                            employee = User.objects.filter(
+                                username__iexact=employee_name,
+                                role='employee',
+                                status='active'
+                            ).first()
+                        
+                        if employee:
+                            # Create new assignment with selected employee
+                            task = Task.objects.filter(name=task_name).first()
+                            if task:
+                                # Check if custom completion days are provided for this task
+                                custom_completion_days = None
+                                if task_name in task_completion_days:
+                                    custom_completion_days = task_completion_days[task_name].get('days', task.completion_days)
+                                    print(f"      Using custom completion days: {custom_completion_days} (original: {task.completion_days})")
+                                else:
+                                    custom_completion_days = task.completion_days
+                                    print(f"      Using default completion days: {custom_completion_days}")
+                                
+                                assigned_task, created = AssignedTask.objects.get_or_create(
+                                    land=land,
+                                    task=task,
+                                    employee=employee,
+                                    defaults={
+                                        'status': 'pending',
+                                        'completion_days': custom_completion_days,
+                                        'due_date': timezone.now() + timezone.timedelta(days=custom_completion_days) if custom_completion_days > 0 else None
+                                    }
+                                )
+                                if created:
+                                    print(f"    ✓ Created new assignment: {task_name} -> {employee.full_name}")
+                                    
+                                    # Queue notification for employee about new task assignment
+                                    pending_notifications.append((employee, f"New task '{task_name}' has been assigned to you for land '{land.name}'"))
+                                else:
+                                    print(f"    - Assignment already exists: {task_name} -> {employee.full_name}")
+                                
+                                # Ensure TaskManage relationship exists
+                                task_manage, created = TaskManage.objects.get_or_create(
+                                    task=task,
+                                    employee=employee
+                                )
+                                if created:
+                                    print(f"      Created TaskManage relationship: {task_name} -> {employee.full_name}")
+                            else:
+                                print(f"    WARNING: Task not found: {task_name}")
+                        else:
+                            print(f"    WARNING: Employee not found: {employee_name}")
+                else:
+                    # No employees selected for new task - don't assign to anyone
+                    print(f"  No employees selected for '{task_name}' - task will not be assigned")
+        
+        notify_many(pending_notifications)
+        
+        # Summary
+        total_assignments = AssignedTask.objects.filter(land=land).count()
+        print(f"\nUpdate Summary:")
+        print(f"  Tasks removed: {len(tasks_to_remove)}")
+        print(f"  Tasks updated: {len(tasks_with_employee_changes)}")
+        print(f"  Tasks added: {len(tasks_to_add)}")
+        print(f"  Total assignments after update: {total_assignments}")
+        
+        if tasks_to_remove or tasks_with_employee_changes or tasks_to_add:
+            return True, f"Successfully updated task assignments. Removed: {len(tasks_to_remove)}, Updated: {len(tasks_with_employee_changes)}, Added: {len(tasks_to_add)}"
+        else:
+            return True, "No changes needed - existing assignments remain unchanged"
+        
+    except Exception as e:
+        print(f"Error in update_assigned_tasks_for_land: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        return False, f"Error updating task assignments: {str(e)}"
+
+@login_required
+def update_task_status(request, assigned_task_id):
+    """
+    Update the status of an assigned task (pending/complete)
+    """
+    if request.method != 'POST':
+        return JsonResponse({'success': False, 'message': 'Invalid request method'})
+    
+    if not request.user.is_authenticated or request.user.role != 'employee':
+        return JsonResponse({'success': False, 'message': 'Unauthorized access'})
+    
+    try:
+        from ..models import AssignedTask
+        assigned_task = get_object_or_404(AssignedTask, id=assigned_task_id, employee=request.user)
+        
+        new_status = request.POST.get('status')
+        if new_status not in ['pending', 'complete']:
+            return JsonResponse({'success': False, 'message': 'Invalid status'})
+        
+        assigned_task.status = new_status
+        if new_status == 'complete':
+            assigned_task.completed_date = timezone.now()
+        else:
+            assigned_task.completed_date = None
+        
+        assigned_task.save(update_fields=['status', 'completed_date'])
+        
+        # Create notification for admin about task status change
+        notify_admins(f"Task '{assigned_task.task.name}' status changed to {new_status} by {request.user.get_display_name()}")
+        
+        return JsonResponse({
+            'success': True, 
+            'message': f'Task status updated to {new_status}',
+            'new_status': new_status,
+            'completed_date': assigned_task.completed_date.isoformat() if assigned_task.completed_date else None
+        })
+        
+    except Exception as e:
+        return JsonResponse({'success': False, 'message': f'Error updating task: {str(e)}'})
+
+@login_required
+def get_employee_task_details(request, assigned_task_id):
+    """
+    Get detailed information about a specific assigned task
+    """
+    if not request.user.is_authenticated or request.user.role != 'employee':
+        return JsonResponse({'success': False, 'message': 'Unauthorized access'})
+    
+    try:
+        from ..models import AssignedTask
+        assigned_task = get_object_or_404(AssignedTask, id=assigned_task_id, employee=request.user)
+        
+        task_data = {
+            'id': assigned_task.id,
+            'land_name': assigned_task.land.name,
+            'land_id': assigned_task.land.id,
+            'task_name': assigned_task.task.name,
+            'status': assigned_task.status,
+            'assigned_date': assigned_task.assigned_date.strftime('%Y-%m-%d %H:%M'),
+            'completed_date': assigned_task.completed_date.strftime('%Y-%m-%d %H:%M') if assigned_task.completed_date else None,
+            'admin_approval_notes': assigned_task.admin_approval_notes,
+            'land_details': {
+                'state': assigned_task.land.state,
+                'district': assigned_task.land.district.name,
+                'taluka': assigned_task.land.taluka.name,
+                'village': assigned_task.land.village.name,
+                'sata_prakar': assigned_task.land.sata_prakar,
+                'total_area': str(assigned_task.land.total_area),
+                'built_up_area': str(assigned_task.land.built_up_area) if assigned_task.land.built_up_area else None,
+                'unutilized_area': str(assigned_task.land.unutilized_area) if assigned_task.land.unutilized_area else None,
+                'broker_name': assigned_task.land.broker_name,
+                'past_date': assigned_task.land.past_date.strftime('%Y-%m-%d') if assigned_task.land.past_date else None,
+                'soda_tarikh': assigned_task.land.soda_tarikh.strftime('%Y-%m-%d') if assigned_task.land.soda_tarikh else None,
+                'banakhat_tarikh': assigned_task.land.banakhat_tarikh.strftime('%Y-%m-%d') if assigned_task.land.banakhat_tarikh else None,
+                'dastavej_tarikh': assigned_task.land.dastavej_tarikh.strftime('%Y-%m-%d') if assigned_task.land.dastavej_tarikh else None,
+                'old_sr_no': assigned_task.land.old_sr_no,
+                'new_sr_no': assigned_task.land.new_sr_no,
+            }
+        }
+        
+        return JsonResponse({'success': True, 'task_data': task_data})
+        
+    except Exception as e:
+        return JsonResponse({'success': False, 'message': f'Error fetching task details: {str(e)}'})
+
+@login_required
+def get_land_task_employees(request, land_id, task_id):
+    """
+    Get all available employees for a task and current assignments for a specific land
+    """
+    if not request.user.is_authenticated or request.user.role != 'admin':
+        return JsonResponse({'success': False, 'message': 'Unauthorized access'})
+    
+    try:
+        from ..models import Land, Task, AssignedTask, User, TaskManage
+        
+        # Get the land and task
+        land = get_object_or_404(Land, id=land_id)
+        task = get_object_or_404(Task, id=task_id)
+        
+        # Get all employees who can be assigned to this task (from TaskManage)
+        available_employees = User.objects.filter(
+            task_manages__task=task,
+            role='employee',
+            status='active'
+        ).distinct().order_by('full_name', 'username')
+        
+        # Get current assignments for this land and task
+        current_assignments = AssignedTask.objects.filter(
+            land=land,
+            task=task
+        ).select_related('employee')
+        
+        # Create a set of currently assigned employee IDs for quick lookup
+        assigned_employee_ids = {assignment.employee.id for assignment in current_assignments}
+        
+        # Format the data - include all available employees with their current status
+        all_employees = []
+        for employee in available_employees:
+            # Check if this employee is currently assigned to this land+task
+            current_assignment = current_assignments.filter(employee=employee).first()
+            
+            if current_assignment:
+                # Employee is currently assigned
+                all_employees.append({
+                    'id': employee.id,
+                    'employee_name': employee.full_name or employee.username,
+                    'status': current_assignment.status,
+                    'is_assigned': True,
+                    'assigned_date': current_assignment.assigned_date.strftime('%Y-%m-%d %H:%M'),
+                    'completed_date': current_assignment.completed_date.strftime('%Y-%m-%d %H:%M') if current_assignment.completed_date else None
+                })
+            else:
+                # Employee is available but not currently assigned
+                all_employees.append({
+                    'id': employee.id,
+                    'employee_name': employee.full_name or employee.username,
+                    'status': 'available',
+                    'is_assigned': False,
+                    'assigned_date': None,
+                    'completed_date': None
+                })
+        
+        return JsonResponse({
+            'success': True,
+            'assigned_employees': all_employees,
+            'land_name': land.name,
+            'task_name': task.name,
+            'total_available': len(all_employees),
+            'currently_assigned': len([emp for emp in all_employees if emp['is_assigned']])
+        })
+        
+    except Exception as e:
+        return JsonResponse({'success': False, 'message': f'Error fetching employee assignments: {str(e)}'})
+
+@login_required
+def get_employees_for_tasks(request):
+    """
+    Get employees for task assignment (excluding marketing type)
+    """
+    if not request.user.is_authenticated or request.user.role != 'admin':
+        return JsonResponse({'success': False, 'message': 'Unauthorized access'})
+    
+    try:
+        from ..models import User
+        
+        # Get all active employees excluding marketing type
+        employees = User.objects.filter(
+            role='employee', 
+            status='active'
+        ).exclude(
+            employee_type='marketing'
+        ).order_by('full_name', 'username')
+        
+        # Format employee data
+        employees_data = []
+        for employee in employees:
+            employees_data.append({
+                'id': employee.id,
+                'username': employee.username,
+                'full_name': employee.full_name,
+                'employee_type': employee.employee_type,
+                'email': employee.email,
+                'status': employee.status
+            })
+        
+        return JsonResponse({
+            'success': True,
+            'employees': employees_data,
+            'count': len(employees_data)
+        })
+        
+    except Exception as e:
+        return JsonResponse({
+            'success': False, 
+            'message': f'Error fetching employees: {str(e)}'
+        })
+
+@login_required
+def approve_task_completion(request, task_id):
+    """
+    Admin approves or rejects a task completion request
+    """
+    if not request.user.is_authenticated or request.user.role != 'admin':
+        return JsonResponse({'success': False, 'message': 'Unauthorized access'})
+    
+    if request.method != 'POST':
+        return JsonResponse({'success': False, 'message': 'Invalid request method'})
+    
+    try:
+        from ..models import AssignedTask
+        
+        # Get the assigned task
+        assigned_task = get_object_or_404(AssignedTask, id=task_id)
+        
+        # Get action and notes from request
+        action = request.POST.get('action')  # 'approve' or 'reject'
+        admin_notes = request.POST.get('admin_notes', '')
+        
+        if action == 'approve':
+            # Approve the task completion
+            assigned_task.approve_completion(admin_notes)
+            
+            # Complete the task for everyone else assigned to it on the same land too
+            team_member_ids = _complete_team_assignments(assigned_task)
+            completed_count = len(team_member_ids)
+            
+            # Create notification for each affected employee
+            notify(team_member_ids, f"Task '{assigned_task.task.name}' has been completed (approved for team member {assigned_task.employee.get_display_name()})")
+            
+            if completed_count > 0:
+                message = f'Task "{assigned_task.task.name}" approved successfully! Also completed for {completed_count} other team member(s).'
+            else:
+                message = f'Task "{assigned_task.task.name}" approved successfully!'
+            status = 'complete'
+        elif action == 'reject':
+            # Reject the task completion
+            assigned_task.reject_completion(admin_notes)
+            message = f'Task "{assigned_task.task.name}" rejected and returned to employee.'
+            status = 'in_progress'
+        else:
+            return JsonResponse({'success': False, 'message': 'Invalid action specified'})
+        
+        return JsonResponse({
+            'success': True,
+            'message': message,
+            'task_id': task_id,
+            'new_status': status
+        })
+        
+    except AssignedTask.DoesNotExist:
+        return JsonResponse({'success': False, 'message': 'Task not found'})
+    except Exception as e:
+        return JsonResponse({'success': False, 'message': f'Error processing request: {str(e)}'})
+
+@login_required
+def admin_assigned_tasks_api(request):
+    """API endpoint for admin to get all assigned tasks with filtering and pagination"""
+    if not request.user.is_authenticated or request.user.role != 'admin':
+        return JsonResponse({'error': 'Unauthorized access'}, status=403)
+    
+    try:
+        from ..models import AssignedTask
+        from django.core.paginator import Paginator
+        from django.db.models import Q
+        
+        # Get query parameters
+        page = int(request.GET.get('page', 1))
+        page_size = int(request.GET.get('page_size', 10))
+        status_filter = request.GET.get('status', '')
+        task_filter = request.GET.get('task', '')
+        employee_filter = request.GET.get('employee', '')
+        land_filter = request.GET.get('land', '')
+        search_query = request.GET.get('search', '')
+        
+        # Build queryset
+        queryset = AssignedTask.objects.select_related(
+            'task', 'land', 'employee'
+        ).all()
+        
+        # Apply filters
+        if status_filter:
+            queryset = queryset.filter(status=status_filter)
+        
+        if task_filter:
+            queryset = queryset.filter(task_id=task_filter)
+        
+        if employee_filter:
+            queryset = queryset.filter(employee_id=employee_filter)
+        
+        if land_filter:
+            queryset = queryset.filter(land_id=land_filter)
+        
+        if search_query:
+            queryset = search.search_filter(queryset, search.ASSIGNED_TASK, search_query)
+        
+        # Order by assigned date (newest first)
+        queryset = queryset.order_by('-assigned_date')
+        
+        # Paginate results
+        paginator = Paginator(queryset, page_size)
+        page_obj = paginator.get_page(page)
+        
+        # Serialize data
+        tasks_data = []
+        for task in page_obj:
+            task_data = {
+                'id': task.id,
+                'task': {
+                    'id': task.task.id,
+                    'name': task.task.name,
+                    'position': task.task.position
+                },
+                'land': {
+                    'id': task.land.id,
+                    'name': task.land.name,
+                    'village_name': task.land.village.name,
+                    'taluka': task.land.taluka.name,
+                    'district': task.land.district.name,
+                    'total_area': str(task.land.total_area) if task.land.total_area else None
+                },
+                'employee': {
+                    'id': task.employee.id,
+                    'username': task.employee.username,
+                    'full_name': task.employee.full_name,
+                    'employee_type': task.employee.employee_type,
+                    'location': task.employee.location
+                },
+                'status': task.status,
+                'assigned_date': task.assigned_date.isoformat(),
+                'due_date': task.due_date.isoformat() if task.due_date else None,
+                'completion_days': task.completion_days,
+                'started_date': task.started_date.isoformat() if task.started_date else None,
+                'completed_date': task.completed_date.isoformat() if task.completed_date else None,
+                'completion_notes': task.completion_notes,
+                'completion_photos': task.completion_photos.url if task.completion_photos else None,
+                'completion_pdf': task.completion_pdf.url if task.completion_pdf else None,
+                'completion_submitted_date': task.completion_submitted_date.isoformat() if task.completion_submitted_date else None,
+                'admin_approval_date': task.admin_approval_date.isoformat() if task.admin_approval_date else None,
+                'admin_approval_notes': task.admin_approval_notes
+            }
+            tasks_data.append(task_data)
+        
+        return JsonResponse({
+            'count': paginator.count,
+            'total_pages': paginator.num_pages,
+            'current_page': page,
+            'results': tasks_data
+        })
+        
+    except Exception as e:
+        return JsonResponse({'error': str(e)}, status=500)
+
+@login_required
+def admin_assigned_tasks_statistics_api(request):
+    """API endpoint for admin to get assigned tasks statistics"""
+    if not request.user.is_authenticated or request.user.role != 'admin':
+        return JsonResponse({'error': 'Unauthorized access'}, status=403)
+    
+    try:
+        from ..models import AssignedTask
+        
+        # Get counts for each status
+        stats = {
+            'pending': AssignedTask.objects.filter(status='pending').count(),
+            'in_progress': AssignedTask.objects.filter(status='in_progress').count(),
+            'pending_approval': AssignedTask.objects.filter(status='pending_approval').count(),
+            'complete': AssignedTask.objects.filter(status='complete').count(),
+            'total': AssignedTask.objects.count()
+        }
+        
+        return JsonResponse(stats)
+        
+    except Exception as e:
+        return JsonResponse({'error': str(e)}, status=500)
+
+@login_required
+def admin_assigned_task_detail_api(request, task_id):
+    """API endpoint for admin to get detailed information about a specific assigned task"""
+    if not request.user.is_authenticated or request.user.role != 'admin':
+        return JsonResponse({'error': 'Unauthorized access'}, status=403)
+    
+    try:
+        from ..models import AssignedTask
+        
+        task = get_object_or_404(AssignedTask, id=task_id)
+        
+        task_data = {
+            'id': task.id,
+            'task': {
+                'id': task.task.id,
+                'name': task.task.name,
+                'position': task.task.position,
+                'completion_days': task.task.completion_days
+            },
+            'land': {
+                'id': task.land.id,
+                'name': task.land.name,
+                'village_name': task.land.village.name,
+                'taluka': task.land.taluka.name,
+                'district': task.land.district.name,
+                'state': task.land.state,
+                'old_sr_no': task.land.old_sr_no,
+                'new_sr_no': task.land.new_sr_no,
+                'sata_prakar': task.land.sata_prakar,
+                'built_up_area': str(task.land.built_up_area) if task.land.built_up_area else None,
+                'unutilized_area': str(task.land.unutilized_area) if task.land.unutilized_area else None,
+                'total_area': str(task.land.total_area) if task.land.total_area else None,
+                'broker_name': task.land.broker_name,
+                'past_date': task.land.past_date.strftime('%Y-%m-%d') if task.land.past_date else None,
+                'soda_tarikh': task.land.soda_tarikh.strftime('%Y-%m-%d') if task.land.soda_tarikh else None,
+                'banakhat_tarikh': task.land.banakhat_tarikh.strftime('%Y-%m-%d') if task.land.banakhat_tarikh else None,
+                'dastavej_tarikh': task.land.dastavej_tarikh.strftime('%Y-%m-%d') if task.land.dastavej_tarikh else None
+            },
+            'employee': {
+                'id': task.employee.id,
+                'username': task.employee.username,
+                'full_name': task.employee.full_name,
+                'email': task.employee.email,
+                'mobile': task.employee.mobile,
+                'employee_type': dict(User.EMPLOYEE_TYPE_CHOICES).get(task.employee.employee_type, task.employee.employee_type) if task.employee.employee_type else 'Not specified',
+                'location': task.employee.location if task.employee.location else 'Not specified',
+                'address': task.employee.address
+            },
+            'status': task.status,
+            'assigned_date': task.assigned_date.isoformat(),
+            'due_date': task.due_date.isoformat() if task.due_date else None,
+            'completion_days': task.completion_days,
+            'started_date': task.started_date.isoformat() if task.started_date else None,
+            'completed_date': task.completed_date.isoformat() if task.completed_date else None,
+            'completion_notes': task.completion_notes,
+            'completion_photos': task.completion_photos.url if task.completion_photos else None,
+            'completion_pdf': task.completion_pdf.url if task.completion_pdf else None,
+            'completion_submitted_date': task.completion_submitted_date.isoformat() if task.completion_submitted_date else None,
+            'admin_approval_date': task.admin_approval_date.isoformat() if task.admin_approval_date else None,
+            'admin_approval_notes': task.admin_approval_notes
+        }
+        
+        return JsonResponse(task_data)
+        
+    except AssignedTask.DoesNotExist:
+        return JsonResponse({'error': 'Task not found'}, status=404)
+    except Exception as e:
+        return JsonResponse({'error': str(e)}, status=500)
+
+@login_required
+def get_employee_tasks_api(request, employee_id):
+    """API endpoint to get all marketing tasks (not employee-specific)"""
+    # Allow admin and marketing employees to access this endpoint
+    if not request.user.is_authenticated or not is_marketing_or_admin(request.user):
+        return JsonResponse({'error': 'Unauthorized'}, status=403)
+    
+    try:
+        # Get the user/employee for display name
+        employee = User.objects.get(id=employee_id)
+        
+        # Get all marketing tasks (not filtered by employee assignment)
+        marketing_tasks = Task.objects.filter(
+            marketing_task=True
+        ).order_by('position', 'name')
+        
+        # Format tasks data
+        tasks_data = []
+        for task in marketing_tasks:
+            tasks_data.append({
+                'id': task.id,
+                'name': task.name,
+                'completion_days': task.completion_days,
+                'position': task.position
+            })
+        
+        return JsonResponse({
+            'success': True,
+            'employee_name': employee.full_name or employee.username,
+            'tasks': tasks_data
+        })
+        
+    except User.DoesNotExist:
+        return JsonResponse({'error': 'Employee not found'}, status=404)
+    except Exception as e:
+        return JsonResponse({'error': str(e)}, status=500)
+
+@login_required
+def admin_assigned_task_delete_api(request, task_id):
+    """API endpoint for admin to delete an assigned task"""
+    if not request.user.is_authenticated or request.user.role != 'admin':
+        return JsonResponse({'error': 'Unauthorized access'}, status=403)
+    
+    if request.method != 'DELETE':
+        return JsonResponse({'error': 'Method not allowed'}, status=405)
+    
+    try:
+        from ..models import AssignedTask
+        
+        task = get_object_or_404(AssignedTask, id=task_id)
+        
+        # Prevent deletion of completed tasks
+        if task.status == 'complete':
+            return JsonResponse({'error': 'Cannot delete completed tasks'}, status=400)
+        
+        # Prevent deletion of tasks pending approval
+        if task.status == 'pending_approval':
+            return JsonResponse({'error': 'Cannot delete tasks pending approval. Please approve or reassign first.'}, status=400)
+        
+        # Store task info for logging
+        task_info = f"Task {task.id}: {task.task.name} on {task.land.name} assigned to {task.employee.get_display_name()}"
+        
+        # Delete the task
+        task.delete()
+        
+        return JsonResponse({
+            'message': 'Task deleted successfully',
+            'deleted_task': task_info
+        })
+        
+    except AssignedTask.DoesNotExist:
+        return JsonResponse({'error': 'Task not found'}, status=404)
+    except Exception as e:
+        return JsonResponse({'error': str(e)}, status=500)
+
+@login_required
+def admin_assigned_task_approve_api(request, task_id):
+    """API endpoint for admin to approve task completion from admin assigned tasks page"""
+    if not request.user.is_authenticated or request.user.role != 'admin':
+        return JsonResponse({'error': 'Unauthorized access'}, status=403)
+    
+    if request.method != 'POST':
+        return JsonResponse({'error': 'Method not allowed'}, status=405)
+    
+    try:
+        import json
+        from ..models import AssignedTask
+        
+        # Parse JSON data
+        data = json.loads(request.body)
+        admin_notes = data.get('admin_notes', '')
+        
+        task = get_object_or_404(AssignedTask, id=task_id)
+        
+        # Check if task is in pending_approval status
+        if task.status != 'pending_approval':
+            return JsonResponse({'error': 'Task is not in pending approval status'}, status=400)
+        
+        # Approve completion
+        task.approve_completion(admin_notes)
+        
+        # Create notification for employee
+        notify([task.employee], f"Task '{task.task.name}' completion has been approved by admin")
+        
+        return JsonResponse({'message': 'Task approved successfully'})
+        
+    except AssignedTask.DoesNotExist:
+        return JsonResponse({'error': 'Task not found'}, status=404)
+    except json.JSONDecodeError:
+        return JsonResponse({'error': 'Invalid JSON data'}, status=400)
+    except Exception as e:
+        return JsonResponse({'error': str(e)}, status=500)
+
+@login_required
+def admin_assigned_task_reassign_api(request, task_id):
+    """API endpoint for admin to reassign task from admin assigned tasks page"""
+    if not request.user.is_authenticated or request.user.role != 'admin':
+        return JsonResponse({'error': 'Unauthorized access'}, status=403)
+    
+    if request.method != 'POST':
+        return JsonResponse({'error': 'Method not allowed'}, status=405)
+    
+    try:
+        import json
+        from ..models import AssignedTask
+        
+        # Parse JSON data
+        data = json.loads(request.body)
+        reassignment_notes = data.get('reassignment_notes', '')
+        
+        if not reassignment_notes.strip():
+            return JsonResponse({'error': 'Reassignment notes are required'}, status=400)
+        
+        task = get_object_or_404(AssignedTask, id=task_id)
+        
+        # Check if task is in pending_approval status
+        if task.status != 'pending_approval':
+            return JsonResponse({'error': 'Task is not in pending approval status'}, status=400)
+        
+        # Reassign the task
+        task.status = 'in_progress'
+        task.assigned_date = datetime.datetime.now()
+        task.admin_approval_notes = f"Task reassigned with notes: {reassignment_notes}".strip()
+        task.save(update_fields=['status', 'assigned_date', 'admin_approval_notes'])
+        
+        # Create notification for employee
+        notify([task.employee], f"Task '{task.task.name}' has been reassigned to you with new instructions")
+        
+        return JsonResponse({'message': 'Task reassigned successfully'})
+        
+    except AssignedTask.DoesNotExist:
+        return JsonResponse({'error': 'Task not found'}, status=404)
+    except json.JSONDecodeError:
+        return JsonResponse({'error': 'Invalid JSON data'}, status=400)
+    except Exception as e:
+        return JsonResponse({'error': str(e)}, status=500)
+
+@login_required
+def admin_assigned_tasks_bulk_reassign_api(request):
+    """API endpoint for admin to reassign many assigned tasks to another employee at once"""
+    if not request.user.is_authenticated or request.user.role != 'admin':
+        return JsonResponse({'error': 'Unauthorized access'}, status=403)
+    
+    if request.method != 'POST':
+        return JsonResponse({'error': 'Method not allowed'}, status=405)
+    
+    try:
+        data = json.loads(request.body)
+        
+        try:
+            to_employee = User.objects.get(id=data.get('to_employee'), role='employee', status='active')
+        except (User.DoesNotExist, ValueError, TypeError):
+            return JsonResponse({'error': 'Target employee not found or inactive'}, status=400)
+        
+        from_employee = land = task = None
+        if data.get('from_employee'):
+            from_employee = User.objects.filter(id=data['from_employee'], role='employee').first()
+            if not from_employee:
+                return JsonResponse({'error': 'Source employee not found'}, status=404)
+        if data.get('land'):
+            land = Land.objects.filter(id=data['land']).first()
+            if not land:
+                return JsonResponse({'error': 'Land not found'}, status=404)
+        if data.get('task'):
+            task = Task.objects.filter(id=data['task']).first()
+            if not task:
+                return JsonResponse({'error': 'Task not found'}, status=404)
+        
+        statuses = data.get('statuses') or None
+        if statuses and not set(statuses) <= {choice for choice, _ in AssignedTask.STATUS_CHOICES}:
+            return JsonResponse({'error': 'Invalid status filter'}, status=400)
+        
+        try:
+            report = bulk_operations.bulk_reassign_tasks(
+                to_employee,
+                task_ids=data.get('task_ids'),
+                from_employee=from_employee,
+                statuses=statuses,
+                land=land,
+                task=task,
+                notes=data.get('reassignment_notes', ''),
+            )
+        except ValueError as e:
+            return JsonResponse({'error': str(e)}, status=400)
+        
+        # One summarized notification per affected employee
+        pending_notifications = [
+            (employee_id, f"{count} of your task(s) have been reassigned to {to_employee.get_display_name()}")
+            for employee_id, count in report['per_employee'].items()
+        ]
+        if report['reassigned']:
+            pending_notifications.append((to_employee, f"{report['reassigned']} task(s) have been reassigned to you"))
+        notify_many(pending_notifications)
+        
+        return JsonResponse({
+            'message': f"{report['reassigned']} task(s) reassigned to {to_employee.get_display_name()}",
+            'reassigned': report['reassigned'],
+            'conflicts': report['conflicts'],
+            'failures': report['failures'],
+        })
+        
+    except json.JSONDecodeError:
+        return JsonResponse({'error': 'Invalid JSON data'}, status=400)
+    except Exception as e:
+        return JsonResponse({'error': str(e)}, status=500)
+
+@login_required
+def admin_assigned_tasks_bulk_action_api(request):
+    """API endpoint for admin to approve, reject or mark complete many assigned tasks at once"""
+    if not request.user.is_authenticated or request.user.role != 'admin':
+        return JsonResponse({'error': 'Unauthorized access'}, status=403)
+    
+    if request.method != 'POST':
+        return JsonResponse({'error': 'Method not allowed'}, status=405)
+    
+    try:
+        data = json.loads(request.body)
+        action = data.get('action', '')
+        task_ids = data.get('task_ids', [])
+        admin_notes = data.get('admin_notes', '')
+        
+        if action not in bulk_operations.TASK_TRANSITIONS:
+            return JsonResponse({'error': 'Invalid action specified'}, status=400)
+        if not task_ids:
+            return JsonResponse({'error': 'No tasks selected'}, status=400)
+        
+        results, changed = bulk_operations.bulk_transition_tasks(task_ids, action, admin_notes)
+        
+        # Create notification for each affected employee in one insert
+        messages_by_action = {
+            'approve': "Task '{}' completion has been approved by admin",
+            'reject': "Task '{}' completion has been rejected by admin. Please review and resubmit.",
+            'mark_complete': "Task '{}' has been manually marked as complete by admin",
+        }
+        notify_many([
+            (employee_id, messages_by_action[action].format(task_name))
+            for _, employee_id, task_name in changed
+        ])
+        
+        return JsonResponse({
+            'message': f'{len(changed)} of {len(results)} task(s) updated',
+            'updated': len(changed),
+            'results': results,
+        })
+        
+    except json.JSONDecodeError:
+        return JsonResponse({'error': 'Invalid JSON data'}, status=400)
+    except Exception as e:
+        return JsonResponse({'error': str(e)}, status=500)
+
+@login_required
+def admin_assigned_task_mark_complete_api(request, task_id):
+    """API endpoint for admin to manually mark a task as complete"""
+    if not request.user.is_authenticated or request.user.role != 'admin':
+        return JsonResponse({'error': 'Unauthorized access'}, status=403)
+    
+    if request.method != 'POST':
+        return JsonResponse({'error': 'Method not allowed'}, status=405)
+    
+    try:
+        import json
+        from ..models import AssignedTask
+        
+        # Parse JSON data
+        data = json.loads(request.body)
+        mark_complete_notes = data.get('mark_complete_notes', '')
+        
+        task = get_object_or_404(AssignedTask, id=task_id)
+        
+        # Check if task can be marked complete
+        if task.status == 'complete':
+            return JsonResponse({'error': 'Task is already complete'}, status=400)
+        
+        if task.status == 'pending_approval':
+            return JsonResponse({'error': 'Task is pending approval. Please approve or reassign instead.'}, status=400)
+        
+        # Mark task as complete with admin notes
+        task.status = 'complete'
+        task.completed_date = datetime.datetime.now()
+        task.admin_approval_date = datetime.datetime.now()
+        task.admin_approval_notes = f"Task manually marked complete by admin: {mark_complete_notes}".strip()
+        task.save(update_fields=['status', 'completed_date', 'admin_approval_date', 'admin_approval_notes'])
+        
+        # Create notification for employee
+        notify([task.employee], f"Task '{task.task.name}' has been manually marked as complete by admin")
+        
+        return JsonResponse({'message': 'Task marked as complete successfully'})
+        
+    except AssignedTask.DoesNotExist:
+        return JsonResponse({'error': 'Task not found'}, status=404)
+    except json.JSONDecodeError:
+        return JsonResponse({'error': 'Invalid JSON data'}, status=400)
+    except Exception as e:
+        return JsonResponse({'error': str(e)}, status=500)
+
+@login_required
+def admin_assigned_tasks_export_api(request):
+    """API endpoint for admin to export assigned tasks data"""
+    if not request.user.is_authenticated or request.user.role != 'admin':
+        return JsonResponse({'error': 'Unauthorized access'}, status=403)
+    
+    try:
+        from ..models import AssignedTask
+        from django.db.models import Q
+        import csv
+        from django.http import HttpResponse
+        
+        # Get filter parameters
+        status_filter = request.GET.get('status', '')
+        task_filter = request.GET.get('task', '')
+        employee_filter = request.GET.get('employee', '')
+        land_filter = request.GET.get('land', '')
+        search_query = request.GET.get('search', '')
+        
+        # Build queryset
+        queryset = AssignedTask.objects.select_related(
+            'task', 'land', 'employee'
+        ).all()
+        
+        # Apply filters
+        if status_filter:
+            queryset = queryset.filter(status=status_filter)
+        
+        if task_filter:
+            queryset = queryset.filter(task_id=task_filter)
+        
+        if employee_filter:
+            queryset = queryset.filter(employee_id=employee_filter)
+        
+        if land_filter:
+            queryset = queryset.filter(land_id=land_filter)
+        
+        if search_query:
+            queryset = search.search_filter(queryset, search.ASSIGNED_TASK, search_query)
+        
+        # Order by assigned date
+        queryset = queryset.order_by('-assigned_date')
+        
+        # Create CSV response
+        response = HttpResponse(content_type='text/csv')
+        response['Content-Disposition'] = f'attachment; filename="assigned_tasks_{datetime.datetime.now().strftime("%Y%m%d")}.csv"'
+        
+        writer = csv.writer(response)
+        
+        # Write header
+        writer.writerow([
+            'Task ID', 'Task Name', 'Land Name', 'Village', 'Taluka', 'District',
+            'Employee Name', 'Employee Type', 'Status', 'Assigned Date', 'Due Date',
+            'Completion Days', 'Started Date', 'Completed Date', 'Completion Notes'
+        ])
+        
+        # Write data rows
+        for task in queryset:
+            writer.writerow([
+                task.id,
+                task.task.name,
+                task.land.name,
+                task.land.village.name,
+                task.land.taluka.name,
+                task.land.district.name,
+                task.employee.full_name or task.employee.username,
+                task.employee.employee_type or 'N/A',
+                task.status,
+                task.assigned_date.strftime('%Y-%m-%d %H:%M') if task.assigned_date else '',
+                task.due_date.strftime('%Y-%m-%d %H:%M') if task.due_date else '',
+                task.completion_days or '',
+                task.started_date.strftime('%Y-%m-%d %H:%M') if task.started_date else '',
+                task.completed_date.strftime('%Y-%m-%d %H:%M') if task.completed_date else '',
+                task.completion_notes or ''
+            ])
+        
+        return response
+        
+    except Exception as e:
+        return JsonResponse({'error': str(e)}, status=500)
+
+@login_required
+@conditional_resource('tasks')
+def get_tasks_api(request):
+    """API endpoint to get all tasks for filtering"""
+    if not request.user.is_authenticated:
+        return JsonResponse({'error': 'Unauthorized access'}, status=403)
+    
+    try:
+        from ..models import Task
+        tasks = Task.objects.all().order_by('name')
+        
+        print(f"Found {tasks.count()} tasks in database")
+        
+        tasks_data = []
+        for task in tasks:
+            task_data = {
+                'id': task.id,
+                'name': task.name,
+                'position': task.position
+            }
+            tasks_data.append(task_data)
+        
+        print(f"Returning {len(tasks_data)} task records")
+        return JsonResponse(tasks_data, safe=False)
+        
+    except Exception as e:
+        print(f"Error in get_tasks_api: {str(e)}")
+        return JsonResponse({'error': str(e)}, status=500)
+
+@admin_required(api=True)
+def assign_task_to_land(request):
+    """AJAX view to assign an existing task to a specific land with an employee"""
+    if request.method == 'POST':
+        try:
+            from ..models import Task, User, Land, AssignedTask
+            
+            task_name = request.POST.get('task_name')
+            position = request.POST.get('position')
+            assign_employee = request.POST.get('assign_employee')
+            is_default = request.POST.get('is_default')
+            completion_days = request.POST.get('completion_days')
+            land_id = request.POST.get('land_id')
+            
+            if not all([task_name, position, assign_employee, is_default, completion_days, land_id]):
+                return JsonResponse({'success': False, 'message': 'All required fields must be filled'})
+            
+            # Validate land exists
+            try:
+                land = Land.objects.get(id=land_id)
+            except Land.DoesNotExist:
+                return JsonResponse({'success': False, 'message': 'Land not found'})
+            
+            # Validate employee exists
+            try:
+                employee = User.objects.get(id=assign_employee, role='employee')
+            except User.DoesNotExist:
+                return JsonResponse({'success': False, 'message': 'Employee not found'})
+            
+            # Convert completion_days to integer
+            try:
+                completion_days_int = int(completion_days)
+                if completion_days_int < 0:
+                    return JsonResponse({'success': False, 'message': 'Completion days must be 0 or greater'})
+            except ValueError:
+                return JsonResponse({'success': False, 'message': 'Completion days must be a valid number'})
+            
+            # Check if task already exists with this name
+            task, created = Task.objects.get_or_create(
+                name=task_name,
+                defaults={
+                    'position': int(position),
+                    'is_default': is_default.lower() == 'true',
+                    'completion_days': completion_days_int
+                }
+            )
+            
+            # If task was created, also create TaskManage record
+            if created:
+                from ..models import TaskManage
+                TaskManage.objects.create(
+                    task=task,
+                    employee=employee
+                )
+            
+            # Check if this task is already assigned to this land for this employee
+            existing_assignment = AssignedTask.objects.filter(
+                land=land,
+                task=task,
+                employee=employee
+            ).first()
+            
+            if existing_assignment:
+                return JsonResponse({'success': False, 'message': 'This task is already assigned to this land for this employee'})
+            
+            # Create the AssignedTask
+            assigned_task = AssignedTask.objects.create(
+                land=land,
+                task=task,
+                employee=employee,
+                status='pending',
+                completion_days=completion_days_int,
+                assigned_date=timezone.now()
+            )
+            
+            return JsonResponse({
+                'success': True,
+                'message': f'Task "{task_name}" assigned to land "{land.name}" for employee "{employee.get_display_name()}" successfully!',
+                'assigned_task_id': assigned_task.id
+            })
+            
+        except Exception as e:
+            print(f"Error in assign_task_to_land: {str(e)}")
+            return JsonResponse({'success': False, 'message': str(e)})
+    
+    return JsonResponse({'success': False, 'message': 'Invalid request method'})
@@ -12,5 +12,7 @@ import os
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'crm_project.settings')
+# Route the polling endpoints to their async views (see settings.ASYNC_POLLING)
+os.environ.setdefault('ASYNC_POLLING', '1')
 
 application = get_asgi_application()
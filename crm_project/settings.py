@@ -37,7 +37,7 @@ INSTALLED_APPS = [
     'django.contrib.contenttypes',
     'django.contrib.sessions',
     'django.contrib.messages',
-    'django.contrib.staticfiles',
+    'core.apps.CrmStaticFilesConfig',
     'core',
 ]
 
@@ -80,19 +80,111 @@ WSGI_APPLICATION = 'crm_project.wsgi.application'
 # https://docs.djangoproject.com/en/5.1/ref/settings/#databases
 
 # Database configuration
-# SQLite configuration for development
-DATABASES = {
+# DB_ENGINE selects postgresql (default) or sqlite; everything else comes from
+# the environment with the local development values as fallbacks.
+
+def env_flag(name, default):
+    return os.environ.get(name, str(default)).lower() in ('1', 'true', 'yes', 'on')
+
+
+# asgi.py sets ASYNC_POLLING: the chat/notification/reminder polls are routed
+# to async views (under WSGI the sync ones are cheaper - no event loop per
+# request), and persistent connections default to off because ASGI runs each
+# request's ORM calls on a thread of its own; use DB_POOL there instead.
+ASYNC_POLLING = env_flag('ASYNC_POLLING', False)
+
+DB_ENGINE = os.environ.get('DB_ENGINE', 'postgresql')
+
+if DB_ENGINE == 'sqlite':
+    # Local benchmarking profile: WAL lets readers run alongside a writer,
+    # synchronous=NORMAL skips an fsync per commit (safe with WAL), and
+    # IMMEDIATE transactions take the write lock up front instead of failing
+    # with "database is locked" halfway through.
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': os.environ.get('DB_NAME', os.path.join(BASE_DIR, 'db.sqlite3')),
+            'OPTIONS': {
+                'init_command': 'PRAGMA journal_mode=WAL; PRAGMA synchronous=NORMAL;',
+                'transaction_mode': 'IMMEDIATE',
+                'timeout': 20,
+            },
+        }
+    }
+else:
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.postgresql',
+            'NAME': os.environ.get('DB_NAME', 'crm_database'),
+            'USER': os.environ.get('DB_USER', 'postgres'),
+            'PASSWORD': os.environ.get('DB_PASSWORD', 'root'),
+            'HOST': os.environ.get('DB_HOST', 'localhost'),
+            'PORT': os.environ.get('DB_PORT', '5433'),
+            # Keep connections open between requests instead of reconnecting for
+            # every AJAX call; health checks drop ones the server has closed.
+            'CONN_MAX_AGE': int(os.environ.get('DB_CONN_MAX_AGE', 0 if ASYNC_POLLING else 60)),
+            'CONN_HEALTH_CHECKS': env_flag('DB_CONN_HEALTH_CHECKS', True),
+            'OPTIONS': {
+                'connect_timeout': int(os.environ.get('DB_CONNECT_TIMEOUT', 5)),
+            },
+        }
+    }
+    if env_flag('DB_POOL', False):
+        # Native pooling (Django 5.1+) needs psycopg 3 with the pool extra:
+        # pip install "psycopg[binary,pool]". A pool replaces persistent
+        # connections, so CONN_MAX_AGE must be 0.
+        DATABASES['default']['CONN_MAX_AGE'] = 0
+        DATABASES['default']['OPTIONS']['pool'] = {
+            'min_size': int(os.environ.get('DB_POOL_MIN_SIZE', 2)),
+            'max_size': int(os.environ.get('DB_POOL_MAX_SIZE', 10)),
+            'timeout': int(os.environ.get('DB_POOL_TIMEOUT', 10)),
+        }
+
+
+# Cache
+# CACHE_BACKEND picks the store behind core.caching: locmem (default) keeps a
+# cache per process. Namespace versions live in the database, so a write
+# retires stale entries in every worker either way; file (one host) or redis
+# (shared) also lets the workers share the cached values and hit counters.
+
+CACHE_BACKEND = os.environ.get('CACHE_BACKEND', 'locmem')
+CACHE_BACKENDS = {
+    'locmem': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'crm',
+    },
+    'file': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': os.environ.get('CACHE_LOCATION', os.path.join(BASE_DIR, '.cache')),
+    },
+    'redis': {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': os.environ.get('CACHE_LOCATION', 'redis://127.0.0.1:6379/1'),
+    },
+}
+CACHES = {
     'default': {
-        'ENGINE': 'django.db.backends.postgresql',
-        'NAME': 'crm_database',
-        'USER': 'postgres',
-        'PASSWORD': 'root',
-        'HOST': 'localhost',
-        'PORT': '5433',
+        **CACHE_BACKENDS[CACHE_BACKEND],
+        'KEY_PREFIX': 'crm',
+        'TIMEOUT': int(os.environ.get('CACHE_TIMEOUT', 300)),
     }
 }
 
 
+# Sessions
+# cached_db reads sessions from the cache and only falls back to the database
+# on a miss, so polling endpoints stop querying the session table. With the
+# per-process locmem cache a logout in one worker would not reach another
+# worker's cached copy, so the default there is the plain database engine.
+# SESSION_STORE may also be cache or signed_cookies.
+
+SESSION_STORE = os.environ.get('SESSION_STORE', 'db' if CACHE_BACKEND == 'locmem' else 'cached_db')
+SESSION_ENGINE = f'django.contrib.sessions.backends.{SESSION_STORE}'
+SESSION_CACHE_ALIAS = 'default'
+# Only write the session when it changes
+SESSION_SAVE_EVERY_REQUEST = False
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
 
@@ -134,7 +226,16 @@ STATIC_ROOT = os.path.join(BASE_DIR, 'staticfiles')
 STATICFILES_DIRS = [
     os.path.join(BASE_DIR, 'core/static'),
 ]
-MIDDLEWARE.insert(1, 'whitenoise.middleware.WhiteNoiseMiddleware')
+MIDDLEWARE.insert(1, 'core.middleware.WhiteNoiseMiddleware')
+
+# collectstatic minifies JS/CSS, writes content-hashed copies plus .gz/.br
+# siblings; WhiteNoise serves hashed names with a far-future immutable
+# Cache-Control and everything else for WHITENOISE_MAX_AGE seconds
+STORAGES = {
+    'default': {'BACKEND': 'django.core.files.storage.FileSystemStorage'},
+    'staticfiles': {'BACKEND': 'core.storage.MinifiedManifestStaticFilesStorage'},
+}
+WHITENOISE_MAX_AGE = int(os.environ.get('WHITENOISE_MAX_AGE', 0 if DEBUG else 3600))
 
 MEDIA_URL = '/media/'
 MEDIA_ROOT = os.path.join(BASE_DIR, 'media')